@@ -12,6 +12,8 @@ PACKAGE_ROOT = Path(__file__).resolve().parent
 
 LABELS_PATH_ENV = "HELEN_LABELS_JSON"
 MODELS_DIR = PACKAGE_ROOT / "video_gesture_model" / "models"
+REGISTRY_PATH = MODELS_DIR / "registry.json"
+REGISTRY_STATE_PATH = MODELS_DIR / "registry.local.json"
 
 
 def _normalise_label(value: str) -> str:
@@ -37,8 +39,22 @@ def _candidate_label_files() -> Iterator[Path]:
                     yield candidate
 
 
+def _registry_labels_path() -> Path | None:
+    """Return ``labels.json`` of the promoted version (local state first, then ``registry.json``)."""
+    try:
+        registry = json.loads(REGISTRY_PATH.read_text(encoding="utf-8"))
+        active = registry["active"]
+        if REGISTRY_STATE_PATH.is_file():
+            active = json.loads(REGISTRY_STATE_PATH.read_text(encoding="utf-8")).get("active") or active
+        entry = registry["versions"][active]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    candidate = (MODELS_DIR / entry["path"] / "labels.json").resolve()
+    return candidate if candidate.exists() else None
+
+
 def _resolve_labels_path(path: str | os.PathLike[str] | None) -> Path:
-    """Resolve the labels file either from an explicit path or the latest model."""
+    """Resolve the labels file from an explicit path, the active model or the latest one."""
     if path:
         resolved = Path(path).expanduser().resolve()
         if not resolved.exists():
@@ -49,6 +65,10 @@ def _resolve_labels_path(path: str | os.PathLike[str] | None) -> Path:
     if env_value:
         return _resolve_labels_path(env_value)
 
+    registered = _registry_labels_path()
+    if registered is not None:
+        return registered
+
     candidates = list(_candidate_label_files())
     if not candidates:
         raise FileNotFoundError(
@@ -1,14 +1,19 @@
-"""Lightweight pure-Python gesture classifier used as backend fallback."""
+"""Lightweight NumPy gesture classifier used as backend fallback."""
 
 from __future__ import annotations
 
 import importlib
-import math
 import pickle
-import random
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+try:  # pragma: no cover - optional dependency
+    from scipy.spatial import cKDTree  # type: ignore
+except Exception:  # pragma: no cover - brute force fallback
+    cKDTree = None  # type: ignore
 
 helpers = importlib.import_module(__name__.rsplit(".", 1)[0] + ".helpers" if "." in __name__ else "helpers")
 
@@ -21,10 +26,34 @@ class Prediction:
     score: float
 
 
+class _BruteForceIndex:
+    """Exact nearest neighbours with one matrix product; used when SciPy is missing."""
+
+    def __init__(self, data: np.ndarray) -> None:
+        self._data = data
+        self._sq_norms = np.einsum("ij,ij->i", data, data)
+
+    def query(self, points: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        # |x - y|² = |x|² - 2 x·y + |y|²
+        sq = np.einsum("ij,ij->i", points, points)[:, None] - 2.0 * points @ self._data.T + self._sq_norms
+        np.maximum(sq, 0.0, out=sq)
+        nearest = np.argpartition(sq, k - 1, axis=1)[:, :k]
+        rows = np.arange(len(sq))[:, None]
+        order = np.argsort(sq[rows, nearest], axis=1)
+        nearest = nearest[rows, order]
+        return np.sqrt(sq[rows, nearest]), nearest
+
+
 class SimpleGestureClassifier:
-    """Compute nearest-centroid predictions from a stored dataset."""
+    """Nearest-centroid (or k-NN) predictions from a stored dataset.
 
-    def __init__(self, dataset_path: str | bytes | Path) -> None:
+    Centroids live in a ``(num_classes, dim)`` array, so a frame (or a batch
+    via :meth:`predict_many`) is classified with one matrix operation. With
+    ``k`` > 0 the label is the majority of the ``k`` nearest samples, looked up
+    in a SciPy KD-tree when available or by brute force otherwise.
+    """
+
+    def __init__(self, dataset_path: str | bytes | Path, *, k: int = 0) -> None:
         self.dataset_path = Path(dataset_path).expanduser().resolve()
         if not self.dataset_path.exists():
             raise FileNotFoundError(f"No se encontró el dataset en {self.dataset_path!s}")
@@ -38,9 +67,28 @@ class SimpleGestureClassifier:
             raise ValueError("El dataset tiene una cantidad desigual de muestras y etiquetas")
 
         canonical_labels = [self._coerce_label(raw_label) for raw_label in labels]
-        self._dimension = len(features[0])
-        self._centroids = self._compute_centroids(features, canonical_labels)
-        self._max_distance = self._compute_max_distance(features, canonical_labels, self._centroids)
+        samples = np.asarray(features, dtype=np.float64)
+        self._dimension = samples.shape[1]
+        # Orden de aparición en el dataset, como el diccionario de centroides original.
+        self._classes = list(dict.fromkeys(canonical_labels))
+        class_index = {label: index for index, label in enumerate(self._classes)}
+        self._codes = np.fromiter((class_index[label] for label in canonical_labels), dtype=np.intp, count=len(samples))
+
+        self._centroids = self._compute_centroids(samples, self._codes, len(self._classes))
+        self._max_distance = self._compute_max_distance(samples, self._codes, self._centroids)
+
+        self.k = min(max(0, int(k)), len(samples))
+        self._index: Any = None
+        if self.k:
+            self._index = cKDTree(samples) if cKDTree is not None else _BruteForceIndex(samples)
+
+    @property
+    def feature_size(self) -> int:
+        return self._dimension
+
+    @property
+    def mode(self) -> str:
+        return "knn" if self.k else "centroid"
 
     @staticmethod
     def _load_dataset(path: Path) -> Dict[str, Sequence]:
@@ -60,102 +108,219 @@ class SimpleGestureClassifier:
             return str(raw_value)
         return helpers.labels_dict.get(numeric, str(raw_value))
 
-    def _compute_centroids(
-        self,
-        features: Sequence[Sequence[float]],
-        labels: Sequence[str],
-    ) -> Dict[str, List[float]]:
-        centroids: Dict[str, List[float]] = {}
-        counts: Dict[str, int] = {}
-
-        for sample, label in zip(features, labels):
-            if label not in centroids:
-                centroids[label] = [0.0] * len(sample)
-                counts[label] = 0
-            accum = centroids[label]
-            for index, value in enumerate(sample):
-                accum[index] += float(value)
-            counts[label] += 1
-
-        for label, accum in centroids.items():
-            divisor = float(counts[label]) or 1.0
-            centroids[label] = [value / divisor for value in accum]
-
-        return centroids
-
-    def _compute_max_distance(
-        self,
-        features: Sequence[Sequence[float]],
-        labels: Sequence[str],
-        centroids: Dict[str, List[float]],
-    ) -> float:
-        max_distance = 0.0
-        for sample, label in zip(features, labels):
-            centroid = centroids[label]
-            distance = self._euclidean_distance(sample, centroid)
-            if distance > max_distance:
-                max_distance = distance
-        return max(max_distance, 1e-6)
-
     @staticmethod
-    def _euclidean_distance(sample: Sequence[float], centroid: Sequence[float]) -> float:
-        return math.sqrt(sum((float(a) - float(b)) ** 2 for a, b in zip(sample, centroid)))
+    def _compute_centroids(samples: np.ndarray, codes: np.ndarray, num_classes: int) -> np.ndarray:
+        sums = np.zeros((num_classes, samples.shape[1]), dtype=np.float64)
+        np.add.at(sums, codes, samples)
+        counts = np.bincount(codes, minlength=num_classes).astype(np.float64)
+        return sums / np.maximum(counts, 1.0)[:, None]
 
-    def predict(self, features: Iterable[float]) -> Prediction:
-        vector = [float(value) for value in features]
-        if len(vector) != self._dimension:
+    @staticmethod
+    def _compute_max_distance(samples: np.ndarray, codes: np.ndarray, centroids: np.ndarray) -> float:
+        distances = np.linalg.norm(samples - centroids[codes], axis=1)
+        return max(float(distances.max()), 1e-6)
+
+    def _as_batch(self, features: Iterable[Iterable[float]]) -> np.ndarray:
+        batch = np.asarray(features if isinstance(features, np.ndarray) else list(features), dtype=np.float64)
+        if batch.ndim != 2 or batch.shape[1] != self._dimension:
+            size = batch.shape[-1] if batch.ndim else 0
             raise ValueError(
-                f"Se esperaban vectores de dimensión {self._dimension}, pero se recibió uno de tamaño {len(vector)}"
+                f"Se esperaban vectores de dimensión {self._dimension}, pero se recibió uno de tamaño {size}"
             )
+        return batch
 
-        best_label = None
-        best_distance = float("inf")
-        for label, centroid in self._centroids.items():
-            distance = self._euclidean_distance(vector, centroid)
-            if distance < best_distance:
-                best_distance = distance
-                best_label = label
-
-        if best_label is None:
-            raise RuntimeError("No se pudo determinar el gesto más cercano")
-
-        score = max(0.0, 1.0 - (best_distance / self._max_distance))
-        return Prediction(label=best_label, score=score)
+    def predict(self, features: Iterable[float]) -> Prediction:
+        vector = np.asarray(features if isinstance(features, np.ndarray) else list(features), dtype=np.float64)
+        if vector.ndim != 1:
+            raise ValueError("predict espera un único vector; usa predict_many para lotes")
+        return self.predict_many(vector[np.newaxis])[0]
+
+    def predict_many(self, features: Iterable[Iterable[float]]) -> List[Prediction]:
+        """Classify a ``(n, dim)`` batch in one pass."""
+
+        batch = self._as_batch(features)
+        if self.k:
+            best, scores = self._knn(batch)
+        else:
+            diff = batch[:, np.newaxis, :] - self._centroids[np.newaxis]
+            distances = np.sqrt(np.einsum("ncd,ncd->nc", diff, diff))
+            best = distances.argmin(axis=1)
+            scores = np.maximum(0.0, 1.0 - distances[np.arange(len(batch)), best] / self._max_distance)
+        return [Prediction(label=self._classes[index], score=float(score)) for index, score in zip(best, scores)]
+
+    def _knn(self, batch: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Majority label of the ``k`` nearest samples and its share of the votes."""
+
+        _, neighbours = self._index.query(batch, k=self.k)
+        neighbours = np.asarray(neighbours).reshape(len(batch), self.k)
+        votes = np.zeros((len(batch), len(self._classes)), dtype=np.float64)
+        # Empates: gana la clase del vecino más cercano. La bonificación por rango es geométrica
+        # (0.25, 0.125, ...): la de un rango supera la suma de todas las siguientes y el total
+        # (< 0.5) nunca cambia el recuento de votos.
+        weights = 1.0 + 0.25 * 0.5 ** np.arange(self.k, dtype=np.float64)
+        np.add.at(votes, (np.arange(len(batch))[:, None], self._codes[neighbours]), weights)
+        best = votes.argmax(axis=1)
+        agreeing = (self._codes[neighbours] == best[:, np.newaxis]).sum(axis=1)
+        return best, agreeing / self.k
+
+
+IDLE_LABEL = "idle"
+JITTER_BLOCK = 4096
+
+
+class _JitterBlock:
+    """Gaussian jitter generated ``block`` rows at a time instead of per element."""
+
+    def __init__(self, dimension: int, jitter: float, rng: np.random.Generator, block: int = JITTER_BLOCK) -> None:
+        self._jitter = float(max(0.0, jitter))
+        self._rng = rng
+        self._noise = np.zeros((max(1, int(block)), dimension), dtype=np.float64)
+        self._cursor = len(self._noise)
+
+    def take(self, count: int) -> np.ndarray:
+        """``(count, dim)`` rows of jitter (zeros when jitter is disabled)."""
+
+        if not self._jitter:
+            return self._noise[:count] if count <= len(self._noise) else np.zeros((count, self._noise.shape[1]))
+        if count > len(self._noise):
+            return self._rng.normal(0.0, self._jitter, (count, self._noise.shape[1]))
+        if self._cursor + count > len(self._noise):
+            self._rng.standard_normal(out=self._noise)
+            self._noise *= self._jitter
+            self._cursor = 0
+        rows = self._noise[self._cursor : self._cursor + count]
+        self._cursor += count
+        return rows
 
 
 class SyntheticGestureStream:
-    """Yield dataset samples in a loop adding small random jitter."""
+    """Yield dataset samples in a loop adding small random jitter.
 
-    def __init__(self, dataset_path: str | bytes | Path, *, jitter: float = 0.02) -> None:
+    La muestra y el ruido se suman en NumPy; :meth:`next_batch` entrega lotes
+    completos para pruebas de carga.
+    """
+
+    def __init__(
+        self,
+        dataset_path: str | bytes | Path,
+        *,
+        jitter: float = 0.02,
+        seed: int | None = None,
+    ) -> None:
         payload = SimpleGestureClassifier._load_dataset(Path(dataset_path).expanduser().resolve())
-        self._features: Sequence[Sequence[float]] = payload["data"]
-        self._labels: Sequence[str | int] = payload["labels"]
-        if not self._features or not self._labels:
+        features: Sequence[Sequence[float]] = payload["data"]
+        labels: Sequence[str | int] = payload["labels"]
+        if not features or not labels:
             raise ValueError("El dataset está vacío")
-        if len(self._features) != len(self._labels):
+        if len(features) != len(labels):
             raise ValueError("El dataset tiene longitudes inconsistentes")
 
+        self._features = np.asarray(features, dtype=np.float64)
         self._index = 0
-        self._rng = random.Random()
-        self._jitter = float(max(0.0, jitter))
-        self._canonical_labels = [SimpleGestureClassifier._coerce_label(label) for label in self._labels]
+        self._jitter = _JitterBlock(self._features.shape[1], jitter, np.random.default_rng(seed))
+        self._canonical_labels = [SimpleGestureClassifier._coerce_label(label) for label in labels]
 
     def __iter__(self) -> Iterator[Tuple[List[float], str]]:
         while True:
             yield self.next()
 
-    def next(self) -> Tuple[List[float], str]:
-        sample = list(self._features[self._index])
+    def next_array(self) -> Tuple[np.ndarray, str]:
+        sample = self._features[self._index] + self._jitter.take(1)[0]
         label = self._canonical_labels[self._index]
         self._index = (self._index + 1) % len(self._features)
+        return sample, label
 
-        if self._jitter:
-            sample = [float(value) + self._rng.gauss(0.0, self._jitter) for value in sample]
+    def next(self) -> Tuple[List[float], str]:
+        sample, label = self.next_array()
+        return sample.tolist(), label
 
-        return sample, label
+    def next_batch(self, count: int) -> Tuple[np.ndarray, List[str]]:
+        """The next ``count`` samples as a ``(count, dim)`` array and their labels."""
+
+        indices = (self._index + np.arange(count)) % len(self._features)
+        self._index = int(indices[-1] + 1) % len(self._features) if count else self._index
+        batch = self._features[indices] + self._jitter.take(count)
+        return batch, [self._canonical_labels[index] for index in indices]
 
     def reset(self) -> None:
         self._index = 0
 
 
-__all__ = ["Prediction", "SimpleGestureClassifier", "SyntheticGestureStream"]
+def parse_script(spec: str) -> List[Tuple[str, float]]:
+    """Parse ``"idle:1.5,Start:0.8,Clima:0.8"`` into ``(label, seconds)`` segments."""
+
+    segments: List[Tuple[str, float]] = []
+    for part in spec.split(","):
+        label, _, seconds = part.strip().partition(":")
+        if not label or not seconds:
+            raise ValueError(f"Segmento inválido '{part}': se espera ETIQUETA:SEGUNDOS")
+        segments.append((label.strip(), float(seconds)))
+    return segments
+
+
+class ScriptedGestureStream:
+    """Loop over scripted ``(label, seconds)`` segments at ``fps`` frames per second.
+
+    Each frame of a gesture segment is a random sample of that label plus
+    pre-generated jitter; ``idle`` segments yield ``None`` features, like a
+    camera that sees no hand. Useful to replay idle → Start → Clima at any rate.
+    """
+
+    def __init__(
+        self,
+        samples: Mapping[str, np.ndarray],
+        script: Sequence[Tuple[str, float]],
+        *,
+        fps: float = 30.0,
+        jitter: float = 0.02,
+        seed: int | None = None,
+    ) -> None:
+        if not script:
+            raise ValueError("El guion de gestos está vacío")
+        missing = sorted({label for label, _ in script if label != IDLE_LABEL and label not in samples})
+        if missing:
+            raise ValueError(f"El dataset no tiene muestras para: {', '.join(missing)}")
+
+        self.fps = float(fps)
+        self._samples = {label: np.asarray(rows, dtype=np.float64) for label, rows in samples.items()}
+        dimension = next(iter(self._samples.values())).shape[1]
+        self._rng = np.random.default_rng(seed)
+        self._jitter = _JitterBlock(dimension, jitter, self._rng)
+        # Una etiqueta por frame del ciclo completo: next() solo avanza un índice.
+        self._timeline = [label for label, seconds in script for _ in range(max(1, round(seconds * self.fps)))]
+        self._position = 0
+
+    @classmethod
+    def from_dataset(
+        cls, dataset_path: str | bytes | Path, script: Sequence[Tuple[str, float]], **kwargs: Any
+    ) -> "ScriptedGestureStream":
+        payload = SimpleGestureClassifier._load_dataset(Path(dataset_path).expanduser().resolve())
+        features = np.asarray(payload["data"], dtype=np.float64)
+        labels = np.asarray([SimpleGestureClassifier._coerce_label(label) for label in payload["labels"]])
+        samples = {str(label): features[labels == label] for label in np.unique(labels)}
+        return cls(samples, script, **kwargs)
+
+    @property
+    def frames_per_cycle(self) -> int:
+        return len(self._timeline)
+
+    def next(self) -> Tuple[np.ndarray | None, str]:
+        label = self._timeline[self._position]
+        self._position = (self._position + 1) % len(self._timeline)
+        if label == IDLE_LABEL:
+            return None, label
+        pool = self._samples[label]
+        return pool[self._rng.integers(len(pool))] + self._jitter.take(1)[0], label
+
+    def reset(self) -> None:
+        self._position = 0
+
+
+__all__ = [
+    "IDLE_LABEL",
+    "Prediction",
+    "ScriptedGestureStream",
+    "SimpleGestureClassifier",
+    "SyntheticGestureStream",
+    "parse_script",
+]
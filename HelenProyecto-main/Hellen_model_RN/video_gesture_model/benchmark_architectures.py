@@ -0,0 +1,93 @@
+"""Compare model architectures and input windows: accuracy vs. CPU time per window.
+
+Entrena cada arquitectura de ``train_model`` (``lstm``, ``gru``, ``tcn``,
+``lstm_subsampled``) con las ventanas/strides indicados usando los mismos
+hiperparámetros, sin poda, y genera la tabla de ``hparam_sweep`` con la precisión
+de validación y la latencia medida de cada modelo exportado. Ejecutarlo en el
+equipo de destino (p. ej. la Raspberry Pi del kiosco) da latencias realistas.
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+# Imports robustos: paquete o script directo
+try:
+    from . import config, hparam_sweep
+    from .train_model import ARCHITECTURES
+except Exception:
+    import config  # type: ignore
+    import hparam_sweep  # type: ignore
+    from train_model import ARCHITECTURES  # type: ignore
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark gesture model architectures on this CPU")
+    parser.add_argument("--dataset", type=Path, default=config.FEATURES_DIR / "gesture_dataset.npz")
+    parser.add_argument("--labels", type=Path, default=config.FEATURES_DIR / "gesture_dataset_labels.json")
+    parser.add_argument("--architecture", nargs="+", choices=ARCHITECTURES, default=list(ARCHITECTURES))
+    parser.add_argument(
+        "--window",
+        nargs="+",
+        default=["0x1", "48x2", "24x2"],
+        help="Ventanas FRAMESxSTRIDE a comparar (0 = secuencia completa).",
+    )
+    parser.add_argument("--units", default="96,64", help="Unidades/filtros L1,L2 comunes a todas las arquitecturas.")
+    parser.add_argument("--epochs", type=int, default=30, help="Épocas máximas por modelo.")
+    parser.add_argument("--workers", type=int, default=1, help="Modelos entrenados en paralelo.")
+    parser.add_argument("--standardize", action="store_true", help="Estandarizar rasgos como train_model --standardize.")
+    parser.add_argument("--output", type=Path, default=None, help="Carpeta de resultados.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    output = args.output or config.MODELS_DIR / datetime.now().strftime("benchmark_%Y%m%d_%H%M%S")
+    windows = [spec.split("x") for spec in args.window]
+    if any(len(parts) != 2 for parts in windows):
+        raise ValueError("--window espera valores con formato FRAMESxSTRIDE, p. ej. 48x2")
+
+    # Cada ventana tiene su propio stride, así que se lanza un barrido por ventana
+    # sobre el mismo directorio y se clasifica todo junto al final.
+    results = []
+    for frames, stride in windows:
+        sweep_args = [
+            "--dataset", str(args.dataset),
+            "--labels", str(args.labels),
+            "--architecture", *args.architecture,
+            "--window", frames,
+            "--window-stride", stride,
+            "--lstm-units", args.units,
+            "--dense-units", "48",
+            "--dropout", "0.3",
+            "--learning-rate", "1e-3",
+            "--epochs", str(args.epochs),
+            "--prune-after", "0",
+            "--workers", str(args.workers),
+            "--output", str(output / f"window_{frames}x{stride}"),
+        ]
+        if args.standardize:
+            sweep_args.append("--standardize")
+        hparam_sweep.main(sweep_args)
+        results.extend(hparam_sweep.load_leaderboard(output / f"window_{frames}x{stride}"))
+
+    ranked = hparam_sweep.rank_results(results)
+    json_path, csv_path = hparam_sweep.write_leaderboard(output, ranked)
+    print(f"\n📊 Comparativa de arquitecturas ({json_path}, {csv_path})")
+    print(f"{'arquitectura':<16} {'ventana':>9} {'val_acc':>8} {'ms/ventana':>11} {'p95':>8} {'parámetros':>11}")
+    for row in ranked:
+        if row.get("status") != "completed":
+            print(f"{row['architecture']:<16} {row['window']:>6}x{row['window_stride']:<2} {row['status']}")
+            continue
+        print(
+            f"{row['architecture']:<16} {row['frames']:>6}x{row['window_stride']:<2} {row['val_accuracy']:>8.3f}"
+            f" {row['latency_ms']:>11.2f} {row['latency_p95_ms']:>8.2f} {row['parameters']:>11}"
+            f"{'  ★' if row['pareto'] else ''}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -16,7 +16,10 @@ DATA_DIR = BASE_DIR / "data"
 VIDEOS_DIR = DATA_DIR / "raw_videos"
 FRAMES_DIR = DATA_DIR / "frames"
 FEATURES_DIR = DATA_DIR / "features"
+LANDMARK_CACHE_DIR = FEATURES_DIR / "landmark_cache"
 MODELS_DIR = DATA_DIR / "models"
+# Modelos desplegados que carga el servidor, con su registro de versiones (registry.json).
+DEPLOYED_MODELS_DIR = BASE_DIR / "models"
 LOGS_DIR = DATA_DIR / "logs"
 
 # Default recording options.
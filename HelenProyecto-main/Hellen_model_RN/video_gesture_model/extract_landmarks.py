@@ -10,9 +10,12 @@ from __future__ import annotations
 
 import argparse
 import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 import cv2
 import mediapipe as mp
@@ -22,9 +25,18 @@ import numpy as np
 try:
     from . import config
     from .cli_utils import gesture_inventory, prompt_for_multiple_gestures
+    from .landmark_cache import LandmarkCache
+    from .sharded_dataset import DEFAULT_SHARD_SIZE, ShardedDatasetWriter
 except ImportError:  # ejecución directa
     import config  # type: ignore
     from cli_utils import gesture_inventory, prompt_for_multiple_gestures  # type: ignore
+    from landmark_cache import LandmarkCache  # type: ignore
+    from sharded_dataset import DEFAULT_SHARD_SIZE, ShardedDatasetWriter  # type: ignore
+
+MIN_DETECTION_CONFIDENCE = 0.6
+MIN_TRACKING_CONFIDENCE = 0.5
+# Subir al cambiar cómo se calculan o normalizan los landmarks guardados en caché.
+LANDMARK_KERNEL_VERSION = 1
 
 
 @dataclass
@@ -53,76 +65,214 @@ def parse_args() -> argparse.Namespace:
         default=config.SEQUENCE_LENGTH,
         help="Number of frames per sample after padding/truncation.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Procesos de extracción en paralelo (cada uno con su propio MediaPipe Hands).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("npz", "sharded"),
+        default="npz",
+        help=(
+            "npz: un único archivo comprimido. sharded: directorio de bloques .npy sin "
+            "comprimir que el entrenamiento lee con memoria mapeada (datasets mayores que la RAM)."
+        ),
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=DEFAULT_SHARD_SIZE,
+        help="Muestras por bloque con --format sharded.",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Ignorar la caché de landmarks y volver a procesar todos los videos.",
+    )
     return parser.parse_args()
 
 
+HANDEDNESS_SLOTS: Dict[str, int] = {"Left": 0, "Right": 1}
+
+
 def normalise_landmarks(landmarks: np.ndarray) -> np.ndarray:
     """Normalise coordinates relative to the wrist of each hand.
 
-    Se desplaza cada coordenada para que la muñeca de cada mano actúe como origen.
+    Acepta un frame (``FEATURE_SIZE``) o un bloque de frames (``(T, FEATURE_SIZE)``)
+    y resta la muñeca de cada mano en una sola operación vectorizada. Las manos
+    ausentes (todo ceros) tienen la muñeca en el origen, por lo que quedan igual.
+    Trabaja en el lugar siempre que el arreglo sea contiguo.
     """
     if landmarks.size == 0:
         return landmarks
-    reshaped = landmarks.reshape(
+    hands = landmarks.reshape(
+        -1, config.MAX_HANDS, config.NUM_HAND_LANDMARKS, config.LANDMARK_DIM
+    )
+    hands -= hands[:, :, :1, :]
+    return hands.reshape(landmarks.shape)
+
+
+def fill_frame_landmarks(
+    out: np.ndarray,
+    multi_hand_landmarks: Optional[Sequence],
+    multi_handedness: Optional[Sequence],
+) -> int:
+    """Write MediaPipe results for one frame into the ``FEATURE_SIZE`` row ``out``.
+
+    Cada mano ocupa el bloque de su lateralidad (izquierda 0, derecha 1) y las
+    ausentes quedan en cero. Devuelve el bloque de la última mano escrita o ``-1``
+    si no hubo manos. No normaliza: se hace por lotes con :func:`normalise_landmarks`.
+    """
+    frame_features = out.reshape(
         config.MAX_HANDS, config.NUM_HAND_LANDMARKS, config.LANDMARK_DIM
     )
-    for hand_idx in range(config.MAX_HANDS):
-        hand_landmarks = reshaped[hand_idx]
-        if not hand_landmarks.any():
-            continue
-        wrist = hand_landmarks[0].copy()
-        reshaped[hand_idx] -= wrist
-    return reshaped.reshape(-1)
+    frame_features.fill(0.0)
+    if not (multi_hand_landmarks and multi_handedness):
+        return -1
+    hand_idx = -1
+    for hand_landmarks, handedness in zip(multi_hand_landmarks, multi_handedness):
+        hand_idx = HANDEDNESS_SLOTS.get(handedness.classification[0].label, 0)
+        points = hand_landmarks.landmark
+        frame_features[hand_idx] = np.fromiter(
+            (value for lm in points for value in (lm.x, lm.y, lm.z)),
+            dtype=np.float32,
+            count=len(points) * config.LANDMARK_DIM,
+        ).reshape(len(points), config.LANDMARK_DIM)
+    return hand_idx
 
 
 def extract_from_video(
     video_path: Path, hands: mp.solutions.hands.Hands, sequence_length: int
 ) -> np.ndarray:
-    """Procesar un video y devolver una secuencia con landmarks normalizados."""
+    """Procesar un video y devolver una secuencia con landmarks normalizados.
+
+    La secuencia se escribe directamente en un arreglo ``(sequence_length,
+    FEATURE_SIZE)`` ya relleno con ceros (padding), se deja de leer al
+    completarla y la normalización se aplica una sola vez a todos los frames.
+    """
+    frames = extract_frames(video_path, hands, max_frames=sequence_length)
+    return fit_sequence(frames, sequence_length)
+
+
+def extract_frames(
+    video_path: Path, hands: mp.solutions.hands.Hands, max_frames: Optional[int] = None
+) -> np.ndarray:
+    """Devolver los landmarks normalizados de cada frame, ``(frames, FEATURE_SIZE)``.
+
+    Sin ``max_frames`` se procesa el video completo, que es lo que guarda la caché.
+    """
     cap = cv2.VideoCapture(str(video_path))
-    frames: List[np.ndarray] = []
+    capacity = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0) or config.SEQUENCE_LENGTH
+    if max_frames is not None:
+        capacity = min(capacity, max_frames)
+    frames = np.empty((max(capacity, 1), config.FEATURE_SIZE), dtype=np.float32)
+    count = 0
 
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(frame_rgb)
+    try:
+        while max_frames is None or count < max_frames:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            if count == len(frames):
+                # El conteo del contenedor puede quedarse corto; se duplica la reserva.
+                grown = np.empty((2 * len(frames), config.FEATURE_SIZE), dtype=np.float32)
+                grown[:count] = frames
+                frames = grown
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            results = hands.process(frame_rgb)
+            fill_frame_landmarks(
+                frames[count], results.multi_hand_landmarks, results.multi_handedness
+            )
+            count += 1
+    finally:
+        cap.release()
 
-        frame_features = np.zeros(
-            (config.MAX_HANDS, config.NUM_HAND_LANDMARKS, config.LANDMARK_DIM),
-            dtype=np.float32,
-        )
-        if results.multi_hand_landmarks and results.multi_handedness:
-            ordering: Dict[str, int] = {"Left": 0, "Right": 1}
-            for hand_landmarks, handedness in zip(
-                results.multi_hand_landmarks, results.multi_handedness
-            ):
-                label = handedness.classification[0].label
-                hand_idx = ordering.get(label, 0)
-                coords = np.array(
-                    [[lm.x, lm.y, lm.z] for lm in hand_landmarks.landmark],
-                    dtype=np.float32,
-                )
-                frame_features[hand_idx] = coords
-
-        frames.append(normalise_landmarks(frame_features.flatten()))
-
-    cap.release()
-
-    if not frames:
+    if not count:
         raise ValueError(f"El video {video_path} no contiene manos detectadas.")
 
-    # Ajustar longitud de la secuencia.
-    # Si hay más frames que los requeridos se recorta; si faltan se añade padding.
-    frames_array = np.array(frames, dtype=np.float32)
-    if len(frames_array) >= sequence_length:
-        return frames_array[:sequence_length]
+    return normalise_landmarks(frames[:count])
 
-    padding = np.zeros(
-        (sequence_length - len(frames_array), frames_array.shape[1]), dtype=np.float32
+
+def fit_sequence(
+    frames: np.ndarray, sequence_length: int, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Recortar o completar con ceros ``frames`` hasta ``sequence_length`` filas."""
+    if out is None:
+        out = np.empty((sequence_length, config.FEATURE_SIZE), dtype=np.float32)
+    used = min(len(frames), sequence_length)
+    out[:used] = frames[:used]
+    out[used:] = 0.0
+    return out
+
+
+def extraction_params() -> Dict[str, object]:
+    """Parameters that change the cached landmarks and therefore its key."""
+    return {
+        "max_num_hands": config.MAX_HANDS,
+        "min_detection_confidence": MIN_DETECTION_CONFIDENCE,
+        "min_tracking_confidence": MIN_TRACKING_CONFIDENCE,
+        "mediapipe": getattr(mp, "__version__", "unknown"),
+        "feature_size": config.FEATURE_SIZE,
+        "kernel": LANDMARK_KERNEL_VERSION,
+    }
+
+
+def _create_hands() -> mp.solutions.hands.Hands:
+    # Configuramos MediaPipe Hands para detectar hasta dos manos por cuadro.
+    return mp.solutions.hands.Hands(
+        static_image_mode=False,
+        max_num_hands=config.MAX_HANDS,
+        min_detection_confidence=MIN_DETECTION_CONFIDENCE,
+        min_tracking_confidence=MIN_TRACKING_CONFIDENCE,
     )
-    return np.vstack([frames_array, padding])
+
+
+# ----------------------------------------------------------------------
+# Extracción en paralelo: un MediaPipe Hands por proceso trabajador.
+_WORKER_HANDS: Optional[mp.solutions.hands.Hands] = None
+
+
+def _init_worker() -> None:
+    global _WORKER_HANDS
+    _WORKER_HANDS = _create_hands()
+
+
+def _extract_in_worker(index: int, video_path: str) -> Tuple[int, np.ndarray]:
+    assert _WORKER_HANDS is not None
+    return index, extract_frames(Path(video_path), _WORKER_HANDS)
+
+
+def _run_jobs(
+    jobs: Sequence[Tuple[int, Path]], workers: int
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """Extraer cada ``(índice, video)`` completo y entregar los resultados según terminan."""
+    if workers <= 1:
+        hands = _create_hands()
+        try:
+            for index, video_path in jobs:
+                yield index, extract_frames(video_path, hands)
+        finally:
+            hands.close()
+        return
+
+    # "spawn" evita heredar el estado de MediaPipe/TensorFlow del proceso padre.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=_init_worker
+    ) as pool:
+        futures = [
+            pool.submit(_extract_in_worker, index, str(video_path))
+            for index, video_path in jobs
+        ]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
 
 
 def main() -> None:
@@ -132,53 +282,83 @@ def main() -> None:
     gestures = args.gestures or prompt_for_multiple_gestures(gesture_inventory())
     print(f"Procesando las señas: {', '.join(gestures)}")
 
-    samples: List[Sample] = []
     label_map: Dict[str, int] = {gesture: idx for idx, gesture in enumerate(sorted(gestures))}
 
-    # Configuramos MediaPipe Hands para detectar hasta dos manos por cuadro.
-    hands = mp.solutions.hands.Hands(
-        static_image_mode=False,
-        max_num_hands=config.MAX_HANDS,
-        min_detection_confidence=0.6,
-        min_tracking_confidence=0.5,
-    )
-
-    try:
-        for gesture in gestures:
-            gesture_dir = config.VIDEOS_DIR / gesture
-            if not gesture_dir.exists():
-                raise FileNotFoundError(
-                    f"No se encontró la carpeta de videos para el gesto '{gesture}'."
-                )
-
-            before = len(samples)
-            for video_path in sorted(gesture_dir.glob("*.mp4")):
-                # Extraemos los landmarks por frame y los asociamos a la etiqueta correspondiente.
-                features = extract_from_video(video_path, hands, args.sequence_length)
-                samples.append(
-                    Sample(features=features, label=label_map[gesture], gesture=gesture)
-                )
-                print(f"✅ Procesado {video_path}")
-
-            if len(samples) == before:
-                print(f"⚠️  No se encontraron videos mp4 para la seña '{gesture}'.")
-    finally:
-        hands.close()
-
-    if not samples:
+    videos: List[Tuple[str, Path]] = []
+    for gesture in gestures:
+        gesture_dir = config.VIDEOS_DIR / gesture
+        if not gesture_dir.exists():
+            raise FileNotFoundError(
+                f"No se encontró la carpeta de videos para el gesto '{gesture}'."
+            )
+        gesture_videos = sorted(gesture_dir.glob("*.mp4"))
+        if not gesture_videos:
+            print(f"⚠️  No se encontraron videos mp4 para la seña '{gesture}'.")
+        videos.extend((gesture, video_path) for video_path in gesture_videos)
+
+    if not videos:
         raise RuntimeError("No se generaron muestras. Asegúrate de que existan videos mp4.")
 
-    # Se agrupan los datos en tensores listos para entrenar o validar el modelo.
-    X = np.stack([sample.features for sample in samples])
-    y = np.array([sample.label for sample in samples], dtype=np.int64)
+    # Los resultados se escriben directamente en su posición del tensor final; con
+    # --format sharded ese tensor son bloques en disco y nunca se carga completo.
+    y = np.array([label_map[gesture] for gesture, _ in videos], dtype=np.int64)
+    writer: Optional[ShardedDatasetWriter] = None
+    if args.format == "sharded":
+        writer = ShardedDatasetWriter(
+            config.FEATURES_DIR / args.output,
+            len(videos),
+            args.sequence_length,
+            config.FEATURE_SIZE,
+            shard_size=args.shard_size,
+        )
+        rows = writer.row
+    else:
+        X = np.zeros((len(videos), args.sequence_length, config.FEATURE_SIZE), dtype=np.float32)
+        rows = X.__getitem__
+
+    # Cada video terminado queda en la caché: si la extracción se interrumpe,
+    # la siguiente ejecución solo procesa los que faltan.
+    cache = LandmarkCache(config.LANDMARK_CACHE_DIR, extraction_params())
+    keys: List[str] = []
+    jobs: List[Tuple[int, Path]] = []
+    for index, (gesture, video_path) in enumerate(videos):
+        keys.append(cache.key_for(video_path))
+        cached = None if args.fresh else cache.load(keys[index])
+        if cached is not None:
+            fit_sequence(cached, args.sequence_length, out=rows(index))
+        else:
+            jobs.append((index, video_path))
+
+    reused = len(videos) - len(jobs)
+    if reused:
+        print(f"♻️  {reused} video(s) recuperados de la caché de landmarks.")
+    workers = max(1, min(args.workers, len(jobs))) if jobs else 1
+    print(f"Extrayendo {len(jobs)} video(s) con {workers} proceso(s).")
+
+    started = time.perf_counter()
+    done = 0
+    total_frames = 0
+    for index, frames in _run_jobs(jobs, workers):
+        _, video_path = videos[index]
+        cache.store(keys[index], frames)
+        fit_sequence(frames, args.sequence_length, out=rows(index))
+        done += 1
+        total_frames += len(frames)
+        elapsed = max(time.perf_counter() - started, 1e-6)
+        print(
+            f"✅ [{done}/{len(jobs)}] {video_path} "
+            f"({done / elapsed:.2f} videos/s, {total_frames / elapsed:.1f} frames/s)"
+        )
 
     summary: Dict[str, int] = {}
-    for sample in samples:
-        summary[sample.gesture] = summary.get(sample.gesture, 0) + 1
-
-    dataset_name = f"{args.output}.npz"
-    dataset_path = config.FEATURES_DIR / dataset_name
-    np.savez_compressed(dataset_path, X=X, y=y)
+    for gesture, _ in videos:
+        summary[gesture] = summary.get(gesture, 0) + 1
+
+    if writer is not None:
+        dataset_path = writer.close(y, label_map)
+    else:
+        dataset_path = config.FEATURES_DIR / f"{args.output}.npz"
+        np.savez_compressed(dataset_path, X=X, y=y)
     print(f"📦 Dataset guardado en {dataset_path}")
 
     label_map_path = config.FEATURES_DIR / f"{args.output}_labels.json"
@@ -192,4 +372,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
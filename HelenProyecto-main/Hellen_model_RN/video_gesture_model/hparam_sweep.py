@@ -0,0 +1,433 @@
+"""Grid/random hyperparameter search for ``train_model`` on a CPU process pool.
+
+Cada prueba se entrena en su propio proceso (``spawn``) con un número limitado
+de hilos de TensorFlow para no sobresuscribir los núcleos. Las pruebas que a
+partir de ``--prune-after`` épocas van por debajo de la mediana de las demás se
+podan. Los modelos terminados se exportan y, cuando ya no queda ningún
+entrenamiento en marcha, el proceso principal mide su latencia de inferencia uno
+por uno con una sola secuencia y un número fijo de hilos, de modo que la tabla
+final compara arquitecturas en igualdad de condiciones frente al presupuesto de
+la Raspberry Pi.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Imports robustos: paquete o script directo
+try:
+    from . import config
+except Exception:
+    import config  # type: ignore
+
+SEARCH_FIELDS = (
+    "architecture",
+    "window",
+    "window_stride",
+    "lstm_units",
+    "dense_units",
+    "dropout",
+    "learning_rate",
+    "batch_size",
+)
+LATENCY_WARMUP_RUNS = 5
+LATENCY_RUNS = 50
+LATENCY_THREADS = 1
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Definir el espacio de búsqueda y los recursos de la ejecución."""
+    parser = argparse.ArgumentParser(description="Hyperparameter sweep for the video gesture model")
+    parser.add_argument(
+        "--dataset", type=Path, default=config.FEATURES_DIR / "gesture_dataset.npz", help="Dataset .npz o en bloques."
+    )
+    parser.add_argument(
+        "--labels", type=Path, default=config.FEATURES_DIR / "gesture_dataset_labels.json", help="Mapa gesto→índice."
+    )
+    parser.add_argument("--mode", choices=("grid", "random"), default="grid", help="Búsqueda exhaustiva o aleatoria.")
+    parser.add_argument(
+        "--architecture",
+        nargs="+",
+        default=["lstm"],
+        help="Arquitecturas de train_model a probar (lstm, gru, tcn, lstm_subsampled).",
+    )
+    parser.add_argument("--window", nargs="+", type=int, default=[0], help="Ventanas en frames (0 = completa).")
+    parser.add_argument("--window-stride", nargs="+", type=int, default=[1], help="Strides temporales.")
+    parser.add_argument("--trials", type=int, default=8, help="Pruebas a muestrear con --mode random.")
+    parser.add_argument(
+        "--lstm-units",
+        nargs="+",
+        default=["160,96", "96,64", "64,32"],
+        help="Pares L1,L2 de neuronas LSTM a probar.",
+    )
+    parser.add_argument("--dense-units", nargs="+", type=int, default=[96, 48], help="Neuronas de la capa densa.")
+    parser.add_argument("--dropout", nargs="+", type=float, default=[0.3, 0.45], help="Valores de Dropout.")
+    parser.add_argument("--learning-rate", nargs="+", type=float, default=[7e-4, 2e-3], help="Tasas de aprendizaje.")
+    parser.add_argument("--batch-size", nargs="+", type=int, default=[24], help="Tamaños de batch.")
+    parser.add_argument("--epochs", type=int, default=40, help="Épocas máximas por prueba.")
+    parser.add_argument("--patience", type=int, default=8, help="Paciencia de EarlyStopping por prueba.")
+    parser.add_argument("--validation-split", type=float, default=0.25, help="Proporción de validación (0-1).")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla de la partición y del muestreo aleatorio.")
+    parser.add_argument("--standardize", action="store_true", help="Estandarizar rasgos como train_model --standardize.")
+    parser.add_argument("--workers", type=int, default=2, help="Pruebas simultáneas.")
+    parser.add_argument(
+        "--threads-per-trial",
+        type=int,
+        default=0,
+        help="Hilos de TensorFlow por prueba (0 = núcleos disponibles / workers).",
+    )
+    parser.add_argument(
+        "--latency-threads",
+        type=int,
+        default=LATENCY_THREADS,
+        help="Hilos de TensorFlow al medir la latencia (iguales para todas las pruebas).",
+    )
+    parser.add_argument(
+        "--prune-after",
+        type=int,
+        default=5,
+        help="Época a partir de la cual se podan pruebas por debajo de la mediana (0 = sin poda).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Carpeta de resultados (por defecto data/models/sweep_<fecha>).",
+    )
+    return parser.parse_args(argv)
+
+
+def build_trials(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Expandir la rejilla; en modo aleatorio se toma una muestra sin repetición."""
+    lstm_pairs = [tuple(int(part) for part in pair.split(",")) for pair in args.lstm_units]
+    if any(len(pair) != 2 for pair in lstm_pairs):
+        raise ValueError("--lstm-units espera pares con formato L1,L2")
+    grid = [
+        dict(zip(SEARCH_FIELDS, values))
+        for values in itertools.product(
+            args.architecture,
+            args.window,
+            args.window_stride,
+            lstm_pairs,
+            args.dense_units,
+            args.dropout,
+            args.learning_rate,
+            args.batch_size,
+        )
+    ]
+    if args.mode == "random" and args.trials < len(grid):
+        rng = np.random.default_rng(args.seed)
+        grid = [grid[index] for index in sorted(rng.choice(len(grid), size=args.trials, replace=False))]
+    return grid
+
+
+def measure_latency(
+    predict, sequence_length: int, feature_dim: int, *, runs: int = LATENCY_RUNS, warmup: int = LATENCY_WARMUP_RUNS
+) -> Tuple[float, float]:
+    """Median and p95 latency (ms) of ``predict`` on one ``(1, L, F)`` sequence."""
+    sample = np.random.default_rng(0).random((1, sequence_length, feature_dim), dtype=np.float32)
+    for _ in range(warmup):
+        predict(sample)
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        predict(sample)
+        timings.append((time.perf_counter() - started) * 1000.0)
+    timings.sort()
+    return statistics.median(timings), timings[min(len(timings) - 1, int(0.95 * len(timings)))]
+
+
+def _init_trial_worker(threads: int) -> None:
+    # Antes de que TensorFlow cree su contexto: limitar hilos de oneDNN/OpenMP y de TF.
+    os.environ["OMP_NUM_THREADS"] = str(threads)
+    os.environ["TF_NUM_INTRAOP_THREADS"] = str(threads)
+    os.environ["TF_NUM_INTEROP_THREADS"] = "1"
+    os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "2")
+    import tensorflow as tf
+
+    tf.config.threading.set_intra_op_parallelism_threads(threads)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+
+
+def measure_completed(
+    results: Sequence[MutableMapping[str, Any]],
+    *,
+    build_predict=None,
+    runs: int = LATENCY_RUNS,
+) -> None:
+    """Medir en serie la latencia de los modelos exportados, ya sin entrenamientos en paralelo.
+
+    Se ejecuta en el proceso principal tras vaciar el pool, de modo que todas
+    las pruebas se cronometran sobre la máquina ociosa y con los mismos hilos.
+    """
+    if build_predict is None:
+        try:
+            from .realtime_inference import build_predict_fn as build_predict
+        except Exception:
+            from realtime_inference import build_predict_fn as build_predict  # type: ignore
+
+    completed = sorted((result for result in results if result.get("status") == "completed"), key=lambda r: r["trial"])
+    for result in completed:
+        try:
+            # Latencia por ventana tal como la verá el backend: frames de cámara → predicción.
+            latency, latency_p95 = measure_latency(
+                build_predict(Path(result["model_dir"])), result["frames_required"], result["feature_dim"], runs=runs
+            )
+        except Exception as exc:
+            result.update(status="failed", error=f"latencia: {exc}")
+            continue
+        result.update(latency_ms=round(latency, 3), latency_p95_ms=round(latency_p95, 3))
+        print(f"   ⏱️  prueba {result['trial']}: {latency:.2f} ms (p95 {latency_p95:.2f} ms)")
+
+
+def _pruning_callback(trial_id: int, reports: MutableMapping[int, List[float]], prune_after: int):
+    import tensorflow as tf
+
+    class MedianPruner(tf.keras.callbacks.Callback):
+        """Stop a trial whose best ``val_accuracy`` so far is below its peers' median."""
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.curve: List[float] = []
+            self.pruned_at: Optional[int] = None
+
+        def on_epoch_end(self, epoch, logs=None):
+            value = float((logs or {}).get("val_accuracy", 0.0))
+            self.curve.append(max(value, self.curve[-1]) if self.curve else value)
+            reports[trial_id] = list(self.curve)
+            if not prune_after or epoch + 1 < prune_after:
+                return
+            peers = [curve[epoch] for other, curve in reports.items() if other != trial_id and len(curve) > epoch]
+            if len(peers) >= 2 and self.curve[-1] < statistics.median(peers):
+                self.pruned_at = epoch + 1
+                self.model.stop_training = True
+
+    return MedianPruner()
+
+
+def run_trial(
+    trial_id: int,
+    params: Mapping[str, Any],
+    settings: Mapping[str, Any],
+    reports: MutableMapping[int, List[float]],
+) -> Dict[str, Any]:
+    """Entrenar una configuración y exportarla (en el proceso trabajador); la latencia se mide después."""
+    import tensorflow as tf
+
+    try:
+        from . import train_model
+        from .preprocessing import InputSpec, save_input_spec, save_normalization
+    except Exception:
+        import train_model  # type: ignore
+        from preprocessing import InputSpec, save_input_spec, save_normalization  # type: ignore
+
+    tf.keras.utils.set_random_seed(settings["seed"])
+    result: Dict[str, Any] = {"trial": trial_id, **params, "lstm_units": list(params["lstm_units"])}
+    data = train_model.prepare_training_data(
+        Path(settings["dataset"]),
+        validation_split=settings["validation_split"],
+        seed=settings["seed"],
+        standardize_features=settings["standardize"],
+        batch_size=params["batch_size"],
+        window=params["window"],
+        stride=params["window_stride"],
+    )
+    num_classes = int(np.max(np.concatenate([data.y_train, data.y_val])) + 1)
+    model = train_model.build_model(
+        num_classes=num_classes,
+        sequence_length=data.sequence_length,
+        feature_dim=data.feature_dim,
+        lstm_units=tuple(params["lstm_units"]),
+        dense_units=params["dense_units"],
+        dropout=params["dropout"],
+        architecture=params["architecture"],
+    )
+    model.compile(
+        optimizer=tf.keras.optimizers.Adam(learning_rate=params["learning_rate"]),
+        loss="sparse_categorical_crossentropy",
+        metrics=["accuracy"],
+    )
+    pruner = _pruning_callback(trial_id, reports, settings["prune_after"])
+    timer = train_model.EpochTimer(len(data.y_train))
+    started = time.perf_counter()
+    model.fit(
+        **data.fit_inputs,
+        validation_data=data.val_data,
+        epochs=settings["epochs"],
+        callbacks=[
+            timer,
+            pruner,
+            tf.keras.callbacks.EarlyStopping(
+                patience=settings["patience"], restore_best_weights=True, monitor="val_accuracy", mode="max"
+            ),
+        ],
+        verbose=0,
+    )
+    result.update(
+        val_accuracy=round(max(pruner.curve) if pruner.curve else 0.0, 4),
+        epochs=len(pruner.curve),
+        train_time_s=round(time.perf_counter() - started, 2),
+        samples_per_s=round(statistics.median(timer.history["samples_per_s"]), 1) if timer.history["samples_per_s"] else None,
+        parameters=int(model.count_params()),
+    )
+    if pruner.pruned_at is not None:
+        result.update(status="pruned", pruned_at=pruner.pruned_at)
+        return result
+
+    model_dir = Path(settings["output"]) / f"trial_{trial_id:03d}"
+    model.export(model_dir, verbose=False)
+    Path(model_dir / "labels.json").write_text(Path(settings["labels"]).read_text(encoding="utf-8"), encoding="utf-8")
+    input_spec = InputSpec(data.sequence_length, params["window_stride"], params["architecture"])
+    save_input_spec(model_dir, input_spec)
+    if settings["standardize"]:
+        save_normalization(model_dir, data.split.mean, data.split.std)
+    result.update(
+        status="completed",
+        model_dir=str(model_dir),
+        frames=data.sequence_length,
+        frames_required=input_spec.frames_required,
+        feature_dim=data.feature_dim,
+    )
+    return result
+
+
+def rank_results(results: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Ordenar por precisión (desc.) y latencia (asc.), marcando el frente de Pareto."""
+    completed = [dict(result) for result in results if result.get("status") == "completed"]
+    for result in completed:
+        result["pareto"] = not any(
+            other is not result
+            and other["val_accuracy"] >= result["val_accuracy"]
+            and other["latency_ms"] <= result["latency_ms"]
+            and (other["val_accuracy"] > result["val_accuracy"] or other["latency_ms"] < result["latency_ms"])
+            for other in completed
+        )
+    completed.sort(key=lambda result: (-result["val_accuracy"], result["latency_ms"]))
+    others = sorted(
+        (dict(result) for result in results if result.get("status") != "completed"),
+        key=lambda result: -result.get("val_accuracy", 0.0),
+    )
+    return completed + others
+
+
+def write_leaderboard(output: Path, ranked: Sequence[Dict[str, Any]]) -> Tuple[Path, Path]:
+    json_path = output / "leaderboard.json"
+    json_path.write_text(json.dumps(list(ranked), indent=2), encoding="utf-8")
+    csv_path = output / "leaderboard.csv"
+    columns = ["trial", "status", "val_accuracy", "latency_ms", "latency_p95_ms", "pareto", *SEARCH_FIELDS, "frames", "parameters", "epochs", "train_time_s", "samples_per_s", "model_dir"]
+    with csv_path.open("w", newline="", encoding="utf-8") as fp:
+        writer = csv.DictWriter(fp, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        for row in ranked:
+            writer.writerow({**row, "lstm_units": ",".join(str(unit) for unit in row["lstm_units"])})
+    return json_path, csv_path
+
+
+def load_leaderboard(output: Path) -> List[Dict[str, Any]]:
+    return json.loads((Path(output) / "leaderboard.json").read_text(encoding="utf-8"))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if not args.labels.exists():
+        raise FileNotFoundError(f"No se encontró el archivo de etiquetas: {args.labels}")
+
+    trials = build_trials(args)
+    workers = max(1, min(args.workers, len(trials)))
+    threads = args.threads_per_trial or max(1, (os.cpu_count() or 1) // workers)
+    output = args.output or config.MODELS_DIR / datetime.now().strftime("sweep_%Y%m%d_%H%M%S")
+    output.mkdir(parents=True, exist_ok=True)
+    print(f"🔎 {len(trials)} prueba(s) en {workers} proceso(s) con {threads} hilo(s) cada uno → {output}")
+    # Los hilos del proceso principal (que luego mide la latencia) se fijan antes de crear el contexto de TF;
+    # los trabajadores ``spawn`` los vuelven a fijar en su inicializador.
+    _init_trial_worker(max(1, args.latency_threads))
+
+    # La partición (y estadísticas) se calculan una vez aquí; las pruebas las leen de la caché.
+    try:
+        from .preprocessing import PreprocessingCache, prepare_split
+        from .sharded_dataset import ShardedDataset, is_sharded_dataset
+    except Exception:
+        from preprocessing import PreprocessingCache, prepare_split  # type: ignore
+        from sharded_dataset import ShardedDataset, is_sharded_dataset  # type: ignore
+    if is_sharded_dataset(args.dataset):
+        dataset = ShardedDataset(args.dataset)
+        labels, read = dataset.labels, dataset.read
+    else:
+        with np.load(args.dataset) as data:
+            labels, X = data["y"], data["X"]
+        read = X.__getitem__
+    prepare_split(
+        labels,
+        validation_split=args.validation_split,
+        seed=args.seed,
+        read=read if args.standardize else None,
+        cache=PreprocessingCache(args.dataset),
+    )
+
+    settings = {
+        "dataset": str(args.dataset),
+        "labels": str(args.labels),
+        "validation_split": args.validation_split,
+        "seed": args.seed,
+        "standardize": args.standardize,
+        "epochs": args.epochs,
+        "patience": args.patience,
+        "prune_after": args.prune_after,
+        "output": str(output),
+    }
+    context = multiprocessing.get_context("spawn")
+    results: List[Dict[str, Any]] = []
+    started = time.perf_counter()
+    with context.Manager() as manager:
+        reports = manager.dict()
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=context, initializer=_init_trial_worker, initargs=(threads,)
+        ) as pool:
+            futures = {
+                pool.submit(run_trial, trial_id, params, settings, reports): (trial_id, params)
+                for trial_id, params in enumerate(trials)
+            }
+            for future in as_completed(futures):
+                trial_id, params = futures[future]
+                try:
+                    result = future.result()
+                except Exception as exc:  # una prueba fallida no detiene el barrido
+                    result = {"trial": trial_id, **params, "lstm_units": list(params["lstm_units"]), "status": "failed", "error": str(exc)}
+                results.append(result)
+                print(
+                    f"   [{len(results)}/{len(trials)}] prueba {trial_id}: {result['status']}"
+                    f" val_acc={result.get('val_accuracy', 0.0):.3f}"
+                )
+
+    print(f"⏱️  Midiendo la latencia de los modelos terminados de a uno ({max(1, args.latency_threads)} hilo(s))")
+    measure_completed(results)
+    ranked = rank_results(results)
+    json_path, _ = write_leaderboard(output, ranked)
+    print(f"🏁 Barrido terminado en {time.perf_counter() - started:.1f}s. Clasificación en {json_path}")
+    print(f"{'#':>3} {'val_acc':>8} {'lat ms':>8} {'p95 ms':>8}  pareto  configuración")
+    for row in ranked:
+        if row.get("status") != "completed":
+            continue
+        print(
+            f"{row['trial']:>3} {row['val_accuracy']:>8.3f} {row['latency_ms']:>8.2f} {row['latency_p95_ms']:>8.2f}"
+            f"  {'  ★   ' if row['pareto'] else '      '}  {row['architecture']} ventana={row['frames']}x{row['window_stride']}"
+            f" unidades={tuple(row['lstm_units'])} Dense={row['dense_units']}"
+            f" Dropout={row['dropout']} LR={row['learning_rate']} Batch={row['batch_size']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
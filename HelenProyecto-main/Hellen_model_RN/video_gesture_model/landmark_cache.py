@@ -0,0 +1,80 @@
+"""Content-addressed cache of per-frame landmarks for recorded gesture clips.
+
+Cada video se procesa con MediaPipe una sola vez: sus landmarks normalizados de
+*todos* los frames se guardan bajo una clave que combina el hash del archivo con
+los parámetros de extracción. Reconstruir el dataset con otra longitud de
+secuencia u otro subconjunto de señas solo recorta arreglos ya calculados.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+import numpy as np
+
+try:
+    from . import config
+except ImportError:  # ejecución directa
+    import config  # type: ignore
+
+HASH_CHUNK_BYTES = 1 << 20
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of the file contents, read in 1 MiB chunks."""
+
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as fp:
+        for chunk in iter(lambda: fp.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class LandmarkCache:
+    """``<key>.npy`` files holding ``(frames, FEATURE_SIZE)`` float32 landmarks.
+
+    La clave es ``sha256(parámetros + hash del video)``: cambiar la versión de
+    MediaPipe, el número de manos o las confianzas invalida las entradas sin
+    tener que borrar nada a mano.
+    """
+
+    def __init__(self, root: Path = config.LANDMARK_CACHE_DIR, params: Optional[Mapping[str, Any]] = None) -> None:
+        self.root = Path(root)
+        self.params: Dict[str, Any] = dict(params or {})
+        self._params_blob = json.dumps(self.params, sort_keys=True).encode("utf-8")
+
+    def key_for(self, video_path: Path) -> str:
+        digest = hashlib.sha256(self._params_blob)
+        digest.update(file_digest(video_path).encode("ascii"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.npy"
+
+    def load(self, key: str) -> Optional[np.ndarray]:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            frames = np.load(path)
+        except (OSError, ValueError):
+            return None
+        if frames.ndim != 2 or frames.shape[1] != config.FEATURE_SIZE:
+            return None
+        return frames
+
+    def store(self, key: str, frames: np.ndarray) -> Path:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Escritura atómica: un corte a mitad de escritura no deja entradas corruptas.
+        tmp_path = path.with_name(f"{key}.tmp.npy")
+        np.save(tmp_path, np.asarray(frames, dtype=np.float32))
+        os.replace(tmp_path, path)
+        return path
+
+
+__all__ = ["LandmarkCache", "file_digest"]
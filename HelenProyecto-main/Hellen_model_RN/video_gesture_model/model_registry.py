@@ -0,0 +1,335 @@
+"""Versioned registry of exported gesture models with a promotable active version.
+
+``registry.json`` vive junto a los modelos desplegados y describe cada versión:
+etiquetas, forma de entrada, métricas de entrenamiento y los pesos
+``best_weights_*`` asociados. Es la semilla versionada en git y solo la
+reescriben ``register``/``scan``. Lo que cambia en el equipo (la versión
+``active`` promovida y la latencia medida) se guarda aparte, en
+``registry.local.json`` (ignorado por git), que se superpone a la semilla al
+leer; así un kiosco que promueve versiones no ensucia su checkout. El servidor
+aplica la promoción en caliente con ``POST /models/promote``.
+
+Uso::
+
+    python -m Hellen_model_RN.video_gesture_model.model_registry scan
+    python -m Hellen_model_RN.video_gesture_model.model_registry list
+    python -m Hellen_model_RN.video_gesture_model.model_registry promote 20251106_063546
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Imports robustos: paquete o script directo
+try:
+    from . import config
+    from .preprocessing import load_input_spec, load_normalization
+except Exception:
+    import config  # type: ignore
+    from preprocessing import load_input_spec, load_normalization  # type: ignore
+
+REGISTRY_FILE = "registry.json"
+STATE_FILE = "registry.local.json"
+LATENCY_FIELDS = ("latency_ms", "latency_p95_ms")
+MODEL_DIR_PREFIX = "gesture_model_"
+WEIGHTS_TEMPLATE = "best_weights_{stamp}.weights.h5"
+
+
+@dataclass
+class ModelVersion:
+    """Manifest entry of one exported SavedModel; ``path`` is relative to the registry."""
+
+    version: str
+    path: str
+    labels: List[str] = field(default_factory=list)
+    input_shape: List[int] = field(default_factory=list)
+    frames_required: int = 0
+    architecture: str = "lstm"
+    metrics: Dict[str, float] = field(default_factory=dict)
+    latency_ms: Optional[float] = None
+    latency_p95_ms: Optional[float] = None
+    weights: Optional[str] = None
+    registered_at: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModelVersion":
+        known = {item.name for item in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+def _version_id(model_dir: Path) -> str:
+    name = model_dir.name
+    return name[len(MODEL_DIR_PREFIX) :] if name.startswith(MODEL_DIR_PREFIX) else name
+
+
+def _training_metrics(model_dir: Path) -> Dict[str, float]:
+    """Best ``val_accuracy`` epoch of ``training_history.json`` (empty if unavailable)."""
+
+    path = model_dir / "training_history.json"
+    if not path.is_file():
+        return {}
+    try:
+        history = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    val_accuracy = history.get("val_accuracy") or []
+    if not val_accuracy:
+        return {}
+    best = max(range(len(val_accuracy)), key=val_accuracy.__getitem__)
+    metrics = {"epochs": float(len(val_accuracy)), "best_epoch": float(best + 1)}
+    for key in ("val_accuracy", "val_loss", "accuracy", "loss"):
+        values = history.get(key) or []
+        if best < len(values):
+            metrics[key] = round(float(values[best]), 6)
+    return metrics
+
+
+def describe_model(model_dir: Path, root: Path, version: Optional[str] = None) -> ModelVersion:
+    """Build the manifest entry of an exported model directory."""
+
+    model_dir = Path(model_dir)
+    if not (model_dir / "saved_model.pb").is_file():
+        raise FileNotFoundError(f"No se encontró saved_model.pb en {model_dir}")
+    labels_path = model_dir / "labels.json"
+    if not labels_path.is_file():
+        raise FileNotFoundError(f"No se encontró labels.json en {model_dir}")
+
+    label_map = json.loads(labels_path.read_text(encoding="utf-8"))
+    labels = [name for name, _ in sorted(label_map.items(), key=lambda item: int(item[1]))]
+    spec = load_input_spec(model_dir)
+    normalization = load_normalization(model_dir)
+    feature_size = len(normalization[0]) if normalization is not None else config.FEATURE_SIZE
+    window = spec.window if spec is not None else config.SEQUENCE_LENGTH
+
+    stamp = _version_id(model_dir)
+    weights = model_dir.parent / WEIGHTS_TEMPLATE.format(stamp=stamp)
+    return ModelVersion(
+        version=version or stamp,
+        path=os.path.relpath(model_dir.resolve(), Path(root).resolve()),
+        labels=labels,
+        input_shape=[int(window), int(feature_size)],
+        frames_required=spec.frames_required if spec is not None else int(window),
+        architecture=spec.architecture if spec is not None else "lstm",
+        metrics=_training_metrics(model_dir),
+        weights=os.path.relpath(weights.resolve(), Path(root).resolve()) if weights.is_file() else None,
+        registered_at=datetime.now().isoformat(timespec="seconds"),
+    )
+
+
+class ModelRegistry:
+    """Read/write access to ``<root>/registry.json`` plus its local state overlay.
+
+    Cada escritura relee el archivo y lo sustituye con ``os.replace``, de modo
+    que el servidor y los scripts de entrenamiento pueden compartirlo sin dejarlo
+    nunca a medio escribir. ``promote`` y ``record_latency`` solo escriben
+    ``state_path``; el manifiesto versionado queda intacto en tiempo de ejecución.
+    """
+
+    def __init__(self, root: Path = config.DEPLOYED_MODELS_DIR, state_path: Optional[Path] = None) -> None:
+        self.root = Path(root)
+        self.path = self.root / REGISTRY_FILE
+        self.state_path = Path(state_path) if state_path is not None else self.root / STATE_FILE
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _read(path: Path) -> Dict[str, Any]:
+        if not path.is_file():
+            return {}
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _write(path: Path, data: Dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        data = self._read(self.path)
+        data.setdefault("active", None)
+        data.setdefault("versions", {})
+        return data
+
+    def _load_state(self) -> Dict[str, Any]:
+        state = self._read(self.state_path)
+        state.setdefault("latency", {})
+        return state
+
+    def _load(self) -> Dict[str, Any]:
+        """Seed manifest with the local ``active`` and latencies laid over it."""
+
+        data = self._load_manifest()
+        state = self._load_state()
+        for key in ("active", "previous", "promoted_at"):
+            if state.get(key) is not None:
+                data[key] = state[key]
+        for version, latency in state["latency"].items():
+            entry = data["versions"].get(version)
+            if entry is not None:
+                entry.update({key: latency.get(key) for key in LATENCY_FIELDS if key in latency})
+        return data
+
+    # ------------------------------------------------------------------
+    def versions(self) -> List[ModelVersion]:
+        entries = self._load()["versions"].values()
+        return sorted((ModelVersion.from_dict(entry) for entry in entries), key=lambda entry: entry.version)
+
+    def get(self, version: str) -> Optional[ModelVersion]:
+        entry = self._load()["versions"].get(version)
+        return ModelVersion.from_dict(entry) if entry is not None else None
+
+    def model_dir(self, entry: ModelVersion) -> Path:
+        return (self.root / entry.path).resolve()
+
+    def active(self) -> Optional[ModelVersion]:
+        data = self._load()
+        entry = data["versions"].get(data["active"]) if data["active"] else None
+        return ModelVersion.from_dict(entry) if entry is not None else None
+
+    def active_dir(self) -> Optional[Path]:
+        """Directory of the active version, or ``None`` if nothing usable is promoted."""
+
+        entry = self.active()
+        if entry is None:
+            return None
+        model_dir = self.model_dir(entry)
+        return model_dir if (model_dir / "saved_model.pb").is_file() else None
+
+    # ------------------------------------------------------------------
+    def register(self, model_dir: Path, *, version: Optional[str] = None) -> ModelVersion:
+        """Add (or refresh) ``model_dir`` in the manifest, keeping its measured latency."""
+
+        entry = describe_model(model_dir, self.root, version)
+        with self._lock:
+            data = self._load_manifest()
+            previous = data["versions"].get(entry.version)
+            if previous is not None:
+                entry.latency_ms = previous.get("latency_ms")
+                entry.latency_p95_ms = previous.get("latency_p95_ms")
+                entry.registered_at = previous.get("registered_at") or entry.registered_at
+            data["versions"][entry.version] = entry.to_dict()
+            self._write(self.path, data)
+        latency = self._load_state()["latency"].get(entry.version, {})
+        entry.latency_ms = latency.get("latency_ms", entry.latency_ms)
+        entry.latency_p95_ms = latency.get("latency_p95_ms", entry.latency_p95_ms)
+        return entry
+
+    def scan(self) -> List[ModelVersion]:
+        """Register the ``gesture_model_*`` directories under ``root`` not yet listed."""
+
+        known = {self.model_dir(entry) for entry in self.versions()}
+        added = []
+        for model_dir in sorted(self.root.glob(f"{MODEL_DIR_PREFIX}*")):
+            if model_dir.resolve() in known or not (model_dir / "saved_model.pb").is_file():
+                continue
+            try:
+                added.append(self.register(model_dir))
+            except (FileNotFoundError, ValueError) as error:
+                print(f"⚠️  Se omite {model_dir.name}: {error}")
+        return added
+
+    def promote(self, version: str) -> ModelVersion:
+        """Make ``version`` the one loaded by the server on this machine."""
+
+        with self._lock:
+            data = self._load()
+            entry = data["versions"].get(version)
+            if entry is None:
+                raise KeyError(f"Versión de modelo desconocida: {version}")
+            model_dir = (self.root / entry["path"]).resolve()
+            if not (model_dir / "saved_model.pb").is_file():
+                raise FileNotFoundError(f"La versión {version} ya no tiene saved_model.pb en {model_dir}")
+            state = self._load_state()
+            if data["active"] != version:
+                state["previous"] = data["active"]
+            state["active"] = version
+            state["promoted_at"] = datetime.now().isoformat(timespec="seconds")
+            self._write(self.state_path, state)
+        return ModelVersion.from_dict(entry)
+
+    def record_latency(self, version: str, latency_ms: float, latency_p95_ms: Optional[float] = None) -> None:
+        with self._lock:
+            if version not in self._load_manifest()["versions"]:
+                return
+            state = self._load_state()
+            latency = state["latency"].setdefault(version, {})
+            latency["latency_ms"] = round(float(latency_ms), 3)
+            if latency_p95_ms is not None:
+                latency["latency_p95_ms"] = round(float(latency_p95_ms), 3)
+            self._write(self.state_path, state)
+
+    def snapshot(self) -> Dict[str, Any]:
+        data = self._load()
+        return {
+            "active": data["active"],
+            "previous": data.get("previous"),
+            "promoted_at": data.get("promoted_at"),
+            "versions": [entry.to_dict() for entry in self.versions()],
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Gestiona el registro de versiones del modelo de video")
+    parser.add_argument("--root", type=Path, default=config.DEPLOYED_MODELS_DIR, help="Carpeta con registry.json.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="Muestra las versiones registradas.")
+    commands.add_parser("scan", help="Registra las carpetas gesture_model_* nuevas.")
+    register = commands.add_parser("register", help="Registra una carpeta de modelo exportado.")
+    register.add_argument("model_dir", type=Path)
+    register.add_argument("--version", default=None)
+    promote = commands.add_parser("promote", help="Activa una versión en el servidor.")
+    promote.add_argument("version")
+    args = parser.parse_args(argv)
+
+    registry = ModelRegistry(args.root)
+    if args.command == "scan":
+        for entry in registry.scan():
+            print(f"➕ {entry.version} ({entry.path})")
+    elif args.command == "register":
+        entry = registry.register(args.model_dir, version=args.version)
+        print(f"➕ {entry.version} ({entry.path})")
+    elif args.command == "promote":
+        try:
+            entry = registry.promote(args.version)
+        except (KeyError, FileNotFoundError) as error:
+            print(f"❌ {error}")
+            return 1
+        print(f"✅ Versión activa: {entry.version}")
+
+    active = registry.active()
+    print(f"\n{'versión':<18} {'arquitectura':<16} {'entrada':>9} {'val_acc':>8} {'ms':>8}")
+    for entry in registry.versions():
+        marker = "★" if active is not None and entry.version == active.version else " "
+        val_accuracy = entry.metrics.get("val_accuracy")
+        print(
+            f"{marker}{entry.version:<17} {entry.architecture:<16} {'x'.join(map(str, entry.input_shape)):>9}"
+            f" {f'{val_accuracy:.3f}' if val_accuracy is not None else '-':>8}"
+            f" {f'{entry.latency_ms:.2f}' if entry.latency_ms is not None else '-':>8}"
+        )
+    return 0
+
+
+__all__ = [
+    "MODEL_DIR_PREFIX",
+    "ModelRegistry",
+    "ModelVersion",
+    "REGISTRY_FILE",
+    "STATE_FILE",
+    "describe_model",
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,301 @@
+"""Deterministic dataset splits and feature standardisation for training.
+
+Las particiones son estratificadas (cada seña aparece en entrenamiento y
+validación en la proporción pedida) y dependen solo de la semilla. Los índices
+y las estadísticas de normalización se guardan junto al dataset en
+``<dataset>_prep/`` para que ejecuciones repetidas (p. ej. barridos de
+hiperparámetros) no vuelvan a calcularlos.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+NORMALIZATION_FILE = "normalization.json"
+INPUT_SPEC_FILE = "input_spec.json"
+STATS_BATCH = 1024
+
+
+def _validation_quotas(counts: np.ndarray, validation_split: float, rng: np.random.Generator) -> np.ndarray:
+    """Validation samples per class, summing to the same total as a plain split.
+
+    Se reparte por restos mayores; las clases con al menos dos muestras que se
+    quedarían sin validación tienen prioridad, y los empates se resuelven con ``rng``.
+    """
+
+    total = int(counts.sum())
+    n_val = total - int(total * (1 - validation_split))
+    exact = counts * validation_split
+    quotas = np.minimum(np.floor(exact).astype(np.int64), counts)
+    missing = n_val - int(quotas.sum())
+    if missing > 0:
+        starved = (quotas == 0) & (counts >= 2)
+        remainder = exact - quotas
+        tiebreak = rng.random(len(counts))
+        eligible = np.flatnonzero(quotas < counts)
+        order = np.lexsort((tiebreak[eligible], -remainder[eligible], ~starved[eligible]))
+        quotas[eligible[order[:missing]]] += 1
+    return quotas
+
+
+def stratified_split(
+    labels: np.ndarray, validation_split: float, seed: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return shuffled ``(train, val)`` index arrays with per-class proportions."""
+
+    labels = np.asarray(labels)
+    rng = np.random.default_rng(seed)
+    classes, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+    quotas = _validation_quotas(counts, validation_split, rng)
+    train: List[np.ndarray] = []
+    val: List[np.ndarray] = []
+    for cls in range(len(classes)):
+        members = rng.permutation(np.flatnonzero(inverse == cls))
+        val.append(members[: quotas[cls]])
+        train.append(members[quotas[cls] :])
+    return rng.permutation(np.concatenate(train)), rng.permutation(np.concatenate(val))
+
+
+def stratified_kfold(
+    labels: np.ndarray, folds: int, seed: Optional[int] = None
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """``folds`` stratified ``(train, val)`` pairs; every sample is validated once."""
+
+    if folds < 2:
+        raise ValueError("Se necesitan al menos 2 folds")
+    labels = np.asarray(labels)
+    rng = np.random.default_rng(seed)
+    assignment = np.empty(len(labels), dtype=np.int64)
+    offset = 0
+    for cls in np.unique(labels):
+        members = rng.permutation(np.flatnonzero(labels == cls))
+        # Reparto circular continuo entre clases: los folds quedan equilibrados.
+        assignment[members] = (np.arange(len(members)) + offset) % folds
+        offset += len(members)
+    return [
+        (rng.permutation(np.flatnonzero(assignment != fold)), rng.permutation(np.flatnonzero(assignment == fold)))
+        for fold in range(folds)
+    ]
+
+
+def feature_statistics(
+    read: Callable[[np.ndarray], np.ndarray], indices: np.ndarray, batch: int = STATS_BATCH
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-feature mean/std over the frames of ``indices``, ignoring zero padding.
+
+    ``read`` devuelve ``(n, secuencia, rasgos)`` para un lote de índices, de modo
+    que sirve tanto para un arreglo en memoria como para un dataset en bloques.
+    """
+
+    total = None
+    total_sq = None
+    frames = 0
+    for start in range(0, len(indices), batch):
+        X = read(indices[start : start + batch])
+        rows = X.reshape(-1, X.shape[-1])
+        rows = rows[rows.any(axis=1)].astype(np.float64)
+        if total is None:
+            total = np.zeros(X.shape[-1])
+            total_sq = np.zeros(X.shape[-1])
+        total += rows.sum(axis=0)
+        total_sq += np.square(rows).sum(axis=0)
+        frames += len(rows)
+    if total is None or frames == 0:
+        raise ValueError("No hay frames con landmarks para calcular estadísticas")
+    mean = total / frames
+    std = np.sqrt(np.maximum(total_sq / frames - np.square(mean), 0.0))
+    std[std < 1e-6] = 1.0
+    return mean.astype(np.float32), std.astype(np.float32)
+
+
+def standardize(X: np.ndarray, mean: np.ndarray, std: np.ndarray) -> np.ndarray:
+    """Standardise ``X`` in place; all-zero (padding) frames stay zero for ``Masking``."""
+
+    padding = ~X.any(axis=-1, keepdims=True)
+    X -= mean
+    X /= std
+    np.copyto(X, 0.0, where=padding)
+    return X
+
+
+def save_normalization(model_dir: Path, mean: np.ndarray, std: np.ndarray) -> Path:
+    path = Path(model_dir) / NORMALIZATION_FILE
+    path.write_text(json.dumps({"mean": mean.tolist(), "std": std.tolist()}), encoding="utf-8")
+    return path
+
+
+def load_normalization(model_dir: Path) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    path = Path(model_dir) / NORMALIZATION_FILE
+    if not path.is_file():
+        return None
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return np.asarray(data["mean"], dtype=np.float32), np.asarray(data["std"], dtype=np.float32)
+
+
+@dataclass(frozen=True)
+class InputSpec:
+    """Temporal input of a trained model: ``window`` frames taken every ``stride``.
+
+    El modelo ve ``window`` frames submuestreados; la inferencia debe acumular
+    ``frames_required`` frames de cámara y quedarse con uno de cada ``stride``.
+    """
+
+    window: int
+    stride: int = 1
+    architecture: str = "lstm"
+
+    @property
+    def frames_required(self) -> int:
+        return (self.window - 1) * self.stride + 1
+
+    def select(self, X: np.ndarray) -> np.ndarray:
+        """``(n, frames, F)`` → the model input: last ``frames_required`` frames, strided."""
+
+        return X[:, -self.frames_required :: self.stride]
+
+
+def window_length(sequence_length: int, window: Optional[int], stride: int) -> int:
+    """Frames seen by the model when a ``sequence_length`` clip is read every ``stride``."""
+
+    available = -(-int(sequence_length) // max(1, int(stride)))
+    return available if not window else min(int(window), available)
+
+
+def apply_window(X: np.ndarray, window: int, stride: int) -> np.ndarray:
+    """Training counterpart of :meth:`InputSpec.select` for clips aligned to their start."""
+
+    if stride == 1 and window == X.shape[1]:
+        return X
+    return np.ascontiguousarray(X[:, : (window - 1) * stride + 1 : stride])
+
+
+def save_input_spec(model_dir: Path, spec: InputSpec) -> Path:
+    path = Path(model_dir) / INPUT_SPEC_FILE
+    path.write_text(
+        json.dumps({"window": spec.window, "stride": spec.stride, "architecture": spec.architecture}),
+        encoding="utf-8",
+    )
+    return path
+
+
+def load_input_spec(model_dir: Path) -> Optional[InputSpec]:
+    path = Path(model_dir) / INPUT_SPEC_FILE
+    if not path.is_file():
+        return None
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return InputSpec(int(data["window"]), int(data.get("stride", 1)), str(data.get("architecture", "lstm")))
+
+
+@dataclass
+class PreparedSplit:
+    train: np.ndarray
+    val: np.ndarray
+    mean: Optional[np.ndarray] = None
+    std: Optional[np.ndarray] = None
+    cached: bool = False
+
+
+class PreprocessingCache:
+    """Split indices and statistics stored in ``<dataset>_prep/<clave>.npz``.
+
+    La clave incluye una huella del dataset (tamaño y fecha del archivo, o del
+    ``index.json`` de un dataset en bloques) y los parámetros de la partición;
+    regenerar el dataset invalida la caché automáticamente.
+    """
+
+    def __init__(self, dataset_path: Path) -> None:
+        dataset_path = Path(dataset_path)
+        self.root = dataset_path.parent / f"{dataset_path.stem}_prep"
+        marker = dataset_path / "index.json" if dataset_path.is_dir() else dataset_path
+        stat = marker.stat()
+        self._fingerprint = {"path": dataset_path.name, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _path(self, params: Dict[str, object]) -> Path:
+        blob = json.dumps({"dataset": self._fingerprint, **params}, sort_keys=True).encode("utf-8")
+        return self.root / f"{hashlib.sha256(blob).hexdigest()[:16]}.npz"
+
+    def load(self, params: Dict[str, object]) -> Optional[Dict[str, np.ndarray]]:
+        path = self._path(params)
+        if not path.is_file():
+            return None
+        try:
+            with np.load(path) as data:
+                return {name: data[name] for name in data.files}
+        except (OSError, ValueError):
+            return None
+
+    def store(self, params: Dict[str, object], **arrays: np.ndarray) -> None:
+        path = self._path(params)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.stem}.tmp.npz")
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+
+
+def prepare_split(
+    labels: np.ndarray,
+    *,
+    validation_split: float,
+    seed: Optional[int],
+    folds: int = 0,
+    fold: int = 0,
+    read: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+    cache: Optional[PreprocessingCache] = None,
+) -> PreparedSplit:
+    """Resolve the train/val indices (and stats when ``read`` is given), using ``cache``.
+
+    Sin semilla la partición no es reproducible y no se guarda en caché.
+    """
+
+    if folds and not 0 <= fold < folds:
+        raise ValueError(f"--fold debe estar entre 0 y {folds - 1}")
+    params: Dict[str, object] = {"seed": seed, "folds": folds}
+    params.update({"fold": fold} if folds else {"validation_split": validation_split})
+    if seed is None:
+        cache = None
+
+    stored = cache.load(params) if cache is not None else None
+    if stored is not None and (read is None or "mean" in stored):
+        return PreparedSplit(stored["train"], stored["val"], stored.get("mean"), stored.get("std"), cached=True)
+
+    if stored is not None:
+        train, val = stored["train"], stored["val"]
+    elif folds:
+        train, val = stratified_kfold(labels, folds, seed)[fold]
+    else:
+        train, val = stratified_split(labels, validation_split, seed)
+
+    arrays: Dict[str, np.ndarray] = {"train": train, "val": val}
+    if read is not None:
+        # Orden ascendente: lectura secuencial del disco; el resultado no depende del orden.
+        arrays["mean"], arrays["std"] = feature_statistics(read, np.sort(train))
+    if cache is not None:
+        cache.store(params, **arrays)
+    return PreparedSplit(train, val, arrays.get("mean"), arrays.get("std"))
+
+
+__all__ = [
+    "INPUT_SPEC_FILE",
+    "InputSpec",
+    "NORMALIZATION_FILE",
+    "PreparedSplit",
+    "PreprocessingCache",
+    "apply_window",
+    "feature_statistics",
+    "load_input_spec",
+    "load_normalization",
+    "prepare_split",
+    "save_input_spec",
+    "save_normalization",
+    "standardize",
+    "stratified_kfold",
+    "stratified_split",
+    "window_length",
+]
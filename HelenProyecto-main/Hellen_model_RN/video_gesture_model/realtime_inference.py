@@ -10,9 +10,8 @@ import json
 import time
 import urllib.error
 import urllib.request
-from collections import deque
 from pathlib import Path
-from typing import Callable, Deque, Dict, Optional
+from typing import Callable, Dict, Optional
 
 import cv2
 import mediapipe as mp
@@ -23,11 +22,15 @@ import tensorflow as tf
 try:
     from . import config
     from .cli_utils import list_saved_models, prompt_for_model_dir
-    from .extract_landmarks import normalise_landmarks
+    from .extract_landmarks import fill_frame_landmarks, normalise_landmarks
+    from .preprocessing import load_input_spec, load_normalization, standardize
+    from .sequence_buffer import SequenceBuffer
 except Exception:
     import config  # type: ignore
     from cli_utils import list_saved_models, prompt_for_model_dir  # type: ignore
-    from extract_landmarks import normalise_landmarks  # type: ignore
+    from extract_landmarks import fill_frame_landmarks, normalise_landmarks  # type: ignore
+    from preprocessing import load_input_spec, load_normalization, standardize  # type: ignore
+    from sequence_buffer import SequenceBuffer  # type: ignore
 
 
 def parse_args() -> argparse.Namespace:
@@ -75,6 +78,29 @@ def load_label_map(path: Path) -> Dict[int, str]:
     return {idx: gesture for gesture, idx in data.items()}
 
 
+def _with_preprocessing(
+    predict: Callable[[np.ndarray], np.ndarray], model_dir: Path
+) -> Callable[[np.ndarray], np.ndarray]:
+    """Aplicar ``input_spec.json`` (ventana/stride) y ``normalization.json`` antes de predecir.
+
+    La función resultante recibe ``(1, frames_required, F)`` frames consecutivos de cámara.
+    """
+    spec = load_input_spec(model_dir)
+    stats = load_normalization(model_dir)
+    if stats is None and spec is None:
+        return predict
+
+    def _predict(x: np.ndarray) -> np.ndarray:
+        if spec is not None:
+            x = spec.select(x)
+        if stats is None:
+            return predict(np.ascontiguousarray(x, dtype=np.float32))
+        # Copia: la ventana recibida suele ser una vista del búfer circular.
+        return predict(standardize(np.array(x, dtype=np.float32), *stats))
+
+    return _predict
+
+
 def build_predict_fn(model_path: Path) -> Callable[[np.ndarray], np.ndarray]:
     """
     Devuelve una función predict(x: np.ndarray)->np.ndarray que entrega
@@ -110,7 +136,7 @@ def build_predict_fn(model_path: Path) -> Callable[[np.ndarray], np.ndarray]:
             y = out[output_name].numpy()
             return y  # shape (1, num_classes)
 
-        return _predict
+        return _with_preprocessing(_predict, saved_model_dir)
 
     # Si es archivo .keras / .h5 cargamos con Keras
     if model_path.suffix.lower() in {".keras", ".h5"} or model_path.is_file():
@@ -249,7 +275,10 @@ def main() -> None:
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.FRAME_WIDTH)
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.FRAME_HEIGHT)
 
-    buffer: Deque[np.ndarray] = deque(maxlen=args.sequence_length)
+    # Modelos con ventana/stride propios indican cuántos frames de cámara necesitan.
+    spec = load_input_spec(model_dir_or_file) if Path(model_dir_or_file).is_dir() else None
+    sequence_length = spec.frames_required if spec is not None else args.sequence_length
+    buffer = SequenceBuffer(sequence_length, config.FEATURE_SIZE)
 
     print(
         "Presiona 'q' en la ventana de video para salir. Umbral de confianza:",
@@ -265,31 +294,20 @@ def main() -> None:
             frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             results = hands.process(frame_rgb)
 
-            frame_features = np.zeros(
-                (config.MAX_HANDS, config.NUM_HAND_LANDMARKS, config.LANDMARK_DIM),
-                dtype=np.float32,
-            )
-            if results.multi_hand_landmarks and results.multi_handedness:
-                ordering = {"Left": 0, "Right": 1}
-                for hand_landmarks, handedness in zip(
-                    results.multi_hand_landmarks, results.multi_handedness
-                ):
-                    label = handedness.classification[0].label
-                    idx = ordering.get(label, 0)
-                    coords = np.array(
-                        [[lm.x, lm.y, lm.z] for lm in hand_landmarks.landmark],
-                        dtype=np.float32,
-                    )
-                    frame_features[idx] = coords
-                    drawing.draw_landmarks(
-                        frame, hand_landmarks, mp.solutions.hands.HAND_CONNECTIONS
-                    )
+            # Cada frame se escribe en su fila de la ventana preasignada.
+            row = buffer.slot()
+            fill_frame_landmarks(row, results.multi_hand_landmarks, results.multi_handedness)
+            for hand_landmarks in results.multi_hand_landmarks or ():
+                drawing.draw_landmarks(
+                    frame, hand_landmarks, mp.solutions.hands.HAND_CONNECTIONS
+                )
 
-            buffer.append(normalise_landmarks(frame_features.flatten()))
+            normalise_landmarks(row)
+            buffer.commit()
 
-            if len(buffer) == args.sequence_length:
-                # Cuando el buffer está lleno se construye el tensor y se predice la etiqueta.
-                input_tensor = np.expand_dims(np.array(buffer, dtype=np.float32), axis=0)
+            if buffer.full:
+                # Cuando el buffer está lleno la ventana contigua se pasa al modelo sin copiarla.
+                input_tensor = buffer.batch()
                 probabilities = predict(input_tensor)[0]  # (num_classes,)
                 pred_idx = int(np.argmax(probabilities))
                 confidence = float(probabilities[pred_idx])
@@ -0,0 +1,87 @@
+"""Preallocated sliding window of landmark frames for the video model.
+
+La ventana temporal del modelo (``SEQUENCE_LENGTH`` × ``FEATURE_SIZE``) vive en
+un único arreglo float32 reservado al inicio: cada frame se escribe en su lugar
+y el clasificador lee la ventana contigua sin construir listas ni copiar.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from . import config
+except ImportError:  # ejecución directa
+    import config  # type: ignore
+
+
+class SequenceBuffer:
+    """Circular ``(length, feature_size)`` float32 window with a contiguous view.
+
+    Every frame is stored twice, at row ``i`` and ``i + length`` of a
+    ``(2 * length, feature_size)`` array, so the most recent ``length``
+    frames are always the contiguous slice ``[start, start + length)`` in
+    chronological order. :meth:`window` therefore returns a view, never a
+    copy. Writers either :meth:`append` a frame or fill :meth:`slot` in place
+    and :meth:`commit` it.
+    """
+
+    def __init__(self, length: int = config.SEQUENCE_LENGTH, feature_size: int = config.FEATURE_SIZE) -> None:
+        if length <= 0 or feature_size <= 0:
+            raise ValueError("length y feature_size deben ser positivos")
+        self.length = int(length)
+        self.feature_size = int(feature_size)
+        self._data = np.zeros((2 * self.length, self.feature_size), dtype=np.float32)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return min(self._count, self.length)
+
+    @property
+    def full(self) -> bool:
+        return self._count >= self.length
+
+    @property
+    def frames_written(self) -> int:
+        return self._count
+
+    def slot(self) -> np.ndarray:
+        """Writable row for the next frame; call :meth:`commit` once it is filled."""
+
+        return self._data[self._count % self.length]
+
+    def commit(self) -> None:
+        index = self._count % self.length
+        self._data[index + self.length] = self._data[index]
+        self._count += 1
+
+    def append(self, frame: np.ndarray) -> None:
+        self.slot()[:] = frame
+        self.commit()
+
+    def window(self) -> np.ndarray:
+        """Chronological view of the last ``len(self)`` frames (no copy)."""
+
+        if self._count < self.length:
+            return self._data[: self._count]
+        start = self._count % self.length
+        return self._data[start : start + self.length]
+
+    def batch(self) -> np.ndarray:
+        """``(1, length, feature_size)`` view ready for the model."""
+
+        return self.window()[np.newaxis]
+
+    def clear(self) -> None:
+        self._count = 0
+
+    def resized(self, length: int) -> "SequenceBuffer":
+        """New buffer of ``length`` frames seeded with the most recent frames of this one."""
+
+        buffer = SequenceBuffer(length, self.feature_size)
+        for frame in self.window()[-buffer.length :]:
+            buffer.append(frame)
+        return buffer
+
+
+__all__ = ["SequenceBuffer"]
@@ -0,0 +1,203 @@
+"""Sharded, memory-mappable landmark dataset and its streaming ``tf.data`` loader.
+
+El formato ``.npz`` comprimido obliga a cargar ``X`` completo en memoria. Aquí
+el dataset es un directorio con:
+
+* ``X_00000.npy``, ``X_00001.npy``...: bloques ``(muestras, secuencia, rasgos)``
+  float32 sin comprimir, que se abren con ``mmap_mode="r"``;
+* ``y.npy``: todas las etiquetas (pequeño, se carga completo);
+* ``index.json``: forma, tamaño de bloque, mapa de etiquetas. Se escribe al
+  final, por lo que su presencia indica que el dataset está completo.
+
+El entrenamiento solo baraja índices y lee del disco las filas de cada batch.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+try:  # TensorFlow solo es necesario para el cargador de entrenamiento
+    import tensorflow as tf
+except ImportError:  # pragma: no cover - depende del entorno
+    tf = None  # type: ignore
+
+INDEX_FILE = "index.json"
+LABELS_FILE = "y.npy"
+FORMAT_VERSION = 1
+DEFAULT_SHARD_SIZE = 512
+
+
+def _shard_name(shard: int) -> str:
+    return f"X_{shard:05d}.npy"
+
+
+def is_sharded_dataset(path: Path) -> bool:
+    return (Path(path) / INDEX_FILE).is_file()
+
+
+class ShardedDatasetWriter:
+    """Write ``num_samples`` sequences straight into memory-mapped shards.
+
+    El dataset se construye en ``<destino>.tmp`` y solo reemplaza al destino en
+    :meth:`close`, de modo que una extracción interrumpida no deja un dataset a
+    medias con apariencia de completo.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        num_samples: int,
+        sequence_length: int,
+        feature_size: int,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+    ) -> None:
+        if num_samples <= 0 or shard_size <= 0:
+            raise ValueError("num_samples y shard_size deben ser positivos")
+        self.root = Path(root)
+        self.num_samples = int(num_samples)
+        self.sequence_length = int(sequence_length)
+        self.feature_size = int(feature_size)
+        self.shard_size = int(shard_size)
+        self._tmp_root = self.root.with_name(f"{self.root.name}.tmp")
+        if self._tmp_root.exists():
+            shutil.rmtree(self._tmp_root)
+        self._tmp_root.mkdir(parents=True)
+        self._shards: List[np.memmap] = []
+        for start in range(0, self.num_samples, self.shard_size):
+            count = min(self.shard_size, self.num_samples - start)
+            self._shards.append(
+                np.lib.format.open_memmap(
+                    self._tmp_root / _shard_name(len(self._shards)),
+                    mode="w+",
+                    dtype=np.float32,
+                    shape=(count, self.sequence_length, self.feature_size),
+                )
+            )
+
+    def row(self, index: int) -> np.ndarray:
+        """Writable ``(sequence_length, feature_size)`` view of sample ``index``."""
+
+        shard, offset = divmod(int(index), self.shard_size)
+        return self._shards[shard][offset]
+
+    def close(self, labels: np.ndarray, label_map: Optional[Mapping[str, int]] = None) -> Path:
+        labels = np.asarray(labels, dtype=np.int64)
+        if labels.shape != (self.num_samples,):
+            raise ValueError("Se esperaba una etiqueta por muestra")
+        for shard in self._shards:
+            shard.flush()
+        self._shards = []
+        np.save(self._tmp_root / LABELS_FILE, labels)
+        index = {
+            "version": FORMAT_VERSION,
+            "num_samples": self.num_samples,
+            "sequence_length": self.sequence_length,
+            "feature_size": self.feature_size,
+            "shard_size": self.shard_size,
+            "shards": [_shard_name(i) for i in range(-(-self.num_samples // self.shard_size))],
+            "label_map": dict(label_map or {}),
+        }
+        (self._tmp_root / INDEX_FILE).write_text(json.dumps(index, ensure_ascii=False, indent=2), encoding="utf-8")
+        if self.root.exists():
+            shutil.rmtree(self.root)
+        os.replace(self._tmp_root, self.root)
+        return self.root
+
+
+class ShardedDataset:
+    """Read-only view over a sharded dataset directory; samples stay on disk."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        index_path = self.root / INDEX_FILE
+        if not index_path.is_file():
+            raise FileNotFoundError(f"No se encontró {INDEX_FILE} en {self.root}")
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        if index.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Versión de dataset no soportada: {index.get('version')}")
+        self.num_samples = int(index["num_samples"])
+        self.sequence_length = int(index["sequence_length"])
+        self.feature_size = int(index["feature_size"])
+        self.shard_size = int(index["shard_size"])
+        self.label_map: Dict[str, int] = dict(index.get("label_map") or {})
+        self._shards = [np.load(self.root / name, mmap_mode="r") for name in index["shards"]]
+        self.labels = np.load(self.root / LABELS_FILE)
+
+    def __len__(self) -> int:
+        return self.num_samples
+
+    def read(self, indices: Sequence[int]) -> np.ndarray:
+        """Gather the given samples into a new ``(len(indices), L, F)`` array.
+
+        Los índices se agrupan por bloque y se leen en orden ascendente dentro
+        de cada uno, para que el acceso al disco sea lo más secuencial posible.
+        """
+
+        indices = np.asarray(indices, dtype=np.int64)
+        out = np.empty((len(indices), self.sequence_length, self.feature_size), dtype=np.float32)
+        shards, offsets = np.divmod(indices, self.shard_size)
+        for shard in np.unique(shards):
+            positions = np.flatnonzero(shards == shard)
+            order = np.argsort(offsets[positions], kind="stable")
+            positions = positions[order]
+            out[positions] = self._shards[int(shard)][offsets[positions]]
+        return out
+
+
+def make_tf_dataset(
+    dataset: ShardedDataset,
+    indices: Sequence[int],
+    batch_size: int,
+    *,
+    shuffle: bool = True,
+    seed: Optional[int] = None,
+    transform: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+    sequence_length: Optional[int] = None,
+):
+    """Stream ``(X, y)`` batches of ``indices`` from disk with prefetching.
+
+    Solo se barajan los índices (enteros); cada batch se lee de los bloques
+    mapeados en memoria con una llamada a :meth:`ShardedDataset.read` y, si se
+    indica, pasa por ``transform`` (p. ej. la estandarización) antes de entregarse.
+    ``sequence_length`` es la longitud temporal de salida si ``transform`` la cambia.
+    """
+
+    if tf is None:
+        raise RuntimeError("TensorFlow no está disponible para construir el cargador")
+
+    indices = np.asarray(indices, dtype=np.int64)
+    labels = dataset.labels
+
+    def _load(batch_indices: np.ndarray):
+        X = dataset.read(batch_indices)
+        if transform is not None:
+            X = transform(X)
+        return X, labels[batch_indices]
+
+    def _load_batch(batch_indices):
+        X, y = tf.numpy_function(_load, [batch_indices], (tf.float32, tf.int64))
+        X.set_shape((None, sequence_length or dataset.sequence_length, dataset.feature_size))
+        y.set_shape((None,))
+        return X, y
+
+    pipeline = tf.data.Dataset.from_tensor_slices(indices)
+    if shuffle:
+        pipeline = pipeline.shuffle(len(indices), seed=seed, reshuffle_each_iteration=True)
+    pipeline = pipeline.batch(batch_size)
+    pipeline = pipeline.map(_load_batch, num_parallel_calls=tf.data.AUTOTUNE)
+    return pipeline.prefetch(tf.data.AUTOTUNE)
+
+
+__all__ = [
+    "DEFAULT_SHARD_SIZE",
+    "ShardedDataset",
+    "ShardedDatasetWriter",
+    "is_sharded_dataset",
+    "make_tf_dataset",
+]
@@ -0,0 +1,94 @@
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from Hellen_model_RN.video_gesture_model import config
+from Hellen_model_RN.video_gesture_model.extract_landmarks import fill_frame_landmarks, normalise_landmarks
+
+
+def _hand(offset):
+    points = [
+        SimpleNamespace(x=offset + i * 0.01, y=offset + i * 0.02, z=-i * 0.001)
+        for i in range(config.NUM_HAND_LANDMARKS)
+    ]
+    return SimpleNamespace(landmark=points)
+
+
+def _handedness(label):
+    return SimpleNamespace(classification=[SimpleNamespace(label=label)])
+
+
+def test_batched_normalisation_matches_per_frame_and_skips_missing_hands():
+    sequence = np.zeros((3, config.FEATURE_SIZE), dtype=np.float32)
+    assert fill_frame_landmarks(sequence[0], [_hand(0.2)], [_handedness("Right")]) == 1
+    assert fill_frame_landmarks(sequence[1], [_hand(0.1), _hand(0.5)], [_handedness("Left"), _handedness("Right")]) == 1
+    assert fill_frame_landmarks(sequence[2], None, None) == -1
+
+    per_frame = [normalise_landmarks(row.copy()) for row in sequence]
+    result = normalise_landmarks(sequence)
+
+    assert result.shape == (3, config.FEATURE_SIZE)
+    assert np.shares_memory(result, sequence)
+    np.testing.assert_allclose(sequence, np.stack(per_frame))
+
+    hands = sequence.reshape(3, config.MAX_HANDS, config.NUM_HAND_LANDMARKS, config.LANDMARK_DIM)
+    assert not hands[0, 0].any()  # la mano izquierda ausente sigue en cero
+    assert not hands[:, :, 0].any()  # todas las muñecas quedan en el origen
+    np.testing.assert_allclose(hands[1, 1, 1], [0.01, 0.02, -0.001], rtol=1e-5)
+
+
+def test_rebuild_only_processes_new_clips_and_reslices_cached_ones(monkeypatch, tmp_path):
+    from Hellen_model_RN.video_gesture_model import extract_landmarks
+
+    videos_dir = tmp_path / "raw_videos"
+    features_dir = tmp_path / "features"
+    (videos_dir / "Hola").mkdir(parents=True)
+    (videos_dir / "Hola" / "a.mp4").write_bytes(b"clip-a")
+    (videos_dir / "Hola" / "b.mp4").write_bytes(b"clip-b")
+    monkeypatch.setattr(config, "VIDEOS_DIR", videos_dir)
+    monkeypatch.setattr(config, "FEATURES_DIR", features_dir)
+    monkeypatch.setattr(config, "LANDMARK_CACHE_DIR", features_dir / "landmark_cache")
+    monkeypatch.setattr(extract_landmarks, "_create_hands", lambda: SimpleNamespace(close=lambda: None))
+
+    processed = []
+
+    def fake_extract(video_path, hands, max_frames=None):
+        processed.append(video_path.name)
+        if video_path.name == "b.mp4" and processed.count("b.mp4") == 1:
+            raise RuntimeError("corte simulado")
+        frames = np.arange(6, dtype=np.float32)[:, None] + np.zeros(config.FEATURE_SIZE, np.float32)
+        return frames
+
+    monkeypatch.setattr(extract_landmarks, "extract_frames", fake_extract)
+
+    def run(*extra):
+        monkeypatch.setattr(sys, "argv", ["extract_landmarks", "Hola", "--output", "ds", *extra])
+        extract_landmarks.main()
+        with np.load(features_dir / "ds.npz") as dataset:
+            return dataset["X"]
+
+    try:
+        run("--sequence-length", "4")
+    except RuntimeError:
+        pass
+    assert run("--sequence-length", "4")[:, :, 0].tolist() == [[0, 1, 2, 3]] * 2
+    assert processed == ["a.mp4", "b.mp4", "b.mp4"]
+
+    # Un clip nuevo y otra longitud: solo se procesa el clip nuevo.
+    (videos_dir / "Hola" / "c.mp4").write_bytes(b"clip-c")
+    X = run("--sequence-length", "8")
+    assert processed[3:] == ["c.mp4"]
+    assert X.shape == (3, 8, config.FEATURE_SIZE)
+    assert X[0, :, 0].tolist() == [0, 1, 2, 3, 4, 5, 0, 0]
+
+    # Cambiar los parámetros de MediaPipe invalida la caché.
+    monkeypatch.setattr(extract_landmarks, "MIN_DETECTION_CONFIDENCE", 0.7)
+    run()
+    assert sorted(processed[4:]) == ["a.mp4", "b.mp4", "c.mp4"]
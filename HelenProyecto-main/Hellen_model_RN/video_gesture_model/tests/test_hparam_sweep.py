@@ -0,0 +1,56 @@
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from Hellen_model_RN.video_gesture_model import hparam_sweep
+
+
+def test_random_search_samples_the_grid_and_leaderboard_ranks_accuracy_then_latency():
+    args = hparam_sweep.parse_args(
+        ["--lstm-units", "64,32", "32,16", "--dense-units", "48", "24", "--mode", "random", "--trials", "3"]
+    )
+    trials = hparam_sweep.build_trials(args)
+    assert len(trials) == 3
+    assert trials == hparam_sweep.build_trials(args)  # misma semilla, mismas pruebas
+    assert {trial["lstm_units"] for trial in trials} <= {(64, 32), (32, 16)}
+
+    ranked = hparam_sweep.rank_results(
+        [
+            {"trial": 0, "status": "completed", "val_accuracy": 0.9, "latency_ms": 9.0},
+            {"trial": 1, "status": "pruned", "val_accuracy": 0.4},
+            {"trial": 2, "status": "completed", "val_accuracy": 0.9, "latency_ms": 4.0},
+            {"trial": 3, "status": "completed", "val_accuracy": 0.8, "latency_ms": 2.0},
+        ]
+    )
+    assert [row["trial"] for row in ranked] == [2, 0, 3, 1]
+    assert {row["trial"] for row in ranked if row.get("pareto")} == {2, 3}
+
+
+def test_latency_is_measured_serially_after_training_for_completed_trials_only(tmp_path):
+    measured = []
+
+    def build_predict(model_dir):
+        def predict(sample):
+            measured.append((model_dir.name, sample.shape))
+
+        return predict
+
+    results = [
+        {"trial": 2, "status": "completed", "model_dir": str(tmp_path / "trial_002"), "frames_required": 12, "feature_dim": 126},
+        {"trial": 1, "status": "pruned"},
+        {"trial": 0, "status": "completed", "model_dir": str(tmp_path / "trial_000"), "frames_required": 8, "feature_dim": 126},
+    ]
+    hparam_sweep.measure_completed(results, build_predict=build_predict, runs=3)
+
+    order = [name for name, _ in measured]
+    # Una prueba termina de medirse antes de empezar la siguiente, en orden de prueba.
+    assert order == ["trial_000"] * (hparam_sweep.LATENCY_WARMUP_RUNS + 3) + ["trial_002"] * (
+        hparam_sweep.LATENCY_WARMUP_RUNS + 3
+    )
+    assert measured[0][1] == (1, 8, 126)
+    assert results[0]["latency_ms"] >= 0.0 and results[2]["latency_p95_ms"] >= 0.0
+    assert "latency_ms" not in results[1]
@@ -0,0 +1,63 @@
+from pathlib import Path
+import sys
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from Hellen_model_RN.video_gesture_model.preprocessing import (
+    PreprocessingCache,
+    prepare_split,
+    standardize,
+    stratified_kfold,
+    stratified_split,
+)
+
+
+def test_stratified_split_is_seeded_and_keeps_rare_gestures_on_both_sides():
+    labels = np.array([0] * 20 + [1] * 8 + [2] * 2)
+
+    train, val = stratified_split(labels, 0.25, seed=7)
+    again_train, again_val = stratified_split(labels, 0.25, seed=7)
+    np.testing.assert_array_equal(train, again_train)
+    np.testing.assert_array_equal(val, again_val)
+
+    assert len(val) == 30 - int(30 * 0.75)
+    assert sorted(np.concatenate([train, val]).tolist()) == list(range(30))
+    for cls in (0, 1, 2):
+        assert (labels[val] == cls).any() and (labels[train] == cls).any()
+
+    folds = stratified_kfold(labels, 4, seed=7)
+    validated = np.concatenate([fold_val for _, fold_val in folds])
+    assert sorted(validated.tolist()) == list(range(30))
+    assert all(np.bincount(labels[fold_val], minlength=3)[0] == 5 for _, fold_val in folds)
+
+
+def test_split_and_statistics_are_cached_next_to_the_dataset(tmp_path):
+    X = np.random.default_rng(0).normal(3.0, 2.0, size=(12, 5, 4)).astype(np.float32)
+    X[:, -1] = 0.0  # padding
+    labels = np.arange(12) % 3
+    dataset_path = tmp_path / "ds.npz"
+    np.savez(dataset_path, X=X, y=labels)
+
+    reads = []
+
+    def read(indices):
+        reads.append(len(indices))
+        return X[indices]
+
+    first = prepare_split(labels, validation_split=0.25, seed=1, read=read, cache=PreprocessingCache(dataset_path))
+    second = prepare_split(labels, validation_split=0.25, seed=1, read=read, cache=PreprocessingCache(dataset_path))
+    assert not first.cached and second.cached and reads == [9]
+    np.testing.assert_array_equal(first.train, second.train)
+    np.testing.assert_allclose(first.mean, second.mean)
+    assert (tmp_path / "ds_prep").is_dir()
+
+    standardized = standardize(X[first.train], first.mean, first.std)
+    frames = standardized[:, :-1].reshape(-1, 4)
+    np.testing.assert_allclose(frames.mean(axis=0), 0.0, atol=1e-5)
+    np.testing.assert_allclose(frames.std(axis=0), 1.0, atol=1e-4)
+    assert not standardized[:, -1].any()
@@ -0,0 +1,48 @@
+from pathlib import Path
+import sys
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from Hellen_model_RN.video_gesture_model.sequence_buffer import SequenceBuffer
+
+
+def test_window_is_a_chronological_view_without_copies():
+    buffer = SequenceBuffer(length=4, feature_size=3)
+    assert len(buffer) == 0 and not buffer.full
+
+    for index in range(3):
+        buffer.append(np.full(3, index, dtype=np.float32))
+    assert buffer.window()[:, 0].tolist() == [0, 1, 2]
+
+    for index in range(3, 10):
+        slot = buffer.slot()
+        slot[:] = index  # escritura en el lugar, como hace el flujo de cámara
+        buffer.commit()
+        window = buffer.window()
+        assert window[:, 0].tolist() == [index - 3, index - 2, index - 1, index]
+        assert window.flags.c_contiguous
+        assert np.shares_memory(window, buffer.batch())
+
+    assert buffer.batch().shape == (1, 4, 3)
+    assert buffer.frames_written == 10
+    buffer.clear()
+    assert len(buffer) == 0
+
+
+def test_resized_keeps_the_most_recent_frames():
+    buffer = SequenceBuffer(length=4, feature_size=2)
+    for index in range(6):
+        buffer.append(np.full(2, index, dtype=np.float32))
+
+    shorter = buffer.resized(2)
+    assert shorter.full and shorter.window()[:, 0].tolist() == [4, 5]
+
+    longer = buffer.resized(6)
+    assert not longer.full and longer.window()[:, 0].tolist() == [2, 3, 4, 5]
+    longer.append(np.full(2, 6, dtype=np.float32))
+    assert longer.window()[:, 0].tolist() == [2, 3, 4, 5, 6]
@@ -0,0 +1,38 @@
+from pathlib import Path
+import sys
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from Hellen_model_RN.video_gesture_model.sharded_dataset import (
+    ShardedDataset,
+    ShardedDatasetWriter,
+    is_sharded_dataset,
+    make_tf_dataset,
+)
+
+
+def test_sharded_dataset_streams_shuffled_batches_from_disk(tmp_path):
+    root = tmp_path / "ds"
+    writer = ShardedDatasetWriter(root, num_samples=7, sequence_length=4, feature_size=2, shard_size=3)
+    assert not is_sharded_dataset(root)
+    for index in range(7):
+        writer.row(index)[:] = index
+    writer.close(np.arange(7) % 2, {"A": 0, "B": 1})
+
+    dataset = ShardedDataset(root)
+    assert len(dataset) == 7 and dataset.label_map == {"A": 0, "B": 1}
+    assert sorted(path.name for path in root.glob("X_*.npy")) == ["X_00000.npy", "X_00001.npy", "X_00002.npy"]
+    np.testing.assert_array_equal(dataset.read([6, 0, 4])[:, 0, 0], [6, 0, 4])
+
+    seen = []
+    for X, y in make_tf_dataset(dataset, np.arange(1, 7), batch_size=4, seed=3):
+        ids = X.numpy()[:, 0, 0].astype(int)
+        assert X.shape[1:] == (4, 2)
+        np.testing.assert_array_equal(y.numpy(), ids % 2)
+        seen.extend(ids.tolist())
+    assert sorted(seen) == [1, 2, 3, 4, 5, 6]
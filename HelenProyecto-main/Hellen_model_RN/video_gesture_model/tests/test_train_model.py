@@ -90,3 +90,54 @@ def test_load_data_splits_dataset(tmp_path):
     shuffled_X = combined_X.reshape(num_samples, -1)
     assert {tuple(row) for row in original_X} == {tuple(row) for row in shuffled_X}
     assert set(y.tolist()) == set(combined_y.tolist())
+
+
+def test_latency_oriented_architectures_build_and_accept_windows():
+    feature_dim = config_module.FEATURE_SIZE
+    for architecture in train_model.ARCHITECTURES:
+        model = train_model.build_model(
+            num_classes=3,
+            sequence_length=12,
+            feature_dim=feature_dim,
+            lstm_units=(8, 4),
+            dense_units=4,
+            dropout=0.1,
+            architecture=architecture,
+        )
+        assert model(tf.zeros((2, 12, feature_dim)), training=False).shape == (2, 3)
+
+    subset = [layer for layer in model.layers if isinstance(layer, train_model.FeatureSubset)]
+    assert subset and len(subset[0].indices) == 2 * len(train_model.SUBSAMPLED_LANDMARKS) * 3
+
+    from video_gesture_model.preprocessing import InputSpec, apply_window, window_length
+
+    clips = np.arange(2 * 96 * 1, dtype=np.float32).reshape(2, 96, 1)
+    frames = window_length(96, 24, 2)
+    spec = InputSpec(frames, 2)
+    assert frames == 24 and spec.frames_required == 47
+    train_window = apply_window(clips, frames, 2)
+    np.testing.assert_array_equal(train_window, spec.select(clips[:, : spec.frames_required]))
+
+
+def test_tcn_pooling_ignores_padding_frames():
+    tf.keras.utils.set_random_seed(0)
+    model = train_model.build_model(
+        num_classes=3,
+        sequence_length=8,
+        feature_dim=4,
+        lstm_units=(6, 6),
+        dense_units=4,
+        dropout=0.0,
+        architecture="tcn",
+    )
+    convolutions = [layer for layer in model.layers if isinstance(layer, tf.keras.layers.Conv1D)]
+    bias = convolutions[-1].bias
+    bias.assign(tf.fill(bias.shape, 100.0))  # con sesgo, los frames de padding dejan de dar cero
+
+    frames = np.random.default_rng(0).normal(size=(1, 8, 4)).astype(np.float32)
+    frames[:, 5:] = 0.0
+    pooling = next(layer for layer in model.layers if isinstance(layer, train_model.PaddingMaskedMaxPooling1D))
+    pooled = tf.keras.Model(model.input, pooling.output)
+    features = tf.keras.Model(model.input, convolutions[-1].output)(frames).numpy()
+
+    np.testing.assert_allclose(pooled(frames).numpy(), features[:, :5].max(axis=1), rtol=1e-6)
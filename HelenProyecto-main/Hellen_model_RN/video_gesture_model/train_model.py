@@ -7,9 +7,11 @@ from __future__ import annotations
 
 import argparse
 import json
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import tensorflow as tf
@@ -18,9 +20,40 @@ import tensorflow as tf
 try:
     from . import config
     from .cli_utils import summarise_distribution
+    from .model_registry import ModelRegistry
+    from .preprocessing import (
+        InputSpec,
+        PreparedSplit,
+        PreprocessingCache,
+        apply_window,
+        prepare_split,
+        save_input_spec,
+        save_normalization,
+        standardize,
+        window_length,
+    )
+    from .sharded_dataset import ShardedDataset, is_sharded_dataset, make_tf_dataset
 except Exception:
     import config  # type: ignore
     from cli_utils import summarise_distribution  # type: ignore
+    from model_registry import ModelRegistry  # type: ignore
+    from preprocessing import (  # type: ignore
+        InputSpec,
+        PreparedSplit,
+        PreprocessingCache,
+        apply_window,
+        prepare_split,
+        save_input_spec,
+        save_normalization,
+        standardize,
+        window_length,
+    )
+    from sharded_dataset import ShardedDataset, is_sharded_dataset, make_tf_dataset  # type: ignore
+
+
+ARCHITECTURES = ("lstm", "gru", "tcn", "lstm_subsampled")
+# Muñeca, nudillos (MCP) y puntas de los dedos: 10 de los 21 landmarks por mano.
+SUBSAMPLED_LANDMARKS = (0, 4, 5, 8, 9, 12, 13, 16, 17, 20)
 
 
 def parse_args() -> argparse.Namespace:
@@ -30,7 +63,10 @@ def parse_args() -> argparse.Namespace:
         "--dataset",
         type=Path,
         default=config.FEATURES_DIR / "gesture_dataset.npz",
-        help="Path to the .npz file containing arrays X and y.",
+        help=(
+            "Path to the .npz file containing arrays X and y, or to a sharded dataset "
+            "directory (extract_landmarks --format sharded) streamed from disk."
+        ),
     )
     parser.add_argument(
         "--labels",
@@ -52,6 +88,27 @@ def parse_args() -> argparse.Namespace:
         default=0.25,
         help="Porcentaje de muestras reservado para validación (0-1).",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Semilla de la partición estratificada y de TensorFlow (ejecuciones comparables).",
+    )
+    parser.add_argument(
+        "--folds",
+        type=int,
+        default=0,
+        help="Validación cruzada estratificada en K folds (0 = partición simple con --validation-split).",
+    )
+    parser.add_argument("--fold", type=int, default=0, help="Fold usado como validación con --folds.")
+    parser.add_argument(
+        "--standardize",
+        action="store_true",
+        help=(
+            "Estandarizar cada rasgo con la media/desviación del entrenamiento; se guardan en "
+            "normalization.json junto al modelo y la inferencia las aplica."
+        ),
+    )
     parser.add_argument(
         "--lstm-units",
         nargs=2,
@@ -72,24 +129,199 @@ def parse_args() -> argparse.Namespace:
         default=0.45,
         help="Proporción de Dropout aplicada después de cada LSTM.",
     )
+    parser.add_argument(
+        "--architecture",
+        choices=ARCHITECTURES,
+        default="lstm",
+        help=(
+            "lstm: dos LSTM (por defecto). gru: dos GRU, más baratas. tcn: convoluciones 1D "
+            "causales dilatadas. lstm_subsampled: LSTM sobre muñeca, nudillos y puntas de los dedos."
+        ),
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=0,
+        help="Frames que ve el modelo tras el submuestreo (0 = la secuencia completa).",
+    )
+    parser.add_argument(
+        "--window-stride",
+        type=int,
+        default=1,
+        help="Tomar un frame de cada N (2 = 12 fps con clips de 24 fps).",
+    )
     return parser.parse_args()
 
 
-def load_data(dataset_path: Path, validation_split: float) -> Tuple[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
-    """Leer el archivo .npz, mezclar las muestras y separarlas en train/validación."""
-    data = np.load(dataset_path)
-    X = data["X"]
-    y = data["y"]
+def load_data(
+    dataset_path: Path,
+    validation_split: float,
+    seed: Optional[int] = None,
+    *,
+    folds: int = 0,
+    fold: int = 0,
+) -> Tuple[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+    """Leer el archivo .npz y separarlo en train/validación de forma estratificada."""
+    with np.load(dataset_path) as data:
+        X = data["X"]
+        y = data["y"]
+
+    split = prepare_split(y, validation_split=validation_split, seed=seed, folds=folds, fold=fold)
+    return (X[split.train], y[split.train]), (X[split.val], y[split.val])
+
+
+class EpochTimer(tf.keras.callbacks.Callback):
+    """Record wall time and throughput of every epoch for ``training_history.json``."""
+
+    def __init__(self, samples_per_epoch: int) -> None:
+        super().__init__()
+        self.samples_per_epoch = int(samples_per_epoch)
+        self.history: Dict[str, List[float]] = {"epoch_time_s": [], "samples_per_s": []}
+        self._started = 0.0
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self._started = time.perf_counter()
+
+    def on_epoch_end(self, epoch, logs=None):
+        elapsed = max(time.perf_counter() - self._started, 1e-9)
+        self.history["epoch_time_s"].append(round(elapsed, 4))
+        self.history["samples_per_s"].append(round(self.samples_per_epoch / elapsed, 2))
+
+
+def subsampled_feature_indices(feature_dim: int) -> List[int]:
+    """Índices de ``SUBSAMPLED_LANDMARKS`` (x, y, z) para cada mano del vector de rasgos."""
+    per_hand = config.NUM_HAND_LANDMARKS * config.LANDMARK_DIM
+    if feature_dim < per_hand or feature_dim % per_hand:
+        raise ValueError(f"lstm_subsampled requiere vectores de {per_hand} rasgos por mano, se recibieron {feature_dim}")
+    return [
+        hand * per_hand + landmark * config.LANDMARK_DIM + dim
+        for hand in range(feature_dim // per_hand)
+        for landmark in SUBSAMPLED_LANDMARKS
+        for dim in range(config.LANDMARK_DIM)
+    ]
+
 
-    indices = np.arange(len(X))
-    np.random.shuffle(indices)
-    X = X[indices]
-    y = y[indices]
+@tf.keras.utils.register_keras_serializable(package="helen")
+class FeatureSubset(tf.keras.layers.Layer):
+    """Keep only the given feature columns (applied before ``Masking``: padding stays zero)."""
 
-    split_idx = int(len(X) * (1 - validation_split))
-    X_train, X_val = X[:split_idx], X[split_idx:]
-    y_train, y_val = y[:split_idx], y[split_idx:]
-    return (X_train, y_train), (X_val, y_val)
+    def __init__(self, indices: Sequence[int], **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.indices = [int(index) for index in indices]
+
+    def call(self, inputs):
+        return tf.gather(inputs, self.indices, axis=-1)
+
+    def compute_output_shape(self, input_shape):
+        return (*input_shape[:-1], len(self.indices))
+
+    def get_config(self):
+        return {**super().get_config(), "indices": self.indices}
+
+
+@tf.keras.utils.register_keras_serializable(package="helen")
+class PaddingMaskedMaxPooling1D(tf.keras.layers.Layer):
+    """Global max over time that ignores padding frames (all-zero inputs, as ``Masking``).
+
+    Takes ``[features, frames]``. The features come from ReLU convolutions
+    (>= 0), so zeroing the padded steps leaves them unable to exceed any real
+    step even though ``relu(bias)`` there may be positive.
+    """
+
+    def call(self, inputs):
+        features, frames = inputs
+        valid = tf.reduce_any(tf.not_equal(frames, 0.0), axis=-1, keepdims=True)
+        return tf.reduce_max(features * tf.cast(valid, features.dtype), axis=1)
+
+    def compute_output_shape(self, input_shape):
+        features_shape = input_shape[0]
+        return (features_shape[0], features_shape[-1])
+
+
+@dataclass
+class TrainingData:
+    """Inputs for ``model.fit`` plus what the summary and the export need."""
+
+    fit_inputs: Dict[str, Any]
+    val_data: Any
+    y_train: np.ndarray
+    y_val: np.ndarray
+    sequence_length: int
+    feature_dim: int
+    split: PreparedSplit
+
+
+def prepare_training_data(
+    dataset_path: Path,
+    *,
+    validation_split: float,
+    seed: Optional[int],
+    folds: int = 0,
+    fold: int = 0,
+    standardize_features: bool = False,
+    batch_size: int = 24,
+    window: int = 0,
+    stride: int = 1,
+) -> TrainingData:
+    """Cargar el dataset (.npz o en bloques), partirlo y dejarlo listo para ``fit``.
+
+    Partición y estadísticas se reutilizan de ``<dataset>_prep/`` si ya se calcularon.
+    Con ``window``/``stride`` cada clip se recorta a ``window`` frames tomados cada
+    ``stride`` (ver :class:`InputSpec`).
+    """
+    sharded = is_sharded_dataset(dataset_path)
+    if sharded:
+        # Dataset en bloques: solo se barajan índices y cada batch se lee del disco.
+        dataset = ShardedDataset(dataset_path)
+        labels = dataset.labels
+        read = dataset.read
+    else:
+        with np.load(dataset_path) as data:
+            X = data["X"]
+            labels = data["y"]
+        read = X.__getitem__
+
+    split = prepare_split(
+        labels,
+        validation_split=validation_split,
+        seed=seed,
+        folds=folds,
+        fold=fold,
+        read=read if standardize_features else None,
+        cache=PreprocessingCache(dataset_path),
+    )
+    y_train, y_val = labels[split.train], labels[split.val]
+
+    if sharded:
+        frames = window_length(dataset.sequence_length, window, stride)
+
+        def transform(batch: np.ndarray) -> np.ndarray:
+            batch = apply_window(batch, frames, stride)
+            return standardize(batch, split.mean, split.std) if standardize_features else batch
+
+        train_data = make_tf_dataset(
+            dataset, split.train, batch_size, shuffle=True, seed=seed, transform=transform, sequence_length=frames
+        )
+        val_data = make_tf_dataset(
+            dataset, split.val, batch_size, shuffle=False, transform=transform, sequence_length=frames
+        )
+        return TrainingData({"x": train_data}, val_data, y_train, y_val, frames, dataset.feature_size, split)
+
+    frames = window_length(X.shape[1], window, stride)
+    X_train = apply_window(X[split.train], frames, stride)
+    X_val = apply_window(X[split.val], frames, stride)
+    if standardize_features:
+        standardize(X_train, split.mean, split.std)
+        standardize(X_val, split.mean, split.std)
+    return TrainingData(
+        {"x": X_train, "y": y_train, "batch_size": batch_size},
+        (X_val, y_val),
+        y_train,
+        y_val,
+        X_train.shape[1],
+        X_train.shape[2],
+        split,
+    )
 
 
 def build_model(
@@ -99,14 +331,38 @@ def build_model(
     lstm_units: Tuple[int, int],
     dense_units: int,
     dropout: float,
+    architecture: str = "lstm",
 ) -> tf.keras.Model:
-    """Crear la arquitectura LSTM que procesa secuencias de landmarks."""
+    """Crear la arquitectura que procesa secuencias de landmarks.
+
+    ``lstm_units`` son las unidades de las dos capas recurrentes (``lstm``, ``gru``,
+    ``lstm_subsampled``) o los filtros de las convoluciones (``tcn``: el primer
+    valor para dilataciones 1-2 y el segundo para 4-8).
+    """
+    if architecture not in ARCHITECTURES:
+        raise ValueError(f"Arquitectura desconocida: {architecture}")
     inputs = tf.keras.layers.Input(shape=(sequence_length, feature_dim), name="landmarks")
-    x = tf.keras.layers.Masking(mask_value=0.0)(inputs)
-    x = tf.keras.layers.LSTM(lstm_units[0], return_sequences=True)(x)
-    x = tf.keras.layers.Dropout(dropout)(x)
-    x = tf.keras.layers.LSTM(lstm_units[1])(x)
-    x = tf.keras.layers.Dropout(dropout)(x)
+    x = inputs
+    if architecture == "lstm_subsampled":
+        x = FeatureSubset(subsampled_feature_indices(feature_dim))(x)
+
+    if architecture == "tcn":
+        # Conv1D no propaga máscaras y con sesgo un frame de padding produce relu(bias), que
+        # podría ser el máximo. Los pasos de padding se anulan antes del pooling, igual que
+        # Masking en las recurrentes; en vivo no hay padding y el cálculo es el mismo.
+        for dilation, filters in ((1, lstm_units[0]), (2, lstm_units[0]), (4, lstm_units[1]), (8, lstm_units[1])):
+            x = tf.keras.layers.Conv1D(
+                filters, kernel_size=3, dilation_rate=dilation, padding="causal", activation="relu"
+            )(x)
+        x = PaddingMaskedMaxPooling1D()([x, inputs])
+        x = tf.keras.layers.Dropout(dropout)(x)
+    else:
+        recurrent = tf.keras.layers.GRU if architecture == "gru" else tf.keras.layers.LSTM
+        x = tf.keras.layers.Masking(mask_value=0.0)(x)
+        x = recurrent(lstm_units[0], return_sequences=True)(x)
+        x = tf.keras.layers.Dropout(dropout)(x)
+        x = recurrent(lstm_units[1])(x)
+        x = tf.keras.layers.Dropout(dropout)(x)
     x = tf.keras.layers.Dense(dense_units, activation="relu")(x)
     outputs = tf.keras.layers.Dense(num_classes, activation="softmax", name="class_probabilities")(x)
     model = tf.keras.Model(inputs=inputs, outputs=outputs)
@@ -123,9 +379,25 @@ def main() -> None:
     label_map = json.loads(args.labels.read_text(encoding="utf-8"))
     idx_to_label = {idx: gesture for gesture, idx in label_map.items()}
 
-    (X_train, y_train), (X_val, y_val) = load_data(args.dataset, args.validation_split)
-    sequence_length = X_train.shape[1]
-    feature_dim = X_train.shape[2]
+    tf.keras.utils.set_random_seed(args.seed)
+
+    data = prepare_training_data(
+        args.dataset,
+        validation_split=args.validation_split,
+        seed=args.seed,
+        folds=args.folds,
+        fold=args.fold,
+        standardize_features=args.standardize,
+        batch_size=args.batch_size,
+        window=args.window,
+        stride=args.window_stride,
+    )
+    if data.split.cached:
+        print("♻️  Partición y estadísticas recuperadas de la caché de preprocesado.")
+    split = data.split
+    y_train, y_val = data.y_train, data.y_val
+    sequence_length, feature_dim = data.sequence_length, data.feature_dim
+    fit_inputs, val_data = data.fit_inputs, data.val_data
     num_classes = int(np.max(np.concatenate([y_train, y_val])) + 1)
 
     model = build_model(
@@ -135,6 +407,7 @@ def main() -> None:
         lstm_units=tuple(args.lstm_units),
         dense_units=args.dense_units,
         dropout=args.dropout,
+        architecture=args.architecture,
     )
     model.compile(
         optimizer=tf.keras.optimizers.Adam(learning_rate=args.learning_rate),
@@ -143,8 +416,8 @@ def main() -> None:
     )
 
     # Resumen útil
-    train_samples = len(X_train)
-    val_samples = len(X_val)
+    train_samples = len(y_train)
+    val_samples = len(y_val)
     total_samples = train_samples + val_samples
 
     def map_distribution(text: str) -> str:
@@ -166,12 +439,17 @@ def main() -> None:
     print(f"   • Distribución etiquetas (val): {val_dist}")
     print("Hiperparámetros seleccionados:")
     print(f"   • Épocas={args.epochs}, Batch={args.batch_size}, LR={args.learning_rate}, Dropout={args.dropout}")
-    print(f"   • LSTM={tuple(args.lstm_units)}, Dense={args.dense_units}")
+    print(f"   • Arquitectura={args.architecture}, unidades={tuple(args.lstm_units)}, Dense={args.dense_units}")
+    print(f"   • Ventana={sequence_length} frames, stride={args.window_stride}")
+    split_desc = f"fold {args.fold}/{args.folds}" if args.folds else f"validación {args.validation_split}"
+    print(f"   • Partición estratificada: semilla={args.seed}, {split_desc}, estandarizar={args.standardize}")
 
     # ==== Callbacks (Keras 3 friendly) ====
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+    epoch_timer = EpochTimer(train_samples)
     callbacks = [
+        epoch_timer,
         # Checkpoint de MEJORES PESOS (ligero, evita requerir .keras)
         tf.keras.callbacks.ModelCheckpoint(
             filepath=str(config.MODELS_DIR / f"best_weights_{timestamp}.weights.h5"),
@@ -200,11 +478,9 @@ def main() -> None:
     ]
 
     history = model.fit(
-        X_train,
-        y_train,
-        validation_data=(X_val, y_val),
+        **fit_inputs,
+        validation_data=val_data,
         epochs=args.epochs,
-        batch_size=args.batch_size,
         callbacks=callbacks,
         verbose=2,
     )
@@ -225,14 +501,28 @@ def main() -> None:
 
     # Historial y etiquetas
     history_path = model_dir / "training_history.json"
+    history_data = {key: [float(value) for value in values] for key, values in history.history.items()}
+    history_data.update(epoch_timer.history)
     with history_path.open("w", encoding="utf-8") as fp:
-        json.dump(history.history, fp, indent=2)
+        json.dump(history_data, fp, indent=2)
     print(f"📝 Historial de entrenamiento guardado en {history_path}")
 
+    input_spec = InputSpec(sequence_length, args.window_stride, args.architecture)
+    save_input_spec(model_dir, input_spec)
+    print(f"🪟 Entrada del modelo: {input_spec.window} frames cada {input_spec.stride} ({input_spec.frames_required} de cámara)")
+
+    if args.standardize:
+        normalization_path = save_normalization(model_dir, split.mean, split.std)
+        print(f"📐 Estadísticas de normalización guardadas en {normalization_path}")
+
     labels_dest = model_dir / "labels.json"
     labels_dest.write_text(json.dumps(label_map, ensure_ascii=False, indent=2), encoding="utf-8")
     print(f"🗂️  Copia del mapa de etiquetas guardada en {labels_dest}")
 
+    # Se registra sin promover: el servidor sigue con la versión activa hasta que se promueva.
+    entry = ModelRegistry().register(model_dir)
+    print(f"📚 Versión {entry.version} registrada; actívala con: model_registry promote {entry.version}")
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
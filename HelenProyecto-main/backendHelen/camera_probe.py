@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import contextlib
 import dataclasses
+import functools
 import hashlib
 import json
 import logging
@@ -19,7 +20,9 @@ import re
 import shutil
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
@@ -161,6 +164,10 @@ BLACK_FRAME_STD_THRESHOLD = 3.5
 PROBE_TIMEOUT_S = 4.0
 FRAME_SAMPLE_LIMIT = 18
 LATENCY_FALLBACK_MS = 9999.0
+PROBE_MAX_WORKERS = 4
+PROBE_DEVICE_BUDGET_S = 12.0
+# Una cámara USB a 720p30 con primer frame en <200 ms (o cualquier CSI) basta para dejar de sondear.
+PROBE_TARGET_SCORE = 190.0
 
 
 @dataclass(frozen=True)
@@ -183,6 +190,7 @@ PREFERRED_MODES: Tuple[CameraMode, ...] = (
 )
 
 PIXEL_FORMAT_PREFERENCE: Tuple[str, ...] = ("MJPG", "YUYV", "NV12", "H264")
+PROBE_PLAN_LIMIT = 3
 
 
 @dataclass
@@ -260,6 +268,19 @@ class CameraSelection:
         return dataclasses.asdict(self)
 
 
+@dataclass
+class DeviceCapabilities:
+    """Formats advertised by a V4L2 node: ``{fourcc: {(width, height): max_fps}}``."""
+
+    formats: Dict[str, Dict[Tuple[int, int], float]] = field(default_factory=dict)
+    video_capture: bool = True
+    source: str = "v4l2-ctl"
+
+    @property
+    def metadata_only(self) -> bool:
+        return not self.video_capture or not self.formats
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -486,6 +507,146 @@ def list_sources() -> Dict[str, List[Dict[str, Any]]]:
     return {"v4l2": v4l2, "libcamera": libcamera}
 
 
+_FORMAT_RE = re.compile(r"\[\d+\]:\s*'([^']+)'")
+_DISCRETE_SIZE_RE = re.compile(r"Size:\s*Discrete\s+(\d+)x(\d+)")
+_STEPWISE_SIZE_RE = re.compile(r"Size:\s*(?:Stepwise|Continuous)\s+(\d+)x(\d+)\s*-\s*(\d+)x(\d+)")
+_INTERVAL_RE = re.compile(r"Interval:.*?\(([\d.]+)\s*fps\)")
+
+
+def _parse_v4l2_formats(text: str) -> DeviceCapabilities:
+    """Parse ``v4l2-ctl --list-formats-ext`` output."""
+
+    capabilities = DeviceCapabilities(video_capture=False)
+    current_format: Optional[str] = None
+    current_sizes: List[Tuple[int, int]] = []
+
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if line.startswith("Type:"):
+            capabilities.video_capture = capabilities.video_capture or "video capture" in line.lower()
+            continue
+        match = _FORMAT_RE.search(line)
+        if match:
+            current_format = match.group(1).strip().upper()
+            capabilities.formats.setdefault(current_format, {})
+            current_sizes = []
+            continue
+        if current_format is None:
+            continue
+        match = _DISCRETE_SIZE_RE.search(line)
+        if match:
+            current_sizes = [(int(match.group(1)), int(match.group(2)))]
+            for size in current_sizes:
+                capabilities.formats[current_format].setdefault(size, 0.0)
+            continue
+        match = _STEPWISE_SIZE_RE.search(line)
+        if match:
+            min_w, min_h, max_w, max_h = (int(value) for value in match.groups())
+            current_sizes = [
+                (mode.width, mode.height)
+                for mode in PREFERRED_MODES
+                if min_w <= mode.width <= max_w and min_h <= mode.height <= max_h
+            ]
+            for size in current_sizes:
+                capabilities.formats[current_format].setdefault(size, 0.0)
+            continue
+        match = _INTERVAL_RE.search(line)
+        if match and current_sizes:
+            fps = float(match.group(1))
+            sizes = capabilities.formats[current_format]
+            for size in current_sizes:
+                sizes[size] = max(sizes.get(size, 0.0), fps)
+
+    # Los formatos sin tamaños no sirven para capturar.
+    capabilities.formats = {fourcc: sizes for fourcc, sizes in capabilities.formats.items() if sizes}
+    return capabilities
+
+
+def _sysfs_metadata_node(path: str) -> bool:
+    """UVC exposes a metadata node (``index`` != 0) next to every capture node."""
+
+    sysfs = Path("/sys/class/video4linux") / Path(path).name
+    index = _safe_read_text(sysfs / "index")
+    if not index or index == "0":
+        return False
+    with contextlib.suppress(OSError):
+        return "uvcvideo" in (sysfs / "device" / "driver").resolve(strict=True).name
+    return False
+
+
+def _device_capabilities(candidate: CameraCandidate) -> Optional[DeviceCapabilities]:
+    """Return (and memoise on the candidate) what a V4L2 node can deliver.
+
+    ``None`` means the capabilities are unknown and the probe should fall
+    back to trying modes blindly.
+    """
+
+    if "capabilities" in candidate.metadata:
+        return candidate.metadata["capabilities"]
+    path = candidate.path
+    capabilities: Optional[DeviceCapabilities] = None
+    if path and path.startswith("/dev/video") and IS_LINUX:
+        if _sysfs_metadata_node(path):
+            capabilities = DeviceCapabilities(video_capture=False, source="sysfs")
+        elif shutil.which("v4l2-ctl"):
+            try:
+                result = _run_command(["v4l2-ctl", "--device", path, "--list-formats-ext"], timeout=3.0)
+            except (OSError, subprocess.TimeoutExpired):
+                result = None
+            if result is not None and result.returncode == 0 and result.stdout:
+                capabilities = _parse_v4l2_formats(result.stdout)
+    candidate.metadata["capabilities"] = capabilities
+    return capabilities
+
+
+def _plan_probe_modes(
+    capabilities: DeviceCapabilities,
+    *,
+    limit: int = PROBE_PLAN_LIMIT,
+) -> List[Tuple[CameraMode, Tuple[str, ...]]]:
+    """Rank the supported (mode, pixel formats) combinations worth opening."""
+
+    def _format_rank(fourcc: str) -> int:
+        try:
+            return PIXEL_FORMAT_PREFERENCE.index(fourcc)
+        except ValueError:
+            return len(PIXEL_FORMAT_PREFERENCE)
+
+    plan: List[Tuple[CameraMode, Tuple[str, ...]]] = []
+    for mode in PREFERRED_MODES:
+        size = (mode.width, mode.height)
+        supported = [
+            (fourcc, sizes[size])
+            for fourcc, sizes in capabilities.formats.items()
+            if size in sizes and _format_rank(fourcc) < len(PIXEL_FORMAT_PREFERENCE)
+        ]
+        if not supported:
+            continue
+        # Formatos que alcanzan la tasa pedida primero; 0.0 = intervalo desconocido.
+        supported.sort(key=lambda item: (0 < item[1] < mode.fps - 0.5, _format_rank(item[0])))
+        best_fps = max(fps for _, fps in supported)
+        planned_mode = mode
+        if 0 < best_fps < mode.fps - 0.5:
+            planned_mode = CameraMode(mode.width, mode.height, int(best_fps))
+        plan.append((planned_mode, tuple(fourcc for fourcc, _ in supported)))
+        if len(plan) >= limit:
+            break
+
+    if not plan and capabilities.formats:
+        # Ningún modo preferido coincide: se usa el mayor tamaño anunciado hasta 720p.
+        options = [
+            (size, fps, fourcc)
+            for fourcc, sizes in capabilities.formats.items()
+            if _format_rank(fourcc) < len(PIXEL_FORMAT_PREFERENCE)
+            for size, fps in sizes.items()
+            if size[0] * size[1] <= 1280 * 720
+        ]
+        if options:
+            size, fps, fourcc = max(options, key=lambda item: (item[0][0] * item[0][1], item[1], -_format_rank(item[2])))
+            plan.append((CameraMode(size[0], size[1], int(fps) or 30), (fourcc,)))
+    return plan
+
+
 # ---------------------------------------------------------------------------
 # Probe utilities
 # ---------------------------------------------------------------------------
@@ -656,8 +817,12 @@ def _probe_with_opencv(
     return ProbeResult(candidate=candidate, backend=backend_name, mode=mode, success=False, reason="probe-failed")
 
 
-def _probe_with_v4l2(candidate: CameraCandidate, mode: CameraMode) -> ProbeResult:
-    return _probe_with_opencv(candidate, mode, backend_name="v4l2")
+def _probe_with_v4l2(
+    candidate: CameraCandidate,
+    mode: CameraMode,
+    pixel_formats: Optional[Sequence[Optional[str]]] = None,
+) -> ProbeResult:
+    return _probe_with_opencv(candidate, mode, backend_name="v4l2", pixel_formats=pixel_formats)
 
 
 def _probe_with_directshow(candidate: CameraCandidate, mode: CameraMode) -> ProbeResult:
@@ -670,16 +835,78 @@ def _probe_with_directshow(candidate: CameraCandidate, mode: CameraMode) -> Prob
     )
 
 
+@functools.lru_cache(maxsize=None)
+def gstreamer_element_available(name: str) -> bool:
+    """Return whether the GStreamer element ``name`` is installed (``gst-inspect-1.0 --exists``)."""
+
+    inspector = shutil.which("gst-inspect-1.0")
+    if not inspector:
+        return False
+    try:
+        result = _run_command([inspector, "--exists", name], timeout=3.0)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+@functools.lru_cache(maxsize=1)
+def opencv_has_gstreamer() -> bool:
+    if cv2 is None:
+        return False
+    with contextlib.suppress(Exception):
+        for line in cv2.getBuildInformation().splitlines():
+            if "GStreamer" in line:
+                return "YES" in line.upper()
+    return False
+
+
+def build_capture_pipeline(
+    *,
+    width: int,
+    height: int,
+    fps: int,
+    device: Optional[str] = None,
+    source_format: Optional[str] = None,
+    output: str = "BGR",
+    hw_accel: bool = False,
+) -> str:
+    """Build the GStreamer capture pipeline shared by the probe and the live stream.
+
+    ``device`` selects ``v4l2src`` (USB); without it ``libcamerasrc`` (CSI)
+    is used. ``source_format`` negotiates MJPG or YUYV on the sensor side;
+    MJPG is decoded with ``v4l2jpegdec`` when ``hw_accel`` is set and the
+    element exists. ``output`` is the appsink format: ``I420`` delivers a
+    luma plane plus chroma in one buffer, so the stream gets gray for free
+    and needs a single conversion to RGB.
+    """
+
+    size_caps = f"width={int(width)},height={int(height)},framerate={int(fps)}/1"
+    stages: List[str]
+    fourcc = (source_format or "").upper()
+    if device:
+        stages = [f"v4l2src device={device}"]
+        if fourcc in {"MJPG", "JPEG"}:
+            decoder = "v4l2jpegdec" if hw_accel and gstreamer_element_available("v4l2jpegdec") else "jpegdec"
+            stages.extend([f"image/jpeg,{size_caps}", decoder])
+        elif fourcc in {"YUYV", "YUY2"}:
+            stages.append(f"video/x-raw,format=YUY2,{size_caps}")
+        else:
+            stages.append(f"video/x-raw,{size_caps}")
+    else:
+        sensor_format = "I420" if output == "I420" else "RGB"
+        stages = ["libcamerasrc", f"video/x-raw,{size_caps},format={sensor_format}"]
+
+    converter = "v4l2convert" if hw_accel and gstreamer_element_available("v4l2convert") else "videoconvert"
+    stages.extend([converter, f"video/x-raw,format={output}", "appsink drop=1 max-buffers=2"])
+    return " ! ".join(stages)
+
+
 def _build_gstreamer_pipeline(candidate: CameraCandidate, mode: CameraMode) -> str:
-    if candidate.kind == "usb" and candidate.path:
-        return (
-            f"v4l2src device={candidate.path} ! video/x-raw,width={mode.width},height={mode.height},"
-            f"framerate={mode.fps}/1 ! videoconvert ! video/x-raw,format=BGR ! appsink drop=1 max-buffers=2"
-        )
-    return (
-        "libcamerasrc ! video/x-raw,width="
-        f"{mode.width},height={mode.height},framerate={mode.fps}/1,format=RGB ! "
-        "videoconvert ! video/x-raw,format=BGR ! appsink drop=1 max-buffers=2"
+    return build_capture_pipeline(
+        width=mode.width,
+        height=mode.height,
+        fps=mode.fps,
+        device=candidate.path if candidate.kind == "usb" and candidate.path else None,
     )
 
 
@@ -722,7 +949,19 @@ def _probe_with_gstreamer(candidate: CameraCandidate, mode: CameraMode) -> Probe
     )
 
 
-def _probe_candidate(candidate: CameraCandidate, forced_backend: Optional[str] = None) -> Optional[ProbeResult]:
+def _probe_candidate(
+    candidate: CameraCandidate,
+    forced_backend: Optional[str] = None,
+    *,
+    deadline: Optional[float] = None,
+    cancel: Optional[threading.Event] = None,
+) -> Optional[ProbeResult]:
+    """Probe ``candidate`` mode by mode until one succeeds.
+
+    ``deadline`` (``time.monotonic`` based) and ``cancel`` are checked between
+    attempts so a slow device cannot hold the whole probe hostage.
+    """
+
     attempts: List[ProbeResult] = []
 
     sequence: List[Optional[str]] = [forced_backend, candidate.backend_hint]
@@ -741,22 +980,142 @@ def _probe_candidate(candidate: CameraCandidate, forced_backend: Optional[str] =
     if not ordered:
         ordered = list(preferred_backend_order(None))
 
-    for mode in PREFERRED_MODES:
-        for backend in ordered:
-            if backend == "gstreamer":
-                result = _probe_with_gstreamer(candidate, mode)
-            elif backend == "directshow":
-                result = _probe_with_directshow(candidate, mode)
-            else:
-                result = _probe_with_v4l2(candidate, mode)
-            attempts.append(result)
-            if result.success:
-                return result
+    capabilities = _device_capabilities(candidate) if candidate.backend_hint == "v4l2" else None
+    if capabilities is not None and capabilities.metadata_only:
+        LOGGER.info("%s no es un nodo de captura de video; se omite", candidate.identifier)
+        return ProbeResult(candidate=candidate, backend="v4l2", mode=PREFERRED_MODES[0], success=False, reason="metadata-node")
+
+    planned_modes: List[Tuple[CameraMode, Optional[Tuple[str, ...]]]]
+    if capabilities is not None:
+        planned_modes = list(_plan_probe_modes(capabilities))
+        if not planned_modes:
+            return ProbeResult(
+                candidate=candidate, backend="v4l2", mode=PREFERRED_MODES[0], success=False, reason="no-supported-mode"
+            )
+    else:
+        planned_modes = [(mode, None) for mode in PREFERRED_MODES]
+
+    plan = [(mode, formats, backend) for mode, formats in planned_modes for backend in ordered]
+    for mode, formats, backend in plan:
+        if cancel is not None and cancel.is_set():
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            LOGGER.info("Presupuesto de sondeo agotado para %s", candidate.identifier)
+            break
+        if backend == "gstreamer":
+            if formats is not None and not {"YUYV", "NV12"} & set(formats):
+                # La pipeline v4l2src negocia video/x-raw; sin formato crudo no vale la pena abrirla.
+                continue
+            result = _probe_with_gstreamer(candidate, mode)
+        elif backend == "directshow":
+            result = _probe_with_directshow(candidate, mode)
+        elif formats is not None:
+            result = _probe_with_v4l2(candidate, mode, pixel_formats=formats)
+        else:
+            result = _probe_with_v4l2(candidate, mode)
+        attempts.append(result)
+        if result.success:
+            return result
     if attempts:
         return max(attempts, key=lambda item: item.score())
     return None
 
 
+def _physical_device_key(candidate: CameraCandidate) -> str:
+    """Group nodes that belong to the same physical camera (e.g. capture + metadata)."""
+
+    path = candidate.path
+    if not path and candidate.index is not None and candidate.backend_hint in {"v4l2", "directshow"}:
+        if candidate.backend_hint == "directshow":
+            return f"directshow:{candidate.index}"
+        path = f"/dev/video{candidate.index}"
+    if path and path.startswith("/dev/video"):
+        sysfs_device = Path("/sys/class/video4linux") / Path(path).name / "device"
+        with contextlib.suppress(OSError):
+            return str(sysfs_device.resolve(strict=True))
+        return path
+    if candidate.backend_hint == "gstreamer":
+        return "libcamera"
+    return path or candidate.identifier
+
+
+def _probe_candidates_parallel(
+    candidates: Sequence[CameraCandidate],
+    *,
+    forced_backend: Optional[str] = None,
+    preferred: Optional[str] = None,
+    logger: Optional[logging.Logger] = None,
+    max_workers: int = PROBE_MAX_WORKERS,
+    device_budget_s: float = PROBE_DEVICE_BUDGET_S,
+    target_score: float = PROBE_TARGET_SCORE,
+) -> List[Tuple[int, ProbeResult]]:
+    """Probe distinct physical devices concurrently.
+
+    Nodes of the same device are probed sequentially by one worker; the
+    search stops early once a result reaches ``target_score`` or, when a
+    ``preferred`` device is among the candidates, only once that device
+    succeeds. Returns ``(candidate_order, result)`` pairs.
+    """
+
+    groups: Dict[str, List[Tuple[int, CameraCandidate]]] = {}
+    for order, candidate in enumerate(candidates):
+        groups.setdefault(_physical_device_key(candidate), []).append((order, candidate))
+
+    found = threading.Event()
+
+    def _is_preferred(candidate: CameraCandidate) -> bool:
+        return bool(preferred) and (
+            preferred == str(candidate.index) or preferred in (candidate.path or "")
+        )
+
+    # Con una cámara elegida por el usuario, otra con buena puntuación no debe cancelar su sondeo.
+    preferred_listed = any(_is_preferred(candidate) for candidate in candidates)
+
+    def _completes_search(candidate: CameraCandidate, result: ProbeResult) -> bool:
+        if not result.success:
+            return False
+        if preferred_listed:
+            return _is_preferred(candidate)
+        return result.score() >= target_score
+
+    def _probe_group(members: List[Tuple[int, CameraCandidate]]) -> List[Tuple[int, ProbeResult]]:
+        deadline = time.monotonic() + device_budget_s
+        results: List[Tuple[int, ProbeResult]] = []
+        for order, candidate in members:
+            if found.is_set() or time.monotonic() >= deadline:
+                break
+            _log(logger, "info", "Probing %s (%s)", candidate.identifier, candidate.label)
+            result = _probe_candidate(candidate, forced_backend, deadline=deadline, cancel=found)
+            if not result:
+                continue
+            results.append((order, result))
+            if _completes_search(candidate, result):
+                found.set()
+        return results
+
+    workers = max(1, min(int(max_workers), len(groups)))
+    started = time.perf_counter()
+    collected: List[Tuple[int, ProbeResult]] = []
+    if workers == 1:
+        for members in groups.values():
+            collected.extend(_probe_group(members))
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="HelenProbe") as executor:
+            for group_results in executor.map(_probe_group, groups.values()):
+                collected.extend(group_results)
+    _log(
+        logger,
+        "info",
+        "Sondeo de %s dispositivo(s) en %.0f ms (%s hilos%s)",
+        len(groups),
+        (time.perf_counter() - started) * 1000.0,
+        workers,
+        ", corte anticipado" if found.is_set() else "",
+    )
+    collected.sort(key=lambda item: item[0])
+    return collected
+
+
 # ---------------------------------------------------------------------------
 # Persistence helpers
 # ---------------------------------------------------------------------------
@@ -768,31 +1127,46 @@ def _ensure_dirs() -> None:
 
 
 def _hardware_signature() -> str:
+    """Fingerprint attached cameras from sysfs only (no v4l2-ctl/libcamera subprocesses)."""
+
     signature_parts: List[str] = []
-    for candidate in _list_v4l2_devices():
-        signature_parts.append(f"{candidate.identifier}:{candidate.label}")
-    libcamera_output = []
-    for candidate in _list_libcamera_devices():
-        libcamera_output.append(f"{candidate.identifier}:{candidate.label}")
-    signature_parts.extend(libcamera_output)
+    for root in (Path("/sys/class/video4linux"), Path("/sys/bus/media/devices")):
+        if not root.exists():
+            continue
+        for entry in sorted(root.iterdir()):
+            label = _safe_read_text(entry / "name") or _safe_read_text(entry / "model")
+            device = ""
+            with contextlib.suppress(OSError):
+                device = str((entry / "device").resolve(strict=True))
+            signature_parts.append(f"{entry.name}:{label}:{device}")
     signature_parts.append(platform.machine())
     signature = "|".join(signature_parts)
     return hashlib.sha256(signature.encode("utf-8", errors="ignore")).hexdigest()
 
 
-def _load_cached_selection() -> Optional[CameraSelection]:
-    if not CONFIG_PATH.exists():
+def _selection_cache_path(cache_name: Optional[str] = None) -> Path:
+    """Return the cache file for ``cache_name`` (one per named runtime)."""
+
+    if not cache_name:
+        return CONFIG_PATH
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(cache_name)).strip("._") or "default"
+    return CONFIG_DIR / f"camera_selection-{safe_name}.json"
+
+
+def _load_cached_selection(path: Optional[Path] = None) -> Optional[CameraSelection]:
+    path = path or CONFIG_PATH
+    if not path.exists():
         return None
     try:
-        payload = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+        payload = json.loads(path.read_text(encoding="utf-8"))
     except Exception:  # pragma: no cover - depends on filesystem
         return None
     return CameraSelection(**payload)
 
 
-def _save_selection(selection: CameraSelection) -> None:
+def _save_selection(selection: CameraSelection, path: Optional[Path] = None) -> None:
     _ensure_dirs()
-    CONFIG_PATH.write_text(json.dumps(selection.to_dict(), indent=2, ensure_ascii=False), encoding="utf-8")
+    (path or CONFIG_PATH).write_text(json.dumps(selection.to_dict(), indent=2, ensure_ascii=False), encoding="utf-8")
 
     timestamp = time.strftime("%Y%m%d-%H%M%S")
     log_path = LOG_DIR / f"camera-probe-{timestamp}.json"
@@ -885,16 +1259,38 @@ def ensure_camera_selection(
     preferred: Optional[Union[str, int]] = None,
     logger: Optional[logging.Logger] = None,
     forced_backend: Optional[str] = None,
+    cache_name: Optional[str] = None,
+    exclude_devices: Optional[Iterable[Union[str, int]]] = None,
+    fast_boot: bool = False,
 ) -> Optional[CameraSelection]:
-    """Return the cached camera selection or probe the available devices."""
+    """Return the cached camera selection or probe the available devices.
+
+    ``cache_name`` keeps a separate cache file per named runtime and
+    ``exclude_devices`` skips cameras already claimed by another runtime.
+    With ``fast_boot`` a cache whose hardware signature matches is returned
+    unverified (no device open); the caller validates it with real frames.
+    """
 
     if cv2 is None:
         _log(logger, "warning", "OpenCV no está disponible; se omite la auto-detección de cámara.")
         return None
 
+    excluded = {str(device) for device in (exclude_devices or ()) if device is not None}
+    cache_path = _selection_cache_path(cache_name)
     current_signature = _hardware_signature()
-    cached = _load_cached_selection()
+    cached = _load_cached_selection(cache_path)
+    if cached and excluded and (str(cached.device) in excluded or str(cached.index) in excluded):
+        cached = None
     if not force and cached and cached.hardware_signature == current_signature:
+        if fast_boot:
+            _log(
+                logger,
+                "info",
+                "Arranque rápido: se usa la cámara cacheada sin validar (backend=%s device=%s)",
+                cached.backend,
+                cached.device or cached.index,
+            )
+            return _annotate_selection(cached, origin="cache", verified=False)
         validated = _validate_cached_selection(cached, logger=logger)
         if validated:
             _log(
@@ -910,10 +1306,22 @@ def ensure_camera_selection(
 
     candidates = _list_libcamera_devices() + _list_v4l2_devices()
     seen_identifiers = {candidate.identifier for candidate in candidates}
+    seen_paths = {candidate.path for candidate in candidates if candidate.path}
     for fallback in _fallback_candidates():
-        if fallback.identifier not in seen_identifiers:
-            candidates.append(fallback)
-            seen_identifiers.add(fallback.identifier)
+        if fallback.identifier in seen_identifiers or (fallback.path and fallback.path in seen_paths):
+            continue
+        candidates.append(fallback)
+        seen_identifiers.add(fallback.identifier)
+
+    if excluded:
+        candidates = [
+            candidate
+            for candidate in candidates
+            if not (
+                candidate.path in excluded
+                or (candidate.backend_hint != "gstreamer" and candidate.index is not None and str(candidate.index) in excluded)
+            )
+        ]
 
     if not candidates:
         _log(logger, "error", CAMERA_NOT_FOUND_MESSAGE)
@@ -924,11 +1332,14 @@ def ensure_camera_selection(
         preferred_str = str(preferred)
 
     best_result: Optional[ProbeResult] = None
-    for candidate in candidates:
-        _log(logger, "info", "Probing %s (%s)", candidate.identifier, candidate.label)
-        result = _probe_candidate(candidate, forced_backend)
-        if not result:
-            continue
+    probed = _probe_candidates_parallel(
+        candidates,
+        forced_backend=forced_backend,
+        preferred=preferred_str,
+        logger=logger,
+    )
+    for _, result in probed:
+        candidate = result.candidate
         if preferred_str and (preferred_str == str(candidate.index) or preferred_str in (candidate.path or "")):
             # Boost preferred candidate if it succeeded
             if result.success:
@@ -976,7 +1387,7 @@ def ensure_camera_selection(
     )
 
     selection = _annotate_selection(selection, origin="probe", verified=True)
-    _save_selection(selection)
+    _save_selection(selection, cache_path)
     _log(
         logger,
         "info",
@@ -1047,8 +1458,16 @@ def parse_resolution(value: str) -> Tuple[int, int]:
     return int(match.group(1)), int(match.group(2))
 
 
-def get_cached_selection() -> Optional[CameraSelection]:
-    cached = _load_cached_selection()
+def selection_verified(selection: CameraSelection) -> bool:
+    return bool(getattr(selection, "_verified", False))
+
+
+def mark_selection_verified(selection: CameraSelection) -> None:
+    setattr(selection, "_verified", True)
+
+
+def get_cached_selection(cache_name: Optional[str] = None) -> Optional[CameraSelection]:
+    cached = _load_cached_selection(_selection_cache_path(cache_name))
     if not cached:
         return None
     return _annotate_selection(cached, origin="cache", verified=False)
@@ -1061,8 +1480,13 @@ __all__ = [
     "probe_specific_device",
     "parse_resolution",
     "get_cached_selection",
+    "selection_verified",
+    "mark_selection_verified",
     "CAMERA_NOT_FOUND_MESSAGE",
     "normalize_backend_name",
     "resolve_backend_flag",
     "preferred_backend_order",
+    "build_capture_pipeline",
+    "gstreamer_element_available",
+    "opencv_has_gstreamer",
 ]
@@ -0,0 +1,409 @@
+"""Offline replay of recorded predictions through the gesture decision engine.
+
+Tuning thresholds, consensus windows and the cooldown/listening durations on
+live hardware is slow trial and error.  This module loads a stream recorded
+with ``python -m backendHelen.server --record-predictions PATH`` (JSON Lines
+with ``timestamp``, ``label``, ``score``, ``hint`` and ``landmarks``) and
+replays it through :class:`~backendHelen.server.GestureDecisionEngine` using the
+recorded timestamps as the clock.  Parameter grids are evaluated in a process
+pool and ranked by false activations and activation latency.
+
+Example::
+
+    python -m backendHelen.decision_replay session.jsonl \\
+        --param cooldown_s=0.6,0.8 --param threshold.Clima.enter=0.62,0.66,0.7
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import logging
+import math
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from . import server
+
+LOGGER = logging.getLogger("helen.decision_replay")
+
+ParameterGrid = Dict[str, List[float]]
+
+SCALAR_PARAMETERS = {
+    "cooldown_s",
+    "listening_window_s",
+    "command_debounce_s",
+    "clima_post_start_delay_s",
+    "global_min_score",
+    "consensus.window_size",
+    "consensus.required_votes",
+    "clima_consensus.window_size",
+    "clima_consensus.required_votes",
+}
+
+
+@dataclass(frozen=True)
+class RecordedPrediction:
+    timestamp: float
+    label: str
+    score: float
+    hint: Optional[str] = None
+    landmarks: Optional[Tuple[Tuple[float, float, float], ...]] = None
+
+
+def load_recording(path: Path) -> List[RecordedPrediction]:
+    """Read a JSON Lines (or JSON array) recording sorted by timestamp."""
+
+    text = Path(path).read_text(encoding="utf-8")
+    stripped = text.lstrip()
+    if stripped.startswith("["):
+        entries: Iterable[Dict[str, Any]] = json.loads(stripped)
+    else:
+        entries = (json.loads(line) for line in text.splitlines() if line.strip())
+
+    records: List[RecordedPrediction] = []
+    for entry in entries:
+        landmarks = entry.get("landmarks")
+        points = None
+        if landmarks:
+            points = tuple((float(p[0]), float(p[1]), float(p[2]) if len(p) > 2 else 0.0) for p in landmarks)
+        records.append(
+            RecordedPrediction(
+                timestamp=float(entry["timestamp"]),
+                label=str(entry.get("label") or ""),
+                score=float(entry.get("score", 0.0)),
+                hint=entry.get("hint", entry.get("hint_label")) or None,
+                landmarks=points,
+            )
+        )
+
+    records.sort(key=lambda record: record.timestamp)
+    return records
+
+
+def _validate_parameter(name: str) -> None:
+    if name in SCALAR_PARAMETERS:
+        return
+    parts = name.split(".")
+    if len(parts) == 3 and parts[0] == "threshold" and parts[2] in {"enter", "release"}:
+        return
+    raise ValueError(f"Parámetro desconocido: {name}")
+
+
+def parse_parameter(spec: str) -> Tuple[str, List[float]]:
+    """Parse ``name=v1,v2,...`` into a grid axis."""
+
+    if "=" not in spec:
+        raise ValueError(f"Formato inválido (se espera nombre=v1,v2): {spec}")
+    name, values = spec.split("=", 1)
+    name = name.strip()
+    _validate_parameter(name)
+    parsed = [float(value) for value in values.split(",") if value.strip()]
+    if not parsed:
+        raise ValueError(f"Sin valores para {name}")
+    return name, parsed
+
+
+def expand_grid(grid: ParameterGrid) -> List[Dict[str, float]]:
+    """Return the cartesian product of ``grid`` as a list of override dicts."""
+
+    if not grid:
+        return [{}]
+    names = sorted(grid)
+    return [dict(zip(names, combo)) for combo in itertools.product(*(grid[name] for name in names))]
+
+
+def build_engine(overrides: Dict[str, float], *, geometry: bool, clock_start: float) -> server.GestureDecisionEngine:
+    """Instantiate an engine with ``overrides`` applied over the live defaults."""
+
+    thresholds = dict(server.DEFAULT_CLASS_THRESHOLDS)
+    for name, value in overrides.items():
+        if not name.startswith("threshold."):
+            continue
+        _, label, field_name = name.split(".")
+        current = thresholds.get(label, server.VIDEO_COMMAND_THRESHOLD)
+        if field_name == "enter":
+            thresholds[label] = server.ClassThreshold(enter=float(value), release=current.release)
+        else:
+            thresholds[label] = server.ClassThreshold(enter=current.enter, release=float(value))
+
+    default = server.DEFAULT_CONSENSUS_CONFIG
+    consensus = server.ConsensusConfig(
+        window_size=int(overrides.get("consensus.window_size", default.window_size)),
+        required_votes=int(overrides.get("consensus.required_votes", default.required_votes)),
+    )
+    clima = server.CLIMA_CONSENSUS_OVERRIDE
+    clima_consensus = server.ConsensusConfig(
+        window_size=int(overrides.get("clima_consensus.window_size", clima.window_size)),
+        required_votes=int(overrides.get("clima_consensus.required_votes", clima.required_votes)),
+    )
+
+    return server.GestureDecisionEngine(
+        metrics=server.GestureMetrics(),
+        thresholds=thresholds,
+        consensus=consensus,
+        global_min_score=overrides.get("global_min_score", server.GLOBAL_MIN_SCORE),
+        geometry_verifier=server.LandmarkGeometryVerifier() if geometry else None,
+        per_label_consensus={"Clima": clima_consensus},
+        cooldown_seconds=overrides.get("cooldown_s", server.COOLDOWN_SECONDS),
+        listening_window_seconds=overrides.get("listening_window_s", server.LISTENING_WINDOW_SECONDS),
+        command_debounce_seconds=overrides.get("command_debounce_s", server.COMMAND_DEBOUNCE_SECONDS),
+        clima_post_start_delay=overrides.get("clima_post_start_delay_s", server.CLIMA_POST_START_DELAY),
+        clock=lambda: clock_start,
+    )
+
+
+def replay(
+    records: Sequence[RecordedPrediction],
+    overrides: Optional[Dict[str, float]] = None,
+    *,
+    geometry: bool = False,
+) -> Dict[str, Any]:
+    """Replay ``records`` through a fresh engine and score the emitted events.
+
+    An emission counts as a false activation when its label differs from the
+    recorded hint (including frames without hint).  Activation latency is the
+    time between the first frame of a hinted segment and the matching emission.
+    """
+
+    overrides = dict(overrides or {})
+    if not records:
+        return {"overrides": overrides, "frames": 0, "emissions": 0}
+
+    engine = build_engine(overrides, geometry=geometry, clock_start=records[0].timestamp)
+
+    emissions = 0
+    false_activations = 0
+    latencies: List[float] = []
+    segments = 0
+    detected_segments = 0
+    segment_label: Optional[str] = None
+    segment_start = 0.0
+    segment_detected = False
+
+    for record in records:
+        hint = server.GestureMetrics._canonical(record.hint) or None
+        if hint != segment_label:
+            segment_label = hint
+            segment_start = record.timestamp
+            segment_detected = False
+            if hint in server.TRACKED_GESTURES:
+                segments += 1
+
+        decision = engine.process(
+            server.Prediction(label=record.label, score=record.score),
+            timestamp=record.timestamp,
+            hint_label=record.hint,
+            landmarks=record.landmarks,
+        )
+        if not decision.emit:
+            continue
+
+        emissions += 1
+        if decision.label != hint:
+            false_activations += 1
+            continue
+        if not segment_detected:
+            segment_detected = True
+            detected_segments += 1
+            latencies.append((record.timestamp - segment_start) * 1000.0)
+
+    duration_s = max(records[-1].timestamp - records[0].timestamp, 1e-6)
+    return {
+        "overrides": overrides,
+        "frames": len(records),
+        "duration_s": duration_s,
+        "emissions": emissions,
+        "false_activations": false_activations,
+        "false_activations_per_min": false_activations * 60.0 / duration_s,
+        "segments": segments,
+        "detected_segments": detected_segments,
+        "detection_rate": detected_segments / segments if segments else None,
+        "latency_ms_mean": statistics.fmean(latencies) if latencies else None,
+        "latency_ms_p90": _percentile(latencies, 0.9),
+    }
+
+
+def _percentile(values: Sequence[float], fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(math.ceil(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+def rank_results(results: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Sort by false activations, then latency, then detection rate."""
+
+    def key(result: Dict[str, Any]) -> Tuple[float, float, float]:
+        latency = result.get("latency_ms_mean")
+        detection = result.get("detection_rate")
+        return (
+            float(result.get("false_activations_per_min", 0.0)),
+            float(latency) if latency is not None else math.inf,
+            -float(detection or 0.0),
+        )
+
+    return sorted(results, key=key)
+
+
+_WORKER_RECORDS: Sequence[RecordedPrediction] = ()
+_WORKER_GEOMETRY = False
+
+
+def _load_worker_state(records: Sequence[RecordedPrediction], geometry: bool) -> None:
+    global _WORKER_RECORDS, _WORKER_GEOMETRY
+    _WORKER_RECORDS = records
+    _WORKER_GEOMETRY = geometry
+
+
+def _init_worker(records: Sequence[RecordedPrediction], geometry: bool) -> None:
+    """Pool initializer: only runs in spawned workers, so silencing the logger is safe."""
+
+    _load_worker_state(records, geometry)
+    # Los logs por decisión (p. ej. Clima descartada) saturan la salida al reproducir miles de frames.
+    logging.getLogger("helen.backend").setLevel(logging.ERROR)
+
+
+@contextmanager
+def _quiet_backend_logs() -> Iterator[None]:
+    """Silence ``helen.backend`` for an in-process replay and restore its level afterwards."""
+
+    logger = logging.getLogger("helen.backend")
+    previous = logger.level
+    logger.setLevel(logging.ERROR)
+    try:
+        yield
+    finally:
+        logger.setLevel(previous)
+
+
+def _replay_worker(overrides: Dict[str, float]) -> Dict[str, Any]:
+    return replay(_WORKER_RECORDS, overrides, geometry=_WORKER_GEOMETRY)
+
+
+def run_grid(
+    records: Sequence[RecordedPrediction],
+    grid: ParameterGrid,
+    *,
+    workers: Optional[int] = None,
+    geometry: bool = False,
+) -> List[Dict[str, Any]]:
+    """Evaluate every configuration of ``grid`` and return the ranked results."""
+
+    configs = expand_grid(grid)
+    if {} not in configs:
+        configs.insert(0, {})
+
+    max_workers = max(1, int(workers or os.cpu_count() or 1))
+    if max_workers == 1 or len(configs) == 1:
+        _load_worker_state(records, geometry)
+        with _quiet_backend_logs():
+            results = [_replay_worker(config) for config in configs]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(configs)),
+            initializer=_init_worker,
+            initargs=(tuple(records), geometry),
+        ) as pool:
+            results = list(pool.map(_replay_worker, configs, chunksize=max(1, len(configs) // (max_workers * 4))))
+
+    return rank_results(results)
+
+
+def _format_row(position: int, result: Dict[str, Any]) -> str:
+    overrides = result.get("overrides") or {}
+    label = ", ".join(f"{name}={value:g}" for name, value in sorted(overrides.items())) or "(valores actuales)"
+    latency = result.get("latency_ms_mean")
+    detection = result.get("detection_rate")
+    return "{pos:>3}. FA/min={fa:6.2f}  latencia={lat}  detección={det}  emisiones={emit}  {label}".format(
+        pos=position,
+        fa=result.get("false_activations_per_min", 0.0),
+        lat=f"{latency:7.0f} ms" if latency is not None else "     n/d",
+        det=f"{detection:5.1%}" if detection is not None else "  n/d",
+        emit=result.get("emissions", 0),
+        label=label,
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Reproduce predicciones grabadas contra múltiples configuraciones")
+    parser.add_argument("recording", type=Path, help="Archivo JSONL generado con --record-predictions")
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="NOMBRE=V1,V2",
+        help=(
+            "Eje de la grilla (cooldown_s, listening_window_s, command_debounce_s, clima_post_start_delay_s, "
+            "global_min_score, consensus.window_size, consensus.required_votes, clima_consensus.*, "
+            "threshold.<Clase>.enter|release). Repetible"
+        ),
+    )
+    parser.add_argument("--grid", type=Path, default=None, help="JSON {parámetro: [valores]} con ejes adicionales")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos en paralelo (por defecto, núcleos disponibles)")
+    parser.add_argument("--geometry", action="store_true", help="Aplica la verificación geométrica con los landmarks grabados")
+    parser.add_argument("--top", type=int, default=10, help="Cantidad de configuraciones a mostrar")
+    parser.add_argument("--output", type=Path, default=None, help="Guarda el ranking completo en JSON")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="[%(asctime)s] %(levelname)s %(message)s")
+
+    grid: ParameterGrid = {}
+    try:
+        if args.grid:
+            for name, values in json.loads(args.grid.read_text(encoding="utf-8")).items():
+                _validate_parameter(name)
+                grid[name] = [float(value) for value in values]
+        for spec in args.param:
+            name, values = parse_parameter(spec)
+            grid[name] = values
+    except (OSError, ValueError) as error:
+        LOGGER.error("Grilla inválida: %s", error)
+        return 2
+
+    try:
+        records = load_recording(args.recording)
+    except (OSError, ValueError, KeyError) as error:
+        LOGGER.error("No se pudo leer la grabación %s: %s", args.recording, error)
+        return 1
+
+    if not records:
+        LOGGER.error("La grabación %s está vacía", args.recording)
+        return 1
+
+    LOGGER.info("Reproduciendo %d frames contra %d configuraciones", len(records), len(expand_grid(grid)))
+    ranked = run_grid(records, grid, workers=args.workers, geometry=args.geometry)
+
+    for position, result in enumerate(ranked[: max(1, args.top)], start=1):
+        print(_format_row(position, result))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(ranked, indent=2, ensure_ascii=False), encoding="utf-8")
+        LOGGER.info("Ranking guardado en %s", args.output)
+
+    return 0
+
+
+__all__ = [
+    "RecordedPrediction",
+    "build_engine",
+    "expand_grid",
+    "load_recording",
+    "parse_parameter",
+    "rank_results",
+    "replay",
+    "run_grid",
+    "main",
+]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 import argparse
+import json
 import logging
+import statistics
 import time
-from typing import Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from Hellen_model_RN.simple_classifier import IDLE_LABEL, Prediction, ScriptedGestureStream, parse_script
 
 from . import server
 
@@ -85,6 +92,146 @@ def run_camera_check(
     return 2
 
 
+class _SinkWriter:
+    """``wfile`` of an in-process SSE client: counts bytes instead of writing to a socket."""
+
+    def __init__(self) -> None:
+        self.bytes = 0
+
+    def write(self, data: bytes) -> None:
+        self.bytes += len(data)
+
+    def flush(self) -> None:
+        return None
+
+
+class _SinkClient:
+    def __init__(self, index: int) -> None:
+        self.client_address = ("soak", index)
+        self.wfile = _SinkWriter()
+
+
+def run_soak(
+    runtime: "server.HelenRuntime",
+    stream: ScriptedGestureStream,
+    *,
+    duration_s: float,
+    fps: float,
+    realtime: bool = True,
+    classify: bool = False,
+    score: float = 0.95,
+) -> Dict[str, Any]:
+    """Drive ``runtime``'s decision engine and SSE fan-out with scripted frames at ``fps``.
+
+    Con ``realtime`` el bucle respeta el reloj real (los frames atrasados se
+    cuentan en ``late`` sin recuperar el ritmo); sin él las marcas de tiempo
+    avanzan ``1 / fps`` por frame y se mide el rendimiento máximo. Sin
+    ``classify`` cada frame predice su etiqueta del guion con ``score``, de modo
+    que solo se mide el motor de decisiones y la difusión de eventos.
+    """
+
+    period = 1.0 / fps
+    frames = max(1, int(duration_s * fps))
+    timings: List[float] = []
+    emitted: Dict[str, int] = {}
+    late = 0
+    sequence = 1
+    started = time.perf_counter()
+    clock = time.time()
+    for frame in range(frames):
+        if realtime:
+            delay = started + frame * period - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -period:
+                late += 1
+            timestamp = time.time()
+        else:
+            timestamp = clock + frame * period
+
+        features, label = stream.next()
+        if features is None:
+            continue
+        begin = time.perf_counter()
+        prediction = runtime.classifier.predict(features) if classify else Prediction(label=label, score=score)
+        decision = runtime.decision_engine.process(prediction, timestamp=timestamp, hint_label=label)
+        if decision.emit:
+            event = runtime.build_event(
+                label=decision.label,
+                score=decision.score,
+                latency_ms=(time.perf_counter() - begin) * 1000.0,
+                timestamp=timestamp,
+                sequence=sequence,
+                origin="soak",
+                hint_label=decision.hint_label,
+                payload=decision.payload,
+            )
+            runtime.push_prediction(event)
+            emitted[decision.label] = emitted.get(decision.label, 0) + 1
+            sequence += 1
+        timings.append((time.perf_counter() - begin) * 1000.0)
+
+    elapsed = time.perf_counter() - started
+    timings.sort()
+    return {
+        "frames": frames,
+        "processed": len(timings),
+        "idle": frames - len(timings),
+        "elapsed_s": round(elapsed, 3),
+        "achieved_fps": round(frames / elapsed, 1) if elapsed else None,
+        "late": late,
+        "events": emitted,
+        "frame_ms_p50": round(statistics.median(timings), 4) if timings else None,
+        "frame_ms_p99": round(timings[min(len(timings) - 1, int(0.99 * len(timings)))], 4) if timings else None,
+        "sse_clients": runtime.event_stream.client_count(),
+    }
+
+
+def run_soak_check(
+    *,
+    duration_s: float,
+    fps: float,
+    script: str,
+    dataset_path: Optional[Path] = None,
+    realtime: bool = True,
+    classify: bool = False,
+    sse_clients: int = 0,
+) -> int:
+    """Soak-test the decision engine and SSE fan-out without camera and print a JSON report."""
+
+    segments = parse_script(script)
+    dataset_path = dataset_path or server.RuntimeConfig().dataset_path
+    if dataset_path.exists():
+        stream = ScriptedGestureStream.from_dataset(dataset_path, segments, fps=fps, seed=0)
+    elif classify:
+        LOGGER.error("--classify necesita el dataset %s", dataset_path)
+        return 1
+    else:
+        # Sin dataset las muestras no importan: la predicción es la etiqueta del guion.
+        LOGGER.warning("Dataset %s no disponible; se usan muestras aleatorias", dataset_path)
+        rng = np.random.default_rng(0)
+        labels = {label for label, _ in segments if label != IDLE_LABEL}
+        stream = ScriptedGestureStream({label: rng.random((8, 42)) for label in labels}, segments, fps=fps, seed=0)
+
+    runtime = server.HelenRuntime(server.RuntimeConfig(enable_camera=False, warmup=False))
+    sinks = [_SinkClient(index) for index in range(max(0, sse_clients))]
+    client_ids = [runtime.event_stream.register(sink) for sink in sinks]
+    try:
+        if classify and not callable(getattr(runtime.classifier, "predict", None)):
+            LOGGER.error("El clasificador activo (%s) no clasifica frames individuales", runtime.model_source)
+            return 1
+        report = run_soak(
+            runtime, stream, duration_s=duration_s, fps=fps, realtime=realtime, classify=classify
+        )
+    finally:
+        for client_id in client_ids:
+            runtime.event_stream.unregister(client_id)
+        runtime.stop(export_report=False)
+    report["sse_bytes"] = sum(sink.wfile.bytes for sink in sinks)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
 def main(argv: Optional[list[str]] = None) -> int:
     parser = argparse.ArgumentParser(description="Herramientas de diagnóstico de HELEN")
     parser.add_argument("--camera-index", type=int, default=0, help="Índice de la cámara a verificar")
@@ -96,9 +243,35 @@ def main(argv: Optional[list[str]] = None) -> int:
         action="store_true",
         help="No falla si la cámara no está disponible (útil para CI)",
     )
+    soak = parser.add_argument_group("prueba de carga sintética (sin cámara)")
+    soak.add_argument("--soak", type=float, default=None, metavar="SEGUNDOS", help="Duración de la prueba de carga")
+    soak.add_argument("--fps", type=float, default=30.0, help="Frames por segundo inyectados")
+    soak.add_argument(
+        "--script",
+        default="idle:1.5,Start:0.8,idle:0.3,Clima:0.8",
+        help="Guion ETIQUETA:SEGUNDOS repetido en bucle ('idle' = sin mano)",
+    )
+    soak.add_argument("--dataset", type=Path, default=None, help="Dataset pickle con las muestras por gesto")
+    soak.add_argument(
+        "--virtual-time",
+        action="store_true",
+        help="No espera entre frames: marcas de tiempo simuladas a --fps y rendimiento máximo",
+    )
+    soak.add_argument("--classify", action="store_true", help="Pasa cada frame por el clasificador activo")
+    soak.add_argument("--sse-clients", type=int, default=0, help="Clientes SSE simulados en proceso")
 
     args = parser.parse_args(argv)
     logging.basicConfig(level=logging.INFO, format="[%(asctime)s] %(levelname)s %(message)s")
+    if args.soak is not None:
+        return run_soak_check(
+            duration_s=args.soak,
+            fps=args.fps,
+            script=args.script,
+            dataset_path=args.dataset,
+            realtime=not args.virtual_time,
+            classify=args.classify,
+            sse_clients=args.sse_clients,
+        )
     return run_camera_check(
         camera_index=args.camera_index,
         frames=args.frames,
@@ -0,0 +1,753 @@
+"""Capture and landmark extraction in a child process.
+
+``Hands.process``, colour conversion and the per-frame Python bookkeeping
+compete for the GIL with the HTTP threads and the decision engine when they
+run as threads of the backend.  This module moves capture and MediaPipe into a
+child process per camera.  Landmarks travel back through
+:class:`LandmarkRing`, a ``multiprocessing.shared_memory`` ring of fixed-size
+float32 ``(hands, 21, 3)`` slots, so the parent only classifies, decides and
+serves.
+
+The module deliberately avoids importing :mod:`backendHelen.server`: the child
+is started with the ``spawn`` method and should only pay for OpenCV and
+MediaPipe.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import multiprocessing
+import queue
+import threading
+import time
+import zlib
+from collections import deque
+from multiprocessing import shared_memory
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+NUM_LANDMARKS = 21
+LANDMARK_DIM = 3
+DEFAULT_RING_CAPACITY = 8
+
+# Control de nitidez: solo el ROI de la mano, a resolución nativa y recortado a este lado máximo.
+# Reescalar cambiaría la escala del laplaciano y con ella el significado de QUALITY_BLUR_THRESHOLD.
+BLUR_ROI_MAX_SIDE = 320
+BLUR_ROI_PADDING = 0.1
+BLUR_SAMPLE_EVERY_N = 3
+
+# Columnas de ``meta`` por slot.
+META_HANDS = 0
+META_HAND_SCORE = 1
+META_BLUR = 2
+META_WIDTH = 3
+META_HEIGHT = 4
+META_FIELDS = 5
+
+
+class LandmarkFrame(NamedTuple):
+    sequence: int
+    timestamp: float
+    hands: int
+    hand_score: float
+    blur: Optional[float]
+    width: int
+    height: int
+    landmarks: np.ndarray  # (hands, 21, 3) float32, copia propia del lector
+
+
+def _align(offset: int, alignment: int = 8) -> int:
+    return (offset + alignment - 1) // alignment * alignment
+
+
+class LandmarkRing:
+    """Single-producer ring buffer of landmark slots in shared memory.
+
+    Every slot carries its own sequence number used as a seqlock: the writer
+    marks the slot as busy (``-1``), fills it and then stores the new sequence;
+    the reader copies the slot and only accepts it when the sequence did not
+    change in between.
+
+    Las escrituras numpy en memoria compartida no llevan barreras: en ARM (la Pi)
+    el lector puede ver la secuencia nueva antes que los landmarks. Por eso cada
+    slot guarda además un CRC32 de su contenido y de su secuencia, y el lector lo
+    recalcula sobre su copia: un slot a medio publicar se descarta en lugar de
+    devolverse roto. No se usa un lock entre procesos porque ``kill()`` puede
+    terminar al hijo mientras lo tiene tomado.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, capacity: int, hands: int, *, owner: bool) -> None:
+        self._shm = shm
+        self.capacity = int(capacity)
+        self.hands = int(hands)
+        self._owner = owner
+
+        buffer = shm.buf
+        offset = 0
+        self._header = np.ndarray((4,), dtype=np.int64, buffer=buffer, offset=offset)
+        offset = _align(offset + self._header.nbytes)
+        self._slot_seq = np.ndarray((self.capacity,), dtype=np.int64, buffer=buffer, offset=offset)
+        offset = _align(offset + self._slot_seq.nbytes)
+        self._slot_crc = np.ndarray((self.capacity,), dtype=np.int64, buffer=buffer, offset=offset)
+        offset = _align(offset + self._slot_crc.nbytes)
+        self._slot_time = np.ndarray((self.capacity,), dtype=np.float64, buffer=buffer, offset=offset)
+        offset = _align(offset + self._slot_time.nbytes)
+        self._slot_meta = np.ndarray((self.capacity, META_FIELDS), dtype=np.float32, buffer=buffer, offset=offset)
+        offset = _align(offset + self._slot_meta.nbytes)
+        self._slot_landmarks = np.ndarray(
+            (self.capacity, self.hands, NUM_LANDMARKS, LANDMARK_DIM),
+            dtype=np.float32,
+            buffer=buffer,
+            offset=offset,
+        )
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def required_size(capacity: int, hands: int) -> int:
+        size = _align(4 * 8)
+        size = _align(size + capacity * 8)
+        size = _align(size + capacity * 8)
+        size = _align(size + capacity * 8)
+        size = _align(size + capacity * META_FIELDS * 4)
+        return size + capacity * hands * NUM_LANDMARKS * LANDMARK_DIM * 4
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def create(cls, capacity: int = DEFAULT_RING_CAPACITY, hands: int = 1) -> "LandmarkRing":
+        capacity = max(2, int(capacity))
+        hands = max(1, int(hands))
+        shm = shared_memory.SharedMemory(create=True, size=cls.required_size(capacity, hands))
+        ring = cls(shm, capacity, hands, owner=True)
+        ring._header[:] = (0, capacity, hands, 0)
+        ring._slot_seq[:] = 0
+        return ring
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def attach(cls, name: str, capacity: int, hands: int) -> "LandmarkRing":
+        # Los hijos ``spawn`` comparten el resource_tracker del padre, que es quien libera el segmento.
+        shm = shared_memory.SharedMemory(name=name)
+        return cls(shm, capacity, hands, owner=False)
+
+    # ------------------------------------------------------------------
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    # ------------------------------------------------------------------
+    @property
+    def write_sequence(self) -> int:
+        return int(self._header[0])
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _checksum(sequence: int, timestamp: np.ndarray, meta: np.ndarray, landmarks: np.ndarray) -> int:
+        crc = zlib.crc32(np.int64(sequence).tobytes())
+        crc = zlib.crc32(timestamp, crc)
+        crc = zlib.crc32(meta, crc)
+        return zlib.crc32(landmarks, crc)
+
+    # ------------------------------------------------------------------
+    def write(
+        self,
+        *,
+        timestamp: float,
+        landmarks: Optional[np.ndarray],
+        hands: int,
+        hand_score: float,
+        blur: Optional[float],
+        width: int,
+        height: int,
+    ) -> int:
+        sequence = int(self._header[0]) + 1
+        index = (sequence - 1) % self.capacity
+        self._slot_seq[index] = -1
+        self._slot_time[index] = timestamp
+        meta = self._slot_meta[index]
+        meta[META_HANDS] = hands
+        meta[META_HAND_SCORE] = hand_score
+        meta[META_BLUR] = np.nan if blur is None else blur
+        meta[META_WIDTH] = width
+        meta[META_HEIGHT] = height
+        if landmarks is None:
+            self._slot_landmarks[index].fill(0.0)
+        else:
+            self._slot_landmarks[index] = landmarks
+        self._slot_crc[index] = self._checksum(
+            sequence, self._slot_time[index : index + 1], meta, self._slot_landmarks[index]
+        )
+        self._slot_seq[index] = sequence
+        self._header[0] = sequence
+        return sequence
+
+    # ------------------------------------------------------------------
+    def read_latest(self, after: int = 0) -> Optional[LandmarkFrame]:
+        """Return the newest frame with a sequence greater than ``after``."""
+
+        for _ in range(3):
+            sequence = int(self._header[0])
+            if sequence <= after:
+                return None
+            index = (sequence - 1) % self.capacity
+            if int(self._slot_seq[index]) != sequence:
+                continue
+            checksum = int(self._slot_crc[index])
+            timestamp = self._slot_time[index : index + 1].copy()
+            meta = self._slot_meta[index].copy()
+            landmarks = self._slot_landmarks[index].copy()
+            if int(self._slot_seq[index]) != sequence:
+                continue
+            if self._checksum(sequence, timestamp, meta, landmarks) != checksum:
+                continue  # publicación aún no visible por completo (sin barreras de memoria)
+            blur = float(meta[META_BLUR])
+            return LandmarkFrame(
+                sequence=sequence,
+                timestamp=float(timestamp[0]),
+                hands=int(meta[META_HANDS]),
+                hand_score=float(meta[META_HAND_SCORE]),
+                blur=None if np.isnan(blur) else blur,
+                width=int(meta[META_WIDTH]),
+                height=int(meta[META_HEIGHT]),
+                landmarks=landmarks,
+            )
+        return None
+
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        # Las vistas numpy retienen el buffer; se liberan antes de cerrar el segmento.
+        self._header = self._slot_seq = self._slot_crc = None  # type: ignore[assignment]
+        self._slot_time = self._slot_meta = self._slot_landmarks = None  # type: ignore[assignment]
+        with contextlib.suppress(Exception):
+            self._shm.close()
+        if self._owner:
+            with contextlib.suppress(FileNotFoundError):
+                self._shm.unlink()
+
+
+class FramePacer:
+    """Deadline scheduler shared by a pipeline and its camera stream.
+
+    A camera stream asks :meth:`due` for every frame it reads: frames that
+    arrive before the next deadline (or fall between ``frame_stride``) are
+    dropped before any conversion or MediaPipe work, so the processing rate
+    follows ``1 / interval_s`` instead of camera period + work + sleep.
+    ``frame_stride`` thins the arriving frames and the deadline caps the
+    rate, so the result is ``min(camera_fps / frame_stride, 1 / interval_s)``.
+    Streams that are not paced by a sensor (synthetic) block in :meth:`wait`
+    until the deadline instead. A deadline missed by more than one interval
+    re-anchors to the current time so a slow frame never causes a burst.
+
+    With ``--capture-process`` the gate runs in the capture child, which
+    keeps its own copy configured from the parent's through
+    :meth:`CaptureProcess.set_pacing`; the parent only counts the frames that
+    reach the ring (:meth:`accept`).
+    """
+
+    def __init__(
+        self,
+        interval_s: float,
+        frame_stride: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._interval = max(0.0, float(interval_s))
+        self._frame_stride = max(1, int(frame_stride))
+        self._deadline = clock()
+        self._stride_cursor = 0
+        self.processed = 0
+        self.skipped = 0
+        self.late = 0
+        self._due_times: Deque[float] = deque(maxlen=64)
+
+    # ------------------------------------------------------------------
+    def reconfigure(self, *, interval_s: Optional[float] = None, frame_stride: Optional[int] = None) -> None:
+        if interval_s is not None:
+            self._interval = max(0.0, float(interval_s))
+            self._deadline = min(self._deadline, self._clock() + self._interval)
+        if frame_stride is not None:
+            self._frame_stride = max(1, int(frame_stride))
+            self._stride_cursor = 0
+
+    # ------------------------------------------------------------------
+    @property
+    def interval_s(self) -> float:
+        return self._interval
+
+    # ------------------------------------------------------------------
+    @property
+    def frame_stride(self) -> int:
+        return self._frame_stride
+
+    # ------------------------------------------------------------------
+    def accept(self) -> None:
+        """Count a frame already let through by a remote gate (the capture child)."""
+
+        self._mark(self._clock(), self._interval)
+
+    # ------------------------------------------------------------------
+    def due(self) -> bool:
+        """Return whether the frame that just arrived should be processed."""
+
+        now = self._clock()
+        if self._frame_stride > 1:
+            self._stride_cursor += 1
+            if self._stride_cursor < self._frame_stride:
+                self.skipped += 1
+                return False
+        # Tolerancia del 10 % para que el jitter del sensor no haga perder un frame entero;
+        # si el candidato llega antes de plazo, el siguiente frame hereda la candidatura.
+        if now < self._deadline - self._interval * 0.1:
+            self.skipped += 1
+            return False
+        self._stride_cursor = 0
+        self._mark(now, self._interval)
+        return True
+
+    # ------------------------------------------------------------------
+    def wait(self, stop: threading.Event) -> bool:
+        """Block until the next deadline; ``False`` when ``stop`` is set first."""
+
+        remaining = self._deadline - self._clock()
+        if remaining > 0 and stop.wait(remaining):
+            return False
+        if stop.is_set():
+            return False
+        # Sin frames que saltar, el paso se traduce en un periodo ``frame_stride`` veces mayor.
+        self._mark(self._clock(), self._interval * self._frame_stride)
+        return True
+
+    # ------------------------------------------------------------------
+    def _mark(self, now: float, period: float) -> None:
+        if not self.processed or now - self._deadline >= period:
+            self.late += 1 if self.processed else 0
+            self._deadline = now + period
+        else:
+            # Se conserva la cadencia: el próximo plazo cuenta desde el anterior, no desde el frame.
+            self._deadline += period
+        self.processed += 1
+        self._due_times.append(now)
+
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Dict[str, Any]:
+        times = list(self._due_times)
+        effective_fps: Optional[float] = None
+        if len(times) >= 2 and times[-1] > times[0]:
+            effective_fps = round((len(times) - 1) / (times[-1] - times[0]), 2)
+        return {
+            "target_fps": round(1.0 / self._interval, 2) if self._interval > 0 else None,
+            "frame_stride": self._frame_stride,
+            "effective_fps": effective_fps,
+            "processed": self.processed,
+            "skipped": self.skipped,
+            "late": self.late,
+        }
+
+
+# Posiciones del array compartido de ritmo (enteros de 32 bits: escrituras atómicas también en ARM).
+PACING_INTERVAL_US = 0
+PACING_STRIDE = 1
+PACING_SKIPPED = 2
+PACING_FIELDS = 3
+
+
+def _open_capture(cv2: Any, attempts: Sequence[Dict[str, Any]], options: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+    errors: List[str] = []
+    for attempt in attempts:
+        target = attempt.get("target")
+        flag = int(attempt.get("flag") or 0)
+        try:
+            cap = cv2.VideoCapture(target, flag) if flag else cv2.VideoCapture(target)
+        except Exception as error:  # pragma: no cover - depende del entorno
+            errors.append(f"{attempt.get('backend')}: {error}")
+            continue
+        if not cap or not cap.isOpened():
+            if cap:
+                with contextlib.suppress(Exception):
+                    cap.release()
+            errors.append(f"{attempt.get('backend')} no se pudo abrir en {target}")
+            continue
+
+        if attempt.get("backend") != "gstreamer":
+            pixel_format = options.get("pixel_format")
+            if pixel_format and len(pixel_format) == 4:
+                with contextlib.suppress(Exception):
+                    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*pixel_format))
+            width = int(options.get("width") or 0)
+            height = int(options.get("height") or 0)
+            fps = float(options.get("fps") or 0.0)
+            if width > 0 and height > 0:
+                with contextlib.suppress(Exception):
+                    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+                    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            if fps > 0:
+                with contextlib.suppress(Exception):
+                    cap.set(cv2.CAP_PROP_FPS, fps)
+
+        info = {
+            "backend": attempt.get("backend"),
+            "target": str(target),
+            "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH) or 0),
+            "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT) or 0),
+            "fps": float(cap.get(cv2.CAP_PROP_FPS) or 0.0),
+            "pipeline": target if attempt.get("backend") == "gstreamer" else None,
+            "frame_layout": attempt.get("frame_layout") or "BGR",
+        }
+        return cap, info
+
+    raise RuntimeError("; ".join(errors) or "No hay rutas de captura configuradas")
+
+
+def frame_planes(cv2: Any, frame: Any, layout: str = "BGR") -> Tuple[Any, Optional[Any], int, int]:
+    """Split a captured frame into ``(rgb, luma, width, height)``.
+
+    ``I420`` buffers (from a GStreamer appsink) carry the luma plane in their
+    first ``height`` rows, so it comes for free and a single conversion feeds
+    MediaPipe.  ``BGR`` frames return ``luma=None``; callers derive gray only
+    when they need it.
+    """
+
+    if layout == "I420":
+        height = int(frame.shape[0]) * 2 // 3
+        width = int(frame.shape[1])
+        return cv2.cvtColor(frame, cv2.COLOR_YUV2RGB_I420), frame[:height], width, height
+    height, width = frame.shape[:2]
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), None, int(width), int(height)
+
+
+def roi_blur(
+    cv2: Any,
+    image: Any,
+    bbox: Tuple[float, float, float, float],
+    *,
+    max_side: int = BLUR_ROI_MAX_SIDE,
+    padding: float = BLUR_ROI_PADDING,
+) -> Optional[float]:
+    """Laplacian variance of the hand ROI; ``None`` when the ROI is degenerate.
+
+    ``image`` is a luma plane or a BGR frame and ``bbox`` the normalised
+    ``(min_x, min_y, max_x, max_y)`` of the hand.  The ROI is cropped before
+    any conversion and never resized: a ROI larger than ``max_side`` is cut to
+    its central ``max_side`` window, so the value stays on the same per-pixel
+    scale as the former full-frame ``Laplacian(CV_64F).var()`` (same kernel;
+    ``CV_16S`` cannot overflow for 8-bit input) while the cost is bounded.
+    """
+
+    frame_height, frame_width = image.shape[:2]
+    min_x, min_y, max_x, max_y = bbox
+    pad_x = (max_x - min_x) * padding
+    pad_y = (max_y - min_y) * padding
+    x0 = max(0, int((min_x - pad_x) * frame_width))
+    y0 = max(0, int((min_y - pad_y) * frame_height))
+    x1 = min(frame_width, int(math.ceil((max_x + pad_x) * frame_width)))
+    y1 = min(frame_height, int(math.ceil((max_y + pad_y) * frame_height)))
+    if x1 - x0 < 8 or y1 - y0 < 8:
+        return None
+
+    if x1 - x0 > max_side:
+        x0 += (x1 - x0 - max_side) // 2
+        x1 = x0 + max_side
+    if y1 - y0 > max_side:
+        y0 += (y1 - y0 - max_side) // 2
+        y1 = y0 + max_side
+    roi = image[y0:y1, x0:x1]
+    if roi.ndim == 3:
+        roi = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+    _, stddev = cv2.meanStdDev(cv2.Laplacian(roi, cv2.CV_16S))
+    return float(stddev[0][0]) ** 2
+
+
+def landmarks_bbox(landmarks: Any) -> Tuple[float, float, float, float]:
+    xs = landmarks[:, 0]
+    ys = landmarks[:, 1]
+    return float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max())
+
+
+def hand_slots(labels: Sequence[Optional[str]], hands: int) -> List[int]:
+    """Slot of each detected hand: left 0, right 1, or the free one when that is taken.
+
+    MediaPipe a veces etiqueta ambas manos con la misma lateralidad; en ese caso
+    la segunda ocupa el bloque libre en lugar de sobrescribir a la primera.
+    """
+
+    slots: List[int] = []
+    for position, label in enumerate(labels[:hands]):
+        preferred = 1 if label == "Right" else 0 if label == "Left" else position
+        if preferred >= hands or preferred in slots:
+            preferred = next(slot for slot in range(hands) if slot not in slots)
+        slots.append(preferred)
+    return slots
+
+
+def run_capture_worker(
+    ring_name: str,
+    capacity: int,
+    hands: int,
+    attempts: Sequence[Dict[str, Any]],
+    options: Dict[str, Any],
+    stop_event: Any,
+    frame_event: Any,
+    status_queue: Any,
+    pacing: Any = None,
+) -> None:
+    """Child-process entry point: capture, run MediaPipe and fill the ring.
+
+    ``pacing`` is the shared ``PACING_*`` array written by the parent: frames
+    that are not due are read (to drain the sensor) but neither converted nor
+    passed to MediaPipe.
+    """
+
+    ring = LandmarkRing.attach(ring_name, capacity, hands)
+    cap = None
+    detector = None
+    try:
+        import cv2  # type: ignore
+        import mediapipe as mp  # type: ignore
+
+        cap, info = _open_capture(cv2, attempts, options)
+        detector = mp.solutions.hands.Hands(
+            static_image_mode=False,
+            max_num_hands=hands,
+            model_complexity=int(options.get("model_complexity", 1)),
+            min_detection_confidence=float(options.get("detection_confidence", 0.7)),
+            min_tracking_confidence=float(options.get("tracking_confidence", 0.6)),
+        )
+        status_queue.put(("opened", info))
+
+        compute_blur = bool(options.get("compute_blur", True))
+        blur_every = max(1, int(options.get("blur_every") or BLUR_SAMPLE_EVERY_N))
+        blur_threshold = float(options.get("blur_threshold") or 0.0)
+        blur_countdown = 0
+        cached_blur: Optional[float] = None
+        layout = info.get("frame_layout") or "BGR"
+        order_by_handedness = hands > 1
+        landmarks = np.zeros((hands, NUM_LANDMARKS, LANDMARK_DIM), dtype=np.float32)
+        consecutive_failures = 0
+        pacer = FramePacer(0.0)
+        applied_pacing = (0, 1)
+
+        while not stop_event.is_set():
+            ok, frame = cap.read()
+            if not ok or frame is None:
+                consecutive_failures += 1
+                if consecutive_failures in (1, 50):
+                    status_queue.put(("read_error", "No se pudo leer un frame de la cámara"))
+                stop_event.wait(0.05)
+                continue
+            consecutive_failures = 0
+
+            if pacing is not None:
+                requested = (int(pacing[PACING_INTERVAL_US]), int(pacing[PACING_STRIDE]))
+                if requested != applied_pacing:
+                    pacer.reconfigure(interval_s=requested[0] / 1e6, frame_stride=requested[1])
+                    applied_pacing = requested
+                if not pacer.due():
+                    pacing[PACING_SKIPPED] += 1
+                    continue
+
+            image, luma, width, height = frame_planes(cv2, frame, layout)
+            image.flags.writeable = False
+            results = detector.process(image)
+
+            detected = 0
+            hand_score = 0.0
+            blur: Optional[float] = None
+            landmarks.fill(0.0)
+            if results.multi_hand_landmarks:
+                handedness = results.multi_handedness or []
+                detected_hands = results.multi_hand_landmarks[:hands]
+                if order_by_handedness:
+                    labels = [
+                        handedness[position].classification[0].label if position < len(handedness) else None
+                        for position in range(len(detected_hands))
+                    ]
+                    slots = hand_slots(labels, hands)
+                else:
+                    slots = list(range(len(detected_hands)))
+                for slot, hand_landmarks in zip(slots, detected_hands):
+                    landmarks[slot] = [(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark]
+                    detected += 1
+                if handedness:
+                    with contextlib.suppress(AttributeError, IndexError):
+                        hand_score = float(handedness[0].classification[0].score)
+                if compute_blur:
+                    # Muestreo cada N frames con mano; un valor borroso se vuelve a medir en el siguiente.
+                    if blur_countdown <= 0 or cached_blur is None or cached_blur < blur_threshold:
+                        primary = landmarks[1] if order_by_handedness and not landmarks[0].any() else landmarks[0]
+                        cached_blur = roi_blur(cv2, luma if luma is not None else frame, landmarks_bbox(primary))
+                        blur_countdown = blur_every
+                    blur_countdown -= 1
+                    blur = cached_blur
+            else:
+                cached_blur = None
+
+            ring.write(
+                timestamp=time.time(),
+                landmarks=landmarks if detected else None,
+                hands=detected,
+                hand_score=hand_score,
+                blur=blur,
+                width=int(width),
+                height=int(height),
+            )
+            frame_event.set()
+    except Exception as error:  # pragma: no cover - depende del hardware
+        with contextlib.suppress(Exception):
+            status_queue.put(("error", str(error)))
+    finally:
+        if detector is not None:
+            with contextlib.suppress(Exception):
+                detector.close()
+        if cap is not None:
+            with contextlib.suppress(Exception):
+                cap.release()
+        ring.close()
+
+
+class CaptureProcess:
+    """Parent-side handle of one capture child process and its ring."""
+
+    def __init__(
+        self,
+        *,
+        attempts: Sequence[Dict[str, Any]],
+        options: Dict[str, Any],
+        hands: int = 1,
+        capacity: int = DEFAULT_RING_CAPACITY,
+        name: str = "HelenCapture",
+    ) -> None:
+        self._context = multiprocessing.get_context("spawn")
+        self.ring = LandmarkRing.create(capacity, hands)
+        self._stop_event = self._context.Event()
+        self._frame_event = self._context.Event()
+        self._status_queue = self._context.Queue()
+        # Sin lock: solo el padre escribe el ritmo y solo el hijo el contador; kill() no deja nada tomado.
+        self._pacing = self._context.Array("i", PACING_FIELDS, lock=False)
+        self._pacing[PACING_STRIDE] = 1
+        self._process = self._context.Process(
+            target=run_capture_worker,
+            args=(
+                self.ring.name,
+                self.ring.capacity,
+                self.ring.hands,
+                list(attempts),
+                dict(options),
+                self._stop_event,
+                self._frame_event,
+                self._status_queue,
+                self._pacing,
+            ),
+            name=name,
+            daemon=True,
+        )
+        self.info: Dict[str, Any] = {}
+        self.last_error: Optional[str] = None
+        self._last_sequence = 0
+
+    # ------------------------------------------------------------------
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid
+
+    # ------------------------------------------------------------------
+    def start(self, *, timeout: float = 10.0) -> Dict[str, Any]:
+        self._process.start()
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                kind, payload = self._status_queue.get(timeout=0.1)
+            except queue.Empty:
+                if not self._process.is_alive():
+                    break
+                continue
+            if kind == "opened":
+                self.info = dict(payload)
+                return self.info
+            if kind == "error":
+                self.last_error = str(payload)
+                break
+        self.stop()
+        raise RuntimeError(self.last_error or "El proceso de captura no respondió a tiempo")
+
+    # ------------------------------------------------------------------
+    def poll_status(self) -> None:
+        while True:
+            try:
+                kind, payload = self._status_queue.get_nowait()
+            except (queue.Empty, OSError, ValueError):
+                return
+            if kind in {"error", "read_error"}:
+                self.last_error = str(payload)
+
+    # ------------------------------------------------------------------
+    def set_pacing(self, interval_s: float, frame_stride: int) -> None:
+        """Have the child drop frames that are not due before any conversion or MediaPipe work."""
+
+        interval_us = max(0, int(round(float(interval_s) * 1e6)))
+        if self._pacing[PACING_INTERVAL_US] != interval_us:
+            self._pacing[PACING_INTERVAL_US] = interval_us
+        stride = max(1, int(frame_stride))
+        if self._pacing[PACING_STRIDE] != stride:
+            self._pacing[PACING_STRIDE] = stride
+
+    # ------------------------------------------------------------------
+    @property
+    def skipped(self) -> int:
+        """Frames the child read but dropped because they were not due."""
+
+        return int(self._pacing[PACING_SKIPPED])
+
+    # ------------------------------------------------------------------
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    # ------------------------------------------------------------------
+    def next_frame(self, timeout: float) -> Optional[LandmarkFrame]:
+        """Wait up to ``timeout`` seconds for a frame newer than the last one read."""
+
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            frame = self.ring.read_latest(self._last_sequence)
+            if frame is not None:
+                self._last_sequence = frame.sequence
+                return frame
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._process.is_alive():
+                return None
+            self._frame_event.wait(min(remaining, 0.05))
+            self._frame_event.clear()
+
+    # ------------------------------------------------------------------
+    def kill(self) -> None:
+        """Terminate the child right away (e.g. stuck in the driver); ``stop`` still cleans up."""
+
+        if self._process.pid is not None and self._process.is_alive():
+            with contextlib.suppress(Exception):
+                self._process.terminate()
+
+    # ------------------------------------------------------------------
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop_event.set()
+        if self._process.pid is not None:
+            self._process.join(timeout)
+            if self._process.is_alive():  # pragma: no cover - proceso bloqueado en el driver
+                self._process.terminate()
+                self._process.join(1.0)
+        with contextlib.suppress(Exception):
+            self._status_queue.close()
+        self.ring.close()
+
+
+__all__ = [
+    "CaptureProcess",
+    "FramePacer",
+    "LandmarkFrame",
+    "LandmarkRing",
+    "frame_planes",
+    "hand_slots",
+    "landmarks_bbox",
+    "roi_blur",
+    "run_capture_worker",
+]
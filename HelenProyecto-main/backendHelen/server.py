@@ -12,6 +12,8 @@ is production-ready:
   application works out of the box.
 * Exposes a comprehensive ``/health`` endpoint that reports the state of the
   model, camera, pipeline and SSE clients.
+* Lists the registered video model versions on ``/models`` and hot-swaps the
+  one promoted through ``POST /models/promote`` without restarting.
 
 The module is intentionally self-contained so it can be bundled with
 PyInstaller and launched both from source and from frozen executables.
@@ -34,14 +36,15 @@ import time
 import urllib.request
 import uuid
 import math
+import os
 from collections import Counter, defaultdict, deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from functools import partial
 from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler
 from pathlib import Path
-from typing import Any, Deque, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, TYPE_CHECKING, Union
+from typing import Any, Callable, ContextManager, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, TYPE_CHECKING, Union
 import statistics
 import numpy as np
 from xml.sax.saxutils import escape
@@ -58,13 +61,18 @@ except Exception:  # pragma: no cover - handled gracefully at runtime
 
 from Hellen_model_RN.helpers import labels_dict
 from Hellen_model_RN.video_gesture_model import config as video_config
-from Hellen_model_RN.video_gesture_model.extract_landmarks import normalise_landmarks
+from Hellen_model_RN.video_gesture_model.extract_landmarks import fill_frame_landmarks, normalise_landmarks
+from Hellen_model_RN.video_gesture_model.model_registry import ModelRegistry, ModelVersion
+from Hellen_model_RN.video_gesture_model.sequence_buffer import SequenceBuffer
 from Hellen_model_RN.simple_classifier import (
     Prediction,
+    ScriptedGestureStream,
     SimpleGestureClassifier,
     SyntheticGestureStream,
+    parse_script,
 )
-from . import camera_probe
+from . import camera_probe, landmark_worker
+from .landmark_worker import FramePacer
 
 if TYPE_CHECKING:  # pragma: no cover - typing aid only
     from .camera_probe import CameraSelection
@@ -187,6 +195,8 @@ MODEL_PATH = MODEL_DIR / "model.p"
 VIDEO_MODEL_DIR = MODEL_DIR / "video_gesture_model" / "models" / "gesture_model_20251106_063546"
 VIDEO_MODEL_SAVEDMODEL = VIDEO_MODEL_DIR / "saved_model.pb"
 VIDEO_LABELS_PATH = VIDEO_MODEL_DIR / "labels.json"
+# La versión promovida en registry.json tiene prioridad sobre VIDEO_MODEL_DIR.
+VIDEO_MODEL_REGISTRY = ModelRegistry(MODEL_DIR / "video_gesture_model" / "models")
 
 PRIMARY_DATASET_NAME = "data.pickle"
 LEGACY_DATASET_NAME = "data1.pickle"
@@ -373,6 +383,20 @@ DEFAULT_CLASS_THRESHOLDS.update(
 
 GLOBAL_MIN_SCORE = 0.6
 DEFAULT_POLL_INTERVAL_S = 0.12
+MODEL_SWAP_WARMUP_RUNS = 10
+STARTUP_WARMUP_RUNS = 3
+CACHED_SELECTION_FAILURE_LIMIT = 15
+CAMERA_SUPERVISOR_INTERVAL_S = 1.0
+CAMERA_STALL_SECONDS = 3.0
+CAMERA_REOPEN_ATTEMPTS = 2
+CAMERA_DISCONNECT_REPROBE_S = 10.0
+SUPERVISED_STREAM_SOURCES = frozenset({"camera", "video_camera"})
+ADAPTIVE_INTERVAL_S = 1.0
+ADAPTIVE_LATENCY_BUDGET_MS = 70.0
+ADAPTIVE_IDLE_AFTER_S = 4.0
+ADAPTIVE_MIN_DWELL_S = 3.0
+ADAPTIVE_CPU_HIGH = 0.9
+ADAPTIVE_CPU_LOW = 0.6
 
 
 @dataclass(frozen=True)
@@ -393,6 +417,25 @@ class PlatformRuntimeDefaults:
     frame_stride: int
 
 
+@dataclass(frozen=True)
+class AdaptiveLevel:
+    stride_offset: int
+    capture_scale: float
+    model_complexity: int
+
+
+# Del más fino (0) al más barato; el controlador adaptativo recorre la escalera de a un paso.
+ADAPTIVE_LEVELS = (
+    AdaptiveLevel(0, 1.0, 1),
+    AdaptiveLevel(0, 1.0, 0),
+    AdaptiveLevel(1, 0.75, 0),
+    AdaptiveLevel(2, 0.5, 0),
+)
+# Sin mano solo se espacian los frames procesados: resolución y complejidad se conservan
+# para que despertar al empezar un gesto no reabra la cámara ni reconstruya MediaPipe.
+ADAPTIVE_IDLE_STRIDE = 2
+
+
 @dataclass(frozen=True)
 class ConsensusConfig:
     window_size: int = 5
@@ -445,6 +488,30 @@ class DecisionOutcome(NamedTuple):
     window_ms: float
 
 
+class DecisionSnapshot(NamedTuple):
+    state: str
+    dominant_label: Optional[str]
+    cooldown_until: float
+    listen_until: float
+    command_debounce_until: float
+    last_state_change: float
+    last_activation_at: float
+    last_label: Optional[str]
+    last_score: float
+    last_reason: Optional[str]
+    last_emit_label: Optional[str]
+    last_emit_at: Optional[float]
+    processed: int
+    emitted: int
+    votes: Tuple[ConsensusVote, ...]
+    updated_at: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = self._asdict()
+        data["votes"] = [vote._asdict() for vote in self.votes]
+        return data
+
+
 @dataclass
 class SampleRecord:
     timestamp: float
@@ -554,22 +621,27 @@ class FeatureNormalizer:
 
 
 class ConsensusTracker:
-    """Maintain a rolling window of predictions for temporal consensus."""
+    """Maintain a rolling window of predictions for temporal consensus.
+
+    Owned by :class:`GestureDecisionEngine` and only mutated from the pipeline
+    thread, so it keeps no lock of its own.
+    """
 
     def __init__(self, config: ConsensusConfig) -> None:
         self._config = config
         self._votes: Deque[ConsensusVote] = deque(maxlen=config.window_size)
-        self._lock = threading.Lock()
 
     # ------------------------------------------------------------------
     def reset(self) -> None:
-        with self._lock:
-            self._votes.clear()
+        self._votes.clear()
 
     # ------------------------------------------------------------------
     def add(self, label: str, score: float, timestamp: float) -> None:
-        with self._lock:
-            self._votes.append(ConsensusVote(label=label, score=score, timestamp=timestamp))
+        self._votes.append(ConsensusVote(label=label, score=score, timestamp=timestamp))
+
+    # ------------------------------------------------------------------
+    def votes(self) -> Tuple[ConsensusVote, ...]:
+        return tuple(self._votes)
 
     # ------------------------------------------------------------------
     def evaluate(
@@ -579,8 +651,7 @@ class ConsensusTracker:
         *,
         window_size: Optional[int] = None,
     ) -> ConsensusResult:
-        with self._lock:
-            votes = list(self._votes)
+        votes = list(self._votes)
 
         if window_size is not None and window_size > 0:
             limit = max(1, int(window_size))
@@ -596,28 +667,25 @@ class ConsensusTracker:
 
     # ------------------------------------------------------------------
     def snapshot(self) -> Dict[str, Any]:
-        with self._lock:
-            votes = list(self._votes)
-
         return {
             "window_size": self._config.window_size,
             "required_votes": self._config.required_votes,
-            "votes": [vote._asdict() for vote in votes],
+            "votes": [vote._asdict() for vote in self.votes()],
         }
 
 
 class GestureMetrics:
-    """Aggregate per-session metrics for calibration and reporting."""
+    """Aggregate per-session metrics for calibration and reporting.
+
+    Writes happen only on the pipeline thread and are plain appends or counter
+    updates; readers copy the sample list (an atomic operation) and derive the
+    aggregates themselves, so neither side takes a lock.
+    """
 
     def __init__(self) -> None:
         self._samples: List[SampleRecord] = []
-        self._accepted_scores: Dict[str, List[float]] = defaultdict(list)
-        self._rejected_scores: Dict[str, List[float]] = defaultdict(list)
         self._quality_checks = 0
-        self._quality_rejections: Counter[str] = Counter()
-        self._reason_counts: Counter[str] = Counter()
-        self._reason_by_label: Dict[str, Counter[str]] = defaultdict(Counter)
-        self._lock = threading.Lock()
+        self._quality_rejections: Dict[str, int] = {}
 
     # ------------------------------------------------------------------
     @staticmethod
@@ -655,10 +723,9 @@ class GestureMetrics:
 
     # ------------------------------------------------------------------
     def register_quality_check(self, valid: bool, reason: Optional[str]) -> None:
-        with self._lock:
-            self._quality_checks += 1
-            if not valid and reason:
-                self._quality_rejections[reason] += 1
+        self._quality_checks += 1
+        if not valid and reason:
+            self._quality_rejections[reason] = self._quality_rejections.get(reason, 0) + 1
 
     # ------------------------------------------------------------------
     def record_sample(self, record: SampleRecord) -> None:
@@ -666,18 +733,36 @@ class GestureMetrics:
         record.label = canonical_label
         canonical_hint = self._canonical(record.hint_label)
         record.hint_label = canonical_hint or None
+        self._samples.append(record)
 
-        with self._lock:
-            self._samples.append(record)
-            target = canonical_label or "__unlabelled__"
+    # ------------------------------------------------------------------
+    def _collect(self) -> Dict[str, Any]:
+        samples = list(self._samples)
+        quality_rejections = self._quality_rejections.copy()
+        accepted_scores: Dict[str, List[float]] = defaultdict(list)
+        rejected_scores: Dict[str, List[float]] = defaultdict(list)
+        reason_counts: Counter[str] = Counter()
+        reason_by_label: Dict[str, Counter[str]] = defaultdict(Counter)
+
+        for record in samples:
+            target = record.label or "__unlabelled__"
             if record.accepted:
-                self._accepted_scores[target].append(record.score)
+                accepted_scores[target].append(record.score)
             else:
-                self._rejected_scores[target].append(record.score)
+                rejected_scores[target].append(record.score)
+            reason_counts[record.reason] += 1
+            if record.label:
+                reason_by_label[record.label][record.reason] += 1
 
-            self._reason_counts[record.reason] += 1
-            if canonical_label:
-                self._reason_by_label[canonical_label][record.reason] += 1
+        return {
+            "samples": samples,
+            "quality_checks": self._quality_checks,
+            "quality_rejections": quality_rejections,
+            "reason_counts": dict(reason_counts),
+            "reason_by_label": {label: dict(counter) for label, counter in reason_by_label.items()},
+            "accepted_scores": dict(accepted_scores),
+            "rejected_scores": dict(rejected_scores),
+        }
 
     # ------------------------------------------------------------------
     def _f1_counts(self, samples: List[SampleRecord], label: str) -> Tuple[int, int, int]:
@@ -757,8 +842,7 @@ class GestureMetrics:
 
     # ------------------------------------------------------------------
     def threshold_suggestions(self, thresholds: Dict[str, ClassThreshold]) -> List[ThresholdSuggestion]:
-        with self._lock:
-            samples = list(self._samples)
+        samples = list(self._samples)
 
         suggestions: List[ThresholdSuggestion] = []
 
@@ -820,24 +904,9 @@ class GestureMetrics:
 
     # ------------------------------------------------------------------
     def snapshot(self) -> Dict[str, Any]:
-        with self._lock:
-            samples = list(self._samples)
-            quality_checks = self._quality_checks
-            quality_rejections = dict(self._quality_rejections)
-            reason_counts = dict(self._reason_counts)
-            reason_by_label = {label: dict(counter) for label, counter in self._reason_by_label.items()}
-            accepted_scores = {label: list(values) for label, values in self._accepted_scores.items()}
-            rejected_scores = {label: list(values) for label, values in self._rejected_scores.items()}
-
-        return {
-            "samples": [record.__dict__ for record in samples],
-            "quality_checks": quality_checks,
-            "quality_rejections": quality_rejections,
-            "reason_counts": reason_counts,
-            "reason_by_label": reason_by_label,
-            "accepted_scores": accepted_scores,
-            "rejected_scores": rejected_scores,
-        }
+        collected = self._collect()
+        collected["samples"] = [record.__dict__ for record in collected["samples"]]
+        return collected
 
     # ------------------------------------------------------------------
     def generate_report(
@@ -849,14 +918,14 @@ class GestureMetrics:
         latency_stats: Dict[str, float],
         label_consensus: Optional[Dict[str, ConsensusConfig]] = None,
     ) -> Dict[str, Any]:
-        with self._lock:
-            samples = list(self._samples)
-            quality_checks = self._quality_checks
-            quality_rejections = dict(self._quality_rejections)
-            reason_counts = dict(self._reason_counts)
-            reason_by_label = {label: dict(counter) for label, counter in self._reason_by_label.items()}
-            accepted_scores = {label: list(values) for label, values in self._accepted_scores.items()}
-            rejected_scores = {label: list(values) for label, values in self._rejected_scores.items()}
+        collected = self._collect()
+        samples = collected["samples"]
+        quality_checks = collected["quality_checks"]
+        quality_rejections = collected["quality_rejections"]
+        reason_counts = collected["reason_counts"]
+        reason_by_label = collected["reason_by_label"]
+        accepted_scores = collected["accepted_scores"]
+        rejected_scores = collected["rejected_scores"]
 
         total_rejections = sum(quality_rejections.values())
         quality_ratio = (total_rejections / quality_checks) if quality_checks else 0.0
@@ -1212,7 +1281,12 @@ class LandmarkGeometryVerifier:
 
 
 class GestureDecisionEngine:
-    """Stateful filter applying consensus, hysteresis and cooldown rules."""
+    """Stateful filter applying consensus, hysteresis and cooldown rules.
+
+    The engine is single-writer: only the pipeline thread calls :meth:`process`.
+    After every frame it publishes an immutable :class:`DecisionSnapshot` that
+    HTTP handlers and the report exporter read through :meth:`snapshot`.
+    """
 
     def __init__(
         self,
@@ -1223,6 +1297,11 @@ class GestureDecisionEngine:
         global_min_score: float = GLOBAL_MIN_SCORE,
         geometry_verifier: Optional[LandmarkGeometryVerifier] = None,
         per_label_consensus: Optional[Dict[str, ConsensusConfig]] = None,
+        cooldown_seconds: float = COOLDOWN_SECONDS,
+        listening_window_seconds: float = LISTENING_WINDOW_SECONDS,
+        command_debounce_seconds: float = COMMAND_DEBOUNCE_SECONDS,
+        clima_post_start_delay: float = CLIMA_POST_START_DELAY,
+        clock: Callable[[], float] = time.time,
     ) -> None:
         self._metrics = metrics
         base_thresholds = dict(DEFAULT_CLASS_THRESHOLDS)
@@ -1242,18 +1321,39 @@ class GestureDecisionEngine:
                 if canonical:
                     overrides[canonical] = override
         self._per_label_consensus = overrides
+        self._cooldown_duration = max(0.0, float(cooldown_seconds))
+        self._command_debounce_duration = max(0.0, float(command_debounce_seconds))
+        self._clima_post_start_delay = max(0.0, float(clima_post_start_delay))
+        self._clock = clock
 
         self._state = "idle"
         self._cooldown_until = 0.0
         self._listen_until = 0.0
         self._command_debounce_until = 0.0
-        self._listening_duration = LISTENING_WINDOW_SECONDS
+        self._listening_duration = max(0.0, float(listening_window_seconds))
         self._dominant_label: Optional[str] = None
-        self._last_state_change = time.time()
+        self._last_state_change = clock()
         self._last_activation_at = 0.0
-        self._lock = threading.Lock()
         self._last_clima_warning: Optional[str] = None
         self._last_clima_accept_signature: Optional[Tuple[int, int, int, int]] = None
+        self._snapshot = DecisionSnapshot(
+            state=self._state,
+            dominant_label=None,
+            cooldown_until=0.0,
+            listen_until=0.0,
+            command_debounce_until=0.0,
+            last_state_change=self._last_state_change,
+            last_activation_at=0.0,
+            last_label=None,
+            last_score=0.0,
+            last_reason=None,
+            last_emit_label=None,
+            last_emit_at=None,
+            processed=0,
+            emitted=0,
+            votes=(),
+            updated_at=self._last_state_change,
+        )
 
     # ------------------------------------------------------------------
     def _reset_consensus(self) -> None:
@@ -1412,188 +1512,103 @@ class GestureDecisionEngine:
         self,
         prediction: Prediction,
         *,
-        timestamp: float,
+        timestamp: Optional[float] = None,
         hint_label: Optional[str] = None,
         latency_ms: float = 0.0,
         landmarks: Optional[Sequence[LandmarkPoint]] = None,
     ) -> DecisionOutcome:
-        with self._lock:
-            self._update_state(timestamp)
-
-            canonical_label = GestureMetrics._canonical(prediction.label)
-            canonical_hint = GestureMetrics._canonical(hint_label)
-            score = float(prediction.score)
-            state = self._state
-            consensus_override = self._consensus_override(canonical_label)
+        """Evaluate one prediction; must only be called from the pipeline thread.
 
-            payload: Dict[str, Any] = {
-                "latency_ms": latency_ms,
-                "state": state,
-            }
-            geometry_checked = False
+        ``timestamp`` defaults to the engine clock, so cooldown, listening and
+        debounce windows follow the injected ``clock`` unless the caller stamps
+        the frame itself (e.g. replaying a recording).
+        """
 
-            required_votes = (
-                consensus_override.required_votes if consensus_override else self._consensus_config.required_votes
-            )
-            consensus_window = (
-                consensus_override.window_size if consensus_override else self._consensus_config.window_size
-            )
+        if timestamp is None:
+            timestamp = self._clock()
+        outcome = self._decide(
+            prediction,
+            timestamp=timestamp,
+            hint_label=hint_label,
+            latency_ms=latency_ms,
+            landmarks=landmarks,
+        )
+        self._publish(timestamp, outcome)
+        return outcome
 
-            if self._geometry_verifier is not None and landmarks is not None:
-                geometry_ok, geometry_reason = self._geometry_verifier.verify(canonical_label, landmarks)
-                geometry_checked = True
-                if not geometry_ok:
-                    reason = geometry_reason or "geometry_rejected"
-                    self._record(
-                        label=canonical_label,
-                        score=score,
-                        accepted=False,
-                        reason=reason,
-                        state=state,
-                        hint_label=canonical_hint,
-                        support=0,
-                        window_ms=0.0,
-                        timestamp=timestamp,
-                    )
-                    payload["decision_reason"] = reason
-                    payload["geometry_checked"] = True
-                    payload["geometry_reason"] = reason
-                    return self._finalize_decision(
-                        False,
-                        canonical_label,
-                        score,
-                        payload,
-                        reason,
-                        state,
-                        canonical_hint,
-                        0,
-                        0.0,
-                        required_votes,
-                        0,
-                    )
-            if self._geometry_verifier is not None:
-                payload["geometry_checked"] = geometry_checked
+    # ------------------------------------------------------------------
+    def _publish(self, timestamp: float, outcome: Optional[DecisionOutcome]) -> None:
+        # A single reference assignment is atomic, so readers always observe a
+        # complete snapshot without taking a lock on the hot path.
+        previous = self._snapshot
+        emitted = outcome is not None and outcome.emit
+        self._snapshot = DecisionSnapshot(
+            state=self._state,
+            dominant_label=self._dominant_label,
+            cooldown_until=self._cooldown_until,
+            listen_until=self._listen_until,
+            command_debounce_until=self._command_debounce_until,
+            last_state_change=self._last_state_change,
+            last_activation_at=self._last_activation_at,
+            last_label=outcome.label if outcome else previous.last_label,
+            last_score=outcome.score if outcome else previous.last_score,
+            last_reason=outcome.reason if outcome else previous.last_reason,
+            last_emit_label=outcome.label if emitted else previous.last_emit_label,
+            last_emit_at=timestamp if emitted else previous.last_emit_at,
+            processed=previous.processed + (1 if outcome else 0),
+            emitted=previous.emitted + (1 if emitted else 0),
+            votes=self._consensus.votes(),
+            updated_at=timestamp,
+        )
 
-            thresholds = self._current_threshold(canonical_label)
-            self._consensus.add(canonical_label, score, timestamp)
-            result = self._consensus.evaluate(
-                canonical_label,
-                thresholds.enter if thresholds else self._global_min_score,
-                window_size=consensus_window,
-            )
+    # ------------------------------------------------------------------
+    def snapshot(self) -> DecisionSnapshot:
+        """Return the last published state; safe to call from any thread."""
 
-            support = result.votes
-            window_ms = result.span_ms
-            total_votes = result.total
+        return self._snapshot
 
-            if thresholds and result.average >= thresholds.enter:
-                self._dominant_label = canonical_label
+    # ------------------------------------------------------------------
+    def now(self) -> float:
+        """Current time on the engine clock, used to stamp pipeline frames."""
 
-            locked_label = self._apply_hysteresis(canonical_label)
-            state = self._state
+        return self._clock()
 
-            payload.update(
-                {
-                    "consensus_support": support,
-                    "consensus_total": result.total,
-                    "consensus_span_ms": window_ms,
-                    "votes_required": required_votes,
-                    "consensus_window": consensus_window,
-                }
-            )
+    # ------------------------------------------------------------------
+    def _decide(
+        self,
+        prediction: Prediction,
+        *,
+        timestamp: float,
+        hint_label: Optional[str],
+        latency_ms: float,
+        landmarks: Optional[Sequence[LandmarkPoint]],
+    ) -> DecisionOutcome:
+        self._update_state(timestamp)
 
-            if locked_label and locked_label != canonical_label:
-                reason = "hysteresis_locked"
-                self._record(
-                    label=canonical_label,
-                    score=score,
-                    accepted=False,
-                    reason=reason,
-                    state=state,
-                    hint_label=canonical_hint,
-                    support=support,
-                    window_ms=window_ms,
-                    timestamp=timestamp,
-                )
-                payload["locked_label"] = locked_label
-                payload["decision_reason"] = reason
-                return self._finalize_decision(
-                    False,
-                    canonical_label,
-                    score,
-                    payload,
-                    reason,
-                    state,
-                    canonical_hint,
-                    support,
-                    window_ms,
-                    required_votes,
-                    total_votes,
-                )
+        canonical_label = GestureMetrics._canonical(prediction.label)
+        canonical_hint = GestureMetrics._canonical(hint_label)
+        score = float(prediction.score)
+        state = self._state
+        consensus_override = self._consensus_override(canonical_label)
 
-            if score < self._global_min_score:
-                reason = "score_below_global"
-                self._record(
-                    label=canonical_label,
-                    score=score,
-                    accepted=False,
-                    reason=reason,
-                    state=state,
-                    hint_label=canonical_hint,
-                    support=support,
-                    window_ms=window_ms,
-                    timestamp=timestamp,
-                )
-                payload["decision_reason"] = reason
-                return self._finalize_decision(
-                    False,
-                    canonical_label,
-                    score,
-                    payload,
-                    reason,
-                    state,
-                    canonical_hint,
-                    support,
-                    window_ms,
-                    required_votes,
-                    total_votes,
-                )
+        payload: Dict[str, Any] = {
+            "latency_ms": latency_ms,
+            "state": state,
+        }
+        geometry_checked = False
 
-            if thresholds is None:
-                reason = "not_tracked"
-                self._record(
-                    label=canonical_label,
-                    score=score,
-                    accepted=False,
-                    reason=reason,
-                    state=state,
-                    hint_label=canonical_hint,
-                    support=support,
-                    window_ms=window_ms,
-                    timestamp=timestamp,
-                )
-                payload["decision_reason"] = reason
-                return self._finalize_decision(
-                    False,
-                    canonical_label,
-                    score,
-                    payload,
-                    reason,
-                    state,
-                    canonical_hint,
-                    support,
-                    window_ms,
-                    required_votes,
-                    total_votes,
-                )
+        required_votes = (
+            consensus_override.required_votes if consensus_override else self._consensus_config.required_votes
+        )
+        consensus_window = (
+            consensus_override.window_size if consensus_override else self._consensus_config.window_size
+        )
 
-            if (
-                canonical_label == "Clima"
-                and state == "listening"
-                and self._last_activation_at
-                and (timestamp - self._last_activation_at) < CLIMA_POST_START_DELAY
-            ):
-                reason = "post_start_delay"
+        if self._geometry_verifier is not None and landmarks is not None:
+            geometry_ok, geometry_reason = self._geometry_verifier.verify(canonical_label, landmarks)
+            geometry_checked = True
+            if not geometry_ok:
+                reason = geometry_reason or "geometry_rejected"
                 self._record(
                     label=canonical_label,
                     score=score,
@@ -1601,11 +1616,13 @@ class GestureDecisionEngine:
                     reason=reason,
                     state=state,
                     hint_label=canonical_hint,
-                    support=support,
-                    window_ms=window_ms,
+                    support=0,
+                    window_ms=0.0,
                     timestamp=timestamp,
                 )
                 payload["decision_reason"] = reason
+                payload["geometry_checked"] = True
+                payload["geometry_reason"] = reason
                 return self._finalize_decision(
                     False,
                     canonical_label,
@@ -1614,217 +1631,138 @@ class GestureDecisionEngine:
                     reason,
                     state,
                     canonical_hint,
-                    support,
-                    window_ms,
+                    0,
+                    0.0,
                     required_votes,
-                    total_votes,
+                    0,
                 )
+        if self._geometry_verifier is not None:
+            payload["geometry_checked"] = geometry_checked
 
-            if state == "command_debounce" and timestamp < self._command_debounce_until:
-                reason = "command_debounce_active"
-                self._record(
-                    label=canonical_label,
-                    score=score,
-                    accepted=False,
-                    reason=reason,
-                    state=state,
-                    hint_label=canonical_hint,
-                    support=support,
-                    window_ms=window_ms,
-                    timestamp=timestamp,
-                )
-                payload["decision_reason"] = reason
-                return self._finalize_decision(
-                    False,
-                    canonical_label,
-                    score,
-                    payload,
-                    reason,
-                    state,
-                    canonical_hint,
-                    support,
-                    window_ms,
-                    required_votes,
-                    total_votes,
-                )
+        thresholds = self._current_threshold(canonical_label)
+        self._consensus.add(canonical_label, score, timestamp)
+        result = self._consensus.evaluate(
+            canonical_label,
+            thresholds.enter if thresholds else self._global_min_score,
+            window_size=consensus_window,
+        )
 
-            if state == "cooldown" and timestamp < self._cooldown_until:
-                reason = "cooldown_active"
-                self._record(
-                    label=canonical_label,
-                    score=score,
-                    accepted=False,
-                    reason=reason,
-                    state=state,
-                    hint_label=canonical_hint,
-                    support=support,
-                    window_ms=window_ms,
-                    timestamp=timestamp,
-                )
-                payload["decision_reason"] = reason
-                return self._finalize_decision(
-                    False,
-                    canonical_label,
-                    score,
-                    payload,
-                    reason,
-                    state,
-                    canonical_hint,
-                    support,
-                    window_ms,
-                    required_votes,
-                    total_votes,
-                )
+        support = result.votes
+        window_ms = result.span_ms
+        total_votes = result.total
 
-            if state == "idle" and canonical_label != "Start":
-                reason = "awaiting_activation"
-                self._record(
-                    label=canonical_label,
-                    score=score,
-                    accepted=False,
-                    reason=reason,
-                    state=state,
-                    hint_label=canonical_hint,
-                    support=support,
-                    window_ms=window_ms,
-                    timestamp=timestamp,
-                )
-                payload["decision_reason"] = reason
-                return self._finalize_decision(
-                    False,
-                    canonical_label,
-                    score,
-                    payload,
-                    reason,
-                    state,
-                    canonical_hint,
-                    support,
-                    window_ms,
-                    required_votes,
-                    total_votes,
-                )
+        if thresholds and result.average >= thresholds.enter:
+            self._dominant_label = canonical_label
 
-            if state == "listening" and canonical_label == "Start":
-                reason = "awaiting_command"
-                self._record(
-                    label=canonical_label,
-                    score=score,
-                    accepted=False,
-                    reason=reason,
-                    state=state,
-                    hint_label=canonical_hint,
-                    support=support,
-                    window_ms=window_ms,
-                    timestamp=timestamp,
-                )
-                payload["decision_reason"] = reason
-                return self._finalize_decision(
-                    False,
-                    canonical_label,
-                    score,
-                    payload,
-                    reason,
-                    state,
-                    canonical_hint,
-                    support,
-                    window_ms,
-                    required_votes,
-                    total_votes,
-                )
+        locked_label = self._apply_hysteresis(canonical_label)
+        state = self._state
 
-            if state == "listening" and canonical_label not in SUPPORTED_COMMANDS:
-                reason = "unsupported_command"
-                self._record(
-                    label=canonical_label,
-                    score=score,
-                    accepted=False,
-                    reason=reason,
-                    state=state,
-                    hint_label=canonical_hint,
-                    support=support,
-                    window_ms=window_ms,
-                    timestamp=timestamp,
-                )
-                payload["decision_reason"] = reason
-                return self._finalize_decision(
-                    False,
-                    canonical_label,
-                    score,
-                    payload,
-                    reason,
-                    state,
-                    canonical_hint,
-                    support,
-                    window_ms,
-                    required_votes,
-                    total_votes,
-                )
+        payload.update(
+            {
+                "consensus_support": support,
+                "consensus_total": result.total,
+                "consensus_span_ms": window_ms,
+                "votes_required": required_votes,
+                "consensus_window": consensus_window,
+            }
+        )
 
-            if score < thresholds.enter:
-                reason = "score_below_threshold"
-                self._record(
-                    label=canonical_label,
-                    score=score,
-                    accepted=False,
-                    reason=reason,
-                    state=state,
-                    hint_label=canonical_hint,
-                    support=support,
-                    window_ms=window_ms,
-                    timestamp=timestamp,
-                )
-                payload["threshold_enter"] = thresholds.enter
-                payload["decision_reason"] = reason
-                return self._finalize_decision(
-                    False,
-                    canonical_label,
-                    score,
-                    payload,
-                    reason,
-                    state,
-                    canonical_hint,
-                    support,
-                    window_ms,
-                    required_votes,
-                    total_votes,
-                )
+        if locked_label and locked_label != canonical_label:
+            reason = "hysteresis_locked"
+            self._record(
+                label=canonical_label,
+                score=score,
+                accepted=False,
+                reason=reason,
+                state=state,
+                hint_label=canonical_hint,
+                support=support,
+                window_ms=window_ms,
+                timestamp=timestamp,
+            )
+            payload["locked_label"] = locked_label
+            payload["decision_reason"] = reason
+            return self._finalize_decision(
+                False,
+                canonical_label,
+                score,
+                payload,
+                reason,
+                state,
+                canonical_hint,
+                support,
+                window_ms,
+                required_votes,
+                total_votes,
+            )
 
-            passes_votes = support >= required_votes
-            passes_average = result.average >= thresholds.enter
+        if score < self._global_min_score:
+            reason = "score_below_global"
+            self._record(
+                label=canonical_label,
+                score=score,
+                accepted=False,
+                reason=reason,
+                state=state,
+                hint_label=canonical_hint,
+                support=support,
+                window_ms=window_ms,
+                timestamp=timestamp,
+            )
+            payload["decision_reason"] = reason
+            return self._finalize_decision(
+                False,
+                canonical_label,
+                score,
+                payload,
+                reason,
+                state,
+                canonical_hint,
+                support,
+                window_ms,
+                required_votes,
+                total_votes,
+            )
 
-            if not passes_votes and not passes_average:
-                reason = "consensus_short"
-                self._record(
-                    label=canonical_label,
-                    score=score,
-                    accepted=False,
-                    reason=reason,
-                    state=state,
-                    hint_label=canonical_hint,
-                    support=support,
-                    window_ms=window_ms,
-                    timestamp=timestamp,
-                )
-                payload["decision_reason"] = reason
-                return self._finalize_decision(
-                    False,
-                    canonical_label,
-                    score,
-                    payload,
-                    reason,
-                    state,
-                    canonical_hint,
-                    support,
-                    window_ms,
-                    required_votes,
-                    total_votes,
-                )
+        if thresholds is None:
+            reason = "not_tracked"
+            self._record(
+                label=canonical_label,
+                score=score,
+                accepted=False,
+                reason=reason,
+                state=state,
+                hint_label=canonical_hint,
+                support=support,
+                window_ms=window_ms,
+                timestamp=timestamp,
+            )
+            payload["decision_reason"] = reason
+            return self._finalize_decision(
+                False,
+                canonical_label,
+                score,
+                payload,
+                reason,
+                state,
+                canonical_hint,
+                support,
+                window_ms,
+                required_votes,
+                total_votes,
+            )
 
-            reason = "accepted"
+        if (
+            canonical_label == "Clima"
+            and state == "listening"
+            and self._last_activation_at
+            and (timestamp - self._last_activation_at) < self._clima_post_start_delay
+        ):
+            reason = "post_start_delay"
             self._record(
                 label=canonical_label,
                 score=score,
-                accepted=True,
+                accepted=False,
                 reason=reason,
                 state=state,
                 hint_label=canonical_hint,
@@ -1832,37 +1770,214 @@ class GestureDecisionEngine:
                 window_ms=window_ms,
                 timestamp=timestamp,
             )
+            payload["decision_reason"] = reason
+            return self._finalize_decision(
+                False,
+                canonical_label,
+                score,
+                payload,
+                reason,
+                state,
+                canonical_hint,
+                support,
+                window_ms,
+                required_votes,
+                total_votes,
+            )
 
-            payload.update(
-                {
-                    "consensus_average": result.average,
-                    "votes_required": required_votes,
-                }
+        if state == "command_debounce" and timestamp < self._command_debounce_until:
+            reason = "command_debounce_active"
+            self._record(
+                label=canonical_label,
+                score=score,
+                accepted=False,
+                reason=reason,
+                state=state,
+                hint_label=canonical_hint,
+                support=support,
+                window_ms=window_ms,
+                timestamp=timestamp,
             )
             payload["decision_reason"] = reason
+            return self._finalize_decision(
+                False,
+                canonical_label,
+                score,
+                payload,
+                reason,
+                state,
+                canonical_hint,
+                support,
+                window_ms,
+                required_votes,
+                total_votes,
+            )
 
-            if canonical_label == "Start":
-                self._state = "cooldown"
-                self._cooldown_until = timestamp + COOLDOWN_SECONDS
-                self._last_activation_at = timestamp
-                payload["next_state"] = "cooldown"
-                self._reset_consensus()
-            else:
-                self._state = "command_debounce"
-                self._command_debounce_until = timestamp + COMMAND_DEBOUNCE_SECONDS
-                self._listen_until = timestamp
-                payload["next_state"] = "command_debounce"
-                self._reset_consensus()
+        if state == "cooldown" and timestamp < self._cooldown_until:
+            reason = "cooldown_active"
+            self._record(
+                label=canonical_label,
+                score=score,
+                accepted=False,
+                reason=reason,
+                state=state,
+                hint_label=canonical_hint,
+                support=support,
+                window_ms=window_ms,
+                timestamp=timestamp,
+            )
+            payload["decision_reason"] = reason
+            return self._finalize_decision(
+                False,
+                canonical_label,
+                score,
+                payload,
+                reason,
+                state,
+                canonical_hint,
+                support,
+                window_ms,
+                required_votes,
+                total_votes,
+            )
 
-            self._last_state_change = timestamp
+        if state == "idle" and canonical_label != "Start":
+            reason = "awaiting_activation"
+            self._record(
+                label=canonical_label,
+                score=score,
+                accepted=False,
+                reason=reason,
+                state=state,
+                hint_label=canonical_hint,
+                support=support,
+                window_ms=window_ms,
+                timestamp=timestamp,
+            )
+            payload["decision_reason"] = reason
+            return self._finalize_decision(
+                False,
+                canonical_label,
+                score,
+                payload,
+                reason,
+                state,
+                canonical_hint,
+                support,
+                window_ms,
+                required_votes,
+                total_votes,
+            )
+
+        if state == "listening" and canonical_label == "Start":
+            reason = "awaiting_command"
+            self._record(
+                label=canonical_label,
+                score=score,
+                accepted=False,
+                reason=reason,
+                state=state,
+                hint_label=canonical_hint,
+                support=support,
+                window_ms=window_ms,
+                timestamp=timestamp,
+            )
+            payload["decision_reason"] = reason
+            return self._finalize_decision(
+                False,
+                canonical_label,
+                score,
+                payload,
+                reason,
+                state,
+                canonical_hint,
+                support,
+                window_ms,
+                required_votes,
+                total_votes,
+            )
+
+        if state == "listening" and canonical_label not in SUPPORTED_COMMANDS:
+            reason = "unsupported_command"
+            self._record(
+                label=canonical_label,
+                score=score,
+                accepted=False,
+                reason=reason,
+                state=state,
+                hint_label=canonical_hint,
+                support=support,
+                window_ms=window_ms,
+                timestamp=timestamp,
+            )
+            payload["decision_reason"] = reason
+            return self._finalize_decision(
+                False,
+                canonical_label,
+                score,
+                payload,
+                reason,
+                state,
+                canonical_hint,
+                support,
+                window_ms,
+                required_votes,
+                total_votes,
+            )
+
+        if score < thresholds.enter:
+            reason = "score_below_threshold"
+            self._record(
+                label=canonical_label,
+                score=score,
+                accepted=False,
+                reason=reason,
+                state=state,
+                hint_label=canonical_hint,
+                support=support,
+                window_ms=window_ms,
+                timestamp=timestamp,
+            )
+            payload["threshold_enter"] = thresholds.enter
+            payload["decision_reason"] = reason
+            return self._finalize_decision(
+                False,
+                canonical_label,
+                score,
+                payload,
+                reason,
+                state,
+                canonical_hint,
+                support,
+                window_ms,
+                required_votes,
+                total_votes,
+            )
+
+        passes_votes = support >= required_votes
+        passes_average = result.average >= thresholds.enter
 
+        if not passes_votes and not passes_average:
+            reason = "consensus_short"
+            self._record(
+                label=canonical_label,
+                score=score,
+                accepted=False,
+                reason=reason,
+                state=state,
+                hint_label=canonical_hint,
+                support=support,
+                window_ms=window_ms,
+                timestamp=timestamp,
+            )
+            payload["decision_reason"] = reason
             return self._finalize_decision(
-                True,
+                False,
                 canonical_label,
                 score,
                 payload,
                 reason,
-                self._state,
+                state,
                 canonical_hint,
                 support,
                 window_ms,
@@ -1870,6 +1985,56 @@ class GestureDecisionEngine:
                 total_votes,
             )
 
+        reason = "accepted"
+        self._record(
+            label=canonical_label,
+            score=score,
+            accepted=True,
+            reason=reason,
+            state=state,
+            hint_label=canonical_hint,
+            support=support,
+            window_ms=window_ms,
+            timestamp=timestamp,
+        )
+
+        payload.update(
+            {
+                "consensus_average": result.average,
+                "votes_required": required_votes,
+            }
+        )
+        payload["decision_reason"] = reason
+
+        if canonical_label == "Start":
+            self._state = "cooldown"
+            self._cooldown_until = timestamp + self._cooldown_duration
+            self._last_activation_at = timestamp
+            payload["next_state"] = "cooldown"
+            self._reset_consensus()
+        else:
+            self._state = "command_debounce"
+            self._command_debounce_until = timestamp + self._command_debounce_duration
+            self._listen_until = timestamp
+            payload["next_state"] = "command_debounce"
+            self._reset_consensus()
+
+        self._last_state_change = timestamp
+
+        return self._finalize_decision(
+            True,
+            canonical_label,
+            score,
+            payload,
+            reason,
+            self._state,
+            canonical_hint,
+            support,
+            window_ms,
+            required_votes,
+            total_votes,
+        )
+
     # ------------------------------------------------------------------
     def thresholds(self) -> Dict[str, ClassThreshold]:
         return dict(self._thresholds)
@@ -1883,6 +2048,15 @@ class GestureDecisionEngine:
     def consensus_overrides(self) -> Dict[str, ConsensusConfig]:
         return dict(self._per_label_consensus)
 
+    # ------------------------------------------------------------------
+    def durations(self) -> Dict[str, float]:
+        return {
+            "cooldown": self._cooldown_duration,
+            "listening_window": self._listening_duration,
+            "command_debounce": self._command_debounce_duration,
+            "clima_post_start_delay": self._clima_post_start_delay,
+        }
+
 ACTIVATION_ALIASES = {
     # Mantener sincronizado con ``ACTIVATION_ALIASES`` en
     # ``helen/jsSignHandler/actions.js``.
@@ -1987,6 +2161,14 @@ def _resolve_runtime_defaults(profile: Optional[PiCameraProfile]) -> PlatformRun
     )
 
 
+def _scaled_dimension(value: int, scale: float) -> int:
+    """Scale a capture dimension keeping it even (required by I420 and most encoders)."""
+
+    if value <= 0 or scale >= 1.0:
+        return int(value)
+    return max(16, int(round(value * scale / 2.0)) * 2)
+
+
 def _command_exists(command: str) -> bool:
     return bool(shutil.which(command))
 
@@ -2326,8 +2508,12 @@ def connect_wifi(ssid: str, password: str) -> Tuple[bool, str]:
     raise RuntimeError("Conexión Wi-Fi no soportada en esta plataforma.")
 
 
+DEFAULT_RUNTIME_NAME = "default"
+
+
 @dataclass
 class RuntimeConfig:
+    name: str = DEFAULT_RUNTIME_NAME
     camera_index: Optional[Union[int, str]] = None
     camera_device: Optional[str] = None
     camera_backend: Optional[str] = None
@@ -2343,6 +2529,16 @@ class RuntimeConfig:
     process_every_n: Optional[int] = None
     display_mode: str = DEFAULT_DISPLAY_MODE
     camera_profile: Optional[PiCameraProfile] = None
+    record_predictions_path: Optional[Path] = None
+    capture_process: bool = False
+    camera_fast_boot: bool = False
+    camera_supervisor: bool = True
+    hw_capture: bool = False
+    adaptive: bool = False
+    latency_budget_ms: Optional[float] = None
+    warmup: bool = True
+    fallback_knn: int = 0
+    synthetic_script: Optional[str] = None
 
 
 @dataclass
@@ -2369,6 +2565,58 @@ class HealthSnapshot:
     camera_last_capture: Optional[str]
     camera_last_error: Optional[str]
     last_error: Optional[str] = None
+    decision_state: Optional[str] = None
+    runtime: Optional[str] = None
+    camera_supervisor_state: Optional[str] = None
+    camera_recoveries: int = 0
+    camera_last_recovery_ms: Optional[float] = None
+    camera_last_failure: Optional[str] = None
+
+
+class PredictionRecorder:
+    """Append raw classifier outputs to a JSON Lines file for offline replay.
+
+    Each line stores ``timestamp``, ``label``, ``score``, ``hint`` and
+    ``landmarks`` so ``backendHelen.decision_replay`` can feed the exact same
+    stream through :class:`GestureDecisionEngine` with other parameters.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self.path.open("a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self.records = 0
+
+    # ------------------------------------------------------------------
+    def write(
+        self,
+        prediction: Prediction,
+        *,
+        timestamp: float,
+        hint_label: Optional[str] = None,
+        landmarks: Optional[Sequence[LandmarkPoint]] = None,
+    ) -> None:
+        entry = {
+            "timestamp": float(timestamp),
+            "label": str(prediction.label),
+            "score": float(prediction.score),
+            "hint": hint_label or None,
+            "landmarks": [[float(v) for v in point] for point in landmarks] if landmarks else None,
+        }
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            if self._handle.closed:
+                return
+            self._handle.write(line + "\n")
+            self.records += 1
+
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        with self._lock:
+            if not self._handle.closed:
+                self._handle.flush()
+                self._handle.close()
 
 
 class VideoGestureClassifier:
@@ -2399,6 +2647,7 @@ class VideoGestureClassifier:
         if not self._labels_path.exists():
             raise FileNotFoundError(f"No se encontró labels.json en {self._labels_path!s}")
 
+        from Hellen_model_RN.video_gesture_model.preprocessing import load_input_spec
         from Hellen_model_RN.video_gesture_model.realtime_inference import (
             build_predict_fn as build_video_predict_fn,
             load_label_map as load_video_label_map,
@@ -2407,17 +2656,35 @@ class VideoGestureClassifier:
         self._predict = build_video_predict_fn(model_path)
         self._label_map = load_video_label_map(self._labels_path)
         self._lock = threading.Lock()
-        self.sequence_length = int(video_config.SEQUENCE_LENGTH)
+        # Modelos entrenados con --window/--window-stride necesitan menos frames de cámara.
+        input_spec = load_input_spec(model_dir)
+        self.sequence_length = (
+            input_spec.frames_required if input_spec is not None else int(video_config.SEQUENCE_LENGTH)
+        )
+
+    # ------------------------------------------------------------------
+    @property
+    def model_dir(self) -> Path:
+        return self._model_dir
 
     # ------------------------------------------------------------------
-    def predict_sequence(self, frames: Sequence[Sequence[float]]) -> Prediction:
+    def predict_sequence(self, frames: Union[np.ndarray, Sequence[Sequence[float]]]) -> Prediction:
+        """Classify the last ``sequence_length`` frames.
+
+        A float32 ``(frames, FEATURE_SIZE)`` array such as :meth:`SequenceBuffer.window`
+        is passed to the model as a view; other sequences are converted once.
+        """
+
         if len(frames) < self.sequence_length:
             raise ValueError(
                 f"Se requieren {self.sequence_length} frames para inferir, se recibieron {len(frames)}"
             )
 
-        window = list(frames)[-self.sequence_length :]
-        array = np.asarray(window, dtype=np.float32).reshape(1, self.sequence_length, -1)
+        if isinstance(frames, np.ndarray):
+            window = frames[-self.sequence_length :]
+        else:
+            window = list(frames)[-self.sequence_length :]
+        array = np.ascontiguousarray(window, dtype=np.float32).reshape(1, self.sequence_length, -1)
         with self._lock:
             probabilities = self._predict(array)[0]
 
@@ -2427,6 +2694,44 @@ class VideoGestureClassifier:
         return Prediction(label=label, score=score)
 
 
+def _timed_calls(call: Callable[[], Any], runs: int) -> Tuple[float, List[float]]:
+    """Time the first ``call`` (graph tracing, lazy init) apart from ``runs`` later ones, in ms."""
+
+    started = time.perf_counter()
+    call()
+    first_ms = (time.perf_counter() - started) * 1000.0
+    timings = []
+    for _ in range(max(1, runs)):
+        started = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - started) * 1000.0)
+    timings.sort()
+    return first_ms, timings
+
+
+def _synthetic_sequence(classifier: Any) -> np.ndarray:
+    shape = (int(classifier.sequence_length), video_config.FEATURE_SIZE)
+    return np.random.default_rng(0).random(shape, dtype=np.float32)
+
+
+def _measure_classifier_latency(classifier: Any, runs: int = MODEL_SWAP_WARMUP_RUNS) -> Tuple[float, float]:
+    """Warm ``classifier`` up and return the median and p95 ``predict_sequence`` latency in ms."""
+
+    sample = _synthetic_sequence(classifier)
+    _, timings = _timed_calls(lambda: classifier.predict_sequence(sample), runs)
+    return statistics.median(timings), timings[min(len(timings) - 1, int(0.95 * len(timings)))]
+
+
+def _synthetic_hand_landmarks() -> List[LandmarkPoint]:
+    """An open hand in normalised image coordinates (wrist first), for warm-up inputs."""
+
+    points: List[LandmarkPoint] = [(0.5, 0.8, 0.0)]
+    for spread in (-0.12, -0.05, 0.0, 0.05, 0.1):
+        for joint in range(1, 5):
+            points.append((0.5 + spread * joint / 2.0, 0.8 - 0.06 * joint, -0.01 * joint))
+    return points
+
+
 class ProductionGestureClassifier:
     """Thin wrapper around the trained XGBoost model stored in ``model.p``."""
 
@@ -2462,6 +2767,12 @@ class ProductionGestureClassifier:
         self._labels_map = {int(idx): value for idx, value in labels_dict.items()}
         self._numpy = np
 
+    # ------------------------------------------------------------------
+    @property
+    def feature_size(self) -> Optional[int]:
+        size = getattr(self._model, "n_features_in_", None)
+        return int(size) if size else None
+
     # ------------------------------------------------------------------
     def predict(self, features: Iterable[float]) -> Prediction:
         np = self._numpy
@@ -2506,16 +2817,29 @@ class ProductionGestureClassifier:
 
 
 class SyntheticStreamAdapter:
-    """Wrap ``SyntheticGestureStream`` adding runtime diagnostics."""
+    """Wrap ``SyntheticGestureStream`` (or a scripted stream) adding runtime diagnostics.
+
+    Frames are NumPy vectors; scripted ``idle`` frames raise ``TimeoutError``
+    like a camera that sees no hand.
+    """
 
     source = "synthetic"
 
-    def __init__(self, dataset_path: Path) -> None:
-        self._stream = SyntheticGestureStream(dataset_path)
+    def __init__(self, dataset_path: Path, *, script: Optional[str] = None, fps: Optional[float] = None) -> None:
+        self._stream: Union[SyntheticGestureStream, ScriptedGestureStream]
+        if script:
+            self._stream = ScriptedGestureStream.from_dataset(dataset_path, parse_script(script), fps=fps or 30.0)
+        else:
+            self._stream = SyntheticGestureStream(dataset_path)
         self._last_capture: Optional[float] = None
 
-    def next(self, timeout: float = 0.0) -> Tuple[List[float], Optional[str]]:  # noqa: ARG002 - signature parity
-        features, label = self._stream.next()
+    def next(self, timeout: float = 0.0) -> Tuple[np.ndarray, Optional[str]]:  # noqa: ARG002 - signature parity
+        if isinstance(self._stream, ScriptedGestureStream):
+            features, label = self._stream.next()
+            if features is None:
+                raise TimeoutError("Segmento sin mano en el guion sintético")
+        else:
+            features, label = self._stream.next_array()
         self._last_capture = time.time()
         return features, label
 
@@ -2551,6 +2875,98 @@ class ExternalGestureStream:
         }
 
 
+class StageTimings:
+    """Exponentially weighted latency per capture stage (``capture``, ``landmarks``, ``blur``...).
+
+    Only the reading thread records; readers copy the entries, so no lock is taken.
+    """
+
+    def __init__(self, alpha: float = 0.1) -> None:
+        self._alpha = float(alpha)
+        self._stages: Dict[str, List[float]] = {}
+
+    # ------------------------------------------------------------------
+    @contextlib.contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, (time.perf_counter() - started) * 1000.0)
+
+    # ------------------------------------------------------------------
+    def record(self, stage: str, elapsed_ms: float) -> None:
+        entry = self._stages.get(stage)
+        if entry is None:
+            self._stages[stage] = [elapsed_ms, elapsed_ms, elapsed_ms, 1.0, elapsed_ms]
+            return
+        entry[0] += self._alpha * (elapsed_ms - entry[0])
+        entry[1] = elapsed_ms
+        entry[2] = max(entry[2], elapsed_ms)
+        entry[3] += 1.0
+
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            stage: {
+                "avg_ms": round(entry[0], 3),
+                "last_ms": round(entry[1], 3),
+                "max_ms": round(entry[2], 3),
+                "count": int(entry[3]),
+                "first_ms": round(entry[4], 3),
+            }
+            for stage, entry in list(self._stages.items())
+        }
+
+    # ------------------------------------------------------------------
+    def first(self, stage: str) -> Optional[float]:
+        """Latency of the first sample recorded for ``stage`` (``None`` until there is one)."""
+
+        entry = self._stages.get(stage)
+        return round(entry[4], 3) if entry is not None else None
+
+
+class SelectionValidation:
+    """Treat the first frames of a stream as validation of a cached camera selection."""
+
+    def __init__(
+        self,
+        callback: Callable[[bool, Optional[str]], None],
+        *,
+        failure_limit: int = CACHED_SELECTION_FAILURE_LIMIT,
+    ) -> None:
+        self._callback = callback
+        self._failure_limit = max(1, int(failure_limit))
+        self._failures = 0
+        self.pending = True
+
+    # ------------------------------------------------------------------
+    def _resolve(self, ok: bool, detail: Optional[str]) -> None:
+        if not self.pending:
+            return
+        self.pending = False
+        try:
+            self._callback(ok, detail)
+        except Exception as error:  # pragma: no cover - defensive
+            LOGGER.warning("Callback de validación de cámara falló: %s", error)
+
+    # ------------------------------------------------------------------
+    def frame_ok(self) -> None:
+        self._resolve(True, None)
+
+    # ------------------------------------------------------------------
+    def frame_failed(self, detail: str) -> None:
+        if not self.pending:
+            return
+        self._failures += 1
+        if self._failures >= self._failure_limit:
+            self._resolve(False, detail)
+
+    # ------------------------------------------------------------------
+    def open_failed(self, detail: str) -> None:
+        self._resolve(False, detail)
+
+
 class VideoGestureStream:
     """Capture MediaPipe landmarks for both hands and emit normalised frames."""
 
@@ -2563,12 +2979,16 @@ class VideoGestureStream:
         detection_confidence: float = 0.6,
         tracking_confidence: float = 0.5,
         selection: Optional[CameraSelection] = None,
+        cpu_gate: Optional[Callable[[], ContextManager[Any]]] = None,
+        on_selection_validated: Optional[Callable[[bool, Optional[str]], None]] = None,
+        hw_capture: bool = False,
     ) -> None:
         if cv2 is None:
             raise RuntimeError("OpenCV no está instalado. Ejecuta `pip install opencv-python`.")
         if mp is None:
             raise RuntimeError("MediaPipe no está instalado. Ejecuta `pip install mediapipe`.")
 
+        self._validation = SelectionValidation(on_selection_validated) if on_selection_validated else None
         resolved_index: Optional[Union[int, str]] = camera_index
         if selection:
             if selection.index is not None:
@@ -2579,6 +2999,16 @@ class VideoGestureStream:
         self._selection = selection
         self._detection_confidence = detection_confidence
         self._tracking_confidence = tracking_confidence
+        self._cpu_gate = cpu_gate or contextlib.nullcontext
+        self._hw_capture = bool(hw_capture)
+        self._frame_layout = "BGR"
+        self._capture_scale = 1.0
+        self._model_complexity = 1
+        self._profile: Optional[PiCameraProfile] = None
+        self._pending_adapt: Optional[Tuple[Dict[str, Any], List[threading.Event]]] = None
+        self._last_reconfigure: Optional[Dict[str, Any]] = None
+        self._stage_timings = StageTimings()
+        self.frame_gate: Optional[Callable[[], bool]] = None
 
         self._cap: Optional[Any] = None
         self._hands: Optional[Any] = None
@@ -2589,33 +3019,252 @@ class VideoGestureStream:
         self._frames_without_hand = 0
         self._last_landmarks: Optional[List[LandmarkPoint]] = None
         self._last_frame_shape: Optional[Tuple[int, int]] = None
+        self._opened_at: Optional[float] = None
+        self._last_frame_at: Optional[float] = None
+        self._read_failures = 0
+        self._reopen_requested = False
 
     # ------------------------------------------------------------------
-    def open(self) -> None:
-        if self._opened:
-            return
+    def _open_validated(self) -> None:
+        try:
+            self.open()
+        except Exception as error:
+            if self._validation is not None:
+                self._validation.open_failed(str(error))
+            raise
+        self._opened_at = time.time()
+
+    # ------------------------------------------------------------------
+    def _note_frame_ok(self) -> None:
+        self._last_frame_at = time.time()
+        if self._validation is not None:
+            self._validation.frame_ok()
+
+    # ------------------------------------------------------------------
+    def _note_frame_failed(self, detail: str) -> None:
+        self._read_failures += 1
+        if self._validation is not None:
+            self._validation.frame_failed(detail)
+
+    # ------------------------------------------------------------------
+    def request_reopen(self) -> None:
+        """Ask the reading thread to release and reopen the capture before its next read."""
+
+        self._reopen_requested = True
+
+    # ------------------------------------------------------------------
+    def capture_health(self) -> Dict[str, Any]:
+        return {
+            "device": self._device_target(),
+            "opened": self._opened,
+            "opened_at": self._opened_at,
+            "last_frame_at": self._last_frame_at,
+            "read_failures": self._read_failures,
+        }
+
+    # ------------------------------------------------------------------
+    def _hw_pipeline(self) -> Optional[str]:
+        """GStreamer pipeline delivering I420 for ``--hw-capture``; ``None`` when unavailable."""
+
+        if not self._hw_capture or not camera_probe.opencv_has_gstreamer():
+            return None
+        selection = self._selection
+        device: Optional[str] = None
+        if selection is None or selection.kind != "csi":
+            target = self._device_target()
+            device = target if isinstance(target, str) else f"/dev/video{int(target)}"
+        fps = int(self._capture_fps() or 30)
+        width, height = self._capture_size()
+        return camera_probe.build_capture_pipeline(
+            width=width,
+            height=height,
+            fps=fps,
+            device=device,
+            source_format=selection.pixel_format if selection else None,
+            output="I420",
+            hw_accel=True,
+        )
+
+    # ------------------------------------------------------------------
+    def _open_device(self) -> Optional[Any]:
+        pipeline = self._hw_pipeline()
+        if pipeline:
+            cap = cv2.VideoCapture(pipeline, cv2.CAP_GSTREAMER)
+            if cap and cap.isOpened():
+                LOGGER.info("Captura acelerada por GStreamer (pipeline=%s)", pipeline)
+                self._frame_layout = "I420"
+                return cap
+            if cap:
+                with contextlib.suppress(Exception):
+                    cap.release()
+            LOGGER.warning("Pipeline GStreamer no disponible; se usa la captura estándar de OpenCV")
 
-        target: Any = self._camera_index if self._camera_index is not None else 0
-        cap = cv2.VideoCapture(target)
+        self._frame_layout = "BGR"
+        cap = cv2.VideoCapture(self._device_target())
         if not cap or not cap.isOpened():
-            self._last_error = f"No se pudo abrir la cámara en {target}"
-            raise RuntimeError(self._last_error)
+            return None
+        self._configure_capture(cap)
+        return cap
 
-        cap.set(cv2.CAP_PROP_FRAME_WIDTH, video_config.FRAME_WIDTH)
-        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, video_config.FRAME_HEIGHT)
+    # ------------------------------------------------------------------
+    def _configure_capture(self, cap: Any) -> None:
+        width, height = self._capture_size()
+        with contextlib.suppress(Exception):
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            fps = self._capture_fps()
+            if fps:
+                cap.set(cv2.CAP_PROP_FPS, fps)
 
-        self._hands = mp.solutions.hands.Hands(
+    # ------------------------------------------------------------------
+    def _capture_size(self) -> Tuple[int, int]:
+        profile = self._profile
+        width = profile.width if profile else video_config.FRAME_WIDTH
+        height = profile.height if profile else video_config.FRAME_HEIGHT
+        return _scaled_dimension(width, self._capture_scale), _scaled_dimension(height, self._capture_scale)
+
+    # ------------------------------------------------------------------
+    def _capture_fps(self) -> float:
+        if self._profile is not None:
+            return float(self._profile.fps)
+        selection = self._selection
+        return float(selection.fps) if selection and selection.fps else 0.0
+
+    # ------------------------------------------------------------------
+    def _create_hands(self) -> Any:
+        return mp.solutions.hands.Hands(
             static_image_mode=False,
             max_num_hands=video_config.MAX_HANDS,
+            model_complexity=self._model_complexity,
             min_detection_confidence=self._detection_confidence,
             min_tracking_confidence=self._tracking_confidence,
         )
 
+    # ------------------------------------------------------------------
+    def adapt(
+        self, *, capture_scale: Optional[float] = None, model_complexity: Optional[int] = None
+    ) -> threading.Event:
+        """Queue a capture scale and/or landmarker complexity change for the reading thread."""
+
+        changes: Dict[str, Any] = {}
+        if capture_scale is not None:
+            changes["capture_scale"] = max(0.25, min(float(capture_scale), 1.0))
+        if model_complexity is not None:
+            changes["model_complexity"] = 0 if int(model_complexity) <= 0 else 1
+        return self._queue_adapt(changes)
+
+    # ------------------------------------------------------------------
+    def reconfigure(self, *, profile: Optional[PiCameraProfile]) -> threading.Event:
+        """Queue a display-mode capture profile; the event is set once the reading thread applies it."""
+
+        return self._queue_adapt({"profile": profile})
+
+    # ------------------------------------------------------------------
+    def _queue_adapt(self, changes: Dict[str, Any]) -> threading.Event:
+        done = threading.Event()
+        pending = self._pending_adapt
+        if pending is not None:
+            self._pending_adapt = ({**pending[0], **changes}, pending[1] + [done])
+        else:
+            self._pending_adapt = (changes, [done])
+        if not self._opened:
+            self._apply_pending_adapt()
+        return done
+
+    # ------------------------------------------------------------------
+    def last_reconfigure(self) -> Optional[Dict[str, Any]]:
+        return dict(self._last_reconfigure) if self._last_reconfigure else None
+
+    # ------------------------------------------------------------------
+    def _apply_pending_adapt(self) -> None:
+        pending = self._pending_adapt
+        if pending is None:
+            return
+        self._pending_adapt = None
+        changes, events = pending
+        started = time.perf_counter()
+        profile = changes.get("profile", self._profile)
+        scale = changes.get("capture_scale", self._capture_scale)
+        complexity = changes.get("model_complexity", self._model_complexity)
+        resize = scale != self._capture_scale or profile != self._profile
+        complexity_changed = complexity != self._model_complexity
+        self._profile = profile
+        self._capture_scale = scale
+        self._model_complexity = complexity
+        strategy = "unchanged"
+        if not self._opened:
+            strategy = "deferred"
+        elif resize or complexity_changed:
+            strategy = self._apply_adapt(resize, complexity_changed)
+
+        width, height = self._capture_size()
+        self._last_reconfigure = {
+            "strategy": strategy,
+            "latency_ms": round((time.perf_counter() - started) * 1000.0, 3),
+            "requested": {"width": width, "height": height, "fps": self._capture_fps()},
+            "capture_scale": self._capture_scale,
+            "model_complexity": self._model_complexity,
+            "applied_at": time.time(),
+        }
+        for done in events:
+            done.set()
+
+    # ------------------------------------------------------------------
+    def _apply_adapt(self, resize: bool, complexity_changed: bool) -> str:
+        strategies = []
+        if resize and self._cap is not None:
+            if self._frame_layout == "I420":
+                self._reopen_capture()
+                strategies.append("reopen_capture")
+            else:
+                self._configure_capture(self._cap)
+                strategies.append("in_place")
+        if complexity_changed and self._hands is not None:
+            with contextlib.suppress(Exception):
+                self._hands.close()
+            self._hands = self._create_hands()
+            strategies.append("rebuild_landmarker")
+        return "+".join(strategies) or "unchanged"
+
+    # ------------------------------------------------------------------
+    def open(self) -> None:
+        if self._opened:
+            return
+
+        target: Any = self._device_target()
+        cap = self._open_device()
+        if cap is None:
+            self._last_error = f"No se pudo abrir la cámara en {target}"
+            raise RuntimeError(self._last_error)
+
+        self._hands = self._create_hands()
+
         self._cap = cap
         self._opened = True
         self._healthy = True
         self._last_error = None
 
+    # ------------------------------------------------------------------
+    def _device_target(self) -> Any:
+        return self._camera_index if self._camera_index is not None else 0
+
+    # ------------------------------------------------------------------
+    def _reopen_capture(self) -> None:
+        self._reopen_requested = False
+        target = self._device_target()
+        LOGGER.warning("Reabriendo la captura de %s", target)
+        if self._cap is not None:
+            with contextlib.suppress(Exception):
+                self._cap.release()
+        cap = self._open_device()
+        if cap is None:
+            self._cap = None
+            self.close()
+            self._last_error = f"No se pudo reabrir la cámara en {target}"
+            raise RuntimeError(self._last_error)
+        self._cap = cap
+        self._opened_at = time.time()
+
     # ------------------------------------------------------------------
     def close(self) -> None:
         if self._cap is not None:
@@ -2628,8 +3277,16 @@ class VideoGestureStream:
 
     # ------------------------------------------------------------------
     def next(self, timeout: float = 2.0) -> Tuple[List[float], Optional[str]]:
+        features = np.zeros(video_config.FEATURE_SIZE, dtype=np.float32)
+        source_label = self.next_into(features, timeout=timeout)
+        return features.tolist(), source_label
+
+    # ------------------------------------------------------------------
+    def next_into(self, out: np.ndarray, timeout: float = 2.0) -> Optional[str]:
+        """Write the next normalised ``FEATURE_SIZE`` frame into ``out`` (e.g. a :class:`SequenceBuffer` slot)."""
+
         if not self._opened:
-            self.open()
+            self._open_validated()
 
         assert self._cap is not None
         assert self._hands is not None
@@ -2641,12 +3298,23 @@ class VideoGestureStream:
                 self._healthy = False
                 raise TimeoutError(self._last_error)
 
-            ok, frame = self._cap.read()
+            if self._pending_adapt is not None:
+                self._apply_pending_adapt()
+            if self._reopen_requested:
+                self._reopen_capture()
+
+            with self._stage_timings.measure("capture"):
+                ok, frame = self._cap.read()
             if not ok or frame is None:
                 self._last_error = "No se pudo leer un frame de la cámara"
                 self._healthy = False
+                self._note_frame_failed(self._last_error)
                 time.sleep(0.05)
                 continue
+            self._note_frame_ok()
+            if self.frame_gate is not None and not self.frame_gate():
+                # Frame fuera de plazo: se descarta sin convertir ni pasar por MediaPipe.
+                continue
 
             height, width = frame.shape[:2]
             if height <= 0 or width <= 0:
@@ -2655,44 +3323,32 @@ class VideoGestureStream:
                 time.sleep(0.05)
                 continue
 
-            self._last_frame_shape = (int(height), int(width))
+            with self._cpu_gate():
+                with self._stage_timings.measure("convert"):
+                    frame_rgb, _, width, height = landmark_worker.frame_planes(cv2, frame, self._frame_layout)
+                self._last_frame_shape = (int(height), int(width))
+                with self._stage_timings.measure("landmarks"):
+                    results = self._hands.process(frame_rgb)
 
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self._hands.process(frame_rgb)
-
-            frame_features = np.zeros(
-                (video_config.MAX_HANDS, video_config.NUM_HAND_LANDMARKS, video_config.LANDMARK_DIM),
-                dtype=np.float32,
-            )
-            if results.multi_hand_landmarks and results.multi_handedness:
-                ordering: Dict[str, int] = {"Left": 0, "Right": 1}
-                for hand_landmarks, handedness in zip(
-                    results.multi_hand_landmarks, results.multi_handedness
-                ):
-                    label = handedness.classification[0].label
-                    idx = ordering.get(label, 0)
-                    coords = np.array(
-                        [[lm.x, lm.y, lm.z] for lm in hand_landmarks.landmark],
-                        dtype=np.float32,
-                    )
-                    frame_features[idx] = coords
-                    self._last_landmarks = [
-                        (float(lm.x), float(lm.y), float(getattr(lm, "z", 0.0)))
-                        for lm in hand_landmarks.landmark
-                    ]
-
-            if frame_features.sum() == 0:
+            if not (results.multi_hand_landmarks and results.multi_handedness):
                 self._frames_without_hand += 1
                 self._last_landmarks = None
-                time.sleep(0.02)
                 continue
 
+            # Los landmarks se escriben directamente en la fila destino con el mismo
+            # kernel que usa la extracción del dataset; sin arreglos intermedios.
+            hand_idx = fill_frame_landmarks(out, results.multi_hand_landmarks, results.multi_handedness)
+            hand = out.reshape(
+                video_config.MAX_HANDS, video_config.NUM_HAND_LANDMARKS, video_config.LANDMARK_DIM
+            )[hand_idx]
+            self._last_landmarks = [tuple(point) for point in hand.tolist()]
+
             self._frames_without_hand = 0
-            normalised = normalise_landmarks(frame_features.flatten())
+            normalise_landmarks(out)
             self._last_capture = time.time()
             self._healthy = True
             self._last_error = None
-            return normalised.tolist(), None
+            return None
 
     # ------------------------------------------------------------------
     def status(self) -> Dict[str, Any]:
@@ -2704,6 +3360,9 @@ class VideoGestureStream:
             "frames_without_hand": self._frames_without_hand,
             "frame_shape": self._last_frame_shape,
             "selection": self._selection.to_dict() if self._selection else None,
+            "capture_scale": self._capture_scale,
+            "model_complexity": self._model_complexity,
+            "stage_timings": self._stage_timings.snapshot(),
         }
 
     # ------------------------------------------------------------------
@@ -2733,6 +3392,9 @@ class NullGesturePipeline:
     def is_running(self) -> bool:
         return self._running
 
+    def reconfigure(self, **_: Any) -> None:
+        return None
+
 
 class CameraGestureStream:
     """Capture MediaPipe hand landmarks from a physical camera."""
@@ -2751,12 +3413,17 @@ class CameraGestureStream:
         forced_backend: Optional[str] = None,
         width_override: Optional[int] = None,
         height_override: Optional[int] = None,
+        cpu_gate: Optional[Callable[[], ContextManager[Any]]] = None,
+        on_selection_validated: Optional[Callable[[bool, Optional[str]], None]] = None,
+        hw_capture: bool = False,
     ) -> None:
         if cv2 is None:
             raise RuntimeError("OpenCV no está instalado. Ejecuta `pip install opencv-python`.")
         if mp is None:
             raise RuntimeError("MediaPipe no está instalado. Ejecuta `pip install mediapipe`.")
 
+        self._validation = SelectionValidation(on_selection_validated) if on_selection_validated else None
+
         self._selection = selection
         self._forced_backend = camera_probe.normalize_backend_name(forced_backend)
         self._width_override = int(width_override) if width_override else None
@@ -2771,6 +3438,7 @@ class CameraGestureStream:
         self._detection_confidence = detection_confidence
         self._tracking_confidence = tracking_confidence
         self._metrics = metrics
+        self._cpu_gate = cpu_gate or contextlib.nullcontext
         if selection and selection.device:
             self._device_path: Optional[str] = selection.device
         elif isinstance(camera_index, str):
@@ -2779,6 +3447,9 @@ class CameraGestureStream:
             self._device_path = None
         backend_candidate = self._forced_backend or (selection.backend if selection else None)
         backend_candidate = camera_probe.normalize_backend_name(backend_candidate)
+        self._hw_capture = bool(hw_capture)
+        if self._hw_capture and not self._forced_backend and camera_probe.opencv_has_gstreamer():
+            backend_candidate = "gstreamer"
         if not backend_candidate:
             backend_candidate = "directshow" if camera_probe.IS_WINDOWS else "v4l2"
         self._preferred_backend = backend_candidate
@@ -2793,6 +3464,7 @@ class CameraGestureStream:
         self._profile: Optional[PiCameraProfile] = profile
         self._capture_backend: Optional[str] = None
         self._gstreamer_pipeline: Optional[str] = None
+        self._frame_layout = "BGR"
 
         self._last_capture: Optional[float] = None
         self._last_error: Optional[str] = None
@@ -2802,10 +3474,27 @@ class CameraGestureStream:
         self._quality_rejections: Counter[str] = Counter()
         self._last_landmarks: Optional[List[LandmarkPoint]] = None
         self._last_frame_shape: Optional[Tuple[int, int]] = None
+        self._opened_at: Optional[float] = None
+        self._last_frame_at: Optional[float] = None
+        self._read_failures = 0
+        self._reopen_requested = False
         self._last_roi: Optional[Dict[str, Any]] = None
+        self._stage_timings = StageTimings()
+        self.frame_gate: Optional[Callable[[], bool]] = None
+        self._blur_cached: Optional[float] = None
+        self._blur_countdown = 0
+        self._capture_scale = 1.0
+        self._model_complexity = 1
+        self._pending_reconfigure: Optional[Tuple[Dict[str, Any], List[threading.Event]]] = None
+        self._last_reconfigure: Optional[Dict[str, Any]] = None
 
     # ------------------------------------------------------------------
     def _desired_dimensions(self) -> Tuple[int, int, float]:
+        width, height, fps = self._requested_dimensions()
+        return _scaled_dimension(width, self._capture_scale), _scaled_dimension(height, self._capture_scale), fps
+
+    # ------------------------------------------------------------------
+    def _requested_dimensions(self) -> Tuple[int, int, float]:
         if self._width_override and self._height_override:
             return int(self._width_override), int(self._height_override), 0.0
         selection = self._selection
@@ -2871,11 +3560,17 @@ class CameraGestureStream:
         )
         self._capture_backend = backend_name
         self._gstreamer_pipeline = None
+        self._frame_layout = "BGR"
         return cap, None
 
+    # ------------------------------------------------------------------
+    def _gstreamer_output(self) -> str:
+        # Con --hw-capture la appsink entrega I420: luma gratis y una sola conversión a RGB.
+        return "I420" if self._hw_capture else "BGR"
+
     # ------------------------------------------------------------------
     def _build_gstreamer_pipeline(self) -> str:
-        if self._selection_dict and self._selection_dict.get("pipeline"):
+        if not self._hw_capture and self._selection_dict and self._selection_dict.get("pipeline"):
             return str(self._selection_dict["pipeline"])
         width, height, fps = self._desired_dimensions()
         if width <= 0:
@@ -2884,10 +3579,17 @@ class CameraGestureStream:
             height = 720
         if fps <= 0:
             fps = 30
-        return (
-            "libcamerasrc ! video/x-raw,width="
-            f"{width},height={height},framerate={fps}/1,format=RGB ! "
-            "videoconvert ! video/x-raw,format=BGR ! appsink drop=1 max-buffers=2"
+        device: Optional[str] = None
+        if self._hw_capture and self._device_path and (not self._selection or self._selection.kind != "csi"):
+            device = self._device_path
+        return camera_probe.build_capture_pipeline(
+            width=width,
+            height=height,
+            fps=int(fps),
+            device=device,
+            source_format=self._selection.pixel_format if self._hw_capture and self._selection else None,
+            output=self._gstreamer_output(),
+            hw_accel=self._hw_capture,
         )
 
     # ------------------------------------------------------------------
@@ -2903,7 +3605,8 @@ class CameraGestureStream:
         LOGGER.info("Ruta de cámara inicializada: gstreamer (pipeline=%s)", pipeline)
         self._capture_backend = "gstreamer"
         self._gstreamer_pipeline = pipeline
-        self._pixel_format = "BGR"
+        self._frame_layout = self._gstreamer_output()
+        self._pixel_format = self._frame_layout
         return cap, None
 
     # ------------------------------------------------------------------
@@ -2952,6 +3655,44 @@ class CameraGestureStream:
         self._healthy = True
         return True
 
+    # ------------------------------------------------------------------
+    def _open_validated(self) -> None:
+        try:
+            self.open()
+        except Exception as error:
+            if self._validation is not None:
+                self._validation.open_failed(str(error))
+            raise
+        self._opened_at = time.time()
+
+    # ------------------------------------------------------------------
+    def _note_frame_ok(self) -> None:
+        self._last_frame_at = time.time()
+        if self._validation is not None:
+            self._validation.frame_ok()
+
+    # ------------------------------------------------------------------
+    def _note_frame_failed(self, detail: str) -> None:
+        self._read_failures += 1
+        if self._validation is not None:
+            self._validation.frame_failed(detail)
+
+    # ------------------------------------------------------------------
+    def request_reopen(self) -> None:
+        """Ask the reading thread to release and reopen the capture before its next read."""
+
+        self._reopen_requested = True
+
+    # ------------------------------------------------------------------
+    def capture_health(self) -> Dict[str, Any]:
+        return {
+            "device": self._device_target(),
+            "opened": self._opened,
+            "opened_at": self._opened_at,
+            "last_frame_at": self._last_frame_at,
+            "read_failures": self._read_failures,
+        }
+
     # ------------------------------------------------------------------
     def open(self) -> None:
         if self._opened:
@@ -2960,15 +3701,154 @@ class CameraGestureStream:
         cap = self._initialise_capture()
 
         self._cap = cap
-        self._hands = mp.solutions.hands.Hands(
+        self._hands = self._create_hands()
+        self._opened = True
+        self._healthy = True
+        self._last_error = None
+
+    # ------------------------------------------------------------------
+    def _device_target(self) -> Any:
+        return self._device_path if self._device_path is not None else self._camera_index
+
+    # ------------------------------------------------------------------
+    def _reopen_capture(self) -> None:
+        self._reopen_requested = False
+        LOGGER.warning("Reabriendo la captura de %s", self._device_target())
+        if self._cap is not None:
+            with contextlib.suppress(Exception):
+                self._cap.release()
+            self._cap = None
+        try:
+            self._cap = self._initialise_capture()
+        except RuntimeError:
+            self.close()
+            raise
+        self._opened_at = time.time()
+
+    # ------------------------------------------------------------------
+    def _create_hands(self) -> Any:
+        return mp.solutions.hands.Hands(
             static_image_mode=False,
             max_num_hands=1,
+            model_complexity=self._model_complexity,
             min_detection_confidence=self._detection_confidence,
             min_tracking_confidence=self._tracking_confidence,
         )
-        self._opened = True
-        self._healthy = True
-        self._last_error = None
+
+    # ------------------------------------------------------------------
+    def reconfigure(self, *, profile: Optional[PiCameraProfile]) -> threading.Event:
+        """Queue a capture profile change; the reading thread applies it between frames.
+
+        Returns an event that is set once the change is live so callers can
+        measure the switch without touching the capture from another thread.
+        """
+
+        return self._queue_reconfigure({"profile": profile})
+
+    # ------------------------------------------------------------------
+    def adapt(self, *, capture_scale: Optional[float] = None, model_complexity: Optional[int] = None) -> threading.Event:
+        """Queue a capture scale and/or landmarker complexity change (see :class:`AdaptiveRateController`)."""
+
+        changes: Dict[str, Any] = {}
+        if capture_scale is not None:
+            changes["capture_scale"] = max(0.25, min(float(capture_scale), 1.0))
+        if model_complexity is not None:
+            changes["model_complexity"] = 0 if int(model_complexity) <= 0 else 1
+        return self._queue_reconfigure(changes)
+
+    # ------------------------------------------------------------------
+    def _queue_reconfigure(self, changes: Dict[str, Any]) -> threading.Event:
+        done = threading.Event()
+        pending = self._pending_reconfigure
+        if pending is not None:
+            # Se fusiona con un cambio aún no aplicado; ambos eventos se liberan juntos.
+            changes = {**pending[0], **changes}
+            self._pending_reconfigure = (changes, pending[1] + [done])
+        else:
+            self._pending_reconfigure = (changes, [done])
+        if not self._opened:
+            self._apply_pending_reconfigure()
+        return done
+
+    # ------------------------------------------------------------------
+    def last_reconfigure(self) -> Optional[Dict[str, Any]]:
+        return dict(self._last_reconfigure) if self._last_reconfigure else None
+
+    # ------------------------------------------------------------------
+    def _apply_pending_reconfigure(self) -> None:
+        pending = self._pending_reconfigure
+        if pending is None:
+            return
+        self._pending_reconfigure = None
+        changes, events = pending
+        started = time.perf_counter()
+        resize = False
+        if "profile" in changes:
+            self._profile = changes["profile"]
+            resize = True
+        scale = changes.get("capture_scale", self._capture_scale)
+        if scale != self._capture_scale:
+            self._capture_scale = scale
+            resize = True
+        complexity = changes.get("model_complexity", self._model_complexity)
+        complexity_changed = complexity != self._model_complexity
+        self._model_complexity = complexity
+
+        strategy = self._reconfigure_capture() if resize else "unchanged"
+        if complexity_changed and strategy in {"unchanged", "in_place", "reopen_capture"}:
+            rebuilt = self._rebuild_landmarker()
+            strategy = rebuilt if strategy == "unchanged" else f"{strategy}+{rebuilt}"
+        if strategy not in {"deferred", "unchanged"}:
+            # Los landmarks suavizados de la resolución previa no son comparables.
+            self._landmark_buffer.clear()
+
+        width, height, fps = self._desired_dimensions()
+        self._last_reconfigure = {
+            "strategy": strategy,
+            "latency_ms": round((time.perf_counter() - started) * 1000.0, 3),
+            "requested": {"width": width, "height": height, "fps": fps},
+            "capture_scale": self._capture_scale,
+            "model_complexity": self._model_complexity,
+            "applied_at": time.time(),
+        }
+        LOGGER.info(
+            "Perfil de captura actualizado (%s): %sx%s @ %s FPS, complejidad=%s",
+            strategy,
+            width or "<driver>",
+            height or "<driver>",
+            fps or "<driver>",
+            self._model_complexity,
+        )
+        for done in events:
+            done.set()
+
+    # ------------------------------------------------------------------
+    def _rebuild_landmarker(self) -> str:
+        if self._hands is None:
+            return "deferred"
+        with contextlib.suppress(Exception):
+            self._hands.close()
+        self._hands = self._create_hands()
+        return "rebuild_landmarker"
+
+    # ------------------------------------------------------------------
+    def _reconfigure_capture(self) -> str:
+        if not self._opened or self._cap is None:
+            return "deferred"
+
+        if self._capture_backend == "gstreamer":
+            # Los caps de GStreamer son fijos: se reabre la captura, MediaPipe se conserva.
+            cap, error = self._attempt_gstreamer()
+            if cap is None:
+                LOGGER.warning("No se pudo reconfigurar la pipeline GStreamer: %s", error)
+                return "unchanged"
+            with contextlib.suppress(Exception):
+                self._cap.release()
+            self._cap = cap
+            return "reopen_capture"
+
+        self._configure_capture(self._cap)
+        return "in_place"
 
     # ------------------------------------------------------------------
     def close(self) -> None:
@@ -2981,12 +3861,13 @@ class CameraGestureStream:
         self._opened = False
         self._capture_backend = None
         self._gstreamer_pipeline = None
+        self._frame_layout = "BGR"
         self._pixel_format = self._selection.pixel_format if self._selection else None
 
     # ------------------------------------------------------------------
     def next(self, timeout: float = 2.0) -> Tuple[List[float], Optional[str]]:
         if not self._opened:
-            self.open()
+            self._open_validated()
 
         assert self._cap is not None
         assert self._hands is not None
@@ -2998,16 +3879,27 @@ class CameraGestureStream:
                 self._healthy = False
                 raise TimeoutError(self._last_error)
 
-            ok, frame = self._cap.read()
+            if self._pending_reconfigure is not None:
+                self._apply_pending_reconfigure()
+            if self._reopen_requested:
+                self._reopen_capture()
+
+            with self._stage_timings.measure("capture"):
+                ok, frame = self._cap.read()
             if not ok or frame is None:
                 self._last_error = "No se pudo leer un frame de la cámara"
                 self._healthy = False
+                self._note_frame_failed(self._last_error)
                 if self._capture_backend == "v4l2" and self._switch_to_gstreamer():
                     LOGGER.warning("Lectura fallida con V4L2; cambiando a pipeline GStreamer")
                     time.sleep(0.1)
                     continue
                 time.sleep(0.05)
                 continue
+            self._note_frame_ok()
+            if self.frame_gate is not None and not self.frame_gate():
+                # Frame fuera de plazo: se descarta sin convertir ni pasar por MediaPipe.
+                continue
 
             height, width = frame.shape[:2]
             if height <= 0 or width <= 0:
@@ -3017,60 +3909,88 @@ class CameraGestureStream:
                 time.sleep(0.05)
                 continue
 
-            self._last_frame_shape = (int(height), int(width))
-
-            image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            if hasattr(image, "flags"):
-                image.flags.writeable = False
-            try:
-                results = self._hands.process(image)
-            finally:
+            with self._cpu_gate():
+                with self._stage_timings.measure("convert"):
+                    image, luma, width, height = landmark_worker.frame_planes(cv2, frame, self._frame_layout)
+                self._last_frame_shape = (int(height), int(width))
                 if hasattr(image, "flags"):
-                    image.flags.writeable = True
+                    image.flags.writeable = False
+                try:
+                    with self._stage_timings.measure("landmarks"):
+                        results = self._hands.process(image)
+                finally:
+                    if hasattr(image, "flags"):
+                        image.flags.writeable = True
 
             if not results.multi_hand_landmarks:
-                self._frames_without_hand += 1
-                if self._frames_without_hand > 2:
-                    self._landmark_buffer.clear()
-                    self._last_landmarks = None
-                    self._last_roi = None
-                time.sleep(0.02)
+                self._register_missing_hand()
                 continue
 
             self._frames_without_hand = 0
             landmarks = results.multi_hand_landmarks[0]
-            if not self._validate_landmarks(frame, results, landmarks, width, height):
-                self._last_landmarks = None
-                self._last_roi = None
-                continue
-
-            coords = [
-                (
-                    self._clamp_normalized(float(lm.x)),
-                    self._clamp_normalized(float(lm.y)),
-                    float(getattr(lm, "z", 0.0)),
-                )
-                for lm in landmarks.landmark
+            points = [
+                (float(lm.x), float(lm.y), float(getattr(lm, "z", 0.0)))
+                for lm in getattr(landmarks, "landmark", [])
             ]
-            roi_snapshot = self._snapshot_roi(coords, width, height)
-            if roi_snapshot is None:
-                self._register_quality_check(False, "roi_projection")
-                self._landmark_buffer.clear()
-                self._last_landmarks = None
-                self._last_roi = None
+            features = self._accept_landmarks(
+                points,
+                self._hand_score(results),
+                width,
+                height,
+                lambda bbox: self._frame_blur(frame, luma, bbox),
+            )
+            if features is None:
                 continue
-
-            self._landmark_buffer.append(coords)
-            smoothed = self._smooth_landmarks()
-            self._last_landmarks = [tuple(point) for point in smoothed]
-            self._last_roi = roi_snapshot
-            features = self._extract_features(smoothed)
-            self._register_quality_check(True, None)
-            self._last_capture = time.time()
-            self._last_error = None
-            self._healthy = True
             return features, None
 
+    # ------------------------------------------------------------------
+    def _register_missing_hand(self) -> None:
+        self._frames_without_hand += 1
+        self._blur_cached = None
+        if self._frames_without_hand > 2:
+            self._landmark_buffer.clear()
+            self._last_landmarks = None
+            self._last_roi = None
+
+    # ------------------------------------------------------------------
+    def _accept_landmarks(
+        self,
+        points: Sequence[LandmarkPoint],
+        hand_score: float,
+        width: int,
+        height: int,
+        blur: Callable[[Tuple[float, float, float, float]], Optional[float]],
+    ) -> Optional[List[float]]:
+        """Validate, smooth and featurise one hand; ``None`` when it is rejected."""
+
+        if not self._validate_points(points, hand_score, width, height, blur):
+            self._last_landmarks = None
+            self._last_roi = None
+            return None
+
+        coords = [
+            (self._clamp_normalized(x), self._clamp_normalized(y), float(z))
+            for x, y, z in points
+        ]
+        roi_snapshot = self._snapshot_roi(coords, width, height)
+        if roi_snapshot is None:
+            self._register_quality_check(False, "roi_projection")
+            self._landmark_buffer.clear()
+            self._last_landmarks = None
+            self._last_roi = None
+            return None
+
+        self._landmark_buffer.append(coords)
+        smoothed = self._smooth_landmarks()
+        self._last_landmarks = [tuple(point) for point in smoothed]
+        self._last_roi = roi_snapshot
+        features = self._extract_features(smoothed)
+        self._register_quality_check(True, None)
+        self._last_capture = time.time()
+        self._last_error = None
+        self._healthy = True
+        return features
+
     # ------------------------------------------------------------------
     def status(self) -> Dict[str, Any]:
         status: Dict[str, Any] = {
@@ -3089,6 +4009,12 @@ class CameraGestureStream:
             "probe_latency_ms": self._probe_latency_ms,
             "orientation_hint": self._orientation_hint,
             "pixel_format": self._pixel_format,
+            "frame_layout": self._frame_layout,
+            "capture_scale": self._capture_scale,
+            "model_complexity": self._model_complexity,
+            "last_reconfigure": self._last_reconfigure,
+            "stage_timings": self._stage_timings.snapshot(),
+            "selection_validation_pending": bool(self._validation and self._validation.pending),
         }
 
         if self._selection_dict:
@@ -3197,6 +4123,45 @@ class CameraGestureStream:
         if not valid and reason:
             self._quality_rejections[reason] += 1
 
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _hand_score(results: Any) -> float:
+        try:
+            classifications = results.multi_handedness[0].classification
+            if classifications:
+                return float(classifications[0].score)
+        except (AttributeError, IndexError, TypeError):
+            pass
+        return 1.0
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _frame_blur(
+        frame: Any,
+        luma: Any = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None,
+    ) -> Optional[float]:
+        try:
+            return landmark_worker.roi_blur(cv2, luma if luma is not None else frame, bbox or (0.0, 0.0, 1.0, 1.0))
+        except Exception:
+            return None
+
+    # ------------------------------------------------------------------
+    def _sampled_blur(
+        self,
+        blur: Callable[[Tuple[float, float, float, float]], Optional[float]],
+        bbox: Tuple[float, float, float, float],
+    ) -> Optional[float]:
+        # Se mide cada BLUR_SAMPLE_EVERY_N frames; un valor borroso se vuelve a medir enseguida.
+        cached = self._blur_cached
+        if self._blur_countdown <= 0 or cached is None or cached < QUALITY_BLUR_THRESHOLD:
+            with self._stage_timings.measure("blur"):
+                cached = blur(bbox)
+            self._blur_cached = cached
+            self._blur_countdown = landmark_worker.BLUR_SAMPLE_EVERY_N
+        self._blur_countdown -= 1
+        return cached
+
     # ------------------------------------------------------------------
     def _validate_landmarks(
         self,
@@ -3206,19 +4171,31 @@ class CameraGestureStream:
         image_width: int,
         image_height: int,
     ) -> bool:
-        hand_score = 1.0
-        try:
-            classifications = results.multi_handedness[0].classification
-            if classifications:
-                hand_score = float(classifications[0].score)
-        except (AttributeError, IndexError, TypeError):
-            hand_score = 1.0
+        points = [
+            (float(lm.x), float(lm.y), float(getattr(lm, "z", 0.0)))
+            for lm in getattr(landmarks, "landmark", [])
+        ]
+        return self._validate_points(
+            points,
+            self._hand_score(results),
+            image_width,
+            image_height,
+            lambda bbox: self._frame_blur(frame, bbox=bbox),
+        )
 
+    # ------------------------------------------------------------------
+    def _validate_points(
+        self,
+        points: Sequence[LandmarkPoint],
+        hand_score: float,
+        image_width: int,
+        image_height: int,
+        blur: Callable[[Tuple[float, float, float, float]], Optional[float]],
+    ) -> bool:
         if hand_score < QUALITY_MIN_HAND_SCORE:
             self._register_quality_check(False, "low_confidence")
             return False
 
-        points = getattr(landmarks, "landmark", [])
         if len(points) < QUALITY_MIN_LANDMARKS:
             self._register_quality_check(False, "incomplete_landmarks")
             return False
@@ -3227,8 +4204,8 @@ class CameraGestureStream:
             self._register_quality_check(False, "invalid_dimensions")
             return False
 
-        x_coords = [float(lm.x) for lm in points]
-        y_coords = [float(lm.y) for lm in points]
+        x_coords = [float(point[0]) for point in points]
+        y_coords = [float(point[1]) for point in points]
         if not x_coords or not y_coords:
             self._register_quality_check(False, "empty_landmarks")
             return False
@@ -3263,66 +4240,461 @@ class CameraGestureStream:
             self._register_quality_check(False, "small_bbox")
             return False
 
-        pixel_width = self._normalised_to_pixel(max_x, image_width) - self._normalised_to_pixel(min_x, image_width)
-        pixel_height = self._normalised_to_pixel(max_y, image_height) - self._normalised_to_pixel(min_y, image_height)
-        if pixel_width <= 6 or pixel_height <= 6:
-            self._register_quality_check(False, "roi_too_small")
-            return False
+        pixel_width = self._normalised_to_pixel(max_x, image_width) - self._normalised_to_pixel(min_x, image_width)
+        pixel_height = self._normalised_to_pixel(max_y, image_height) - self._normalised_to_pixel(min_y, image_height)
+        if pixel_width <= 6 or pixel_height <= 6:
+            self._register_quality_check(False, "roi_too_small")
+            return False
+
+        if QUALITY_BLUR_THRESHOLD:
+            # If blur detection fails (None) we do not discard the frame.
+            variance = self._sampled_blur(blur, (min_x, min_y, max_x, max_y))
+            if variance is not None and variance < QUALITY_BLUR_THRESHOLD:
+                self._register_quality_check(False, "blur")
+                return False
+
+        return True
+
+    # ------------------------------------------------------------------
+    def _smooth_landmarks(self) -> List[LandmarkPoint]:
+        if not self._landmark_buffer:
+            return []
+
+        buffer = list(self._landmark_buffer)
+        count = len(buffer)
+        length = len(buffer[0])
+        smoothed: List[LandmarkPoint] = []
+        for index in range(length):
+            avg_x = sum(item[index][0] for item in buffer) / count
+            avg_y = sum(item[index][1] for item in buffer) / count
+            avg_z = sum(item[index][2] for item in buffer) / count
+            smoothed.append((avg_x, avg_y, avg_z))
+        return smoothed
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _extract_features(coords: Iterable[LandmarkPoint]) -> List[float]:
+        coords = list(coords)
+        if not coords:
+            return []
+
+        x_coords = [point[0] for point in coords]
+        y_coords = [point[1] for point in coords]
+        min_x = min(x_coords)
+        min_y = min(y_coords)
+
+        data_aux: List[float] = []
+        for point in coords:
+            x, y = point[0], point[1]
+            data_aux.append(x - min_x)
+            data_aux.append(y - min_y)
+
+        return data_aux
+
+    # ------------------------------------------------------------------
+    def last_landmarks(self) -> Optional[List[LandmarkPoint]]:
+        if not self._last_landmarks:
+            return None
+        return [tuple(point) for point in self._last_landmarks]
+
+
+class ProcessCameraGestureStream(CameraGestureStream):
+    """Camera stream whose capture and MediaPipe run in a child process.
+
+    The parent keeps validation, smoothing and feature extraction so the
+    resulting features are identical to :class:`CameraGestureStream`.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._process: Optional[landmark_worker.CaptureProcess] = None
+        # Sustituye a frame_gate: el plazo se evalúa en el hijo, antes de convertir y de MediaPipe.
+        self.frame_pacer: Optional[FramePacer] = None
+
+    # ------------------------------------------------------------------
+    def _capture_attempts(self) -> List[Dict[str, Any]]:
+        target: Any = self._device_path if self._device_path is not None else self._camera_index
+        attempts: List[Dict[str, Any]] = []
+        for backend in camera_probe.preferred_backend_order(self._preferred_backend):
+            if backend == "gstreamer":
+                attempts.append(
+                    {
+                        "backend": backend,
+                        "target": self._build_gstreamer_pipeline(),
+                        "flag": int(cv2.CAP_GSTREAMER),
+                        "frame_layout": self._gstreamer_output(),
+                    }
+                )
+                continue
+            if target is None:
+                continue
+            flag = camera_probe.resolve_backend_flag(backend) or camera_probe.DEFAULT_CAPTURE_FLAG
+            try:
+                flag_int = int(flag)
+            except Exception:
+                flag_int = 0
+            attempts.append({"backend": backend, "target": target, "flag": flag_int})
+        return attempts
+
+    # ------------------------------------------------------------------
+    def open(self) -> None:
+        if self._opened:
+            return
+
+        width, height, fps = self._desired_dimensions()
+        process = landmark_worker.CaptureProcess(
+            attempts=self._capture_attempts(),
+            options={
+                "width": width,
+                "height": height,
+                "fps": fps,
+                "pixel_format": self._pixel_format,
+                "model_complexity": self._model_complexity,
+                "detection_confidence": self._detection_confidence,
+                "tracking_confidence": self._tracking_confidence,
+                "compute_blur": bool(QUALITY_BLUR_THRESHOLD),
+                "blur_threshold": QUALITY_BLUR_THRESHOLD,
+            },
+            hands=1,
+            name=f"HelenCapture-{self._device_path or self._camera_index}",
+        )
+        try:
+            info = process.start()
+        except RuntimeError as error:
+            self._last_error = f"Proceso de captura sin cámara: {error}"
+            raise RuntimeError(self._last_error) from error
+
+        self._process = process
+        self._capture_backend = info.get("backend")
+        self._gstreamer_pipeline = info.get("pipeline")
+        self._frame_layout = info.get("frame_layout") or "BGR"
+        if self._capture_backend == "gstreamer":
+            self._pixel_format = self._frame_layout
+        LOGGER.info(
+            "Captura aislada en proceso %s: %s (target=%s, %sx%s @ %.2f fps)",
+            process.pid,
+            info.get("backend"),
+            info.get("target"),
+            info.get("width"),
+            info.get("height"),
+            float(info.get("fps") or 0.0),
+        )
+        self._opened = True
+        self._healthy = True
+        self._last_error = None
+
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        process = self._process
+        self._process = None
+        if process is not None:
+            process.stop()
+        super().close()
+
+    # ------------------------------------------------------------------
+    def _sampled_blur(
+        self,
+        blur: Callable[[Tuple[float, float, float, float]], Optional[float]],
+        bbox: Tuple[float, float, float, float],
+    ) -> Optional[float]:
+        # El proceso hijo ya muestrea el ROI cada BLUR_SAMPLE_EVERY_N frames.
+        return blur(bbox)
+
+    # ------------------------------------------------------------------
+    def _reconfigure_capture(self) -> str:
+        if not self._opened or self._process is None:
+            return "deferred"
+        # La captura vive en el proceso hijo: se reinicia con el nuevo perfil.
+        self.close()
+        self.open()
+        return "restart_capture_process"
+
+    # ------------------------------------------------------------------
+    def _rebuild_landmarker(self) -> str:
+        return self._reconfigure_capture()
+
+    # ------------------------------------------------------------------
+    def _reopen_capture(self) -> None:
+        self._reopen_requested = False
+        LOGGER.warning("Reiniciando el proceso de captura de %s", self._device_target())
+        self.close()
+        self.open()
+        self._opened_at = time.time()
+
+    # ------------------------------------------------------------------
+    def interrupt_capture(self) -> None:
+        # El hijo puede estar bloqueado en cap.read(): se termina y el hilo lector lo reinicia.
+        self._reopen_requested = True
+        process = self._process
+        if process is not None:
+            process.kill()
+
+    # ------------------------------------------------------------------
+    def next(self, timeout: float = 2.0) -> Tuple[List[float], Optional[str]]:
+        if not self._opened:
+            self._open_validated()
+
+        process = self._process
+        assert process is not None
+
+        start = time.time()
+        while True:
+            remaining = (timeout - (time.time() - start)) if timeout else 0.5
+            if timeout and remaining <= 0:
+                self._last_error = "Tiempo de espera agotado sin detectar mano"
+                self._healthy = False
+                raise TimeoutError(self._last_error)
+
+            if self._pending_reconfigure is not None or self._reopen_requested:
+                if self._pending_reconfigure is not None:
+                    self._apply_pending_reconfigure()
+                if self._reopen_requested:
+                    self._reopen_capture()
+                process = self._process
+                assert process is not None
+
+            pacer = self.frame_pacer
+            if pacer is not None:
+                process.set_pacing(pacer.interval_s, pacer.frame_stride)
+            frame = process.next_frame(max(0.0, remaining))
+            process.poll_status()
+            if frame is None:
+                if not process.is_alive() and self._reopen_requested:
+                    # Terminado por el supervisor (interrupt_capture): se reinicia arriba.
+                    continue
+                if not process.is_alive():
+                    self._healthy = False
+                    self._last_error = process.last_error or "El proceso de captura terminó inesperadamente"
+                    if self._validation is not None:
+                        self._validation.open_failed(self._last_error)
+                    raise RuntimeError(self._last_error)
+                self._note_frame_failed(process.last_error or "Sin frames del proceso de captura")
+                continue
+            self._note_frame_ok()
+            if pacer is not None:
+                # El hijo ya descartó los frames fuera de plazo sin convertirlos ni pasarlos por MediaPipe.
+                pacer.accept()
+
+            if frame.width <= 0 or frame.height <= 0:
+                self._last_error = "Dimensiones de imagen no válidas"
+                self._healthy = False
+                self._register_quality_check(False, "invalid_dimensions")
+                continue
+
+            self._last_frame_shape = (frame.height, frame.width)
+            if frame.hands <= 0:
+                self._register_missing_hand()
+                continue
+
+            self._frames_without_hand = 0
+            blur = frame.blur
+            features = self._accept_landmarks(
+                [tuple(point) for point in frame.landmarks[0].tolist()],
+                frame.hand_score,
+                frame.width,
+                frame.height,
+                lambda bbox: blur,
+            )
+            if features is None:
+                continue
+            return features, None
+
+    # ------------------------------------------------------------------
+    def status(self) -> Dict[str, Any]:
+        status = super().status()
+        process = self._process
+        status["capture_process"] = (
+            {
+                "pid": process.pid,
+                "alive": process.is_alive(),
+                "sequence": process.ring.write_sequence,
+                "paced_out": process.skipped,
+                "last_error": process.last_error,
+            }
+            if process is not None
+            else None
+        )
+        return status
+
+
+class ProcessVideoGestureStream(VideoGestureStream):
+    """Two-hand video stream whose capture and MediaPipe run in a child process."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._process: Optional[landmark_worker.CaptureProcess] = None
+        # Sustituye a frame_gate: el plazo se evalúa en el hijo, antes de convertir y de MediaPipe.
+        self.frame_pacer: Optional[FramePacer] = None
 
-        if QUALITY_BLUR_THRESHOLD:
-            try:
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                variance = float(cv2.Laplacian(gray, cv2.CV_64F).var())
-                if variance < QUALITY_BLUR_THRESHOLD:
-                    self._register_quality_check(False, "blur")
-                    return False
-            except Exception:
-                # If blur detection fails we do not discard the frame.
-                pass
+    # ------------------------------------------------------------------
+    def _device_target(self) -> Any:
+        # El nodo sondeado (p. ej. /dev/video2) es más estable que el índice entre reinicios.
+        selection = self._selection
+        if selection is not None and selection.device and selection.kind != "csi":
+            return selection.device
+        return super()._device_target()
 
-        return True
+    # ------------------------------------------------------------------
+    def _capture_attempts(self) -> List[Dict[str, Any]]:
+        target = self._device_target()
+        attempts: List[Dict[str, Any]] = []
+        pipeline = self._hw_pipeline()
+        if pipeline:
+            attempts.append(
+                {"backend": "gstreamer", "target": pipeline, "flag": int(cv2.CAP_GSTREAMER), "frame_layout": "I420"}
+            )
+        backend = self._selection.backend if self._selection else None
+        if backend and backend not in ("auto", "gstreamer"):
+            flag = camera_probe.resolve_backend_flag(backend)
+            if flag is not None:
+                attempts.append({"backend": backend, "target": target, "flag": int(flag)})
+        attempts.append({"backend": "auto", "target": target, "flag": 0})
+        return attempts
 
     # ------------------------------------------------------------------
-    def _smooth_landmarks(self) -> List[LandmarkPoint]:
-        if not self._landmark_buffer:
-            return []
+    def open(self) -> None:
+        if self._opened:
+            return
 
-        buffer = list(self._landmark_buffer)
-        count = len(buffer)
-        length = len(buffer[0])
-        smoothed: List[LandmarkPoint] = []
-        for index in range(length):
-            avg_x = sum(item[index][0] for item in buffer) / count
-            avg_y = sum(item[index][1] for item in buffer) / count
-            avg_z = sum(item[index][2] for item in buffer) / count
-            smoothed.append((avg_x, avg_y, avg_z))
-        return smoothed
+        target = self._device_target()
+        selection = self._selection
+        process = landmark_worker.CaptureProcess(
+            attempts=self._capture_attempts(),
+            options={
+                "width": self._capture_size()[0],
+                "height": self._capture_size()[1],
+                "fps": self._capture_fps(),
+                "pixel_format": selection.pixel_format if selection else None,
+                "model_complexity": self._model_complexity,
+                "detection_confidence": self._detection_confidence,
+                "tracking_confidence": self._tracking_confidence,
+                "compute_blur": False,
+            },
+            hands=video_config.MAX_HANDS,
+            name=f"HelenCapture-{target}",
+        )
+        try:
+            process.start()
+        except RuntimeError as error:
+            self._last_error = f"No se pudo abrir la cámara en {target}: {error}"
+            raise RuntimeError(self._last_error) from error
+
+        LOGGER.info("Captura de video aislada en proceso %s (target=%s)", process.pid, target)
+        self._process = process
+        self._opened = True
+        self._healthy = True
+        self._last_error = None
 
     # ------------------------------------------------------------------
-    @staticmethod
-    def _extract_features(coords: Iterable[LandmarkPoint]) -> List[float]:
-        coords = list(coords)
-        if not coords:
-            return []
+    def close(self) -> None:
+        process = self._process
+        self._process = None
+        if process is not None:
+            process.stop()
+        self._opened = False
 
-        x_coords = [point[0] for point in coords]
-        y_coords = [point[1] for point in coords]
-        min_x = min(x_coords)
-        min_y = min(y_coords)
+    # ------------------------------------------------------------------
+    def _reopen_capture(self) -> None:
+        self._reopen_requested = False
+        LOGGER.warning("Reiniciando el proceso de captura de %s", self._device_target())
+        self.close()
+        self.open()
+        self._opened_at = time.time()
 
-        data_aux: List[float] = []
-        for point in coords:
-            x, y = point[0], point[1]
-            data_aux.append(x - min_x)
-            data_aux.append(y - min_y)
+    # ------------------------------------------------------------------
+    def interrupt_capture(self) -> None:
+        # El hijo puede estar bloqueado en cap.read(): se termina y el hilo lector lo reinicia.
+        self._reopen_requested = True
+        process = self._process
+        if process is not None:
+            process.kill()
 
-        return data_aux
+    # ------------------------------------------------------------------
+    def _apply_adapt(self, resize: bool, complexity_changed: bool) -> str:
+        # Resolución y complejidad viven en el proceso hijo: se reinicia con las nuevas opciones.
+        self.close()
+        self.open()
+        return "restart_process"
 
     # ------------------------------------------------------------------
-    def last_landmarks(self) -> Optional[List[LandmarkPoint]]:
-        if not self._last_landmarks:
+    def next_into(self, out: np.ndarray, timeout: float = 2.0) -> Optional[str]:
+        if not self._opened:
+            self._open_validated()
+
+        process = self._process
+        assert process is not None
+
+        start = time.time()
+        while True:
+            remaining = (timeout - (time.time() - start)) if timeout else 0.5
+            if timeout and remaining <= 0:
+                self._last_error = "Tiempo de espera agotado sin detectar mano"
+                self._healthy = False
+                raise TimeoutError(self._last_error)
+
+            if self._pending_adapt is not None:
+                self._apply_pending_adapt()
+            if self._reopen_requested:
+                self._reopen_capture()
+            process = self._process
+            assert process is not None
+
+            pacer = self.frame_pacer
+            if pacer is not None:
+                process.set_pacing(pacer.interval_s, pacer.frame_stride)
+            frame = process.next_frame(max(0.0, remaining))
+            process.poll_status()
+            if frame is None:
+                if not process.is_alive() and self._reopen_requested:
+                    # Terminado por el supervisor (interrupt_capture): se reinicia arriba.
+                    continue
+                if not process.is_alive():
+                    self._healthy = False
+                    self._last_error = process.last_error or "El proceso de captura terminó inesperadamente"
+                    if self._validation is not None:
+                        self._validation.open_failed(self._last_error)
+                    raise RuntimeError(self._last_error)
+                self._note_frame_failed(process.last_error or "Sin frames del proceso de captura")
+                continue
+            self._note_frame_ok()
+            if pacer is not None:
+                # El hijo ya descartó los frames fuera de plazo sin convertirlos ni pasarlos por MediaPipe.
+                pacer.accept()
+
+            self._last_frame_shape = (frame.height, frame.width)
+            if frame.hands <= 0:
+                self._frames_without_hand += 1
+                self._last_landmarks = None
+                continue
+
+            for hand in frame.landmarks[::-1]:
+                if hand.any():
+                    self._last_landmarks = [tuple(point) for point in hand.tolist()]
+                    break
+
+            self._frames_without_hand = 0
+            out[:] = frame.landmarks.reshape(-1)
+            normalise_landmarks(out)
+            self._last_capture = time.time()
+            self._healthy = True
+            self._last_error = None
             return None
-        return [tuple(point) for point in self._last_landmarks]
+
+    # ------------------------------------------------------------------
+    def status(self) -> Dict[str, Any]:
+        status = super().status()
+        process = self._process
+        status["capture_process"] = (
+            {
+                "pid": process.pid,
+                "alive": process.is_alive(),
+                "sequence": process.ring.write_sequence,
+                "paced_out": process.skipped,
+            }
+            if process is not None
+            else None
+        )
+        return status
 
 
 class EventStream:
@@ -3394,6 +4766,496 @@ class _SSEClient:
                 self._handler.wfile.flush()
 
 
+class FairFrameScheduler:
+    """Share CPU slots fairly between the capture pipelines of several runtimes.
+
+    Work items (MediaPipe landmark extraction and classifier inference) queue
+    in FIFO order, so a pipeline that just finished a frame lines up behind the
+    others instead of starving them. At most ``slots`` items run concurrently.
+    """
+
+    def __init__(self, slots: Optional[int] = None) -> None:
+        default_slots = max(1, (os.cpu_count() or 2) - 1)
+        self._slots = max(1, int(slots or default_slots))
+        self._condition = threading.Condition()
+        self._queue: Deque[object] = deque()
+        self._active = 0
+        self._granted: Dict[str, int] = defaultdict(int)
+        self._wait_ms: Dict[str, float] = defaultdict(float)
+
+    # ------------------------------------------------------------------
+    @property
+    def slots(self) -> int:
+        return self._slots
+
+    # ------------------------------------------------------------------
+    @contextlib.contextmanager
+    def slot(self, name: str) -> Iterator[None]:
+        ticket = object()
+        requested_at = time.perf_counter()
+        with self._condition:
+            self._queue.append(ticket)
+            while self._queue[0] is not ticket or self._active >= self._slots:
+                self._condition.wait()
+            self._queue.popleft()
+            self._active += 1
+            self._granted[name] += 1
+            self._wait_ms[name] += (time.perf_counter() - requested_at) * 1000.0
+            # Otro integrante de la cola puede tomar un slot libre de inmediato.
+            self._condition.notify_all()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Dict[str, Any]:
+        with self._condition:
+            granted = dict(self._granted)
+            wait_ms = dict(self._wait_ms)
+            active = self._active
+            queued = len(self._queue)
+        return {
+            "slots": self._slots,
+            "active": active,
+            "queued": queued,
+            "granted": granted,
+            "avg_wait_ms": {
+                name: round(wait_ms.get(name, 0.0) / count, 3) for name, count in granted.items() if count
+            },
+        }
+
+
+class CameraSupervisor:
+    """Watch the live camera stream and recover it without restarting the runtime.
+
+    Every ``interval_s`` the supervisor checks the age of the last frame read
+    and whether the device node still exists in sysfs (hotplug). A stalled
+    process-backed capture is killed (``interrupt_capture``) so a read blocked
+    in the driver ends with the child, and the reading thread restarts it. An
+    in-process capture only gets ``request_reopen``: ``cv2.VideoCapture`` is
+    not thread-safe, and releasing it under a blocked ``read()`` frees the
+    V4L2 buffers that read is using. After ``reopen_attempts`` failures, or
+    when the device disappears and another one shows up, the runtime
+    re-probes and swaps in a new stream. Recovery time runs from detection to
+    the first frame after recovery.
+    """
+
+    def __init__(
+        self,
+        runtime: "HelenRuntime",
+        *,
+        interval_s: float = CAMERA_SUPERVISOR_INTERVAL_S,
+        stall_after_s: float = CAMERA_STALL_SECONDS,
+        reopen_attempts: int = CAMERA_REOPEN_ATTEMPTS,
+        disconnect_reprobe_s: float = CAMERA_DISCONNECT_REPROBE_S,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._runtime = runtime
+        self._interval = max(0.1, float(interval_s))
+        self._stall_after = max(0.5, float(stall_after_s))
+        self._reopen_attempts = max(0, int(reopen_attempts))
+        self._disconnect_reprobe_s = max(0.0, float(disconnect_reprobe_s))
+        self._clock = clock
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.state = "idle"
+        self.recoveries = 0
+        self.last_recovery_ms: Optional[float] = None
+        self.last_failure: Optional[str] = None
+        self._incident_started: Optional[float] = None
+        self._attempts = 0
+        self._last_reprobe_at: Optional[float] = None
+        self._watch_started = clock()
+        self._known_nodes = self._video_nodes()
+
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._watch_started = self._clock()
+        self._thread = threading.Thread(target=self._run, name=f"HelenCameraSupervisor-{self._runtime.name}", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread:
+            thread.join(timeout=2.0)
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _video_nodes() -> set:
+        root = Path("/sys/class/video4linux")
+        if not root.exists():
+            return set()
+        with contextlib.suppress(OSError):
+            return {f"/dev/{entry.name}" for entry in root.iterdir()}
+        return set()
+
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self.check()
+            except Exception as error:  # pragma: no cover - defensive
+                LOGGER.warning("Supervisor de cámara: error inesperado: %s", error)
+
+    # ------------------------------------------------------------------
+    def check(self) -> str:
+        stream = self._runtime.stream
+        health_getter = getattr(stream, "capture_health", None)
+        if self._runtime.stream_source not in SUPERVISED_STREAM_SOURCES or not callable(health_getter):
+            self.state = "idle"
+            return self.state
+
+        now = self._clock()
+        info = health_getter()
+        nodes = self._video_nodes()
+        appeared = nodes - self._known_nodes
+        self._known_nodes = nodes
+
+        last_frame_at = info.get("last_frame_at")
+        device = info.get("device")
+        disconnected = (
+            Path("/sys/class/video4linux").exists()
+            and isinstance(device, str)
+            and device.startswith("/dev/video")
+            and device not in nodes
+        )
+
+        if self._incident_started is not None:
+            if last_frame_at and last_frame_at > self._incident_started and not disconnected:
+                self.last_recovery_ms = round((last_frame_at - self._incident_started) * 1000.0, 1)
+                self.recoveries += 1
+                LOGGER.info("Cámara recuperada en %.0f ms (%s)", self.last_recovery_ms, self.last_failure)
+                self._incident_started = None
+                self._attempts = 0
+                self.state = "ok"
+                return self.state
+        else:
+            reference = last_frame_at or info.get("opened_at") or self._watch_started
+            stalled = (now - reference) > self._stall_after
+            if not disconnected and not stalled:
+                self.state = "ok"
+                return self.state
+            self._incident_started = now
+            self._attempts = 0
+            self.last_failure = "dispositivo desconectado" if disconnected else f"sin frames desde hace {now - reference:.1f} s"
+            LOGGER.warning("Supervisor de cámara: %s (%s)", self.last_failure, device)
+
+        self._recover(stream, device, disconnected, appeared, now)
+        return self.state
+
+    # ------------------------------------------------------------------
+    def _recover(self, stream: Any, device: Any, disconnected: bool, appeared: set, now: float) -> None:
+        if disconnected:
+            self.state = "disconnected"
+            if device in appeared:
+                LOGGER.info("La cámara %s volvió a conectarse; reabriendo", device)
+                self._interrupt(stream)
+                self.state = "recovering"
+                return
+            waited = now - (self._incident_started or now)
+            if appeared or waited >= self._disconnect_reprobe_s:
+                self._reprobe()
+            return
+
+        if self._attempts < self._reopen_attempts:
+            self._attempts += 1
+            self.state = "recovering"
+            self._interrupt(stream)
+            return
+        self._reprobe()
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _interrupt(stream: Any) -> None:
+        # Solo las capturas en proceso hijo se interrumpen desde aquí (se mata el hijo). Liberar un
+        # cv2.VideoCapture en uso desde otro hilo puede tumbar el backend; ese caso espera al
+        # reintento y, si sigue bloqueado, al re-sondeo.
+        interrupt = getattr(stream, "interrupt_capture", None)
+        if callable(interrupt):
+            interrupt()
+        else:
+            stream.request_reopen()
+
+    # ------------------------------------------------------------------
+    def _reprobe(self) -> None:
+        now = self._clock()
+        if self._runtime.reprobe_in_progress() or (
+            self._last_reprobe_at is not None and now - self._last_reprobe_at < self._disconnect_reprobe_s
+        ):
+            return
+        self.state = "reprobing"
+        self._attempts = 0
+        self._last_reprobe_at = now
+        self._runtime.request_camera_reprobe()
+
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "recoveries": self.recoveries,
+            "last_recovery_ms": self.last_recovery_ms,
+            "last_failure": self.last_failure,
+            "incident_open": self._incident_started is not None,
+        }
+
+
+def _normalised_load() -> Optional[float]:
+    """One-minute load average divided by the CPU count; ``None`` where unavailable (Windows)."""
+
+    try:
+        return os.getloadavg()[0] / float(os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        return None
+
+
+class AdaptiveRateController:
+    """Hold a per-frame latency budget by stepping stride, resolution and landmarker complexity.
+
+    Once per ``interval_s`` the controller adds up the processing stages of
+    the live stream (conversion, landmarks, blur; the wait for the sensor is
+    excluded) and the classifier latency, and reads the normalised load
+    average. Two checks in a row over budget step one level down
+    :data:`ADAPTIVE_LEVELS`; three checks comfortably under budget step back
+    up, and these changes respect ``min_dwell_s`` to avoid oscillation. With
+    no hand and an idle decision engine it only adds ``idle_stride`` to the
+    frame stride; a hand or an open gesture removes it immediately. Parking
+    and waking never touch resolution or landmarker complexity, so the first
+    frames of a gesture are not lost to a capture reopen. The stride goes
+    through the pipeline's :class:`FramePacer`, which a capture child applies
+    before MediaPipe; each decision records where it took effect
+    (``stride_applied_in``).
+    """
+
+    def __init__(
+        self,
+        runtime: "HelenRuntime",
+        *,
+        budget_ms: float = ADAPTIVE_LATENCY_BUDGET_MS,
+        interval_s: float = ADAPTIVE_INTERVAL_S,
+        idle_after_s: float = ADAPTIVE_IDLE_AFTER_S,
+        min_dwell_s: float = ADAPTIVE_MIN_DWELL_S,
+        levels: Sequence[AdaptiveLevel] = ADAPTIVE_LEVELS,
+        idle_stride: int = ADAPTIVE_IDLE_STRIDE,
+        clock: Callable[[], float] = time.time,
+        load: Callable[[], Optional[float]] = _normalised_load,
+    ) -> None:
+        self._runtime = runtime
+        self._budget_ms = max(1.0, float(budget_ms))
+        self._interval = max(0.1, float(interval_s))
+        self._idle_after = max(0.0, float(idle_after_s))
+        self._min_dwell = max(0.0, float(min_dwell_s))
+        self._levels = tuple(levels)
+        self._idle_stride = max(0, int(idle_stride))
+        self._clock = clock
+        self._load = load
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.level = 0
+        self.idle = False
+        self._active_level = 0
+        self._over = 0
+        self._under = 0
+        self._changed_at = clock()
+        self._stream_id: Optional[int] = None
+        self.last_latency_ms: Optional[float] = None
+        self.last_load: Optional[float] = None
+        self.decisions: Deque[Dict[str, Any]] = deque(maxlen=20)
+
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"HelenAdaptive-{self._runtime.name}", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread:
+            thread.join(timeout=2.0)
+
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self.check()
+            except Exception as error:  # pragma: no cover - defensive
+                LOGGER.warning("Control adaptativo: error inesperado: %s", error)
+
+    # ------------------------------------------------------------------
+    def stride_offset(self) -> int:
+        return self._levels[self.level].stride_offset + (self._idle_stride if self.idle else 0)
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _stride_applied_in(stream: Any) -> Optional[str]:
+        """Where a stride change saves landmark work; ``None`` when it saves none."""
+
+        if hasattr(stream, "frame_pacer"):
+            # Sin pacer el hijo sigue pasando cada frame por MediaPipe: el paso no ahorra nada.
+            return "capture_process" if stream.frame_pacer is not None else None
+        if getattr(stream, "frame_gate", None) is not None:
+            return "stream"
+        return "pipeline"
+
+    # ------------------------------------------------------------------
+    def _frame_latency_ms(self, stream_status: Dict[str, Any]) -> Optional[float]:
+        stages = dict(stream_status.get("stage_timings") or {})
+        stages.update(self._runtime.stage_timings.snapshot())
+        costs = [float(entry["avg_ms"]) for name, entry in stages.items() if name != "capture"]
+        return round(sum(costs), 3) if costs else None
+
+    # ------------------------------------------------------------------
+    def _gesture_active(self, stream_status: Dict[str, Any], now: float) -> bool:
+        if self._runtime.decision_engine.snapshot().state != "idle":
+            return True
+        last_hand = stream_status.get("last_capture")
+        return bool(last_hand) and (now - float(last_hand)) <= self._idle_after
+
+    # ------------------------------------------------------------------
+    def check(self) -> int:
+        stream = self._runtime.stream
+        if self._runtime.stream_source not in SUPERVISED_STREAM_SOURCES:
+            return self.level
+
+        now = self._clock()
+        stream_status = getattr(stream, "status", lambda: {})() or {}
+        latency = self._frame_latency_ms(stream_status)
+        load = self._load()
+        self.last_latency_ms = latency
+        self.last_load = None if load is None else round(load, 3)
+        active = self._gesture_active(stream_status, now)
+
+        over = (latency is not None and latency > self._budget_ms) or (load is not None and load > ADAPTIVE_CPU_HIGH)
+        under = (latency is None or latency < self._budget_ms * 0.6) and (load is None or load < ADAPTIVE_CPU_LOW)
+        self._over = self._over + 1 if over else 0
+        self._under = self._under + 1 if under and not over else 0
+
+        deepest = len(self._levels) - 1
+        reason: Optional[str] = None
+        if self._over >= 2 and self._active_level < deepest:
+            self._active_level += 1
+            reason = "sobre_presupuesto"
+        elif active and self._under >= 3 and self._active_level > 0:
+            self._active_level -= 1
+            reason = "holgura"
+        target = self._active_level
+        idle = not active
+        wake_change = idle != self.idle
+
+        if id(stream) != self._stream_id:
+            # Un flujo nuevo (re-sondeo) arranca con la configuración completa: se reaplica el nivel.
+            self._stream_id = id(stream)
+            if target == self.level:
+                self._apply(target, idle, "flujo_nuevo", latency, load, now, force_adapt=True)
+                return self.level
+
+        if target == self.level and not wake_change:
+            return self.level
+        if target != self.level and (now - self._changed_at) < self._min_dwell:
+            if not wake_change:
+                return self.level
+            target = self.level  # el cambio de ritmo no espera; el de nivel sí
+        if target == self.level:
+            reason = "inactivo" if idle else "gesto"
+        self._apply(target, idle, reason or "ajuste", latency, load, now)
+        return self.level
+
+    # ------------------------------------------------------------------
+    def _apply(
+        self,
+        target: int,
+        idle: bool,
+        reason: str,
+        latency: Optional[float],
+        load: Optional[float],
+        now: float,
+        *,
+        force_adapt: bool = False,
+    ) -> None:
+        previous = self.level
+        previous_level = self._levels[previous]
+        level = self._levels[target]
+        if target != previous:
+            self._changed_at = now
+        self._over = 0
+        self._under = 0
+        self.level = target
+        self.idle = idle
+
+        frame_stride = max(1, int(self._runtime.config.process_every_n or 1)) + self.stride_offset()
+        self._runtime.pipeline.reconfigure(frame_stride=frame_stride)
+        stride_applied_in = self._stride_applied_in(self._runtime.stream)
+        capture_changed = (level.capture_scale, level.model_complexity) != (
+            previous_level.capture_scale,
+            previous_level.model_complexity,
+        )
+        adapt = getattr(self._runtime.stream, "adapt", None)
+        if callable(adapt) and (capture_changed or force_adapt):
+            adapt(capture_scale=level.capture_scale, model_complexity=level.model_complexity)
+
+        decision = {
+            "at": now,
+            "from": previous,
+            "to": target,
+            "idle": idle,
+            "reason": reason,
+            "latency_ms": latency,
+            "load": None if load is None else round(load, 3),
+            "frame_stride": frame_stride,
+            "stride_applied_in": stride_applied_in,
+            "capture_scale": level.capture_scale,
+            "model_complexity": level.model_complexity,
+        }
+        self.decisions.append(decision)
+        LOGGER.info(
+            "Control adaptativo: nivel %s → %s (%s; latencia=%s ms, carga=%s) → paso=%s (%s), escala=%.2f, complejidad=%s",
+            previous,
+            target,
+            reason,
+            "-" if latency is None else f"{latency:.1f}",
+            "-" if load is None else f"{load:.2f}",
+            frame_stride,
+            stride_applied_in or "sin efecto en MediaPipe",
+            level.capture_scale,
+            level.model_complexity,
+        )
+
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Dict[str, Any]:
+        level = self._levels[self.level]
+        return {
+            "level": self.level,
+            "idle": self.idle,
+            "active_level": self._active_level,
+            "budget_ms": self._budget_ms,
+            "last_latency_ms": self.last_latency_ms,
+            "last_load": self.last_load,
+            "frame_stride_offset": self.stride_offset(),
+            "capture_scale": level.capture_scale,
+            "model_complexity": level.model_complexity,
+            "decisions": list(self.decisions),
+        }
+
+
+def _stream_is_paced(stream: Any) -> bool:
+    """Whether ``stream`` applies the pipeline's pacer itself (in process or in its capture child)."""
+
+    return getattr(stream, "frame_gate", None) is not None or getattr(stream, "frame_pacer", None) is not None
+
+
 class VideoGesturePipeline:
     """Background thread that buffers frames for the TensorFlow model."""
 
@@ -3404,14 +5266,16 @@ class VideoGesturePipeline:
         interval_s: float = 0.04,
         frame_stride: int = 1,
         sequence_length: int,
+        pacer: Optional[FramePacer] = None,
     ) -> None:
         self._runtime = runtime
         self._interval = float(max(0.01, interval_s))
-        self._frame_stride = max(1, int(frame_stride))
         self._sequence_length = max(1, int(sequence_length))
+        self.sequence_buffer = SequenceBuffer(self._sequence_length, video_config.FEATURE_SIZE)
         self._thread: Optional[threading.Thread] = None
         self._running = False
-        self._stride_cursor = 0
+        self._stop_event = threading.Event()
+        self.pacer = pacer or FramePacer(self._interval, frame_stride)
 
     # ------------------------------------------------------------------
     def start(self) -> None:
@@ -3419,53 +5283,80 @@ class VideoGesturePipeline:
             return
 
         self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self.run, name="VideoGesturePipeline", daemon=True)
         self._thread.start()
 
     # ------------------------------------------------------------------
     def stop(self) -> None:
         self._running = False
+        self._stop_event.set()
         thread = self._thread
         if thread:
             thread.join(timeout=1.5)
 
+    # ------------------------------------------------------------------
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ------------------------------------------------------------------
+    def reconfigure(self, *, interval_s: Optional[float] = None, frame_stride: Optional[int] = None) -> None:
+        """Apply pacing changes to the running thread without restarting it."""
+
+        if interval_s is not None:
+            self._interval = float(max(0.01, interval_s))
+        self.pacer.reconfigure(interval_s=interval_s, frame_stride=frame_stride)
+
     # ------------------------------------------------------------------
     def run(self) -> None:
         LOGGER.info("Gesture pipeline (video model) iniciada")
-        buffer: Deque[Sequence[float]] = deque(maxlen=self._sequence_length)
+        buffer = self.sequence_buffer
         sequence = 1
         while self._running:
+            self._runtime.close_retired_streams()
+            stream = self._runtime.stream
+            # Las cámaras consultan al pacer por frame; el resto espera su plazo aquí.
+            if not _stream_is_paced(stream) and not self.pacer.wait(self._stop_event):
+                break
             try:
-                features, source_label = self._runtime.stream.next(timeout=1.5)
+                next_into = getattr(stream, "next_into", None)
+                if callable(next_into):
+                    # El flujo escribe el frame normalizado directamente en la ventana.
+                    source_label = next_into(buffer.slot(), timeout=1.5)
+                    buffer.commit()
+                else:
+                    features, source_label = stream.next(timeout=1.5)
+                    buffer.append(np.asarray(features, dtype=np.float32))
             except TimeoutError:
-                time.sleep(self._interval)
                 continue
             except Exception as error:  # pragma: no cover - depends on environment
                 self._runtime.report_error(f"stream_error: {error}")
-                time.sleep(0.5)
+                self._stop_event.wait(0.5)
                 continue
 
-            if self._frame_stride > 1:
-                self._stride_cursor = (self._stride_cursor + 1) % self._frame_stride
-                if self._stride_cursor != 1:
-                    time.sleep(self._interval)
-                    continue
+            classifier = self._runtime.classifier
+            required = int(getattr(classifier, "sequence_length", buffer.length))
+            if required != buffer.length:
+                # Modelo promovido en caliente con otra ventana: se conservan los frames recientes.
+                buffer = self.sequence_buffer = buffer.resized(required)
+                self._sequence_length = required
 
-            buffer.append(list(features))
-            if len(buffer) < self._sequence_length:
-                time.sleep(self._interval)
+            if not buffer.full:
                 continue
 
             try:
-                start = time.perf_counter()
-                prediction: Prediction = self._runtime.classifier.predict_sequence(buffer)
-                latency_ms = (time.perf_counter() - start) * 1000.0
+                with self._runtime.cpu_slot():
+                    start = time.perf_counter()
+                    prediction: Prediction = classifier.predict_sequence(buffer.window())
+                    latency_ms = (time.perf_counter() - start) * 1000.0
+                self._runtime.stage_timings.record("classify", latency_ms)
             except Exception as error:  # pragma: no cover - classifier failure
                 self._runtime.report_error(f"classifier_error: {error}")
-                time.sleep(0.5)
+                self._stop_event.wait(0.5)
                 continue
 
-            timestamp = time.time()
+            timestamp = self._runtime.decision_engine.now()
+            self._runtime.record_prediction(prediction, timestamp=timestamp, hint_label=source_label)
             decision = self._runtime.decision_engine.process(
                 prediction,
                 timestamp=timestamp,
@@ -3490,8 +5381,6 @@ class VideoGesturePipeline:
                 self._runtime.push_prediction(event)
                 sequence += 1
 
-            time.sleep(self._interval)
-
         LOGGER.info("Gesture pipeline (video model) detenida")
 
 
@@ -3504,26 +5393,29 @@ class GesturePipeline:
         interval_s: float = 0.12,
         *,
         frame_stride: int = 1,
+        pacer: Optional[FramePacer] = None,
     ) -> None:
         self._runtime = runtime
         self._interval = max(0.01, float(interval_s))
         self._thread: Optional[threading.Thread] = None
         self._running = threading.Event()
+        self._stopped = threading.Event()
         self._sequence = 0
-        self._frame_stride = max(1, int(frame_stride))
-        self._stride_cursor = 0
+        self.pacer = pacer or FramePacer(self._interval, frame_stride)
 
     # ------------------------------------------------------------------
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
             return
         self._running.set()
+        self._stopped.clear()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
     # ------------------------------------------------------------------
     def stop(self) -> None:
         self._running.clear()
+        self._stopped.set()
         if self._thread:
             self._thread.join(timeout=2.0)
 
@@ -3531,27 +5423,34 @@ class GesturePipeline:
     def is_running(self) -> bool:
         return self._thread is not None and self._thread.is_alive()
 
+    # ------------------------------------------------------------------
+    def reconfigure(self, *, interval_s: Optional[float] = None, frame_stride: Optional[int] = None) -> None:
+        """Apply pacing changes to the running thread without restarting it."""
+
+        if interval_s is not None:
+            self._interval = max(0.01, float(interval_s))
+        self.pacer.reconfigure(interval_s=interval_s, frame_stride=frame_stride)
+
     # ------------------------------------------------------------------
     def _run(self) -> None:
         LOGGER.info("Gesture pipeline started")
         while self._running.is_set():
             self._runtime.register_heartbeat()
+            self._runtime.close_retired_streams()
+            stream = self._runtime.stream
+            # Las cámaras consultan al pacer por frame; el resto espera su plazo aquí.
+            if not _stream_is_paced(stream) and not self.pacer.wait(self._stopped):
+                break
             try:
-                features, source_label = self._runtime.stream.next(timeout=max(1.0, self._interval * 6))
+                features, source_label = stream.next(timeout=max(1.0, self._interval * 6))
             except TimeoutError as timeout_error:
                 LOGGER.debug("Pipeline timeout waiting for hand landmarks: %s", timeout_error)
                 continue
             except Exception as error:  # pragma: no cover - unexpected runtime failure
                 self._runtime.report_error(f"stream_error: {error}")
-                time.sleep(0.5)
+                self._stopped.wait(0.5)
                 continue
 
-            if self._frame_stride > 1:
-                self._stride_cursor = (self._stride_cursor + 1) % self._frame_stride
-                if self._stride_cursor != 1:
-                    time.sleep(self._interval)
-                    continue
-
             try:
                 transformed = self._runtime.feature_normalizer.transform(features)
             except Exception as error:  # pragma: no cover - unexpected normalization failure
@@ -3559,15 +5458,17 @@ class GesturePipeline:
                 transformed = list(features)
 
             try:
-                start = time.perf_counter()
-                prediction: Prediction = self._runtime.classifier.predict(transformed)
-                latency_ms = (time.perf_counter() - start) * 1000.0
+                with self._runtime.cpu_slot():
+                    start = time.perf_counter()
+                    prediction: Prediction = self._runtime.classifier.predict(transformed)
+                    latency_ms = (time.perf_counter() - start) * 1000.0
+                self._runtime.stage_timings.record("classify", latency_ms)
             except Exception as error:  # pragma: no cover - classifier failure
                 self._runtime.report_error(f"classifier_error: {error}")
-                time.sleep(0.5)
+                self._stopped.wait(0.5)
                 continue
 
-            timestamp = time.time()
+            timestamp = self._runtime.decision_engine.now()
             landmarks: Optional[Sequence[LandmarkPoint]] = None
             last_landmarks_getter = getattr(self._runtime.stream, "last_landmarks", None)
             if callable(last_landmarks_getter):
@@ -3575,6 +5476,12 @@ class GesturePipeline:
                     landmarks_candidate = last_landmarks_getter()
                     if landmarks_candidate:
                         landmarks = list(landmarks_candidate)
+            self._runtime.record_prediction(
+                prediction,
+                timestamp=timestamp,
+                hint_label=source_label,
+                landmarks=landmarks,
+            )
             decision = self._runtime.decision_engine.process(
                 prediction,
                 timestamp=timestamp,
@@ -3598,7 +5505,6 @@ class GesturePipeline:
                 )
                 self._runtime.push_prediction(event)
                 self._sequence += 1
-            time.sleep(self._interval)
 
         LOGGER.info("Gesture pipeline stopped")
 
@@ -3606,8 +5512,18 @@ class GesturePipeline:
 class HelenRuntime:
     """Holds application state shared across HTTP handlers."""
 
-    def __init__(self, config: Optional[RuntimeConfig] = None) -> None:
+    def __init__(
+        self,
+        config: Optional[RuntimeConfig] = None,
+        *,
+        shared_classifier: Optional[Tuple[Any, Dict[str, Any]]] = None,
+        scheduler: Optional[FairFrameScheduler] = None,
+        exclude_devices: Iterable[Union[int, str]] = (),
+    ) -> None:
         self.config = config or RuntimeConfig()
+        self.name = str(getattr(self.config, "name", None) or DEFAULT_RUNTIME_NAME)
+        self.scheduler = scheduler
+        self._excluded_devices = tuple(exclude_devices)
 
         provided_mode = getattr(self.config, "display_mode", None)
         if config is None or provided_mode is None:
@@ -3625,10 +5541,12 @@ class HelenRuntime:
         self._configure_mode_runtime(active_mode, profile)
         self.session_id = uuid.uuid4().hex
         self.started_at = time.time()
+        self.stage_timings = StageTimings()
         self.event_stream = EventStream()
         self.metrics = GestureMetrics()
         self.vision_snapshot = VISION_RUNTIME_SNAPSHOT
         self._camera_selection: Optional[CameraSelection] = None
+        self._reprobe_thread: Optional[threading.Thread] = None
         if self.config.enable_camera:
             self._camera_selection = self._ensure_camera_selection(force=False)
 
@@ -3651,8 +5569,13 @@ class HelenRuntime:
         )
         self._log_clima_tuning()
 
-        classifier, classifier_meta = self._create_classifier()
+        if shared_classifier is not None:
+            classifier, classifier_meta = shared_classifier
+            LOGGER.info("Runtime '%s' reutiliza el clasificador cargado (%s)", self.name, classifier_meta.get("source"))
+        else:
+            classifier, classifier_meta = self._create_classifier()
         self.classifier = classifier
+        self.classifier_meta = dict(classifier_meta)
         self.model_source = classifier_meta.get("source", "")
         self.model_loaded = bool(classifier_meta.get("loaded", False))
         self.model_kind = classifier_meta.get("model_kind", "")
@@ -3683,16 +5606,52 @@ class HelenRuntime:
                     interval_s=self.config.poll_interval_s,
                     frame_stride=self.config.process_every_n,
                 )
+            self._attach_frame_pacer(self.stream)
         if self.external_only:
             LOGGER.info(
                 "Se operará en modo de inferencia externa; conecte el script de tiempo real al endpoint /gestures/gesture-key"
             )
         self.lock = threading.Lock()
+        # RuntimeHost la sustituye por una instancia compartida entre runtimes.
+        self.model_swap = ModelHotSwap(lambda: [self])
+        self.camera_supervisor: Optional[CameraSupervisor] = None
+        if self.config.enable_camera and getattr(self.config, "camera_supervisor", True):
+            self.camera_supervisor = CameraSupervisor(self)
+        self.rate_controller: Optional[AdaptiveRateController] = None
+        if self.config.enable_camera and not self.external_only and getattr(self.config, "adaptive", False):
+            self.rate_controller = AdaptiveRateController(
+                self, budget_ms=self.config.latency_budget_ms or ADAPTIVE_LATENCY_BUDGET_MS
+            )
+        self._last_mode_switch: Optional[Dict[str, Any]] = None
+        self._retired_streams: List[Any] = []
+        self._retired_lock = threading.Lock()
+        self._mode_switch_applied: Optional[threading.Event] = None
         self.latency_history: Deque[float] = deque(maxlen=240)
         self.last_prediction: Optional[Dict[str, Any]] = None
         self.last_prediction_at: Optional[float] = None
         self.last_heartbeat = 0.0
+        self.warmup_report: Optional[Dict[str, Any]] = None
         self.last_error: Optional[str] = None
+        self.prediction_recorder: Optional[PredictionRecorder] = None
+        record_path = getattr(self.config, "record_predictions_path", None)
+        if record_path:
+            try:
+                self.prediction_recorder = PredictionRecorder(Path(record_path))
+                LOGGER.info("Grabando predicciones para reproducción offline en %s", record_path)
+            except OSError as error:
+                LOGGER.warning("No se pudo abrir %s para grabar predicciones: %s", record_path, error)
+
+    # ------------------------------------------------------------------
+    def _attach_frame_pacer(self, stream: Any) -> None:
+        """Let a camera stream drop frames that are not due before doing any work on them."""
+
+        pacer = getattr(getattr(self, "pipeline", None), "pacer", None)
+        if pacer is None:
+            return
+        if hasattr(stream, "frame_pacer"):
+            stream.frame_pacer = pacer  # captura en proceso hijo: el plazo se aplica allí
+        elif hasattr(stream, "frame_gate"):
+            stream.frame_gate = pacer.due
 
     # ------------------------------------------------------------------
     def _apply_runtime_defaults(self, profile: Optional[PiCameraProfile]) -> None:
@@ -3785,6 +5744,9 @@ class HelenRuntime:
                 preferred=preferred,
                 logger=LOGGER,
                 forced_backend=getattr(self.config, "camera_backend", None),
+                cache_name=None if self.name == DEFAULT_RUNTIME_NAME else self.name,
+                exclude_devices=self._excluded_devices,
+                fast_boot=bool(getattr(self.config, "camera_fast_boot", False)) and not force,
             )
         except Exception as error:  # pragma: no cover - depends on environment
             LOGGER.warning("Auto-probe de cámara falló: %s", error)
@@ -3815,12 +5777,25 @@ class HelenRuntime:
     # ------------------------------------------------------------------
     def _create_classifier(self) -> Tuple[Any, Dict[str, Any]]:
         try:
-            classifier = VideoGestureClassifier(VIDEO_MODEL_SAVEDMODEL, VIDEO_LABELS_PATH)
-            LOGGER.info("Modelo de video cargado desde %s", VIDEO_MODEL_SAVEDMODEL)
+            active = VIDEO_MODEL_REGISTRY.active()
+            active_dir = VIDEO_MODEL_REGISTRY.active_dir()
+        except Exception as error:
+            LOGGER.warning("No se pudo leer el registro de modelos: %s", error)
+            active, active_dir = None, None
+
+        try:
+            if active is not None and active_dir is not None:
+                classifier = VideoGestureClassifier(active_dir)
+                version = active.version
+            else:
+                classifier = VideoGestureClassifier(VIDEO_MODEL_SAVEDMODEL, VIDEO_LABELS_PATH)
+                version = VIDEO_MODEL_DIR.name
+            LOGGER.info("Modelo de video cargado desde %s (versión %s)", classifier.model_dir, version)
             return classifier, {
                 "source": VideoGestureClassifier.source,
                 "loaded": True,
                 "model_kind": "video",
+                "version": version,
             }
         except Exception as error:
             LOGGER.warning("No se pudo cargar el modelo de video: %s", error)
@@ -3833,7 +5808,8 @@ class HelenRuntime:
             LOGGER.warning("No se pudo cargar el modelo de producción: %s", error)
             dataset_path = self.config.dataset_path
             if dataset_path.exists():
-                fallback = SimpleGestureClassifier(dataset_path)
+                fallback = SimpleGestureClassifier(dataset_path, k=getattr(self.config, "fallback_knn", 0))
+                LOGGER.info("Clasificador de respaldo en modo %s", fallback.mode)
                 return fallback, {"source": "synthetic", "loaded": True}
 
             _notify_missing_dataset(dataset_path)
@@ -3846,19 +5822,31 @@ class HelenRuntime:
     def _create_stream(self) -> Tuple[Any, Dict[str, Any]]:
         if self.config.enable_camera:
             selection = getattr(self, "_camera_selection", None)
+            video_stream_cls = VideoGestureStream
+            camera_stream_cls = CameraGestureStream
+            if self.config.capture_process:
+                video_stream_cls = ProcessVideoGestureStream
+                camera_stream_cls = ProcessCameraGestureStream
+            # Una selección cacheada sin validar (arranque rápido) se valida con los primeros frames reales.
+            validation_hook = None
+            if selection is not None and not camera_probe.selection_verified(selection):
+                validation_hook = self._on_selection_validated
             try:
                 if self.model_kind == "video":
-                    stream = VideoGestureStream(
+                    stream = video_stream_cls(
                         camera_index=self.config.camera_index,
                         detection_confidence=self.config.detection_confidence,
                         tracking_confidence=self.config.tracking_confidence,
                         selection=selection,
+                        cpu_gate=self.cpu_slot,
+                        on_selection_validated=validation_hook,
+                        hw_capture=self.config.hw_capture,
                     )
                     target = selection.device if selection and selection.device else self.config.camera_index
                     LOGGER.info("Usando cámara física (modelo de video) en %s", target)
                     return stream, {"source": VideoGestureStream.source}
 
-                stream = CameraGestureStream(
+                stream = camera_stream_cls(
                     camera_index=self.config.camera_index,
                     detection_confidence=self.config.detection_confidence,
                     tracking_confidence=self.config.tracking_confidence,
@@ -3868,6 +5856,9 @@ class HelenRuntime:
                     forced_backend=self.config.camera_backend,
                     width_override=self.config.camera_width,
                     height_override=self.config.camera_height,
+                    cpu_gate=self.cpu_slot,
+                    on_selection_validated=validation_hook,
+                    hw_capture=self.config.hw_capture,
                 )
                 target = selection.device if selection and selection.device else self.config.camera_index
                 LOGGER.info("Usando cámara física en %s", target)
@@ -3880,11 +5871,13 @@ class HelenRuntime:
                 if refreshed:
                     self._camera_selection = refreshed
                     try:
-                        stream = VideoGestureStream(
+                        stream = video_stream_cls(
                             camera_index=self.config.camera_index,
                             detection_confidence=self.config.detection_confidence,
                             tracking_confidence=self.config.tracking_confidence,
                             selection=refreshed,
+                            cpu_gate=self.cpu_slot,
+                            hw_capture=self.config.hw_capture,
                         )
                         target = refreshed.device if refreshed.device else refreshed.index
                         LOGGER.info("Cámara reprovisionada automáticamente en %s", target)
@@ -3892,7 +5885,7 @@ class HelenRuntime:
                     except Exception:
                         pass
                     try:
-                        stream = CameraGestureStream(
+                        stream = camera_stream_cls(
                             camera_index=self.config.camera_index,
                             detection_confidence=self.config.detection_confidence,
                             tracking_confidence=self.config.tracking_confidence,
@@ -3902,6 +5895,8 @@ class HelenRuntime:
                             forced_backend=self.config.camera_backend,
                             width_override=self.config.camera_width,
                             height_override=self.config.camera_height,
+                            cpu_gate=self.cpu_slot,
+                            hw_capture=self.config.hw_capture,
                         )
                         target = refreshed.device if refreshed.device else refreshed.index
                         LOGGER.info("Cámara reprovisionada automáticamente en %s", target)
@@ -3912,7 +5907,9 @@ class HelenRuntime:
         dataset_path = self.config.dataset_path
         if dataset_path.exists():
             LOGGER.info("Usando flujo sintético de gestos desde %s", dataset_path)
-            return SyntheticStreamAdapter(dataset_path), {"source": "synthetic"}
+            script = getattr(self.config, "synthetic_script", None)
+            stream = SyntheticStreamAdapter(dataset_path, script=script, fps=1.0 / self.config.poll_interval_s)
+            return stream, {"source": "synthetic"}
 
         _notify_missing_dataset(dataset_path)
         LOGGER.warning(
@@ -3921,37 +5918,175 @@ class HelenRuntime:
         self.config.enable_camera = False
         return ExternalGestureStream(), {"source": "external", "external_only": True}
 
+    # ------------------------------------------------------------------
+    def _on_selection_validated(self, ok: bool, detail: Optional[str]) -> None:
+        selection = self._camera_selection
+        if ok:
+            if selection is not None:
+                camera_probe.mark_selection_verified(selection)
+            LOGGER.info("Cámara cacheada validada con los primeros frames reales")
+            return
+        LOGGER.warning("La cámara cacheada no entregó frames (%s); se reprobará en segundo plano", detail)
+        self.request_camera_reprobe()
+
+    # ------------------------------------------------------------------
+    def request_camera_reprobe(self) -> None:
+        with self.lock:
+            if self._reprobe_thread is not None and self._reprobe_thread.is_alive():
+                return
+            thread = threading.Thread(target=self._background_reprobe, name=f"HelenReprobe-{self.name}", daemon=True)
+            self._reprobe_thread = thread
+        thread.start()
+
+    # ------------------------------------------------------------------
+    def reprobe_in_progress(self) -> bool:
+        thread = self._reprobe_thread
+        return thread is not None and thread.is_alive()
+
+    # ------------------------------------------------------------------
+    def _background_reprobe(self) -> None:
+        selection = self._ensure_camera_selection(force=True)
+        if selection is None:
+            LOGGER.error("El re-sondeo de cámara no encontró dispositivos válidos")
+            return
+
+        self._camera_selection = selection
+        try:
+            stream, stream_meta = self._create_stream()
+        except Exception as error:  # pragma: no cover - depends on hardware
+            LOGGER.error("No se pudo crear el flujo tras el re-sondeo: %s", error)
+            return
+
+        previous = self.stream
+        self._attach_frame_pacer(stream)
+        # El pipeline lee ``runtime.stream`` en cada iteración y toma el nuevo flujo en el siguiente frame.
+        # El anterior puede seguir dentro de ``next()``: lo cierra el propio pipeline (retire_stream).
+        self.stream = stream
+        self.stream_source = stream_meta.get("source", "")
+        self.retire_stream(previous)
+        LOGGER.info(
+            "Cámara re-sondeada y reemplazada en caliente: %s",
+            selection.device if selection.device else selection.index,
+        )
+
+    # ------------------------------------------------------------------
+    def retire_stream(self, stream: Any) -> None:
+        """Hand a replaced stream to the pipeline thread, which closes it between frames."""
+
+        with self._retired_lock:
+            self._retired_streams.append(stream)
+
+    # ------------------------------------------------------------------
+    def close_retired_streams(self) -> None:
+        """Close replaced streams; only the pipeline thread (or :meth:`stop`) calls this."""
+
+        if not self._retired_streams:
+            return
+        with self._retired_lock:
+            retired, self._retired_streams = self._retired_streams, []
+        for stream in retired:
+            close_stream = getattr(stream, "close", None)
+            if callable(close_stream):
+                with contextlib.suppress(Exception):
+                    close_stream()
+
+    # ------------------------------------------------------------------
+    def cpu_slot(self) -> ContextManager[Any]:
+        scheduler = self.scheduler
+        if scheduler is None:
+            return contextlib.nullcontext()
+        return scheduler.slot(self.name)
+
+    # ------------------------------------------------------------------
+    def claimed_device(self) -> Optional[Union[int, str]]:
+        selection = self._camera_selection
+        if selection is not None:
+            return selection.device or selection.index
+        if not self.config.enable_camera:
+            return None
+        return self.config.camera_device or self.config.camera_index
+
     # ------------------------------------------------------------------
     def start(self) -> None:
+        if getattr(self.config, "warmup", True):
+            self.warm_up()
         self.pipeline.start()
+        if self.camera_supervisor is not None:
+            self.camera_supervisor.start()
+        if self.rate_controller is not None:
+            self.rate_controller.start()
 
     # ------------------------------------------------------------------
     def stop(self, *, export_report: bool = True) -> None:
+        if self.rate_controller is not None:
+            self.rate_controller.stop()
+        if self.camera_supervisor is not None:
+            self.camera_supervisor.stop()
         self.pipeline.stop()
+        self.close_retired_streams()
         close_stream = getattr(self.stream, "close", None)
         if callable(close_stream):
             close_stream()
         if export_report:
             self._export_session_report()
+            if self.prediction_recorder is not None:
+                self.prediction_recorder.close()
+
+    # ------------------------------------------------------------------
+    def record_prediction(
+        self,
+        prediction: Prediction,
+        *,
+        timestamp: float,
+        hint_label: Optional[str] = None,
+        landmarks: Optional[Sequence[LandmarkPoint]] = None,
+    ) -> None:
+        recorder = self.prediction_recorder
+        if recorder is None:
+            return
+        try:
+            recorder.write(prediction, timestamp=timestamp, hint_label=hint_label, landmarks=landmarks)
+        except Exception as error:  # pragma: no cover - disco lleno o similar
+            LOGGER.warning("No se pudo grabar la predicción: %s", error)
+            self.prediction_recorder = None
 
     # ------------------------------------------------------------------
     def register_heartbeat(self) -> None:
-        with self.lock:
-            self.last_heartbeat = time.time()
+        # Called on every frame; a float assignment is atomic so no lock is needed.
+        self.last_heartbeat = time.time()
 
     # ------------------------------------------------------------------
     def clear_error(self) -> None:
-        with self.lock:
+        if self.last_error is not None:
             self.last_error = None
 
+    # ------------------------------------------------------------------
+    def _settle_mode_switch(self) -> None:
+        """Complete a pending switch record once the reading thread has applied the profile."""
+
+        applied = self._mode_switch_applied
+        if applied is None or not applied.is_set():
+            return
+        self._mode_switch_applied = None
+        details = getattr(self.stream, "last_reconfigure", lambda: None)() or {}
+        record = self._last_mode_switch
+        if record is None:
+            return
+        record["strategy"] = str(details.get("strategy") or "applied")
+        applied_at = details.get("applied_at")
+        if applied_at is not None:
+            record["applied_latency_ms"] = round(max(0.0, float(applied_at) - float(record["at"])) * 1000.0, 3)
+
     # ------------------------------------------------------------------
     def mode_snapshot(self, persisted_mode: Optional[str] = None) -> Dict[str, Any]:
         with self.lock:
+            self._settle_mode_switch()
             active = self.config.display_mode
             poll_interval = float(self.config.poll_interval_s)
             stride = int(self.config.process_every_n)
             profile = self.config.camera_profile
             stream_source = self.stream_source
+            last_switch = dict(self._last_mode_switch) if self._last_mode_switch else None
 
         snapshot: Dict[str, Any] = {
             "active": active,
@@ -3960,6 +6095,7 @@ class HelenRuntime:
             "process_every_n": stride,
             "stream_source": stream_source,
             "camera_profile": None,
+            "last_switch": last_switch,
         }
 
         if profile:
@@ -3975,7 +6111,15 @@ class HelenRuntime:
         return snapshot
 
     # ------------------------------------------------------------------
-    def apply_display_mode(self, mode: str) -> Dict[str, Any]:
+    def apply_display_mode(self, mode: str, *, wait_s: float = 0.0) -> Dict[str, Any]:
+        """Switch display mode without blocking on the capture thread.
+
+        The capture profile is queued on the stream and applied by the reading
+        thread between frames; until then ``switch_strategy`` is ``"pending"``
+        and :meth:`mode_snapshot` completes the record once it is live.
+        ``wait_s`` lets synchronous callers (CLI, tests) wait for it.
+        """
+
         normalized = _normalize_display_mode(mode)
         persisted = DISPLAY_MODE_STORE.save(normalized)
 
@@ -3985,39 +6129,116 @@ class HelenRuntime:
             return self.mode_snapshot(persisted_mode=persisted)
 
         LOGGER.info("Cambiando modo de visualización: %s → %s", current_mode, normalized)
-
-        self.stop(export_report=False)
+        started = time.perf_counter()
 
         with self.lock:
             self.config.display_mode = normalized
             self.config.camera_profile = _profile_for_mode(normalized)
             profile = self.config.camera_profile
             self._configure_mode_runtime(normalized, profile)
-            stream, stream_meta = self._create_stream()
-            self.stream = stream
-            self.stream_source = stream_meta.get("source", "")
-            classifier_external = self.classifier is None
-            stream_external = bool(stream_meta.get("external_only"))
-            self.external_only = classifier_external or stream_external
-        if self.external_only:
-            self.pipeline = NullGesturePipeline(self)
-        else:
-            if self.model_kind == "video":
-                self.pipeline = VideoGesturePipeline(
-                    self,
-                    interval_s=self.config.poll_interval_s,
-                    frame_stride=self.config.process_every_n,
-                    sequence_length=getattr(self.classifier, "sequence_length", video_config.SEQUENCE_LENGTH),
-                )
-            else:
-                self.pipeline = GesturePipeline(
-                    self,
-                    interval_s=self.config.poll_interval_s,
-                    frame_stride=self.config.process_every_n,
-                )
+            interval_s = self.config.poll_interval_s
+            frame_stride = self.config.process_every_n
+        if self.rate_controller is not None:
+            frame_stride += self.rate_controller.stride_offset()
+
+        # El dispositivo no cambia con el modo: se reconfiguran la captura y el
+        # ritmo del pipeline en caliente, conservando cámara, MediaPipe y consenso.
+        applied: Optional[threading.Event] = None
+        reconfigure_stream = getattr(self.stream, "reconfigure", None)
+        if callable(reconfigure_stream):
+            applied = reconfigure_stream(profile=profile)
+        self.pipeline.reconfigure(interval_s=interval_s, frame_stride=frame_stride)
+
+        latency_ms = (time.perf_counter() - started) * 1000.0
+        with self.lock:
+            self._last_mode_switch = {
+                "from": current_mode,
+                "to": normalized,
+                "strategy": "pipeline_only" if applied is None else "pending",
+                "latency_ms": round(latency_ms, 3),
+                "at": time.time(),
+            }
+            self._mode_switch_applied = applied
+        if applied is not None and wait_s > 0:
+            applied.wait(wait_s)
+        LOGGER.info("Modo %s solicitado en %.1f ms", normalized, latency_ms)
+
+        snapshot = self.mode_snapshot(persisted_mode=persisted)
+        snapshot["switch_latency_ms"] = round(latency_ms, 3)
+        snapshot["switch_strategy"] = (snapshot.get("last_switch") or {}).get("strategy", "pending")
+        return snapshot
 
-        self.pipeline.start()
-        return self.mode_snapshot(persisted_mode=persisted)
+    # ------------------------------------------------------------------
+    def warm_up(self, runs: int = STARTUP_WARMUP_RUNS) -> Dict[str, Any]:
+        """Run synthetic inputs through the geometry verifier, normaliser and classifier.
+
+        Graph tracing and lazy initialisation are paid here, before the pipeline
+        starts, instead of by the first real gesture. ``engine_status`` reports
+        this cost next to the latency of the first real inference.
+        """
+
+        report: Dict[str, Any] = {"runs": runs}
+        started = time.perf_counter()
+        landmarks = _synthetic_hand_landmarks()
+
+        if self.geometry_verifier is not None:
+            phase = time.perf_counter()
+            try:
+                for label in TRACKED_GESTURES:
+                    self.geometry_verifier.verify(label, landmarks)
+            except Exception as error:  # pragma: no cover - defensive
+                LOGGER.warning("Calentamiento del filtro geométrico fallido: %s", error)
+            report["geometry_ms"] = round((time.perf_counter() - phase) * 1000.0, 3)
+
+        classifier = self.classifier
+        if classifier is not None and not self.external_only:
+            try:
+                if self.model_kind == "video":
+                    sample = _synthetic_sequence(classifier)
+                    call: Callable[[], Any] = lambda: classifier.predict_sequence(sample)
+                else:
+                    features = CameraGestureStream._extract_features(landmarks)
+                    size = int(getattr(classifier, "feature_size", None) or len(features))
+                    features = (features + [0.0] * size)[:size]
+                    phase = time.perf_counter()
+                    transformed = self.feature_normalizer.transform(features)
+                    report["normalizer_ms"] = round((time.perf_counter() - phase) * 1000.0, 3)
+                    call = lambda: classifier.predict(transformed)
+                with self.cpu_slot():
+                    first_ms, timings = _timed_calls(call, runs)
+                report["first_call_ms"] = round(first_ms, 3)
+                report["classifier_ms"] = round(statistics.median(timings), 3)
+            except Exception as error:
+                LOGGER.warning("No se pudo calentar el clasificador: %s", error)
+                report["error"] = str(error)
+
+        report["warmup_ms"] = round((time.perf_counter() - started) * 1000.0, 3)
+        with self.lock:
+            self.warmup_report = report
+        LOGGER.info(
+            "Calentamiento en %.0f ms (primera inferencia sintética %.1f ms, siguientes %.1f ms)",
+            report["warmup_ms"],
+            report.get("first_call_ms", 0.0),
+            report.get("classifier_ms", 0.0),
+        )
+        return report
+
+    # ------------------------------------------------------------------
+    def swap_classifier(self, classifier: Any, classifier_meta: Dict[str, Any]) -> None:
+        """Replace the video classifier between two predictions, without restarting.
+
+        The pipeline reads ``self.classifier`` once per window and resizes its
+        buffer (keeping the latest frames) if the new model needs another length.
+        """
+
+        if self.model_kind != "video" or not isinstance(self.pipeline, VideoGesturePipeline):
+            raise RuntimeError("El cambio de modelo en caliente requiere el pipeline de video")
+        with self.lock:
+            self.classifier = classifier
+            self.classifier_meta = dict(classifier_meta)
+            self.model_source = classifier_meta.get("source", self.model_source)
+            self.model_loaded = bool(classifier_meta.get("loaded", True))
+        LOGGER.info("Runtime '%s' usa ahora el modelo %s", self.name, classifier_meta.get("version"))
 
     # ------------------------------------------------------------------
     def engine_status(self) -> Dict[str, Any]:
@@ -4046,6 +6267,7 @@ class HelenRuntime:
         mode_snapshot = self.mode_snapshot()
 
         payload = {
+            "runtime": self.name,
             "mode": mode_snapshot,
             "ui_mode": mode_snapshot.get("active", DEFAULT_DISPLAY_MODE),
             "thresholds": thresholds,
@@ -4057,11 +6279,31 @@ class HelenRuntime:
                 "external_only": self.external_only,
             },
             "stream": stream_status,
+            "model": {
+                "source": self.model_source,
+                "kind": self.model_kind,
+                "version": self.classifier_meta.get("version"),
+            },
+            "decision": self.decision_engine.snapshot().to_dict(),
             "vision": self.vision_snapshot,
+            "warmup": self._warmup_snapshot(),
         }
 
         if self._camera_selection:
             payload["camera_selection"] = self._camera_selection.to_dict()
+            payload["camera_selection"]["verified"] = camera_probe.selection_verified(self._camera_selection)
+
+        if self.scheduler is not None:
+            payload["scheduler"] = self.scheduler.snapshot()
+
+        if self.camera_supervisor is not None:
+            payload["camera_supervisor"] = self.camera_supervisor.snapshot()
+        if self.rate_controller is not None:
+            payload["adaptive"] = self.rate_controller.snapshot()
+        payload["pipeline"]["stage_timings"] = self.stage_timings.snapshot()
+        pacer = getattr(self.pipeline, "pacer", None)
+        if pacer is not None:
+            payload["pipeline"]["pacing"] = pacer.snapshot()
 
         return payload
 
@@ -4170,6 +6412,14 @@ class HelenRuntime:
         self.push_prediction(event)
         return event
 
+    # ------------------------------------------------------------------
+    def _warmup_snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            payload = dict(self.warmup_report or {"skipped": True})
+        # Primera inferencia con frames reales, ya sin el coste de trazado.
+        payload["first_inference_ms"] = self.stage_timings.first("classify")
+        return payload
+
     # ------------------------------------------------------------------
     def _latency_snapshot(self) -> Dict[str, float]:
         with self.lock:
@@ -4192,9 +6442,17 @@ class HelenRuntime:
     def _export_session_report(self) -> None:
         try:
             latency_stats = self._latency_snapshot()
+            warmup = self._warmup_snapshot()
+            if warmup.get("warmup_ms") is not None:
+                latency_stats["warmup_ms"] = warmup["warmup_ms"]
+            if warmup["first_inference_ms"] is not None:
+                latency_stats["first_inference_ms"] = warmup["first_inference_ms"]
             dataset_info = dict(self.dataset_info)
             dataset_info["normalizer"] = self.feature_normalizer.snapshot()
-            report_path = REPO_ROOT / "reports" / "gesture_session_report.md"
+            report_name = "gesture_session_report"
+            if self.name != DEFAULT_RUNTIME_NAME:
+                report_name = f"{report_name}-{self.name}"
+            report_path = REPO_ROOT / "reports" / f"{report_name}.md"
             self.metrics.dump_report(
                 markdown_path=report_path,
                 thresholds=self.decision_engine.thresholds(),
@@ -4242,6 +6500,8 @@ class HelenRuntime:
         pixel_format = stream_status.get("pixel_format") or selection_info.get("pixel_format")
         probe_latency = stream_status.get("probe_latency_ms")
 
+        supervisor = self.camera_supervisor.snapshot() if self.camera_supervisor is not None else {}
+
         status = "HEALTHY"
         if last_error:
             status = "ERROR"
@@ -4280,19 +6540,233 @@ class HelenRuntime:
             ),
             camera_last_error=stream_status.get("last_error"),
             last_error=last_error,
+            decision_state=self.decision_engine.snapshot().state,
+            runtime=self.name,
+            camera_supervisor_state=supervisor.get("state"),
+            camera_recoveries=int(supervisor.get("recoveries") or 0),
+            camera_last_recovery_ms=supervisor.get("last_recovery_ms"),
+            camera_last_failure=supervisor.get("last_failure"),
+        )
+
+
+class ModelHotSwap:
+    """Promote a registered model version while the runtimes keep serving.
+
+    The new :class:`VideoGestureClassifier` is loaded and warmed up on a
+    background thread; only once it answers is the version promoted (in the
+    untracked ``registry.local.json``, never the committed ``registry.json``)
+    and swapped into every runtime. A version that fails to load never becomes
+    active.
+    """
+
+    def __init__(
+        self,
+        runtimes: Callable[[], Iterable["HelenRuntime"]],
+        registry: Optional[ModelRegistry] = None,
+    ) -> None:
+        self._runtimes = runtimes
+        self._registry = registry or VIDEO_MODEL_REGISTRY
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._state: Dict[str, Any] = {"state": "idle"}
+
+    # ------------------------------------------------------------------
+    def promote(self, version: str) -> Dict[str, Any]:
+        entry = self._registry.get(version)
+        if entry is None:
+            raise KeyError(f"Versión de modelo desconocida: {version}")
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                raise RuntimeError(f"Ya se está cargando la versión {self._state.get('version')}")
+            self._state = {"state": "loading", "version": version, "started_at": time.time()}
+            self._thread = threading.Thread(target=self._load, args=(entry,), name="HelenModelSwap", daemon=True)
+            self._thread.start()
+            return dict(self._state)
+
+    # ------------------------------------------------------------------
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return thread is None or not thread.is_alive()
+
+    # ------------------------------------------------------------------
+    def _load(self, entry: ModelVersion) -> None:
+        started = time.perf_counter()
+        try:
+            classifier = VideoGestureClassifier(self._registry.model_dir(entry))
+            latency_ms, latency_p95_ms = _measure_classifier_latency(classifier)
+            self._registry.record_latency(entry.version, latency_ms, latency_p95_ms)
+            self._registry.promote(entry.version)
+        except Exception as error:
+            LOGGER.warning("No se pudo activar la versión %s del modelo: %s", entry.version, error)
+            with self._lock:
+                self._state = {"state": "failed", "version": entry.version, "error": str(error)}
+            return
+
+        meta = {
+            "source": VideoGestureClassifier.source,
+            "loaded": True,
+            "model_kind": "video",
+            "version": entry.version,
+        }
+        swapped: List[str] = []
+        skipped: List[str] = []
+        for runtime in self._runtimes():
+            try:
+                runtime.swap_classifier(classifier, meta)
+                swapped.append(runtime.name)
+            except RuntimeError as error:
+                LOGGER.warning("Runtime '%s' conserva su modelo hasta reiniciar: %s", runtime.name, error)
+                skipped.append(runtime.name)
+
+        load_ms = (time.perf_counter() - started) * 1000.0
+        LOGGER.info(
+            "Versión %s del modelo activa en %.0f ms (%.1f ms por ventana)", entry.version, load_ms, latency_ms
         )
+        with self._lock:
+            self._state = {
+                "state": "active",
+                "version": entry.version,
+                "load_ms": round(load_ms, 3),
+                "latency_ms": round(latency_ms, 3),
+                "latency_p95_ms": round(latency_p95_ms, 3),
+                "runtimes": swapped,
+                "skipped": skipped,
+                "finished_at": time.time(),
+            }
+
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Dict[str, Any]:
+        payload = self._registry.snapshot()
+        with self._lock:
+            payload["swap"] = dict(self._state)
+        return payload
+
+
+class RuntimeHost:
+    """Several named :class:`HelenRuntime` instances served by one process.
+
+    The classifier (and its model weights) is loaded once by the first runtime
+    and shared with the rest; every runtime keeps its own camera selection,
+    stream, decision engine and ``EventStream``. When more than one runtime is
+    configured a :class:`FairFrameScheduler` arbitrates CPU between them.
+    """
+
+    def __init__(self, configs: Sequence[RuntimeConfig], *, cpu_slots: Optional[int] = None) -> None:
+        if not configs:
+            raise ValueError("Se requiere al menos una configuración de runtime")
+
+        names = [str(config.name or DEFAULT_RUNTIME_NAME) for config in configs]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Nombres de runtime duplicados: {names}")
+
+        self.scheduler = FairFrameScheduler(cpu_slots) if len(configs) > 1 else None
+        self._runtimes: Dict[str, HelenRuntime] = {}
+        shared: Optional[Tuple[Any, Dict[str, Any]]] = None
+        claimed: List[Union[int, str]] = []
+        for config in configs:
+            runtime = HelenRuntime(
+                config,
+                shared_classifier=shared,
+                scheduler=self.scheduler,
+                exclude_devices=claimed,
+            )
+            if shared is None:
+                shared = (runtime.classifier, runtime.classifier_meta)
+            device = runtime.claimed_device()
+            if device is not None:
+                claimed.append(device)
+            self._runtimes[runtime.name] = runtime
+            LOGGER.info("Runtime '%s' listo (stream=%s)", runtime.name, runtime.stream_source)
+
+        self.default = self._runtimes[names[0]]
+        # Los runtimes comparten el clasificador, así que también su cambio en caliente.
+        self.model_swap = ModelHotSwap(lambda: list(self._runtimes.values()))
+        for runtime in self._runtimes.values():
+            runtime.model_swap = self.model_swap
+
+    # ------------------------------------------------------------------
+    def get(self, name: str) -> Optional[HelenRuntime]:
+        return self._runtimes.get(name)
+
+    # ------------------------------------------------------------------
+    def names(self) -> List[str]:
+        return list(self._runtimes)
+
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        for runtime in self._runtimes.values():
+            runtime.start()
+
+    # ------------------------------------------------------------------
+    def stop(self) -> None:
+        for runtime in self._runtimes.values():
+            runtime.stop()
+
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Dict[str, Any]:
+        runtimes = []
+        for name, runtime in self._runtimes.items():
+            health = runtime.health()
+            runtimes.append(
+                {
+                    "name": name,
+                    "status": health.status,
+                    "stream_source": health.stream_source,
+                    "camera_device": health.camera_device,
+                    "clients": health.clients,
+                    "events": f"/r/{name}/events",
+                }
+            )
+        payload: Dict[str, Any] = {"default": self.default.name, "runtimes": runtimes}
+        if self.scheduler is not None:
+            payload["scheduler"] = self.scheduler.snapshot()
+        return payload
+
+
+RUNTIME_ROUTE_PREFIX = "/r/"
 
 
 class HelenRequestHandler(SimpleHTTPRequestHandler):
-    """HTTP handler serving the SPA and the SSE endpoints."""
+    """HTTP handler serving the SPA and the SSE endpoints.
+
+    Routes under ``/r/<name>/...`` are dispatched to the named runtime of the
+    :class:`RuntimeHost`; unprefixed routes use the default runtime.
+    """
 
     server_version = "HelenHTTP/1.0"
     runtime: HelenRuntime  # populated at server construction time
 
-    def __init__(self, *args: Any, runtime: HelenRuntime, **kwargs: Any) -> None:
-        self.runtime = runtime
+    def __init__(
+        self,
+        *args: Any,
+        runtime: Optional[HelenRuntime] = None,
+        host: Optional[RuntimeHost] = None,
+        **kwargs: Any,
+    ) -> None:
+        if runtime is None and host is None:
+            raise ValueError("HelenRequestHandler requiere runtime o host")
+        self.host = host
+        self.runtime = runtime if runtime is not None else host.default  # type: ignore[union-attr]
         super().__init__(*args, directory=str(FRONTEND_ROOT), **kwargs)
 
+    # ------------------------------------------------------------------
+    def _resolve_runtime(self, path: str) -> Optional[str]:
+        """Select the runtime for ``path`` and return the path without prefix."""
+
+        if not path.startswith(RUNTIME_ROUTE_PREFIX):
+            return path
+        name, _, remainder = path[len(RUNTIME_ROUTE_PREFIX):].partition("/")
+        runtime = self.host.get(name) if self.host is not None else None
+        if runtime is None and name == self.runtime.name:
+            runtime = self.runtime
+        if runtime is None:
+            self._write_json({"error": f"Runtime desconocido: {name}"}, status=HTTPStatus.NOT_FOUND)
+            return None
+        self.runtime = runtime
+        return "/" + remainder
+
     def _write_json(self, payload: Dict[str, Any], status: HTTPStatus = HTTPStatus.OK) -> None:
         body = json.dumps(payload).encode("utf-8")
         self.send_response(status)
@@ -4307,7 +6781,16 @@ class HelenRequestHandler(SimpleHTTPRequestHandler):
 
     # ------------------------------------------------------------------
     def do_GET(self) -> None:  # noqa: D401 - inherited API
-        path = self.path.split("?", 1)[0]
+        path = self._resolve_runtime(self.path.split("?", 1)[0])
+        if path is None:
+            return
+
+        if path == "/runtimes":
+            if self.host is not None:
+                self._write_json(self.host.snapshot())
+            else:
+                self._write_json({"default": self.runtime.name, "runtimes": [{"name": self.runtime.name}]})
+            return
 
         if path in {"", "/"}:
             self.path = "/index.html"
@@ -4352,6 +6835,10 @@ class HelenRequestHandler(SimpleHTTPRequestHandler):
             self._write_json(snapshot)
             return
 
+        if path == "/models":
+            self._write_json(self.runtime.model_swap.snapshot())
+            return
+
         if path.startswith("/events"):
             self._handle_sse()
             return
@@ -4360,7 +6847,9 @@ class HelenRequestHandler(SimpleHTTPRequestHandler):
 
     # ------------------------------------------------------------------
     def do_POST(self) -> None:  # noqa: D401 - inherited API
-        path = self.path.split("?", 1)[0]
+        path = self._resolve_runtime(self.path.split("?", 1)[0])
+        if path is None:
+            return
 
         if path == "/net/connect":
             length = int(self.headers.get("Content-Length", "0"))
@@ -4411,7 +6900,39 @@ class HelenRequestHandler(SimpleHTTPRequestHandler):
                 self._write_json({"ok": False, "error": str(error)}, status=HTTPStatus.BAD_GATEWAY)
                 return
 
-            self._write_json({"mode": snapshot["active"], "snapshot": snapshot})
+            # El perfil de captura se aplica entre frames; GET /mode/get informa cuándo queda activo.
+            pending = snapshot.get("switch_strategy") == "pending"
+            self._write_json(
+                {"mode": snapshot["active"], "snapshot": snapshot},
+                status=HTTPStatus.ACCEPTED if pending else HTTPStatus.OK,
+            )
+            return
+
+        if path == "/models/promote":
+            length = int(self.headers.get("Content-Length", "0"))
+            raw_body = self.rfile.read(length) if length else b"{}"
+            try:
+                data = json.loads(raw_body.decode("utf-8"))
+            except json.JSONDecodeError:
+                self._write_json({"ok": False, "error": "JSON inválido"}, status=HTTPStatus.BAD_REQUEST)
+                return
+
+            version = str(data.get("version", "")).strip()
+            if not version:
+                self._write_json({"ok": False, "error": "Versión requerida"}, status=HTTPStatus.BAD_REQUEST)
+                return
+
+            try:
+                state = self.runtime.model_swap.promote(version)
+            except KeyError as error:
+                self._write_json({"ok": False, "error": error.args[0]}, status=HTTPStatus.NOT_FOUND)
+                return
+            except RuntimeError as error:
+                self._write_json({"ok": False, "error": str(error)}, status=HTTPStatus.CONFLICT)
+                return
+
+            # La carga sigue en segundo plano; GET /models informa cuándo queda activa.
+            self._write_json({"ok": True, "swap": state}, status=HTTPStatus.ACCEPTED)
             return
 
         if path == "/gestures/gesture-key":
@@ -4467,19 +6988,31 @@ class HelenRequestHandler(SimpleHTTPRequestHandler):
             self.runtime.event_stream.unregister(client_id)
 
 
-def run(host: str = "0.0.0.0", port: int = 5000, *, config: Optional[RuntimeConfig] = None) -> None:
-    runtime = HelenRuntime(config=config)
-    runtime.start()
+def run(
+    host: str = "0.0.0.0",
+    port: int = 5000,
+    *,
+    config: Optional[RuntimeConfig] = None,
+    configs: Optional[Sequence[RuntimeConfig]] = None,
+    cpu_slots: Optional[int] = None,
+) -> None:
+    runtime_host = RuntimeHost(list(configs) if configs else [config or RuntimeConfig()], cpu_slots=cpu_slots)
+    runtime_host.start()
 
-    handler_factory = partial(HelenRequestHandler, runtime=runtime)
+    handler_factory = partial(HelenRequestHandler, host=runtime_host)
     with ThreadingHTTPServer((host, port), handler_factory) as httpd:
-        LOGGER.info("HELEN backend serving from %s:%s", host, port)
+        LOGGER.info(
+            "HELEN backend serving from %s:%s (runtimes: %s)",
+            host,
+            port,
+            ", ".join(runtime_host.names()),
+        )
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:  # pragma: no cover - manual shutdown
             LOGGER.info("Shutting down backend")
         finally:
-            runtime.stop()
+            runtime_host.stop()
 
 
 class ThreadingHTTPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
@@ -4487,7 +7020,7 @@ class ThreadingHTTPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
     allow_reuse_address = True
 
 
-__all__ = ["HelenRuntime", "HelenRequestHandler", "RuntimeConfig", "run", "main"]
+__all__ = ["HelenRuntime", "HelenRequestHandler", "RuntimeConfig", "RuntimeHost", "run", "main"]
 
 
 def _parse_camera_spec(value: Optional[str]) -> Optional[Union[int, str]]:
@@ -4567,6 +7100,92 @@ def main(argv: Optional[List[str]] = None) -> int:
         action="store_true",
         help="Falla si la cámara no está disponible en lugar de usar el dataset sintético",
     )
+    parser.add_argument(
+        "--record-predictions",
+        dest="record_predictions",
+        type=Path,
+        default=None,
+        help="Graba cada predicción en un archivo JSONL para reproducirla con backendHelen.decision_replay",
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "--runtime",
+        dest="runtimes",
+        action="append",
+        default=[],
+        help=(
+            "Runtime adicional con nombre y cámara propia (p. ej. kiosko2=/dev/video2). Repetible; cada uno se "
+            "expone en /r/<nombre>/events, /r/<nombre>/health, etc."
+        ),
+        metavar="NOMBRE=INDEX|PATH",
+    )
+    parser.add_argument(
+        "--camera-fast-boot",
+        action="store_true",
+        help=(
+            "Confía en la cámara cacheada sin abrirla al arrancar; los primeros frames reales la validan y "
+            "solo se vuelve a sondear si la captura falla"
+        ),
+    )
+    parser.add_argument(
+        "--no-camera-supervisor",
+        action="store_true",
+        help="Desactiva el supervisor que reabre o vuelve a sondear la cámara cuando deja de entregar frames",
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help=(
+            "Ajusta en lazo cerrado el salto de frames, la resolución y la complejidad de MediaPipe para "
+            "sostener el presupuesto de latencia; baja el ritmo sin mano y lo recupera al detectar un gesto"
+        ),
+    )
+    parser.add_argument(
+        "--latency-budget-ms",
+        type=float,
+        default=None,
+        help=f"Presupuesto de latencia por frame para --adaptive (por defecto {ADAPTIVE_LATENCY_BUDGET_MS:.0f} ms)",
+    )
+    parser.add_argument(
+        "--hw-capture",
+        action="store_true",
+        help=(
+            "Captura por GStreamer con decodificación MJPEG por hardware (v4l2jpegdec) cuando exista; "
+            "los frames llegan en I420 y el plano de luma se usa sin conversiones para el control de nitidez"
+        ),
+    )
+    parser.add_argument(
+        "--capture-process",
+        action="store_true",
+        help=(
+            "Ejecuta captura y MediaPipe en un proceso hijo por cámara; los landmarks llegan por memoria "
+            "compartida y este proceso solo clasifica, decide y sirve"
+        ),
+    )
+    parser.add_argument(
+        "--fallback-knn",
+        type=int,
+        default=0,
+        metavar="K",
+        help="El clasificador de respaldo vota entre los K vecinos más cercanos del dataset en lugar de usar centroides",
+    )
+    parser.add_argument(
+        "--synthetic-script",
+        default=None,
+        metavar="GUION",
+        help="Sin cámara, repite un guion de gestos sintéticos, p. ej. 'idle:2,Start:1,Clima:1' (segundos)",
+    )
+    parser.add_argument(
+        "--no-warmup",
+        action="store_true",
+        help="No ejecuta la inferencia sintética de calentamiento antes de iniciar el pipeline",
+    )
+    parser.add_argument(
+        "--cpu-slots",
+        type=int,
+        default=None,
+        help="Frames procesados en paralelo entre todos los runtimes (por defecto, núcleos - 1)",
+    )
 
     args = parser.parse_args(argv)
     camera_spec = _parse_camera_spec(args.camera_index)
@@ -4593,9 +7212,39 @@ def main(argv: Optional[List[str]] = None) -> int:
         enable_camera=not args.no_camera,
         fallback_to_synthetic=not args.no_synthetic_fallback,
         process_every_n=frame_stride,
+        record_predictions_path=args.record_predictions,
+        capture_process=args.capture_process,
+        camera_fast_boot=args.camera_fast_boot,
+        hw_capture=args.hw_capture,
+        adaptive=args.adaptive,
+        latency_budget_ms=args.latency_budget_ms,
+        camera_supervisor=not args.no_camera_supervisor,
+        warmup=not args.no_warmup,
+        fallback_knn=max(0, args.fallback_knn),
+        synthetic_script=args.synthetic_script,
     )
 
-    run(args.host, args.port, config=config)
+    configs = [config]
+    for spec in args.runtimes:
+        name, separator, camera_value = spec.partition("=")
+        name = name.strip()
+        if not separator or not name:
+            parser.error(f"--runtime espera NOMBRE=INDEX|PATH, recibido: {spec}")
+        runtime_camera = _parse_camera_spec(camera_value)
+        record_path = args.record_predictions
+        if record_path is not None:
+            record_path = record_path.with_name(f"{record_path.stem}-{name}{record_path.suffix}")
+        configs.append(
+            replace(
+                config,
+                name=name,
+                camera_index=runtime_camera,
+                camera_device=runtime_camera if isinstance(runtime_camera, str) else None,
+                record_predictions_path=record_path,
+            )
+        )
+
+    run(args.host, args.port, configs=configs, cpu_slots=args.cpu_slots)
     return 0
 
 
@@ -14,7 +14,14 @@ from backendHelen.server import (
     GestureDecisionEngine,
     GestureMetrics,
     ConsensusConfig,
+    FairFrameScheduler,
+    CameraSupervisor,
+    AdaptiveRateController,
+    StageTimings,
+    FramePacer,
+    ModelHotSwap,
 )
+from Hellen_model_RN.video_gesture_model.model_registry import ModelRegistry
 from Hellen_model_RN.simple_classifier import Prediction
 
 
@@ -176,6 +183,44 @@ def test_foco_command_is_not_flagged_as_activation(live_server):
         client.close()
 
 
+def test_runtime_prefixed_routes(live_server, runtime):
+    parts = urlparse(live_server)
+    conn = HTTPConnection(parts.hostname, parts.port, timeout=5)
+    conn.request('GET', f'/r/{runtime.name}/engine/status')
+    response = conn.getresponse()
+    payload = json.loads(response.read().decode('utf-8'))
+    assert response.status == 200
+    assert payload['runtime'] == runtime.name
+
+    conn.request('GET', '/r/desconocido/health')
+    response = conn.getresponse()
+    response.read()
+    conn.close()
+    assert response.status == 404
+
+
+def test_fair_scheduler_alternates_between_runtimes():
+    scheduler = FairFrameScheduler(slots=1)
+    stop = threading.Event()
+
+    def worker(name):
+        while not stop.is_set():
+            with scheduler.slot(name):
+                stop.wait(0.002)
+
+    threads = [threading.Thread(target=worker, args=(name,), daemon=True) for name in ('kiosko1', 'kiosko2')]
+    for thread in threads:
+        thread.start()
+    stop.wait(0.3)
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=1)
+
+    granted = scheduler.snapshot()['granted']
+    assert granted['kiosko1'] > 5 and granted['kiosko2'] > 5
+    assert abs(granted['kiosko1'] - granted['kiosko2']) <= 2
+
+
 def test_command_debounce_prevents_spam():
     metrics = GestureMetrics()
     engine = GestureDecisionEngine(
@@ -195,3 +240,666 @@ def test_command_debounce_prevents_spam():
     outcome_repeat = engine.process(Prediction(label='Clima', score=0.94), timestamp=timestamp)
     assert outcome_repeat.emit is False
     assert outcome_repeat.reason == 'command_debounce_active'
+
+
+def test_decision_engine_timing_follows_injected_clock():
+    now = [50.0]
+    engine = GestureDecisionEngine(
+        metrics=GestureMetrics(),
+        consensus=ConsensusConfig(window_size=3, required_votes=1),
+        clock=lambda: now[0],
+    )
+
+    assert engine.process(Prediction(label='Start', score=0.92)).emit is True
+    assert engine.snapshot().last_emit_at == 50.0
+
+    now[0] += 0.1  # el cooldown se mide con el reloj inyectado, no con time.time()
+    assert engine.process(Prediction(label='Clima', score=0.93)).reason == 'cooldown_active'
+
+    now[0] += 1.0
+    assert engine.process(Prediction(label='Clima', score=0.93)).emit is True
+
+
+def test_decision_snapshot_tracks_state_without_locks():
+    metrics = GestureMetrics()
+    engine = GestureDecisionEngine(
+        metrics=metrics,
+        consensus=ConsensusConfig(window_size=3, required_votes=1),
+    )
+
+    initial = engine.snapshot()
+    assert initial.state == 'idle'
+    assert initial.processed == 0
+
+    engine.process(Prediction(label='Start', score=0.92), timestamp=10.0)
+    snapshot = engine.snapshot()
+    assert snapshot is not initial
+    assert snapshot.state == 'cooldown'
+    assert snapshot.last_emit_label == 'Start'
+    assert snapshot.processed == 1 and snapshot.emitted == 1
+    assert snapshot.to_dict()['last_reason'] == 'accepted'
+    assert metrics.snapshot()['reason_counts'] == {'accepted': 1}
+
+
+def test_display_mode_switch_keeps_pipeline_alive(runtime, tmp_path, monkeypatch):
+    from backendHelen import server
+
+    monkeypatch.setattr(server, 'DISPLAY_MODE_STORE', server.DisplayModeStore(tmp_path / 'mode.json', 'windows'))
+    original_mode = runtime.config.display_mode
+    target_mode = 'windows' if original_mode == 'raspberry' else 'raspberry'
+    pipeline = runtime.pipeline
+    stream = runtime.stream
+
+    try:
+        snapshot = runtime.apply_display_mode(target_mode, wait_s=2.0)
+
+        assert snapshot['active'] == target_mode
+        assert snapshot['switch_latency_ms'] >= 0.0
+        assert snapshot['switch_strategy']
+        assert snapshot['last_switch']['to'] == target_mode
+        assert runtime.pipeline is pipeline
+        assert runtime.stream is stream
+        assert runtime.pipeline.is_running() or runtime.external_only
+    finally:
+        runtime.apply_display_mode(original_mode)
+
+
+def test_display_mode_switch_does_not_block_on_capture_thread(tmp_path, monkeypatch):
+    import threading
+
+    from backendHelen import server
+
+    class PendingStream:
+        def __init__(self):
+            self.applied = threading.Event()
+            self.profiles = []
+
+        def reconfigure(self, *, profile):
+            self.profiles.append(profile)
+            return self.applied
+
+        def last_reconfigure(self):
+            return {'strategy': 'in_place', 'applied_at': server.time.time()}
+
+    monkeypatch.setattr(server, 'DISPLAY_MODE_STORE', server.DisplayModeStore(tmp_path / 'mode.json', 'windows'))
+    instance = HelenRuntime()
+    stream = PendingStream()
+    instance.stream = stream
+    target_mode = 'windows' if instance.config.display_mode == 'raspberry' else 'raspberry'
+
+    snapshot = instance.apply_display_mode(target_mode)
+    assert snapshot['active'] == target_mode
+    assert snapshot['switch_strategy'] == 'pending'
+    assert stream.profiles == [server._profile_for_mode(target_mode)]
+
+    # El hilo de lectura aplica el perfil entre frames y el snapshot se completa solo.
+    stream.applied.set()
+    settled = instance.mode_snapshot()['last_switch']
+    assert settled['strategy'] == 'in_place'
+    assert settled['applied_latency_ms'] >= 0.0
+
+
+def test_video_stream_applies_display_profile_to_capture_size():
+    pytest.importorskip('cv2')
+    pytest.importorskip('mediapipe')
+    from backendHelen import server
+
+    stream = server.VideoGestureStream()
+    profile = server.RASPBERRY_MODE_PROFILE
+    applied = stream.reconfigure(profile=profile)
+
+    # Sin cámara abierta el perfil se aplica de inmediato y se usará al abrirla.
+    assert applied.is_set()
+    assert stream._capture_size() == (profile.width, profile.height)
+    assert stream._capture_fps() == float(profile.fps)
+    assert stream.last_reconfigure()['strategy'] == 'deferred'
+
+
+def test_startup_warmup_is_reported_apart_from_first_real_inference(runtime):
+    warmup = runtime.engine_status()['warmup']
+    assert warmup['warmup_ms'] >= 0.0 and warmup['runs'] >= 1
+    if not runtime.external_only:
+        assert 'error' not in warmup
+        assert warmup['first_call_ms'] >= 0.0 and warmup['classifier_ms'] >= 0.0
+
+    timings = StageTimings()
+    assert timings.first('classify') is None
+    for latency in (30.0, 5.0, 6.0):
+        timings.record('classify', latency)
+    assert timings.first('classify') == 30.0
+    assert timings.snapshot()['classify']['first_ms'] == 30.0
+
+
+def test_selection_validation_reports_first_frame_or_repeated_failures():
+    from backendHelen.server import SelectionValidation
+
+    outcomes = []
+    validation = SelectionValidation(lambda ok, detail: outcomes.append((ok, detail)), failure_limit=3)
+    validation.frame_failed('sin frame')
+    validation.frame_ok()
+    validation.frame_failed('sin frame')
+    assert outcomes == [(True, None)]
+
+    failing = SelectionValidation(lambda ok, detail: outcomes.append((ok, detail)), failure_limit=2)
+    failing.frame_failed('sin frame')
+    failing.frame_failed('sin frame')
+    failing.frame_ok()
+    assert outcomes[-1] == (False, 'sin frame')
+    assert len(outcomes) == 2
+
+
+def test_camera_supervisor_never_releases_an_in_process_capture_under_a_read(monkeypatch):
+    import threading
+    from types import SimpleNamespace
+
+    import numpy as np
+
+    pytest.importorskip('cv2')
+    pytest.importorskip('mediapipe')
+    from backendHelen import server
+
+    class BlockingCapture:
+        def __init__(self):
+            self.reading = threading.Event()
+            self.unblock = threading.Event()
+            self.released_during_read = False
+            self.in_read = False
+
+        def read(self):
+            self.in_read = True
+            self.reading.set()
+            self.unblock.wait(10.0)  # como un VIDIOC_DQBUF colgado hasta el timeout del driver
+            self.in_read = False
+            return False, None
+
+        def release(self):
+            # En V4L2, liberar aquí desmapearía los buffers que usa la lectura pendiente.
+            self.released_during_read = self.released_during_read or self.in_read
+
+    class EmptyCapture:
+        def read(self):
+            return False, None
+
+        def release(self):
+            pass
+
+    stream = server.VideoGestureStream()
+    blocking = BlockingCapture()
+    reopened = []
+    stream._cap, stream._hands, stream._opened = blocking, object(), True
+    monkeypatch.setattr(stream, '_open_device', lambda: reopened.append(True) or EmptyCapture())
+
+    errors = []
+
+    def read_frame():
+        try:
+            stream.next_into(np.zeros(server.video_config.FEATURE_SIZE, dtype=np.float32), timeout=0.5)
+        except Exception as error:
+            errors.append(error)
+
+    reader = threading.Thread(target=read_frame, daemon=True)
+    reader.start()
+    assert blocking.reading.wait(2.0)
+
+    now = [100.0]
+    reprobes = []
+    runtime = SimpleNamespace(
+        name='test',
+        stream=stream,
+        stream_source='video_camera',
+        reprobe_in_progress=lambda: False,
+        request_camera_reprobe=lambda: reprobes.append(now[0]),
+    )
+    supervisor = CameraSupervisor(runtime, stall_after_s=2.0, reopen_attempts=1, clock=lambda: now[0])
+    now[0] = 104.0
+    assert supervisor.check() == 'recovering'
+    assert stream._reopen_requested and not blocking.released_during_read
+
+    now[0] = 105.0
+    assert supervisor.check() == 'reprobing'
+    assert reprobes == [105.0]
+    assert not blocking.released_during_read
+
+    blocking.unblock.set()  # el driver agota su timeout: el hilo lector reabre por su cuenta
+    reader.join(3.0)
+    assert not reader.is_alive()
+    assert reopened == [True]
+    assert not blocking.released_during_read
+    assert errors and isinstance(errors[0], TimeoutError)
+
+
+def test_camera_supervisor_kills_a_stalled_capture_process():
+    from types import SimpleNamespace
+
+    pytest.importorskip('cv2')
+    pytest.importorskip('mediapipe')
+    from backendHelen import server
+
+    class FakeCaptureProcess:
+        def __init__(self):
+            self.killed = 0
+
+        def kill(self):
+            self.killed += 1
+
+    stream = server.ProcessVideoGestureStream()
+    stream._process = process = FakeCaptureProcess()
+    now = [100.0]
+    runtime = SimpleNamespace(
+        name='test',
+        stream=stream,
+        stream_source='video_camera',
+        reprobe_in_progress=lambda: False,
+        request_camera_reprobe=lambda: None,
+    )
+    supervisor = CameraSupervisor(runtime, stall_after_s=2.0, reopen_attempts=1, clock=lambda: now[0])
+    now[0] = 104.0
+    assert supervisor.check() == 'recovering'
+    assert process.killed == 1
+    assert stream._reopen_requested
+
+
+def test_reprobe_hands_old_stream_to_pipeline_instead_of_closing_it(monkeypatch):
+    from types import SimpleNamespace
+
+    class FakeStream:
+        def __init__(self):
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    instance = HelenRuntime()
+    previous, replacement = FakeStream(), FakeStream()
+    instance.stream = previous
+    selection = SimpleNamespace(device='/dev/video2', index=None)
+    monkeypatch.setattr(instance, '_ensure_camera_selection', lambda *, force: selection)
+    monkeypatch.setattr(instance, '_create_stream', lambda: (replacement, {'source': 'camera'}))
+    monkeypatch.setattr(instance, '_attach_frame_pacer', lambda stream: None)
+
+    instance._background_reprobe()
+
+    # El pipeline podría seguir dentro de previous.next(): el re-sondeo no lo cierra.
+    assert instance.stream is replacement
+    assert previous.closed is False
+
+    instance.close_retired_streams()  # lo hace el hilo del pipeline entre frames
+    assert previous.closed is True
+    assert replacement.closed is False
+
+
+def test_camera_supervisor_reopens_stalled_capture_and_measures_recovery():
+    from types import SimpleNamespace
+
+    now = [100.0]
+
+    class FakeStream:
+        def __init__(self):
+            self.last_frame_at = 99.5
+            self.reopen_requests = 0
+
+        def capture_health(self):
+            return {'device': 0, 'opened_at': 90.0, 'last_frame_at': self.last_frame_at, 'read_failures': 0}
+
+        def request_reopen(self):
+            self.reopen_requests += 1
+
+    stream = FakeStream()
+    reprobes = []
+    runtime = SimpleNamespace(
+        name='test',
+        stream=stream,
+        stream_source='camera',
+        reprobe_in_progress=lambda: False,
+        request_camera_reprobe=lambda: reprobes.append(now[0]),
+    )
+    supervisor = CameraSupervisor(runtime, stall_after_s=2.0, reopen_attempts=1, clock=lambda: now[0])
+
+    assert supervisor.check() == 'ok'
+
+    now[0] = 104.0
+    assert supervisor.check() == 'recovering'
+    assert stream.reopen_requests == 1
+
+    now[0] = 105.0
+    assert supervisor.check() == 'reprobing'
+    assert reprobes == [105.0]
+
+    stream.last_frame_at = 105.5
+    now[0] = 106.0
+    assert supervisor.check() == 'ok'
+    snapshot = supervisor.snapshot()
+    assert snapshot['recoveries'] == 1
+    assert snapshot['last_recovery_ms'] == 1500.0
+
+
+def test_adaptive_controller_steps_down_over_budget_and_wakes_on_gesture():
+    from types import SimpleNamespace
+
+    now = [100.0]
+    latency = [120.0]
+
+    class FakeStream:
+        def __init__(self):
+            self.last_capture = 100.0
+            self.adapted = []
+
+        def status(self):
+            return {'last_capture': self.last_capture, 'stage_timings': {'landmarks': {'avg_ms': latency[0]}}}
+
+        def adapt(self, **changes):
+            self.adapted.append(changes)
+
+    class FakePipeline:
+        def __init__(self):
+            self.strides = []
+
+        def reconfigure(self, *, frame_stride=None, interval_s=None):
+            self.strides.append(frame_stride)
+
+    stream = FakeStream()
+    pipeline = FakePipeline()
+    runtime = SimpleNamespace(
+        name='test',
+        stream=stream,
+        stream_source='camera',
+        pipeline=pipeline,
+        config=SimpleNamespace(process_every_n=2),
+        stage_timings=StageTimings(),
+        decision_engine=SimpleNamespace(snapshot=lambda: SimpleNamespace(state='idle')),
+    )
+    controller = AdaptiveRateController(
+        runtime, budget_ms=50.0, idle_after_s=4.0, min_dwell_s=0.0, clock=lambda: now[0], load=lambda: None
+    )
+
+    assert controller.check() == 0  # primer vistazo: reaplica el nivel al flujo
+    assert controller.check() == 0
+    assert controller.check() == 1  # dos chequeos seguidos sobre presupuesto
+    assert stream.adapted[-1] == {'capture_scale': 1.0, 'model_complexity': 0}
+
+    latency[0] = 10.0
+    now[0] = 110.0  # sin mano: solo se espacian los frames, sin tocar resolución ni complejidad
+    adapted = len(stream.adapted)
+    assert controller.check() == 1
+    assert controller.idle is True
+    assert pipeline.strides[-1] == 4
+    assert len(stream.adapted) == adapted
+
+    stream.last_capture = 110.5  # aparece una mano: recupera el ritmo activo de inmediato
+    controller._min_dwell = 60.0
+    assert controller.check() == 1
+    assert controller.idle is False
+    assert pipeline.strides[-1] == 2
+    assert len(stream.adapted) == adapted
+    assert [d['reason'] for d in controller.snapshot()['decisions']] == [
+        'flujo_nuevo', 'sobre_presupuesto', 'inactivo', 'gesto'
+    ]
+
+
+def test_adaptive_wake_from_idle_does_not_reopen_the_capture(monkeypatch):
+    from types import SimpleNamespace
+
+    pytest.importorskip('cv2')
+    pytest.importorskip('mediapipe')
+    from backendHelen import server
+
+    class FakeCapture:
+        def set(self, *args):
+            return True
+
+        def release(self):
+            pass
+
+    stream = server.VideoGestureStream()
+    stream._cap, stream._hands, stream._opened = FakeCapture(), object(), True
+    stream._frame_layout = 'I420'  # con GStreamer un cambio de resolución obligaría a reabrir
+    reopens, rebuilds = [], []
+    monkeypatch.setattr(stream, '_reopen_capture', lambda: reopens.append(True))
+    monkeypatch.setattr(stream, '_create_hands', lambda: rebuilds.append(True))
+    stream._last_capture = 100.0
+
+    now = [100.0]
+    pipeline = SimpleNamespace(strides=[])
+    pipeline.reconfigure = lambda *, frame_stride=None, interval_s=None: pipeline.strides.append(frame_stride)
+    runtime = SimpleNamespace(
+        name='test',
+        stream=stream,
+        stream_source='video_camera',
+        pipeline=pipeline,
+        config=SimpleNamespace(process_every_n=1),
+        stage_timings=StageTimings(),
+        decision_engine=SimpleNamespace(snapshot=lambda: SimpleNamespace(state='idle')),
+    )
+    controller = AdaptiveRateController(
+        runtime, budget_ms=50.0, idle_after_s=4.0, min_dwell_s=3.0, clock=lambda: now[0], load=lambda: None
+    )
+    controller.check()
+    stream._apply_pending_adapt()  # el hilo lector aplica la configuración inicial del flujo
+
+    now[0] = 110.0  # sin mano → reposo
+    controller.check()
+    stream._apply_pending_adapt()
+    assert controller.idle is True
+
+    stream._last_capture = 110.2  # empieza un gesto → activo
+    now[0] = 110.5
+    controller.check()
+    stream._apply_pending_adapt()
+    assert controller.idle is False
+
+    assert pipeline.strides[-2:] == [1 + server.ADAPTIVE_IDLE_STRIDE, 1]
+    assert reopens == [] and rebuilds == []
+
+
+def test_adaptive_idle_stride_reaches_the_capture_process():
+    from types import SimpleNamespace
+
+    import numpy as np
+
+    pytest.importorskip('cv2')
+    pytest.importorskip('mediapipe')
+    from backendHelen import server
+    from backendHelen.landmark_worker import LandmarkFrame
+
+    class FakeCaptureProcess:
+        pid, skipped, pacing = 1, 0, None
+        ring = SimpleNamespace(write_sequence=0)
+
+        def set_pacing(self, interval_s, frame_stride):
+            self.pacing = (interval_s, frame_stride)
+
+        def next_frame(self, timeout):
+            landmarks = np.full((server.video_config.MAX_HANDS, 21, 3), 0.5, dtype=np.float32)
+            return LandmarkFrame(1, 100.0, 2, 0.9, None, 640, 480, landmarks)
+
+        def poll_status(self):
+            pass
+
+        def is_alive(self):
+            return True
+
+    now = [100.0]
+    pipeline = server.VideoGesturePipeline(SimpleNamespace(), interval_s=0.04, sequence_length=4)
+    stream = server.ProcessVideoGestureStream()
+    stream._process, stream._opened = FakeCaptureProcess(), True
+    stream._last_capture = 100.0
+    runtime = SimpleNamespace(
+        name='test',
+        stream=stream,
+        stream_source='video_camera',
+        pipeline=pipeline,
+        config=SimpleNamespace(process_every_n=1),
+        stage_timings=StageTimings(),
+        decision_engine=SimpleNamespace(snapshot=lambda: SimpleNamespace(state='idle')),
+    )
+    controller = AdaptiveRateController(
+        runtime, budget_ms=50.0, idle_after_s=4.0, min_dwell_s=0.0, clock=lambda: now[0], load=lambda: None
+    )
+    stream.adapt = lambda **changes: None  # el nivel no cambia; así no se reinicia el proceso hijo
+
+    # Sin pacer enlazado el hijo procesaría cada frame: el paso no se presenta como ahorro.
+    controller.check()
+    assert controller.decisions[-1]['stride_applied_in'] is None
+
+    HelenRuntime._attach_frame_pacer(runtime, stream)
+    now[0] = 110.0  # sin mano → reposo
+    controller.check()
+    assert controller.idle is True
+    assert controller.decisions[-1]['stride_applied_in'] == 'capture_process'
+
+    stream.next_into(np.zeros(server.video_config.FEATURE_SIZE, dtype=np.float32), timeout=0.5)
+    assert stream._process.pacing == (0.04, 1 + server.ADAPTIVE_IDLE_STRIDE)
+
+
+def test_frame_pacer_follows_target_rate_from_frame_arrivals():
+    now = [0.0]
+    pacer = FramePacer(0.04, clock=lambda: now[0])
+
+    processed = 0
+    for frame in range(90):  # 3 s de cámara a 30 fps
+        now[0] = 5.0 + frame / 30.0
+        processed += pacer.due()
+    assert 74 <= processed <= 76  # 25 Hz sin dormir entre frames
+    assert pacer.skipped == 90 - processed
+
+    pacer.reconfigure(frame_stride=2)
+    processed = 0
+    for frame in range(90, 180):
+        now[0] = 5.0 + frame / 30.0
+        processed += pacer.due()
+    assert 44 <= processed <= 46  # min(30 / 2, 25) = 15 Hz
+
+    stop = threading.Event()
+    stop.set()
+    assert pacer.wait(stop) is False
+
+
+def test_process_stream_hands_pacing_to_the_capture_child():
+    from types import SimpleNamespace
+
+    import numpy as np
+
+    pytest.importorskip('cv2')
+    pytest.importorskip('mediapipe')
+    from backendHelen import server
+    from backendHelen.landmark_worker import LandmarkFrame
+
+    class FakeCaptureProcess:
+        pacing = None
+
+        def set_pacing(self, interval_s, frame_stride):
+            self.pacing = (interval_s, frame_stride)
+
+        def next_frame(self, timeout):
+            landmarks = np.full((server.video_config.MAX_HANDS, 21, 3), 0.5, dtype=np.float32)
+            return LandmarkFrame(1, 100.0, 2, 0.9, None, 640, 480, landmarks)
+
+        def poll_status(self):
+            pass
+
+        def is_alive(self):
+            return True
+
+    instance = SimpleNamespace(pipeline=SimpleNamespace(pacer=FramePacer(0.1, 3)))
+    stream = server.ProcessVideoGestureStream()
+    HelenRuntime._attach_frame_pacer(instance, stream)
+    assert stream.frame_pacer is instance.pipeline.pacer and stream.frame_gate is None
+    assert server._stream_is_paced(stream)
+
+    stream._process, stream._opened = FakeCaptureProcess(), True
+    stream.next_into(np.zeros(server.video_config.FEATURE_SIZE, dtype=np.float32), timeout=0.5)
+    # El ritmo del pipeline llega al hijo, que descarta antes de MediaPipe; el padre no vuelve a filtrar.
+    assert stream._process.pacing == (0.1, 3)
+    assert instance.pipeline.pacer.processed == 1 and instance.pipeline.pacer.skipped == 0
+
+    instance.pipeline.pacer.reconfigure(frame_stride=5)
+    stream.next_into(np.zeros(server.video_config.FEATURE_SIZE, dtype=np.float32), timeout=0.5)
+    assert stream._process.pacing == (0.1, 5)
+
+
+def _exported_model(root, name, window):
+    model_dir = root / name
+    model_dir.mkdir(parents=True)
+    (model_dir / 'saved_model.pb').write_bytes(b'')
+    (model_dir / 'labels.json').write_text(json.dumps({'Start': 0, 'Clima': 1}), encoding='utf-8')
+    (model_dir / 'input_spec.json').write_text(json.dumps({'window': window, 'stride': 1}), encoding='utf-8')
+    return model_dir
+
+
+def test_model_hot_swap_warms_up_before_promoting(tmp_path, monkeypatch):
+    import backendHelen.server as server
+
+    registry = ModelRegistry(tmp_path)
+    _exported_model(tmp_path, 'gesture_model_20250101_000000', 48)
+    _exported_model(tmp_path, 'gesture_model_20250102_000000', 24)
+    assert [entry.version for entry in registry.scan()] == ['20250101_000000', '20250102_000000']
+    registry.promote('20250101_000000')
+    seed = (tmp_path / 'registry.json').read_text(encoding='utf-8')
+
+    class FakeClassifier:
+        source = 'video_model'
+
+        def __init__(self, model_dir):
+            if 'broken' in str(model_dir):
+                raise OSError('SavedModel corrupto')
+            self.sequence_length = 24
+            self.calls = 0
+
+        def predict_sequence(self, frames):
+            assert frames.shape == (24, server.video_config.FEATURE_SIZE)
+            self.calls += 1
+            return Prediction(label='Start', score=1.0)
+
+    class FakeRuntime:
+        name = 'default'
+        swapped = None
+
+        def swap_classifier(self, classifier, meta):
+            assert classifier.calls > 1  # ya calentado antes de entrar en servicio
+            self.swapped = (classifier, meta)
+
+    monkeypatch.setattr(server, 'VideoGestureClassifier', FakeClassifier)
+    runtime = FakeRuntime()
+    swap = ModelHotSwap(lambda: [runtime], registry)
+
+    with pytest.raises(KeyError):
+        swap.promote('19990101_000000')
+    assert swap.promote('20250102_000000')['state'] == 'loading'
+    assert swap.wait(timeout=5)
+
+    snapshot = swap.snapshot()
+    assert snapshot['active'] == '20250102_000000' and snapshot['previous'] == '20250101_000000'
+    assert snapshot['swap']['state'] == 'active' and snapshot['swap']['runtimes'] == ['default']
+    assert runtime.swapped[1]['version'] == '20250102_000000'
+    assert registry.get('20250102_000000').latency_ms is not None
+    # La promoción y la latencia van al estado local; el manifiesto versionado no cambia.
+    assert (tmp_path / 'registry.json').read_text(encoding='utf-8') == seed
+    assert json.loads((tmp_path / 'registry.local.json').read_text(encoding='utf-8'))['active'] == '20250102_000000'
+    assert ModelRegistry(tmp_path).active().version == '20250102_000000'
+
+    # Una versión que no carga nunca queda activa.
+    registry.register(_exported_model(tmp_path, 'broken', 24))
+    swap.promote('broken')
+    assert swap.wait(timeout=5)
+    assert swap.snapshot()['swap']['state'] == 'failed'
+    assert registry.active().version == '20250102_000000'
+
+
+def test_soak_driver_runs_scripted_sequence_through_decision_engine(runtime):
+    import numpy as np
+
+    from backendHelen import diagnostics
+    from Hellen_model_RN.simple_classifier import ScriptedGestureStream, parse_script
+
+    samples = {label: np.zeros((2, 42)) for label in ('Start', 'Clima')}
+    stream = ScriptedGestureStream(samples, parse_script('idle:1,Start:1,idle:0.5,Clima:1'), fps=200, seed=0)
+    sink = diagnostics._SinkClient(0)
+    client_id = runtime.event_stream.register(sink)
+    try:
+        report = diagnostics.run_soak(runtime, stream, duration_s=3.5, fps=200, realtime=False)
+    finally:
+        runtime.event_stream.unregister(client_id)
+
+    assert report['frames'] == 700 and report['idle'] == 300 and report['processed'] == 400
+    assert report['events'].get('Start', 0) >= 1
+    assert sink.wfile.bytes > 0
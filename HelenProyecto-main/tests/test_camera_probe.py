@@ -70,6 +70,7 @@ def test_probe_prefers_high_resolution(monkeypatch):
     monkeypatch.setattr(camera_probe, "_list_v4l2_devices", lambda: [candidate])
     monkeypatch.setattr(camera_probe, "_list_libcamera_devices", lambda: [])
     monkeypatch.setattr(camera_probe, "_fallback_candidates", lambda: [])
+    monkeypatch.setattr(camera_probe, "_device_capabilities", lambda local_candidate: None)
     monkeypatch.setattr(camera_probe, "_probe_with_v4l2", fake_probe_v4l2)
     monkeypatch.setattr(camera_probe, "_probe_with_gstreamer", fake_probe_gstreamer)
     monkeypatch.setattr(camera_probe, "cv2", object())
@@ -82,3 +83,184 @@ def test_probe_prefers_high_resolution(monkeypatch):
     assert selection.width == 1280
     assert selection.height == 720
     assert selection.pixel_format == "MJPG"
+
+
+def test_parallel_probe_stops_once_target_score_is_reached(monkeypatch):
+    import time
+
+    def make_candidate(name, path):
+        return camera_probe.CameraCandidate(
+            identifier=f"test:{name}", label=name, kind="usb", backend_hint="v4l2", path=path, index=None
+        )
+
+    fast = make_candidate("fast", "/dev/video0")
+    slow_capture = make_candidate("slow", "/dev/video2")
+    slow_metadata = make_candidate("slow-meta", "/dev/video2")
+    probed = []
+
+    def fake_probe_v4l2(local_candidate, mode):
+        probed.append(local_candidate.identifier)
+        if local_candidate is fast:
+            return camera_probe.ProbeResult(
+                candidate=local_candidate,
+                backend="v4l2",
+                mode=mode,
+                success=True,
+                latency_ms=5.0,
+                resolution=(mode.width, mode.height),
+                fps=float(mode.fps),
+            )
+        time.sleep(0.2)
+        return camera_probe.ProbeResult(candidate=local_candidate, backend="v4l2", mode=mode, success=False)
+
+    monkeypatch.setattr(camera_probe, "_device_capabilities", lambda local_candidate: None)
+    monkeypatch.setattr(camera_probe, "_probe_with_v4l2", fake_probe_v4l2)
+    monkeypatch.setattr(
+        camera_probe,
+        "_probe_with_gstreamer",
+        lambda local_candidate, mode: camera_probe.ProbeResult(
+            candidate=local_candidate, backend="gstreamer", mode=mode, success=False
+        ),
+    )
+
+    results = camera_probe._probe_candidates_parallel([slow_capture, slow_metadata, fast], max_workers=2)
+
+    successful = [result for _, result in results if result.success]
+    assert [result.candidate for result in successful] == [fast]
+    assert successful[0].score() >= camera_probe.PROBE_TARGET_SCORE
+    assert "test:slow-meta" not in probed
+    assert probed.count("test:slow") == 1
+
+
+def test_parallel_probe_does_not_cancel_preferred_device(monkeypatch):
+    import time
+
+    def make_candidate(name, path):
+        return camera_probe.CameraCandidate(
+            identifier=f"test:{name}", label=name, kind="usb", backend_hint="v4l2", path=path, index=None
+        )
+
+    other = make_candidate("other", "/dev/video0")
+    chosen = make_candidate("chosen", "/dev/video2")
+
+    def fake_probe_v4l2(local_candidate, mode):
+        if local_candidate is chosen:
+            time.sleep(0.2)  # la cámara elegida tarda más que la otra en responder
+        return camera_probe.ProbeResult(
+            candidate=local_candidate,
+            backend="v4l2",
+            mode=mode,
+            success=True,
+            latency_ms=5.0,
+            resolution=(mode.width, mode.height),
+            fps=float(mode.fps),
+        )
+
+    monkeypatch.setattr(camera_probe, "_device_capabilities", lambda local_candidate: None)
+    monkeypatch.setattr(camera_probe, "_probe_with_v4l2", fake_probe_v4l2)
+    monkeypatch.setattr(
+        camera_probe,
+        "_probe_with_gstreamer",
+        lambda local_candidate, mode: camera_probe.ProbeResult(
+            candidate=local_candidate, backend="gstreamer", mode=mode, success=False
+        ),
+    )
+
+    results = camera_probe._probe_candidates_parallel([other, chosen], preferred="/dev/video2", max_workers=2)
+
+    successful = {result.candidate.identifier for _, result in results if result.success}
+    assert "test:chosen" in successful
+    assert "test:other" in successful
+
+
+V4L2_FORMATS_OUTPUT = """ioctl: VIDIOC_ENUM_FMT
+\tType: Video Capture
+
+\t[0]: 'MJPG' (Motion-JPEG, compressed)
+\t\tSize: Discrete 1280x720
+\t\t\tInterval: Discrete 0.033s (30.000 fps)
+\t\tSize: Discrete 640x480
+\t\t\tInterval: Discrete 0.033s (30.000 fps)
+\t[1]: 'YUYV' (YUYV 4:2:2)
+\t\tSize: Discrete 1280x720
+\t\t\tInterval: Discrete 0.100s (10.000 fps)
+\t\tSize: Discrete 640x480
+\t\t\tInterval: Discrete 0.033s (30.000 fps)
+"""
+
+
+def test_probe_plan_uses_advertised_formats_and_skips_metadata_nodes(monkeypatch):
+    capabilities = camera_probe._parse_v4l2_formats(V4L2_FORMATS_OUTPUT)
+    assert capabilities.formats["MJPG"][(1280, 720)] == 30.0
+    assert capabilities.formats["YUYV"][(1280, 720)] == 10.0
+
+    plan = camera_probe._plan_probe_modes(capabilities)
+    assert [(mode.label, formats) for mode, formats in plan] == [
+        ("1280x720@30", ("MJPG", "YUYV")),
+        ("640x480@30", ("MJPG", "YUYV")),
+    ]
+
+    metadata = camera_probe._parse_v4l2_formats("ioctl: VIDIOC_ENUM_FMT\n\tType: Metadata Capture\n\n\t[0]: 'UVCH' (UVC Payload Header Metadata)\n")
+    assert metadata.metadata_only
+
+    candidate = camera_probe.CameraCandidate(
+        identifier="test:/dev/video1", label="meta", kind="usb", backend_hint="v4l2", path="/dev/video1", index=1
+    )
+    monkeypatch.setattr(camera_probe, "_device_capabilities", lambda local_candidate: metadata)
+    opened = []
+    monkeypatch.setattr(camera_probe, "_probe_with_v4l2", lambda *args, **kwargs: opened.append(args))
+
+    result = camera_probe._probe_candidate(candidate)
+    assert result.reason == "metadata-node"
+    assert not opened
+
+
+def test_fast_boot_trusts_matching_cache_without_opening(monkeypatch, tmp_path):
+    monkeypatch.setattr(camera_probe, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(camera_probe, "LOG_DIR", tmp_path / "logs")
+    monkeypatch.setattr(camera_probe, "cv2", object())
+    monkeypatch.setattr(camera_probe, "_hardware_signature", lambda: "sig")
+
+    def fail_validation(*args, **kwargs):
+        raise AssertionError("fast boot must not open the cached device")
+
+    monkeypatch.setattr(camera_probe, "_validate_cached_selection", fail_validation)
+    cached = camera_probe.CameraSelection(
+        backend="v4l2",
+        device="/dev/video0",
+        index=0,
+        pipeline=None,
+        width=1280,
+        height=720,
+        fps=30.0,
+        latency_ms=20.0,
+        orientation="landscape",
+        kind="usb",
+        mode_name="1280x720@30",
+        hardware_signature="sig",
+        probed_at="2024-01-01T00:00:00Z",
+    )
+    camera_probe._save_selection(cached, camera_probe._selection_cache_path("kiosk"))
+
+    selection = camera_probe.ensure_camera_selection(cache_name="kiosk", fast_boot=True)
+
+    assert selection.device == "/dev/video0"
+    assert not camera_probe.selection_verified(selection)
+    camera_probe.mark_selection_verified(selection)
+    assert camera_probe.selection_verified(selection)
+
+
+def test_capture_pipeline_uses_hardware_jpeg_decode_and_i420(monkeypatch):
+    monkeypatch.setattr(camera_probe, "gstreamer_element_available", lambda name: name == "v4l2jpegdec")
+
+    pipeline = camera_probe.build_capture_pipeline(
+        width=1280, height=720, fps=30, device="/dev/video0", source_format="MJPG", output="I420", hw_accel=True
+    )
+    assert pipeline == (
+        "v4l2src device=/dev/video0 ! image/jpeg,width=1280,height=720,framerate=30/1 ! v4l2jpegdec ! "
+        "videoconvert ! video/x-raw,format=I420 ! appsink drop=1 max-buffers=2"
+    )
+
+    csi = camera_probe.build_capture_pipeline(width=640, height=480, fps=15, output="I420")
+    assert csi.startswith("libcamerasrc ! video/x-raw,width=640,height=480,framerate=15/1,format=I420")
+    assert "jpegdec" not in csi
@@ -0,0 +1,72 @@
+import json
+import logging
+
+from backendHelen import decision_replay
+
+
+DEFAULT_SCRIPT = (
+    ('Reloj', 0.5, None, 5),
+    ('Start', 0.92, 'Start', 10),
+    ('Clima', 0.9, 'Clima', 10),
+)
+
+
+def _write_recording(path, script=DEFAULT_SCRIPT):
+    entries = []
+    timestamp = 1000.0
+    for label, score, hint, frames in script:
+        for _ in range(frames):
+            entries.append({'timestamp': timestamp, 'label': label, 'score': score, 'hint': hint, 'landmarks': None})
+            timestamp += 0.1
+    path.write_text('\n'.join(json.dumps(entry) for entry in entries), encoding='utf-8')
+
+
+def test_replay_scores_activations_and_latency(tmp_path):
+    recording = tmp_path / 'session.jsonl'
+    _write_recording(recording)
+    records = decision_replay.load_recording(recording)
+
+    result = decision_replay.replay(records)
+
+    assert result['frames'] == 25
+    assert result['segments'] == 2
+    assert result['detected_segments'] == 2
+    assert result['false_activations'] == 0
+    assert result['latency_ms_mean'] is not None
+
+
+def test_grid_ranks_false_activations_last(tmp_path):
+    recording = tmp_path / 'session.jsonl'
+    _write_recording(
+        recording,
+        (
+            ('Start', 0.92, 'Start', 5),
+            ('Reloj', 0.3, None, 15),
+            ('Reloj', 0.95, None, 5),
+        ),
+    )
+    records = decision_replay.load_recording(recording)
+
+    name, values = decision_replay.parse_parameter('listening_window_s=0.5,4.0')
+    ranked = decision_replay.run_grid(records, {name: values}, workers=1)
+
+    assert len(ranked) == 3
+    # Con 4 s de escucha el 'Reloj' sin hint se acepta y cuenta como falsa activación.
+    assert ranked[-1]['overrides'] in ({}, {'listening_window_s': 4.0})
+    assert ranked[-1]['false_activations'] >= 1
+    assert ranked[0]['overrides'] == {'listening_window_s': 0.5}
+    assert ranked[0]['false_activations'] == 0
+
+
+def test_in_process_grid_restores_backend_log_level(tmp_path):
+    recording = tmp_path / 'session.jsonl'
+    _write_recording(recording)
+    records = decision_replay.load_recording(recording)
+    logger = logging.getLogger('helen.backend')
+    previous = logger.level
+    logger.setLevel(logging.INFO)
+    try:
+        decision_replay.run_grid(records, {'cooldown_s': [0.5]}, workers=1)
+        assert logger.level == logging.INFO
+    finally:
+        logger.setLevel(previous)
@@ -0,0 +1,257 @@
+import multiprocessing
+import queue
+import sys
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from backendHelen import landmark_worker
+from backendHelen.landmark_worker import LandmarkRing, frame_planes, hand_slots, roi_blur
+
+
+def test_ring_returns_latest_slot_and_wraps():
+    ring = LandmarkRing.create(capacity=3, hands=1)
+    reader = LandmarkRing.attach(ring.name, ring.capacity, ring.hands)
+    try:
+        assert reader.read_latest() is None
+
+        for index in range(5):
+            landmarks = np.full((1, 21, 3), index, dtype=np.float32)
+            ring.write(
+                timestamp=100.0 + index,
+                landmarks=landmarks,
+                hands=1,
+                hand_score=0.9,
+                blur=None if index % 2 else 50.0,
+                width=640,
+                height=480,
+            )
+
+        frame = reader.read_latest()
+        assert frame.sequence == 5
+        assert frame.timestamp == 104.0
+        assert frame.blur == 50.0
+        assert (frame.width, frame.height) == (640, 480)
+        assert frame.landmarks.shape == (1, 21, 3)
+        assert np.all(frame.landmarks == 4)
+        assert reader.read_latest(after=frame.sequence) is None
+
+        ring.write(timestamp=105.0, landmarks=None, hands=0, hand_score=0.0, blur=None, width=640, height=480)
+        empty = reader.read_latest(after=frame.sequence)
+        assert empty.hands == 0
+        assert empty.blur is None
+        assert not empty.landmarks.any()
+    finally:
+        reader.close()
+        ring.close()
+
+
+def _write_numbered_frames(name, capacity, hands, count):
+    ring = LandmarkRing.attach(name, capacity, hands)
+    try:
+        for sequence in range(1, count + 1):
+            ring.write(
+                timestamp=float(sequence),
+                landmarks=np.full((hands, 21, 3), sequence, dtype=np.float32),
+                hands=hands,
+                hand_score=0.5,
+                blur=float(sequence),
+                width=sequence,
+                height=sequence,
+            )
+    finally:
+        ring.close()
+
+
+def test_ring_never_returns_a_torn_frame_under_a_concurrent_writer():
+    ring = LandmarkRing.create(capacity=2, hands=2)
+    count = 20000
+    writer = multiprocessing.get_context("spawn").Process(
+        target=_write_numbered_frames, args=(ring.name, ring.capacity, ring.hands, count), daemon=True
+    )
+    try:
+        writer.start()
+        accepted = 0
+        last = 0
+        while writer.is_alive() or last < count:
+            frame = ring.read_latest(last)
+            if frame is None:
+                if not writer.is_alive() and ring.write_sequence == last:
+                    break
+                continue
+            # Cada campo del slot lleva su número de secuencia: una mezcla de dos escrituras se nota.
+            assert frame.sequence > last
+            assert np.all(frame.landmarks == frame.sequence)
+            assert frame.timestamp == frame.blur == frame.width == frame.height == frame.sequence
+            last = frame.sequence
+            accepted += 1
+        writer.join(timeout=10)
+        assert writer.exitcode == 0
+        assert accepted > 1 and last == count
+    finally:
+        if writer.is_alive():
+            writer.kill()
+        ring.close()
+
+
+def test_ring_rejects_a_slot_whose_payload_is_not_fully_visible():
+    ring = LandmarkRing.create(capacity=2, hands=1)
+    try:
+        for value in (1, 2):
+            landmarks = np.full((1, 21, 3), value, dtype=np.float32)
+            ring.write(
+                timestamp=float(value), landmarks=landmarks, hands=1, hand_score=0.9, blur=None, width=640, height=480
+            )
+        assert ring.read_latest().sequence == 2
+
+        # Secuencia ya publicada pero un landmark todavía con el valor anterior (reordenación en ARM).
+        ring._slot_landmarks[1, 0, 5, 0] = 1.0
+        assert ring.read_latest() is None
+        ring._slot_landmarks[1, 0, 5, 0] = 2.0
+        assert np.all(ring.read_latest().landmarks == 2)
+    finally:
+        ring.close()
+
+
+def test_frame_planes_exposes_i420_luma_without_copy():
+    cv2 = pytest.importorskip("cv2")
+    bgr = np.zeros((48, 64, 3), dtype=np.uint8)
+    bgr[:, :, 2] = 200
+    i420 = cv2.cvtColor(bgr, cv2.COLOR_BGR2YUV_I420)
+
+    rgb, luma, width, height = frame_planes(cv2, i420, "I420")
+    assert (width, height) == (64, 48)
+    assert rgb.shape == (48, 64, 3)
+    assert abs(int(rgb[0, 0, 0]) - 200) <= 3
+    assert luma.shape == (48, 64)
+    assert np.shares_memory(luma, i420)
+
+    rgb, luma, width, height = frame_planes(cv2, bgr)
+    assert luma is None
+    assert (width, height) == (64, 48)
+    assert rgb[0, 0, 0] == 200
+
+
+def test_roi_blur_only_reads_the_hand_region():
+    cv2 = pytest.importorskip("cv2")
+    luma = np.full((720, 1280), 128, dtype=np.uint8)
+    luma[200:400, 300:500] = np.tile(np.array([0, 255], dtype=np.uint8), (200, 100))
+    smooth = cv2.GaussianBlur(luma, (0, 0), 5)
+
+    hand = (300 / 1280, 200 / 720, 500 / 1280, 400 / 720)
+    sharp_score = roi_blur(cv2, luma, hand)
+    blurred_score = roi_blur(cv2, smooth, hand)
+    assert sharp_score > 35.0 > blurred_score
+
+    background = (0.8, 0.8, 0.95, 0.95)
+    assert roi_blur(cv2, luma, background) == 0.0
+    assert roi_blur(cv2, luma, (0.5, 0.5, 0.5001, 0.5001)) is None
+
+
+def test_hand_slots_keep_both_hands_with_duplicate_handedness():
+    assert hand_slots(["Left", "Right"], 2) == [0, 1]
+    assert hand_slots(["Right", "Left"], 2) == [1, 0]
+    # Dos manos etiquetadas "Right": la segunda ocupa el bloque libre en vez de pisar la primera.
+    assert hand_slots(["Right", "Right"], 2) == [1, 0]
+    assert hand_slots(["Left", "Left"], 2) == [0, 1]
+    assert hand_slots([None], 2) == [0]
+
+
+def test_process_video_stream_targets_probed_device():
+    pytest.importorskip("cv2")
+    pytest.importorskip("mediapipe")
+    from backendHelen import camera_probe, server
+
+    selection = camera_probe.CameraSelection(
+        backend="v4l2",
+        device="/dev/video2",
+        index=2,
+        pipeline=None,
+        width=640,
+        height=480,
+        fps=30.0,
+        latency_ms=20.0,
+        orientation="landscape",
+        kind="usb",
+        mode_name="640x480@30",
+        hardware_signature="sig",
+        probed_at="2024-01-01T00:00:00Z",
+    )
+    stream = server.ProcessVideoGestureStream(selection=selection)
+
+    attempts = stream._capture_attempts()
+    assert attempts
+    assert all(attempt["target"] == "/dev/video2" for attempt in attempts)
+    assert attempts[-1]["backend"] == "auto"
+
+
+@pytest.mark.parametrize("sigma", [0.0, 0.8, 1.2, 1.6, 2.0, 3.0])
+def test_roi_blur_matches_the_full_frame_metric_the_threshold_was_tuned_on(sigma):
+    cv2 = pytest.importorskip("cv2")
+    from backendHelen.server import QUALITY_BLUR_THRESHOLD
+
+    rng = np.random.default_rng(7)
+    frame = cv2.GaussianBlur((rng.random((720, 1280)) * 255).astype(np.uint8), (0, 0), 1.0)
+    if sigma:
+        frame = cv2.GaussianBlur(frame, (0, 0), sigma)
+
+    legacy = float(cv2.Laplacian(frame, cv2.CV_64F).var())
+    hand = (300 / 1280, 200 / 720, 700 / 1280, 650 / 720)  # ROI mayor que BLUR_ROI_MAX_SIDE
+    current = roi_blur(cv2, frame, hand)
+
+    # Con nitidez uniforme, el ROI debe medir lo mismo que el frame completo y decidir igual.
+    assert current == pytest.approx(legacy, rel=0.1)
+    assert (current < QUALITY_BLUR_THRESHOLD) == (legacy < QUALITY_BLUR_THRESHOLD)
+
+
+def test_capture_worker_skips_mediapipe_for_frames_that_are_not_due(monkeypatch):
+    pytest.importorskip("cv2")
+    stop_event = threading.Event()
+    processed = []
+
+    class FakeCapture:
+        def __init__(self):
+            self.reads = 0
+
+        def read(self):
+            self.reads += 1
+            if self.reads > 12:
+                stop_event.set()
+                return False, None
+            return True, np.zeros((48, 64, 3), dtype=np.uint8)
+
+        def release(self):
+            pass
+
+    class FakeHands:
+        def __init__(self, **kwargs):
+            pass
+
+        def process(self, image):
+            processed.append(image.shape)
+            return SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+
+        def close(self):
+            pass
+
+    fake_mediapipe = SimpleNamespace(solutions=SimpleNamespace(hands=SimpleNamespace(Hands=FakeHands)))
+    monkeypatch.setitem(sys.modules, "mediapipe", fake_mediapipe)
+    monkeypatch.setattr(
+        landmark_worker, "_open_capture", lambda cv2, attempts, options: (FakeCapture(), {"frame_layout": "BGR"})
+    )
+
+    ring = LandmarkRing.create(capacity=4, hands=1)
+    pacing = [0] * landmark_worker.PACING_FIELDS
+    pacing[landmark_worker.PACING_STRIDE] = 3  # lo que escribe CaptureProcess.set_pacing
+    try:
+        landmark_worker.run_capture_worker(
+            ring.name, ring.capacity, ring.hands, [], {}, stop_event, threading.Event(), queue.Queue(), pacing
+        )
+        # Los 12 frames se leen, pero solo uno de cada tres se convierte y pasa por MediaPipe.
+        assert len(processed) == 4
+        assert pacing[landmark_worker.PACING_SKIPPED] == 8
+        assert ring.write_sequence == 4
+    finally:
+        ring.close()
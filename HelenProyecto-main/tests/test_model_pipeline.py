@@ -16,7 +16,12 @@ if str(MODEL_DIR) not in sys.path:
 
 import backendConexion  # noqa: E402
 import helpers  # noqa: E402
-from simple_classifier import SimpleGestureClassifier, SyntheticGestureStream  # noqa: E402
+from simple_classifier import (  # noqa: E402
+    ScriptedGestureStream,
+    SimpleGestureClassifier,
+    SyntheticGestureStream,
+    parse_script,
+)
 
 
 def load_dataset():
@@ -59,6 +64,41 @@ def test_simple_classifier_predicts_known_labels():
     assert 0.0 <= prediction.score <= 1.0
 
 
+def _write_dataset(path, features, labels):
+    with path.open('wb') as handle:
+        pickle.dump({'data': features, 'labels': labels}, handle)
+    return path
+
+
+def test_simple_classifier_batches_centroids_and_knn(tmp_path):
+    features = [[0.0, 0.0], [0.2, 0.0], [0.0, 0.2], [4.0, 4.0], [4.2, 4.0], [3.9, 4.1]]
+    dataset = _write_dataset(tmp_path / 'toy.pickle', features, ['A', 'A', 'A', 'B', 'B', 'B'])
+
+    centroid = SimpleGestureClassifier(dataset)
+    batch = centroid.predict_many([[0.1, 0.1], [4.0, 4.0], [0.0, 0.2]])
+    assert [prediction.label for prediction in batch] == ['A', 'B', 'A']
+    assert batch[2] == centroid.predict([0.0, 0.2])
+    assert all(0.0 <= prediction.score <= 1.0 for prediction in batch)
+    with pytest.raises(ValueError):
+        centroid.predict([1.0, 2.0, 3.0])
+
+    knn = SimpleGestureClassifier(dataset, k=3)
+    assert knn.mode == 'knn'
+    votes = knn.predict_many([[0.1, 0.1], [2.5, 2.5]])
+    assert [prediction.label for prediction in votes] == ['A', 'B']
+    assert votes[0].score == 1.0
+
+
+def test_simple_classifier_knn_tie_goes_to_nearest_neighbour(tmp_path):
+    features = [[1.0], [1.1], [1.2], [1.3]]
+    dataset = _write_dataset(tmp_path / 'tie.pickle', features, ['B', 'A', 'A', 'B'])
+
+    knn = SimpleGestureClassifier(dataset, k=4)
+    prediction = knn.predict([0.0])
+    assert prediction.label == 'B'
+    assert prediction.score == 0.5
+
+
 def test_synthetic_stream_introduces_variability():
     stream = SyntheticGestureStream(DATASET_PATH, jitter=0.05)
     first_features, first_label = stream.next()
@@ -70,6 +110,30 @@ def test_synthetic_stream_introduces_variability():
     assert any(abs(a - b) > 0 for a, b in zip(first_features, second_features))
 
 
+def test_synthetic_streams_pregenerate_jitter_and_follow_scripts(tmp_path):
+    features = [[float(index)] * 4 for index in range(6)]
+    dataset = _write_dataset(tmp_path / 'toy.pickle', features, ['Start'] * 3 + ['Clima'] * 3)
+
+    stream = SyntheticGestureStream(dataset, jitter=0.05, seed=3)
+    first, label = stream.next()
+    assert isinstance(first, list) and len(first) == 4 and label == 'Start'
+    assert any(abs(value) > 0 for value in first)  # la muestra 0 es todo ceros: el ruido se nota
+    batch, labels = stream.next_batch(8)
+    assert batch.shape == (8, 4) and labels[:2] == ['Start', 'Start'] and labels[2] == 'Clima'
+
+    script = parse_script('idle:0.1, Start:0.2,Clima:0.1')
+    assert script == [('idle', 0.1), ('Start', 0.2), ('Clima', 0.1)]
+    scripted = ScriptedGestureStream.from_dataset(dataset, script, fps=20, jitter=0.0, seed=0)
+    assert scripted.frames_per_cycle == 8
+    frames = [scripted.next() for _ in range(scripted.frames_per_cycle + 1)]
+    assert [label for _, label in frames] == ['idle'] * 2 + ['Start'] * 4 + ['Clima'] * 2 + ['idle']
+    assert frames[0][0] is None
+    assert all(sample[0] < 3 for sample, label in frames if label == 'Start')
+
+    with pytest.raises(ValueError):
+        ScriptedGestureStream.from_dataset(dataset, parse_script('Foco:1'))
+
+
 def test_post_gesturekey_payload_structure(monkeypatch):
     captured = {}
 